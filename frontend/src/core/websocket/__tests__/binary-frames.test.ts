@@ -0,0 +1,57 @@
+/* Copyright 2026 Marimo. All rights reserved. */
+
+import { describe, expect, it, vi } from "vitest";
+import { createFrameHandler, decodeBinaryFrame } from "../binary-frames";
+
+async function makeFrame(text: string, compressed: boolean) {
+  const op = new TextEncoder().encode("cell-op");
+  let payload = new TextEncoder().encode(text);
+  if (compressed) {
+    const stream = new Blob([payload])
+      .stream()
+      .pipeThrough(new CompressionStream("deflate"));
+    payload = new Uint8Array(await new Response(stream).arrayBuffer());
+  }
+  const frame = new Uint8Array(2 + op.length + payload.length);
+  frame.set([compressed ? 1 : 0, op.length]);
+  frame.set(op, 2);
+  frame.set(payload, 2 + op.length);
+  return frame.buffer;
+}
+
+describe("decodeBinaryFrame", () => {
+  it("should decode compressed frames", async () => {
+    const text = '{"op": "cell-op", "data": {"cell_id": "é"}}';
+    const frame = await makeFrame(text, true);
+    expect(await decodeBinaryFrame(frame)).toBe(text);
+    expect(await decodeBinaryFrame(new Blob([frame]))).toBe(text);
+  });
+
+  it("should decode uncompressed frames", async () => {
+    const text = '{"op": "cell-op", "data": {}}';
+    expect(await decodeBinaryFrame(await makeFrame(text, false))).toBe(text);
+  });
+});
+
+describe("createFrameHandler", () => {
+  it("should handle text frames synchronously", () => {
+    const handleText = vi.fn();
+    const handleFrame = createFrameHandler(handleText, vi.fn());
+    handleFrame("a");
+    expect(handleText).toHaveBeenCalledWith("a");
+  });
+
+  it("should preserve the order of text and binary frames", async () => {
+    const received: string[] = [];
+    const handleFrame = createFrameHandler(
+      (text) => received.push(text),
+      vi.fn(),
+    );
+    handleFrame("a");
+    handleFrame(await makeFrame("b", true));
+    handleFrame("c");
+    expect(received).toEqual(["a"]);
+
+    await vi.waitFor(() => expect(received).toEqual(["a", "b", "c"]));
+  });
+});
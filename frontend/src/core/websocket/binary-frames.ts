@@ -0,0 +1,66 @@
+/* Copyright 2026 Marimo. All rights reserved. */
+
+/**
+ * Binary frame flag: the payload is zlib-compressed
+ */
+const COMPRESSED = 0x01;
+
+/**
+ * Decode a binary frame sent by the kernel into its wire message.
+ *
+ * A frame is a flags byte, the length of the operation name, the operation
+ * name, and the JSON wire message (zlib-compressed if the compressed flag
+ * is set). Connections opt into binary frames with `?binary=true`.
+ */
+export async function decodeBinaryFrame(
+  data: ArrayBuffer | Blob,
+): Promise<string> {
+  const bytes = new Uint8Array(
+    data instanceof Blob ? await data.arrayBuffer() : data,
+  );
+  const flags = bytes[0];
+  const opLength = bytes[1];
+  const payload = bytes.subarray(2 + opLength);
+  if (!(flags & COMPRESSED)) {
+    return new TextDecoder().decode(payload);
+  }
+  const stream = new Blob([payload])
+    .stream()
+    .pipeThrough(new DecompressionStream("deflate"));
+  return new Response(stream).text();
+}
+
+/**
+ * Create a handler for WebSocket frames that passes the wire message of
+ * each frame to `handleText`, in the order the frames were received.
+ *
+ * Text frames are handled synchronously, unless binary frames received
+ * before them are still being decoded.
+ */
+export function createFrameHandler(
+  handleText: (text: string) => void,
+  onError: (error: unknown) => void,
+): (data: string | ArrayBuffer | Blob) => void {
+  let pending: Promise<void> | null = null;
+
+  return (data) => {
+    if (typeof data === "string" && pending === null) {
+      handleText(data);
+      return;
+    }
+
+    const next: Promise<void> = (pending ?? Promise.resolve())
+      .then(async () => {
+        handleText(
+          typeof data === "string" ? data : await decodeBinaryFrame(data),
+        );
+      })
+      .catch(onError)
+      .finally(() => {
+        if (pending === next) {
+          pending = null;
+        }
+      });
+    pending = next;
+  };
+}
@@ -7,6 +7,7 @@ import { toast } from "@/components/ui/use-toast";
 import { getNotebook, useCellActions } from "@/core/cells/cells";
 import { AUTOCOMPLETER } from "@/core/codemirror/completion/Autocompleter";
 import type { NotificationPayload } from "@/core/kernel/messages";
+import { createFrameHandler } from "@/core/websocket/binary-frames";
 import { useConnectionTransport } from "@/core/websocket/useWebSocket";
 import { renderHTML } from "@/plugins/core/RenderHTML";
 import {
@@ -115,8 +116,19 @@ export function useMarimoKernelConnection(opts: {
     filterFromVariables: filterStorageFromVariables,
   } = useStorageActions();
 
-  const handleMessage = (e: MessageEvent<JsonString<NotificationPayload>>) => {
-    const msg = jsonParseWithSpecialChar(e.data);
+  const handleMessage = (
+    data: JsonString<NotificationPayload | NotificationPayload[]>,
+  ) => {
+    const parsed = jsonParseWithSpecialChar(data);
+    // Connections in batch mode may receive several messages in one frame
+    if (Array.isArray(parsed)) {
+      parsed.forEach(handleNotification);
+    } else {
+      handleNotification(parsed);
+    }
+  };
+
+  const handleNotification = (msg: NotificationPayload) => {
     switch (msg.data.op) {
       case "reload":
         reloadSafe();
@@ -327,6 +339,26 @@ export function useMarimoKernelConnection(opts: {
     }
   };
 
+  const handleMessageError = (data: unknown, error: unknown) => {
+    Logger.error("Failed to handle message", data, error);
+    toast({
+      title: "Failed to handle message",
+      description: prettyError(error),
+      variant: "danger",
+    });
+  };
+
+  const handleFrame = createFrameHandler(
+    (text) => {
+      try {
+        handleMessage(text as JsonString<NotificationPayload>);
+      } catch (error) {
+        handleMessageError(text, error);
+      }
+    },
+    (error) => handleMessageError(undefined, error),
+  );
+
   const tryReconnecting = (code?: number, reason?: string) => {
     // If not properly gated, we could try reconnecting forever if the
     // issue is not transient. So we want to try reconnecting only once after an
@@ -379,16 +411,7 @@ export function useMarimoKernelConnection(opts: {
      * Handle messages sent by the kernel.
      */
     onMessage: (e) => {
-      try {
-        handleMessage(e);
-      } catch (error) {
-        Logger.error("Failed to handle message", e.data, error);
-        toast({
-          title: "Failed to handle message",
-          description: prettyError(error),
-          variant: "danger",
-        });
-      }
+      handleFrame(e.data);
     },
 
     /**
@@ -1,10 +1,15 @@
 /* Copyright 2026 Marimo. All rights reserved. */
 
 import { z } from "zod";
+import { rpc } from "@/plugins/core/rpc";
 import type { IPlugin, IPluginProps } from "@/plugins/types";
 import type { VegaLiteSpec } from "./types";
 
-import type { Data, VegaComponentState } from "./vega-component";
+import type {
+  Data,
+  VegaComponentState,
+  VegaFunctions,
+} from "./vega-component";
 
 import "./vega.css";
 import React, { type JSX } from "react";
@@ -12,7 +17,9 @@ import { TooltipProvider } from "@/components/ui/tooltip";
 
 const LazyVegaComponent = React.lazy(() => import("./vega-component"));
 
-export class VegaPlugin implements IPlugin<VegaComponentState, Data> {
+export class VegaPlugin
+  implements IPlugin<VegaComponentState, Data, VegaFunctions>
+{
   tagName = "marimo-vega";
 
   validator = z.object({
@@ -25,15 +32,34 @@ export class VegaPlugin implements IPlugin<VegaComponentState, Data> {
       .default(true),
     fieldSelection: z.union([z.boolean(), z.array(z.string())]).default(true),
     embedOptions: z.object({}).passthrough().default({}),
+    downsample: z.object({ field: z.string() }).nullish(),
   });
 
-  render(props: IPluginProps<VegaComponentState, Data>): JSX.Element {
+  functions = {
+    get_downsampled_data: rpc
+      .input(
+        z.object({
+          x_range: z.tuple([z.number(), z.number()]).nullish(),
+        }),
+      )
+      .output(
+        z.object({
+          url: z.string(),
+          format: z.object({ type: z.string() }).passthrough(),
+        }),
+      ),
+  };
+
+  render(
+    props: IPluginProps<VegaComponentState, Data, VegaFunctions>,
+  ): JSX.Element {
     return (
       <TooltipProvider>
         <LazyVegaComponent
           value={props.value}
           setValue={props.setValue}
           {...props.data}
+          {...props.functions}
         />
       </TooltipProvider>
     );
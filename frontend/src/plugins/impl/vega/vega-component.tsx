@@ -13,6 +13,7 @@ import { tooltipHandler } from "@/components/charts/tooltip";
 import type { SignalListener } from "@/components/charts/types";
 import { Alert, AlertTitle } from "@/components/ui/alert";
 import { Tooltip } from "@/components/ui/tooltip";
+import { asRemoteURL } from "@/core/runtime/config";
 import { useAsyncData } from "@/hooks/useAsyncData";
 import { useDeepCompareMemoize } from "@/hooks/useDeepCompareMemoize";
 import { useTheme } from "@/theme/useTheme";
@@ -22,6 +23,7 @@ import { Objects } from "@/utils/objects";
 import { ErrorBanner } from "../common/error-banner";
 import { fixRelativeUrl } from "./fix-relative-url";
 import { arrow } from "./formats";
+import { vegaLoadData } from "./loader";
 import { makeSelectable } from "./make-selectable";
 import { getSelectionParamNames, ParamNames } from "./params";
 import { resolveVegaSpecData } from "./resolve-data";
@@ -34,8 +36,20 @@ export interface Data {
   chartSelection: boolean | "point" | "interval";
   fieldSelection: boolean | string[];
   embedOptions?: Record<string, unknown>;
+  /**
+   * Set when the chart data is downsampled in the backend,
+   * with the x field to re-query when zooming.
+   */
+  downsample?: { field: string } | null;
 }
 
+// eslint-disable-next-line @typescript-eslint/consistent-type-definitions
+export type VegaFunctions = {
+  get_downsampled_data: (req: {
+    x_range?: [number, number] | null;
+  }) => Promise<{ url: string; format: { type: string } }>;
+};
+
 export interface VegaComponentState {
   [channel: string]: {
     // List of selected items
@@ -50,7 +64,7 @@ export interface VegaComponentState {
   };
 }
 
-interface VegaComponentProps<T> extends Data {
+interface VegaComponentProps<T> extends Data, Partial<VegaFunctions> {
   value: T;
   setValue: (value: T) => void;
 }
@@ -62,6 +76,8 @@ const VegaComponent = ({
   fieldSelection,
   spec,
   embedOptions,
+  downsample,
+  get_downsampled_data,
 }: VegaComponentProps<VegaComponentState>) => {
   const { data: resolvedSpec, error } = useAsyncData(async () => {
     // We try to resolve the data before passing it to Vega
@@ -87,6 +103,8 @@ const VegaComponent = ({
       fieldSelection={fieldSelection}
       spec={resolvedSpec}
       embedOptions={embedOptions}
+      downsample={downsample}
+      get_downsampled_data={get_downsampled_data}
     />
   );
 };
@@ -98,6 +116,8 @@ const LoadedVegaComponent = ({
   fieldSelection,
   spec,
   embedOptions,
+  downsample,
+  get_downsampled_data,
 }: VegaComponentProps<VegaComponentState>): JSX.Element => {
   const { theme } = useTheme();
   const vegaRef = useRef<HTMLDivElement>(null);
@@ -162,12 +182,67 @@ const LoadedVegaComponent = ({
     [handleUpdateValue],
   );
 
+  // When the data is downsampled, reload the visible range
+  // at full resolution (up to the same number of points) on pan/zoom.
+  // Responses can arrive out of order, so only the latest request's
+  // data is shown.
+  const downsampleRequestId = useRef(0);
+  const debouncedDownsampleHandler = useMemo(
+    () =>
+      debounce(async (signalValue: unknown) => {
+        const requestId = ++downsampleRequestId.current;
+        const isStale = () => requestId !== downsampleRequestId.current;
+        const view = vegaView.current;
+        const datasetName = getDatasetName(specMemo);
+        if (!downsample || !get_downsampled_data || !view || !datasetName) {
+          return;
+        }
+        const range = convertDatetimeToEpochMilliseconds(
+          (signalValue as Record<string, unknown> | null)?.[downsample.field],
+        );
+        const xRange =
+          Array.isArray(range) &&
+          range.length === 2 &&
+          range.every((v) => typeof v === "number")
+            ? (range as [number, number])
+            : null;
+        try {
+          const { url, format } = await get_downsampled_data({
+            x_range: xRange,
+          });
+          if (isStale()) {
+            return;
+          }
+          const data = await vegaLoadData(
+            asRemoteURL(url).href,
+            format as Parameters<typeof vegaLoadData>[1],
+          );
+          if (isStale()) {
+            return;
+          }
+          view.data(datasetName, data);
+          await view.runAsync();
+        } catch (error) {
+          Logger.error("Failed to load downsampled data", error);
+        }
+      }, 200),
+    [downsample, get_downsampled_data, specMemo],
+  );
+
   const namesMemo = useDeepCompareMemoize(names);
   const signalListeners = useMemo(
     () =>
       namesMemo.reduce<SignalListener[]>((acc, name) => {
-        // pan/zoom does not count towards selection
+        // pan/zoom does not count towards selection,
+        // but reloads downsampled data
         if (ParamNames.PAN_ZOOM === name) {
+          if (downsample) {
+            acc.push({
+              signalName: name,
+              handler: (_signalName, signalValue) =>
+                debouncedDownsampleHandler(signalValue),
+            });
+          }
           return acc;
         }
 
@@ -187,7 +262,12 @@ const LoadedVegaComponent = ({
 
         return acc;
       }, []),
-    [namesMemo, debouncedSignalHandler],
+    [
+      namesMemo,
+      debouncedSignalHandler,
+      debouncedDownsampleHandler,
+      downsample,
+    ],
   );
 
   const handleError = useEvent((error) => {
@@ -315,6 +395,16 @@ const LoadedVegaComponent = ({
   );
 };
 
+/**
+ * The name of the top-level dataset, as resolved by `resolveVegaSpecData`
+ */
+function getDatasetName(spec: VegaLiteSpec): string | undefined {
+  if ("data" in spec && spec.data && "name" in spec.data) {
+    return spec.data.name;
+  }
+  return undefined;
+}
+
 /**
  * Convert any sets to a list before passing to the BE
  */
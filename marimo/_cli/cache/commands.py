@@ -0,0 +1,143 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+from typing import Any, Optional
+
+import click
+
+from marimo._cli.help_formatter import ColoredCommand, ColoredGroup
+from marimo._cli.print import echo, green, muted
+
+_SIZE_UNITS = {
+    "": 1,
+    "B": 1,
+    "KB": 1024,
+    "MB": 1024**2,
+    "GB": 1024**3,
+    "TB": 1024**4,
+}
+_AGE_UNITS = {
+    "": 1,
+    "s": 1,
+    "m": 60,
+    "h": 60 * 60,
+    "d": 24 * 60 * 60,
+    "w": 7 * 24 * 60 * 60,
+}
+
+
+def _parse_size(ctx: Any, param: Any, value: Optional[str]) -> Optional[int]:
+    del ctx
+    del param
+    if value is None:
+        return None
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([a-zA-Z]*)\s*", value)
+    unit = match.group(2).upper() if match else ""
+    if match is None or unit not in _SIZE_UNITS:
+        raise click.BadParameter(
+            "Must be a size such as 500MB or 10GB (units: B, KB, MB, GB, TB)"
+        )
+    return int(float(match.group(1)) * _SIZE_UNITS[unit])
+
+
+def _parse_age(ctx: Any, param: Any, value: Optional[str]) -> Optional[float]:
+    del ctx
+    del param
+    if value is None:
+        return None
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([a-zA-Z]*)\s*", value)
+    unit = match.group(2).lower() if match else ""
+    if match is None or unit not in _AGE_UNITS:
+        raise click.BadParameter(
+            "Must be a duration such as 12h or 7d (units: s, m, h, d, w)"
+        )
+    return float(match.group(1)) * _AGE_UNITS[unit]
+
+
+def _find_cache_dirs(path: Path) -> list[Path]:
+    """Find the marimo cache directories in and below `path`."""
+    if path.name == "cache" and path.parent.name == "__marimo__":
+        return [path]
+    found: list[Path] = []
+    for dirpath, dirnames, _ in os.walk(path):
+        if Path(dirpath).name == "__marimo__" and "cache" in dirnames:
+            found.append(Path(dirpath) / "cache")
+            dirnames.remove("cache")
+        # Skip hidden directories, such as .git and virtual environments
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+    return found
+
+
+def _format_size(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size:.0f} B"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+@click.group(
+    cls=ColoredGroup,
+    help="""Manage the caches saved by mo.persistent_cache.""",
+)
+def cache() -> None:
+    pass
+
+
+@click.command(
+    cls=ColoredCommand,
+    help="""Remove old caches from marimo cache directories.
+
+Caches are removed if they haven't been used for longer than --max-age;
+then the least recently used caches are removed until each cache
+directory is smaller than --max-size.
+
+PATH is a __marimo__/cache directory, or a directory to search for them.
+Defaults to the current directory.
+
+Example usage:
+
+    marimo cache gc --max-size 10GB --max-age 30d
+""",
+)
+@click.argument(
+    "path",
+    required=False,
+    default=".",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+)
+@click.option(
+    "--max-size",
+    default=None,
+    callback=_parse_size,
+    help="Maximum size of each cache directory, e.g. 10GB.",
+)
+@click.option(
+    "--max-age",
+    default=None,
+    callback=_parse_age,
+    help="Remove caches not used for this long, e.g. 30d.",
+)
+def gc(path: Path, max_size: Optional[int], max_age: Optional[float]) -> None:
+    from marimo._save.stores.file_index import CacheIndex
+
+    cache_dirs = _find_cache_dirs(path)
+    if not cache_dirs:
+        echo(muted(f"No marimo cache directories found in {path}"))
+        return
+
+    for cache_dir in cache_dirs:
+        index = CacheIndex(cache_dir)
+        result = index.collect(max_bytes=max_size, max_age=max_age)
+        index.remove_stale_temp_files()
+        echo(
+            f"{green(str(cache_dir))}: removed {result.removed} "
+            f"({_format_size(result.freed_bytes)}), "
+            f"{_format_size(result.total_bytes)} remaining"
+        )
+
+
+cache.add_command(gc)
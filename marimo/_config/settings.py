@@ -21,6 +21,32 @@ class GlobalSettings:
     IN_SECURE_ENVIRONMENT: bool = os.getenv(
         "MARIMO_IN_SECURE_ENVIRONMENT", "false"
     ) in ("true", "1")
+    # Number of pre-started kernel processes kept for edit-mode sessions
+    KERNEL_POOL_SIZE: int = int(os.getenv("MARIMO_KERNEL_POOL_SIZE", "0"))
+    # Modules imported by pooled kernels while they wait for a session
+    KERNEL_POOL_PRELOAD: tuple[str, ...] = tuple(
+        module.strip()
+        for module in os.getenv(
+            "MARIMO_KERNEL_POOL_PRELOAD", "numpy,pandas"
+        ).split(",")
+        if module.strip()
+    )
+    # Console outputs kept per cell for replay and export, in characters
+    # and lines (0 for no limit); older outputs are truncated
+    CONSOLE_MAX_SIZE: int | None = (
+        int(os.getenv("MARIMO_CONSOLE_MAX_SIZE", "10000000")) or None
+    )
+    CONSOLE_MAX_LINES: int | None = (
+        int(os.getenv("MARIMO_CONSOLE_MAX_LINES", "0")) or None
+    )
+    # Fork run-mode kernels from a process that has run the setup cell.
+    # Resources the setup cell opens (files, sockets, database connections,
+    # HTTP clients) are shared by every session's kernel, so setup cells
+    # should only load data and import modules.
+    RUN_FORK_SERVER: bool = os.getenv("MARIMO_RUN_FORK_SERVER", "false") in (
+        "true",
+        "1",
+    )
 
 
 GLOBAL_SETTINGS = GlobalSettings()
@@ -19,9 +19,12 @@ if TYPE_CHECKING:
     from marimo._plugins.core.web_component import JSONType
     from marimo._plugins.ui._core.ui_element import UIElement
     from marimo._plugins.ui._impl.batch import batch as batch_plugin
+    from marimo._runtime.virtual_file import VirtualFileRegistryItem
 
 
-def _hypertext_cleanup(virtual_filenames: list[str]) -> None:
+def _hypertext_cleanup(
+    virtual_files: list[tuple[str, VirtualFileRegistryItem]],
+) -> None:
     """Cleanup side-effects related to initialization of Html."""
     from marimo._runtime.context import (
         ContextNotInitializedError,
@@ -34,8 +37,8 @@ def _hypertext_cleanup(virtual_filenames: list[str]) -> None:
         return
 
     if ctx is not None and ctx.virtual_files_supported:
-        for f in virtual_filenames:
-            ctx.virtual_file_registry.dereference(f)
+        for filename, item in virtual_files:
+            ctx.virtual_file_registry.dereference(filename, item)
 
 
 @mddoc
@@ -101,6 +104,8 @@ class Html(MIME):
 
         # A list of the virtual file names referenced by this HTML element.
         self._virtual_filenames: list[str] = []
+        # The registry items of the referenced virtual files
+        virtual_files: list[tuple[str, VirtualFileRegistryItem]] = []
 
         from marimo._runtime.context import (
             ContextNotInitializedError,
@@ -123,13 +128,13 @@ class Html(MIME):
         flat_text = flatten_string(self._text)
         for virtual_filename in ctx.virtual_file_registry.filenames():
             if virtual_filename in flat_text:
-                ctx.virtual_file_registry.reference(virtual_filename)
+                item = ctx.virtual_file_registry.reference(virtual_filename)
+                if item is not None:
+                    virtual_files.append((virtual_filename, item))
                 self._virtual_filenames.append(virtual_filename)
 
         # Dereference virtual files on object destruction
-        finalizer = weakref.finalize(
-            self, _hypertext_cleanup, self._virtual_filenames
-        )
+        finalizer = weakref.finalize(self, _hypertext_cleanup, virtual_files)
         finalizer.atexit = False
 
     @property
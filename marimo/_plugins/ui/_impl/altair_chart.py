@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import datetime
 import sys
+from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -29,6 +30,8 @@ from marimo._plugins.ui._impl.charts.altair_transformer import (
     register_transformers,
     sanitize_nan_infs,
 )
+from marimo._plugins.ui._impl.charts.downsample import downsample
+from marimo._runtime.functions import Function
 from marimo._utils import flatten
 from marimo._utils.narwhals_utils import (
     assert_can_narwhalify,
@@ -464,6 +467,99 @@ def _has_transforms(spec: VegaSpec) -> bool:
     return "transform" in spec and len(spec["transform"]) > 0
 
 
+# Marks whose selections are made on their x/y (or color) fields,
+# so they apply to the original rows of downsampled data
+_DOWNSAMPLE_MARKS = {"line", "point", "circle", "square", "area"}
+# Channels that split the data into separately drawn series
+_SERIES_CHANNELS = ("color", "detail", "strokeDash", "shape")
+
+
+@dataclass
+class _DownsampleFields:
+    x: str
+    y: str
+    group_by: list[str]
+
+
+def _get_downsample_fields(
+    chart: AltairChartType,
+) -> Optional[_DownsampleFields]:
+    """The fields to downsample a chart by.
+
+    Only single (not layered or concatenated) line, area and scatter charts
+    of raw x/y fields can be downsampled; returns None for other charts.
+    """
+    import altair as alt
+
+    if not isinstance(chart, alt.Chart):
+        return None
+    if not can_narwhalify(chart.data, eager_only=True):
+        return None
+
+    # Resolve the encoding (e.g. shorthands and inferred types)
+    # without serializing the data
+    data = nw.from_native(chart.data, eager_only=True)
+    probe = chart.copy(deep=False)
+    probe.data = data.head(0).to_native()
+    try:
+        with alt.data_transformers.enable("default"):
+            spec = probe.to_dict(validate=False)
+    except Exception as e:
+        LOGGER.debug(f"Failed to resolve chart encoding: {e}")
+        return None
+
+    mark = spec.get("mark")
+    mark_type = mark.get("type") if isinstance(mark, dict) else mark
+    if mark_type not in _DOWNSAMPLE_MARKS or _has_transforms(spec):
+        return None
+
+    encoding: dict[str, Any] = spec.get("encoding", {})
+    if any(channel in encoding for channel in ("row", "column", "facet")):
+        return None
+    x, y = encoding.get("x"), encoding.get("y")
+    if not isinstance(x, dict) or not isinstance(y, dict):
+        return None
+    for channel in (x, y):
+        if channel.get("field") not in data.columns or any(
+            k in channel for k in ("aggregate", "bin", "timeUnit")
+        ):
+            return None
+    if x.get("type") not in ("quantitative", "temporal"):
+        return None
+    if y.get("type") != "quantitative":
+        return None
+
+    group_by: list[str] = []
+    for name in _SERIES_CHANNELS:
+        channel = encoding.get(name)
+        if (
+            isinstance(channel, dict)
+            and channel.get("field") in data.columns
+            and channel.get("type") in ("nominal", "ordinal")
+        ):
+            group_by.append(channel["field"])
+    return _DownsampleFields(x=x["field"], y=y["field"], group_by=group_by)
+
+
+def _with_data(chart: AltairChartType, data: Any) -> AltairChartType:
+    chart = chart.copy(deep=False)
+    chart.data = data
+    return chart
+
+
+@dataclass
+class GetDownsampledDataArgs:
+    # The visible range of the x-axis; temporal values
+    # are in milliseconds since the epoch
+    x_range: Optional[list[float]] = None
+
+
+@dataclass
+class GetDownsampledDataResponse:
+    url: str
+    format: dict[str, Any]
+
+
 @mddoc
 class altair_chart(UIElement[ChartSelection, ChartDataType]):
     """Make reactive charts with Altair.
@@ -516,6 +612,12 @@ class altair_chart(UIElement[ChartSelection, ChartDataType]):
         label (str, optional): Markdown label for the element. Defaults to "".
         on_change (Optional[Callable[[ChartDataType], None]], optional): Optional
             callback to run when this element's value changes. Defaults to None.
+        max_points (Optional[int], optional): Draw at most this many points of
+            a line, area, or scatter chart, picked with the
+            Largest-Triangle-Three-Buckets algorithm so the chart keeps its
+            shape. When zoomed in, the visible range is redrawn from the full
+            data. Selections always apply to all rows of the data.
+            Defaults to None, which draws every point.
     """
 
     name: Final[str] = "marimo-vega"
@@ -528,6 +630,7 @@ class altair_chart(UIElement[ChartSelection, ChartDataType]):
         *,
         label: str = "",
         on_change: Optional[Callable[[ChartDataType], None]] = None,
+        max_points: Optional[int] = None,
     ) -> None:
         DependencyManager.altair.require(why="to use `mo.ui.altair_chart`")
 
@@ -564,14 +667,32 @@ class altair_chart(UIElement[ChartSelection, ChartDataType]):
             if chart.autosize is alt.Undefined:
                 chart.autosize = "fit-x"
 
+        # Only send a downsampled copy of the data to the frontend;
+        # selections are still applied to the full data
+        self._max_points = max_points
+        self._downsample_fields: Optional[_DownsampleFields] = None
+        display_chart, fallback_chart = chart, original_chart
+        if max_points is not None:
+            self._downsample_fields = _get_downsample_fields(chart)
+            if self._downsample_fields is None:
+                sys.stderr.write(
+                    "Warning: max_points is only supported for single line, "
+                    "area, and scatter charts of x and y fields. "
+                    "Drawing all points.\n"
+                )
+            else:
+                data = self._downsample()
+                display_chart = _with_data(chart, data)
+                fallback_chart = _with_data(original_chart, data)
+
         try:
-            vega_spec = _parse_spec(chart)
+            vega_spec = _parse_spec(display_chart)
         except Exception:
             # Sometimes the changes to width and autosize (above) can cause `.to_dict()` to throw an error
             # similarly to the issue described in https://github.com/marimo-team/marimo/issues/6244
             # so we fallback to the original chart.
             LOGGER.info("Failed to parse spec, using original chart")
-            vega_spec = _parse_spec(original_chart)
+            vega_spec = _parse_spec(fallback_chart)
 
         if label:
             vega_spec["title"] = label
@@ -651,8 +772,54 @@ class altair_chart(UIElement[ChartSelection, ChartDataType]):
                 "chart-selection": chart_selection,
                 "field-selection": legend_selection,
                 "embed-options": embed_options,
+                "downsample": (
+                    {"field": self._downsample_fields.x}
+                    if self._downsample_fields is not None
+                    else None
+                ),
             },
             on_change=on_change,
+            functions=(
+                Function(
+                    name="get_downsampled_data",
+                    arg_cls=GetDownsampledDataArgs,
+                    function=self._get_downsampled_data,
+                ),
+            ),
+        )
+
+    def _downsample(
+        self, x_range: Optional[tuple[float, float]] = None
+    ) -> ChartDataType:
+        assert self._downsample_fields is not None
+        assert self._max_points is not None
+        fields = self._downsample_fields
+        data, _ = downsample(
+            self._chart.data,
+            x=fields.x,
+            y=fields.y,
+            max_points=self._max_points,
+            group_by=fields.group_by,
+            x_range=x_range,
+        )
+        return data
+
+    def _get_downsampled_data(
+        self, args: GetDownsampledDataArgs
+    ) -> GetDownsampledDataResponse:
+        import altair as alt
+
+        if self._downsample_fields is None:
+            raise ValueError("This chart is not downsampled")
+        x_range = None
+        if args.x_range is not None and len(args.x_range) == 2:
+            x_range = (float(args.x_range[0]), float(args.x_range[1]))
+        data = self._downsample(x_range)
+        # Serialized like the chart's data in `_parse_spec`
+        with alt.data_transformers.enable("marimo_arrow"):
+            result = alt.data_transformers.get()(data)
+        return GetDownsampledDataResponse(
+            url=result["url"], format=dict(result["format"])
         )
 
     # Override _mime_ to return an Altair spec in non-JS environments
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import base64
-from typing import Any, Literal, TypedDict, Union
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypedDict, Union
 
 import narwhals.stable.v2 as nw
 from narwhals.typing import IntoDataFrame
@@ -10,6 +10,10 @@ from narwhals.typing import IntoDataFrame
 import marimo._output.data.data as mo_data
 from marimo import _loggers
 from marimo._dependencies.dependencies import DependencyManager
+from marimo._plugins.ui._impl.charts.downsample import (
+    DownsampleMethod,
+    downsample,
+)
 from marimo._plugins.ui._impl.tables.utils import (
     get_table_manager,
     get_table_manager_or_none,
@@ -20,6 +24,9 @@ from marimo._utils.narwhals_utils import (
     make_lazy,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 LOGGER = _loggers.marimo_logger()
 
 Data = Union[dict[Any, Any], IntoDataFrame, nw.DataFrame[Any]]
@@ -48,7 +55,7 @@ def _to_marimo_json(data: Data, **kwargs: Any) -> _TransformResult:
     Custom implementation of altair.utils.data.to_json that
     returns a VirtualFile URL instead of writing to disk.
     """
-    del kwargs
+    data = _maybe_downsample(data, **kwargs)
     data_json = _data_to_json_string(data)
     virtual_file = mo_data.json(data_json.encode("utf-8"))
     return {"url": virtual_file.url, "format": {"type": "json"}}
@@ -59,7 +66,7 @@ def _to_marimo_csv(data: Data, **kwargs: Any) -> _TransformResult:
     Custom implementation of altair.utils.data.to_csv that
     returns a VirtualFile URL instead of writing to disk.
     """
-    del kwargs
+    data = _maybe_downsample(data, **kwargs)
     data_csv = _data_to_csv_string(data)
     virtual_file = mo_data.csv(data_csv.encode("utf-8"))
     return {"url": virtual_file.url, "format": {"type": "csv"}}
@@ -69,7 +76,7 @@ def _to_marimo_arrow(data: Data, **kwargs: Any) -> _TransformResult:
     """
     Convert data to arrow format, falls back to CSV if not possible.
     """
-    del kwargs
+    data = _maybe_downsample(data, **kwargs)
     data = _maybe_sanitize_dataframe(data)
     try:
         data_arrow = get_table_manager(data).to_arrow_ipc()
@@ -89,7 +96,7 @@ def _to_marimo_inline_csv(data: Data, **kwargs: Any) -> _TransformResult:
     Custom implementation of altair.utils.data.to_csv that
     inlines the CSV data in the URL.
     """
-    del kwargs
+    data = _maybe_downsample(data, **kwargs)
     data_csv = _data_to_csv_string(data)
     url = build_data_url(
         mimetype="text/csv",
@@ -98,6 +105,42 @@ def _to_marimo_inline_csv(data: Data, **kwargs: Any) -> _TransformResult:
     return {"url": url, "format": {"type": "csv"}}
 
 
+def _maybe_downsample(
+    data: Data,
+    *,
+    max_points: Optional[int] = None,
+    x: Optional[str] = None,
+    y: Optional[str] = None,
+    method: DownsampleMethod = "lttb",
+    group_by: Sequence[str] = (),
+    **kwargs: Any,
+) -> Data:
+    """Downsample line/scatter data when enabled in the transformer options.
+
+    Downsampling is opt-in, e.g.
+    `alt.data_transformers.enable("marimo_arrow", max_points=5000, x="date",
+    y="price")`.
+    """
+    del kwargs
+    if max_points is None or x is None or y is None:
+        return data
+    if not can_narwhalify(data, eager_only=True):
+        return data
+    try:
+        downsampled, _ = downsample(
+            data,  # type: ignore[arg-type]
+            x=x,
+            y=y,
+            max_points=max_points,
+            method=method,
+            group_by=group_by,
+        )
+    except Exception as e:
+        LOGGER.warning(f"Failed to downsample chart data: {e}")
+        return data
+    return downsampled
+
+
 # Copied from https://github.com/altair-viz/altair/blob/0ca83784e2455f2b84d0f6d789af2abbe8814348/altair/utils/data.py#L263C1-L288C10
 def _data_to_json_string(data: _DataType) -> str:
     """Return a JSON string representation of the input data"""
@@ -0,0 +1,246 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Downsampling of line and scatter chart data.
+
+Large charts are drawn from a subset of their rows, chosen to preserve
+the visual shape of each series:
+
+- `lttb`: Largest-Triangle-Three-Buckets, which keeps the point of each
+  bucket that forms the largest triangle with its neighbours.
+- `minmax`: the minimum and maximum point of each bucket, which keeps
+  every peak and trough.
+
+The selected rows are returned as-is (not aggregated), so they can be
+mapped back to the rows of the original data.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Literal, Optional
+
+import narwhals.stable.v2 as nw
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy as np
+    import numpy.typing as npt
+    from narwhals.typing import IntoDataFrame
+
+DownsampleMethod = Literal["lttb", "minmax"]
+
+# LTTB always keeps the first and last point, plus one point per bucket
+MIN_POINTS = 3
+
+
+def lttb_indices(
+    x: npt.NDArray[np.float64], y: npt.NDArray[np.float64], n_out: int
+) -> npt.NDArray[np.intp]:
+    """Indices of the points kept by Largest-Triangle-Three-Buckets.
+
+    `x` must be sorted in ascending order and neither `x` nor `y` may
+    contain NaNs.
+    """
+    import numpy as np
+
+    n = len(x)
+    if n_out >= n or n_out < MIN_POINTS:
+        return np.arange(n, dtype=np.intp)
+
+    # The first and last point are always kept; the rest are split into
+    # `n_out - 2` buckets of (almost) equal size
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    starts, ends = edges[:-1], edges[1:]
+
+    # The average point of each bucket, from cumulative sums
+    cum_x = np.concatenate(([0.0], np.cumsum(x)))
+    cum_y = np.concatenate(([0.0], np.cumsum(y)))
+    counts = ends - starts
+    avg_x = (cum_x[ends] - cum_x[starts]) / counts
+    avg_y = (cum_y[ends] - cum_y[starts]) / counts
+    # Each bucket is compared against the average of the next bucket;
+    # the last bucket is compared against the last point
+    next_x = np.append(avg_x[1:], x[-1])
+    next_y = np.append(avg_y[1:], y[-1])
+
+    out = np.empty(n_out, dtype=np.intp)
+    out[0] = 0
+    out[-1] = n - 1
+    selected = 0
+    # Each bucket depends on the point selected in the previous bucket,
+    # so only the work within a bucket is vectorized
+    for i in range(n_out - 2):
+        start, end = starts[i], ends[i]
+        a_x, a_y = x[selected], y[selected]
+        # Twice the area of the triangle (a, candidate, next average)
+        areas = np.abs(
+            (a_x - next_x[i]) * (y[start:end] - a_y)
+            - (a_x - x[start:end]) * (next_y[i] - a_y)
+        )
+        selected = start + int(np.argmax(areas))
+        out[i + 1] = selected
+    return out
+
+
+def minmax_indices(
+    y: npt.NDArray[np.float64], n_out: int
+) -> npt.NDArray[np.intp]:
+    """Indices of the first, last, minimum and maximum point of each bucket.
+
+    The points are split into `(n_out - 2) // 2` buckets of equal size;
+    `y` may not contain NaNs.
+    """
+    import numpy as np
+
+    n = len(y)
+    if n_out >= n or n_out < MIN_POINTS:
+        return np.arange(n, dtype=np.intp)
+
+    n_buckets = max((n_out - 2) // 2, 1)
+    size = -(-n // n_buckets)
+    n_buckets = -(-n // size)
+    # Pad the last bucket with NaNs, which nanargmin/nanargmax skip
+    padded = np.full(n_buckets * size, np.nan)
+    padded[:n] = y
+    buckets = padded.reshape(n_buckets, size)
+    offsets = np.arange(n_buckets, dtype=np.intp) * size
+    indices = np.concatenate(
+        (
+            [0, n - 1],
+            offsets + np.nanargmin(buckets, axis=1),
+            offsets + np.nanargmax(buckets, axis=1),
+        )
+    )
+    return np.unique(indices)
+
+
+def _to_float_array(series: nw.Series[Any]) -> npt.NDArray[np.float64]:
+    """Convert a numeric or temporal column to floats, with nulls as NaN.
+
+    Temporal columns are converted to milliseconds since the epoch, which
+    is how Vega represents them.
+    """
+    import numpy as np
+
+    dtype = series.dtype
+    if dtype == nw.Date:
+        series = series.cast(nw.Datetime("ms"))
+    if series.dtype.is_temporal():
+        series = series.dt.timestamp("ms")
+    values = series.cast(nw.Float64).fill_null(float("nan")).to_numpy()
+    return np.asarray(values, dtype=np.float64)
+
+
+def _group_codes(
+    df: nw.DataFrame[Any], columns: Sequence[str]
+) -> npt.NDArray[np.intp]:
+    """An integer code per row, identifying its group."""
+    import numpy as np
+
+    codes = np.zeros(len(df), dtype=np.intp)
+    for column in columns:
+        values = df[column].cast(nw.String).fill_null("").to_numpy()
+        _, inverse = np.unique(values.astype(str), return_inverse=True)
+        codes = codes * (int(inverse.max(initial=0)) + 1) + inverse
+    return np.unique(codes, return_inverse=True)[1].reshape(-1)
+
+
+def downsample_indices(
+    x: npt.NDArray[np.float64],
+    y: npt.NDArray[np.float64],
+    max_points: int,
+    *,
+    method: DownsampleMethod = "lttb",
+    x_range: Optional[tuple[float, float]] = None,
+) -> npt.NDArray[np.intp]:
+    """Indices of at most `max_points` rows that preserve the series' shape.
+
+    Rows with a missing `x` or `y` are dropped, and the series is sorted by
+    `x`. When `x_range` is given, only rows within it (and their direct
+    neighbours, so lines run to the edges) are kept.
+
+    Returns:
+        The selected indices, in ascending order.
+    """
+    import numpy as np
+
+    order = np.flatnonzero(~(np.isnan(x) | np.isnan(y)))
+    order = order[np.argsort(x[order], kind="stable")]
+    if x_range is not None:
+        sorted_x = x[order]
+        start = max(int(np.searchsorted(sorted_x, x_range[0], "left")) - 1, 0)
+        end = int(np.searchsorted(sorted_x, x_range[1], "right")) + 1
+        order = order[start:end]
+
+    if method == "lttb":
+        selected = lttb_indices(x[order], y[order], max_points)
+    elif method == "minmax":
+        selected = minmax_indices(y[order], max_points)
+    else:
+        raise ValueError(
+            f"Unknown downsampling method: {method}. "
+            "Expected 'lttb' or 'minmax'."
+        )
+    return np.sort(order[selected])
+
+
+def downsample(
+    data: IntoDataFrame,
+    *,
+    x: str,
+    y: str,
+    max_points: int,
+    method: DownsampleMethod = "lttb",
+    group_by: Sequence[str] = (),
+    x_range: Optional[tuple[float, float]] = None,
+) -> tuple[IntoDataFrame, Optional[npt.NDArray[np.intp]]]:
+    """Downsample a dataframe to at most `max_points` rows.
+
+    Each group of `group_by` (e.g. the series drawn in one color) is
+    downsampled on its own, and gets an equal share of the points.
+
+    Args:
+        data: The dataframe to downsample.
+        x: The column on the x-axis; numeric or temporal.
+        y: The column on the y-axis; numeric.
+        max_points: The maximum number of rows to keep.
+        method: "lttb" or "minmax".
+        group_by: Columns identifying the series in the chart.
+        x_range: Only keep rows with `x` in this range, e.g. the zoomed
+            in domain. Temporal bounds are in milliseconds since the epoch.
+
+    Returns:
+        The downsampled dataframe and the indices of its rows in `data`,
+        or `data` and `None` if it was small enough already.
+    """
+    import numpy as np
+
+    df = nw.from_native(data, eager_only=True)
+    if len(df) <= max_points and x_range is None:
+        return data, None
+
+    xs = _to_float_array(df[x])
+    ys = _to_float_array(df[y])
+    if not group_by:
+        rows = downsample_indices(
+            xs, ys, max_points, method=method, x_range=x_range
+        )
+    else:
+        codes = _group_codes(df, group_by)
+        n_groups = int(codes.max(initial=-1)) + 1
+        points_per_group = max(max_points // max(n_groups, 1), MIN_POINTS)
+        parts: list[npt.NDArray[np.intp]] = []
+        for group in range(n_groups):
+            members = np.flatnonzero(codes == group)
+            selected = downsample_indices(
+                xs[members],
+                ys[members],
+                points_per_group,
+                method=method,
+                x_range=x_range,
+            )
+            parts.append(members[selected])
+        rows = np.sort(np.concatenate(parts)) if parts else np.arange(0)
+
+    if x_range is None and len(rows) == len(df):
+        return data, None
+    return df[rows.tolist()].to_native(), rows
@@ -1,7 +1,10 @@
 # Copyright 2026 Marimo. All rights reserved.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, TypeVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, TypeVar
+
+import narwhals.stable.v2 as nw
 
 from marimo._plugins.ui._impl.dataframes.transforms.handlers import (
     NarwhalsTransformHandler,
@@ -16,13 +19,16 @@ from marimo._plugins.ui._impl.dataframes.transforms.types import (
 from marimo._plugins.ui._impl.tables.table_manager import FieldTypes
 from marimo._plugins.ui._impl.tables.utils import get_table_manager
 from marimo._utils.assert_never import assert_never
-from marimo._utils.narwhals_utils import can_narwhalify, make_lazy
+from marimo._utils.narwhals_utils import (
+    can_narwhalify,
+    collect_and_preserve_type,
+    make_lazy,
+)
 
 T = TypeVar("T")
 
 
 if TYPE_CHECKING:
-    import narwhals.stable.v2 as nw
     from narwhals.typing import IntoLazyFrame
 
 
@@ -102,23 +108,71 @@ def get_handler_for_dataframe(
     return NarwhalsTransformHandler()
 
 
+# Transformations whose results are costly to recompute and usually much
+# smaller than their inputs; on lazy backends, their results are collected.
+_MATERIALIZED_TRANSFORMS = frozenset(
+    {
+        TransformType.GROUP_BY,
+        TransformType.AGGREGATE,
+        TransformType.PIVOT,
+        TransformType.UNIQUE,
+    }
+)
+
+# Memory held by collected results, per container
+MAX_MATERIALIZED_BYTES = 256 * 1024 * 1024
+
+# Rows collected to estimate the size of a result before collecting it
+MATERIALIZE_SAMPLE_ROWS = 1000
+
+
+def _is_lazy_backend(df: nw.LazyFrame[IntoLazyFrame]) -> bool:
+    # Ibis is left lazy so that the generated SQL covers all transforms
+    return df.implementation in (
+        nw.Implementation.POLARS,
+        nw.Implementation.DUCKDB,
+    )
+
+
+@dataclass
+class _Step:
+    """The result of applying a transformation."""
+
+    transform: Transform
+    df: nw.LazyFrame[IntoLazyFrame]
+    field_types: FieldTypes
+    # Size of the collected result, if the step was materialized
+    nbytes: int = 0
+
+
 class TransformsContainer:
     """
-    Keeps internal state of the last transformation applied to the dataframe.
-    So that we can incrementally apply transformations.
+    Keeps the result of each transformation applied to the dataframe,
+    so that changing a transformation only recomputes it and the ones
+    after it.
+
+    On lazy backends, the results of expensive transformations (such as
+    group by) are collected, so that later steps and page requests don't
+    re-execute the whole plan. Collected results are kept up to
+    `max_materialized_bytes`.
     """
 
     def __init__(
         self,
         df: nw.LazyFrame[IntoLazyFrame],
         handler: NarwhalsTransformHandler,
+        max_materialized_bytes: int = MAX_MATERIALIZED_BYTES,
     ) -> None:
         self._original_df = df
         # The dataframe for the given transform.
         self._snapshot_df = df
         self._handler = handler
-        self._transforms: list[Transform] = []
-        self._field_types_cache: list[FieldTypes] = []
+        self._max_materialized_bytes = max_materialized_bytes
+        self._materialized_bytes = 0
+        self._original_field_types: Optional[FieldTypes] = None
+        # Steps of the most recent transformations; kept when a prefix of
+        # them is applied, so that steps removed and added back are reused
+        self._steps: list[_Step] = []
 
     def apply(
         self, transform: Transformations
@@ -130,61 +184,86 @@ class TransformsContainer:
             Tuple of (final_dataframe, field_types_per_step).
             field_types_per_step[0] = original, field_types_per_step[N] = after N transforms.
         """
-        # If the new transformations are a superset of the existing ones,
-        # then we can just apply the new ones to the snapshot dataframe.
-        if self._is_superset(transform):
-            transforms_to_apply = self._get_next_transformations(transform)
-            df = self._snapshot_df
-            field_types = list(self._field_types_cache)
-
-            for t in transforms_to_apply.transforms:
-                df = _handle(df, self._handler, t)
-                field_types.append(get_table_manager(df).get_field_types())
-
-            self._snapshot_df = df
-        else:
-            field_types = [
-                get_table_manager(self._original_df).get_field_types()
-            ]
-            df = self._original_df
-
-            for t in transform.transforms:
-                df = _handle(df, self._handler, t)
-                field_types.append(get_table_manager(df).get_field_types())
-
-            self._snapshot_df = df
-
-        self._transforms = transform.transforms
-        self._field_types_cache = field_types
+        transforms = transform.transforms
+        start = self._common_prefix_length(transform)
+        if start < len(transforms):
+            for step in self._steps[start:]:
+                self._materialized_bytes -= step.nbytes
+            del self._steps[start:]
+            for t in transforms[start:]:
+                df = self._steps[-1].df if self._steps else self._original_df
+                self._steps.append(self._run(df, t))
+
+        steps = self._steps[: len(transforms)]
+        if self._original_field_types is None:
+            self._original_field_types = get_table_manager(
+                self._original_df
+            ).get_field_types()
+        field_types = [self._original_field_types]
+        field_types.extend(step.field_types for step in steps)
+
+        df = steps[-1].df if steps else self._original_df
+        self._snapshot_df = df
         return df, field_types
 
-    def _is_superset(self, transforms: Transformations) -> bool:
+    def _common_prefix_length(self, transforms: Transformations) -> int:
         """
-        Checks if the new transformations are a superset of the existing ones.
+        Number of leading transformations whose results are already kept.
         """
-        if not self._transforms:
-            return False
-
-        # If the new transformations are smaller than the existing ones,
-        # then it's not a superset.
-        if len(self._transforms) > len(transforms.transforms):
-            return False
-
-        for i, transform in enumerate(self._transforms):
-            if transform != transforms.transforms[i]:
-                return False
-
-        return True
+        length = 0
+        for step, transform in zip(self._steps, transforms.transforms):
+            if step.transform != transform:
+                break
+            length += 1
+        return length
+
+    def _run(
+        self, df: nw.LazyFrame[IntoLazyFrame], transform: Transform
+    ) -> _Step:
+        df = _handle(df, self._handler, transform)
+        nbytes = 0
+        if transform.type in _MATERIALIZED_TRANSFORMS and _is_lazy_backend(df):
+            df, nbytes = self._materialize(df)
+        return _Step(
+            transform=transform,
+            df=df,
+            field_types=get_table_manager(df).get_field_types(),
+            nbytes=nbytes,
+        )
 
-    def _get_next_transformations(
-        self, transforms: Transformations
-    ) -> Transformations:
+    def _materialize(
+        self, df: nw.LazyFrame[IntoLazyFrame]
+    ) -> tuple[nw.LazyFrame[IntoLazyFrame], int]:
         """
-        Gets the next transformations to apply.
+        Collects the dataframe, if the result fits in the memory budget.
+
+        A result larger than the budget is never collected in full: the
+        size of a row is estimated from a sample, and at most one row more
+        than fits in the remaining budget is collected.
         """
-        if self._is_superset(transforms):
-            return Transformations(
-                transforms.transforms[len(self._transforms) :]
-            )
-        else:
-            return transforms
+        remaining = self._max_materialized_bytes - self._materialized_bytes
+        if remaining <= 0:
+            return df, 0
+        collected, undo = collect_and_preserve_type(
+            df.head(MATERIALIZE_SAMPLE_ROWS)
+        )
+        try:
+            nbytes = int(collected.estimated_size())
+            if nbytes > remaining:
+                return df, 0
+            if len(collected) == MATERIALIZE_SAMPLE_ROWS:
+                # The sample may not be the whole result
+                row_bytes = max(nbytes // MATERIALIZE_SAMPLE_ROWS, 1)
+                max_rows = remaining // row_bytes
+                collected, undo = collect_and_preserve_type(
+                    df.head(max_rows + 1)
+                )
+                if len(collected) > max_rows:
+                    return df, 0
+                nbytes = int(collected.estimated_size())
+        except Exception:
+            return df, 0
+        if nbytes > remaining:
+            return df, 0
+        self._materialized_bytes += nbytes
+        return undo(collected), nbytes
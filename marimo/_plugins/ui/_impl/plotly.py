@@ -14,6 +14,7 @@ from typing import (
 from marimo import _loggers
 from marimo._dependencies.dependencies import DependencyManager
 from marimo._messaging.mimetypes import KnownMimeType
+from marimo._output.formatters.plotly_formatters import encode_typed_arrays
 from marimo._output.hypertext import is_non_interactive
 from marimo._output.rich_help import mddoc
 from marimo._plugins.core.web_component import JSONType
@@ -299,7 +300,7 @@ class plotly(UIElement[PlotlySelection, list[dict[str, Any]]]):
             initial_value=initial_value,
             label=label,
             args={
-                "figure": json.loads(json_str),
+                "figure": encode_typed_arrays(json.loads(json_str)),
                 "config": resolved_config,
             },
             on_change=on_change,
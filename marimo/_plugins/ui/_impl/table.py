@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import functools
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
@@ -14,6 +15,7 @@ from typing import (
     cast,
 )
 
+import narwhals.stable.v2 as nw
 from narwhals.typing import IntoDataFrame
 
 import marimo._output.data.data as mo_data
@@ -37,11 +39,17 @@ from marimo._plugins.ui._impl.dataframes.transforms.types import (
     FilterRowsTransform,
     TransformType,
 )
+from marimo._plugins.ui._impl.tables.query_cache import (
+    QueryKey,
+    TableQueryCache,
+)
+from marimo._plugins.ui._impl.tables.search_index import SearchIndex
 from marimo._plugins.ui._impl.tables.selection import (
     INDEX_COLUMN_NAME,
     add_selection_column,
 )
 from marimo._plugins.ui._impl.tables.table_manager import (
+    CellBlock,
     ColumnName,
     FieldTypes,
     RowId,
@@ -68,6 +76,7 @@ from marimo._runtime.functions import EmptyArgs, Function
 from marimo._utils.hashable import is_hashable
 from marimo._utils.methods import getcallable
 from marimo._utils.narwhals_utils import (
+    can_narwhalify,
     can_narwhalify_lazyframe,
     unwrap_narwhals_dataframe,
 )
@@ -304,6 +313,26 @@ class table(
         table
         ```
 
+        Style a whole page at once, which is faster for large dataframes:
+
+        ```python
+        import polars as pl
+
+
+        def style_page(page: pl.DataFrame):
+            # Return one list of styles (or None) per column.
+            return {
+                "age": [
+                    {"color": "red"} if age > 40 else None
+                    for age in page["age"]
+                ]
+            }
+
+
+        table = mo.ui.table(data=df, style_page=style_page)
+        table
+        ```
+
         Create a table with per-cell hover text (plain text only):
 
         ```python
@@ -364,6 +393,11 @@ class table(
         on_change (Callable[[Union[List[JSONType], Dict[str, List[JSONType]], IntoDataFrame, List[TableCell]]], None], optional):
             Optional callback to run when this element's value changes.
         style_cell (Callable[[str, str, Any], Dict[str, Any]], optional): A function that takes the row id, column name and value and returns a dictionary of CSS styles.
+        style_page (Callable[[Any], Any], optional): A vectorized alternative to
+            `style_cell`. A function that takes the visible page (a dataframe of the
+            same type as the data, or a dict of columns for other data) and returns
+            the styles for the page: a mapping from column name to a list of CSS
+            style dictionaries (or None), one per row, or a dataframe of the same shape.
         hover_template (Union[str, Callable[[str, str, Any], str]], optional):
             Either a string template applied at the row level, or a callable
             that computes plain-text hover titles for individual visible cells.
@@ -375,6 +409,10 @@ class table(
         max_height (int, optional): Maximum height of the table body in pixels. When set,
             the table becomes vertically scrollable and the header will be made sticky
             in the UI to remain visible while scrolling. Defaults to None.
+        search_index (bool, optional): Whether to index the table for faster
+            search. The index is built in the background on the first search
+            and holds a lowercased copy of each row as text, so it is best
+            suited to large dataframes that are searched often. Defaults to False.
         label (str, optional): A descriptive name for the table. Defaults to "".
     """
 
@@ -481,10 +519,12 @@ class table(
             ]
         ] = None,
         style_cell: Optional[Callable[[str, str, Any], dict[str, Any]]] = None,
+        style_page: Optional[Callable[[Any], Any]] = None,
         hover_template: Optional[
             Union[str, Callable[[str, str, Any], str]]
         ] = None,
         max_height: Optional[int] = None,
+        search_index: bool = False,
         # The _internal_* arguments are for overriding and unit tests
         # table should take the value unconditionally
         _internal_column_charts_row_limit: Optional[int] = None,
@@ -516,6 +556,13 @@ class table(
         self._data = data
         # Holds the original data
         self._manager = get_table_manager(data)
+        # Results of filtering, searching and sorting the original data
+        self._query_cache = TableQueryCache()
+        self._search_index: Optional[SearchIndex] = (
+            SearchIndex(self._manager)
+            if search_index and SearchIndex.supports(self._manager)
+            else None
+        )
 
         # Handle max_columns: use config default if not provided, None means "all"
         if max_columns == MAX_COLUMNS_NOT_PROVIDED:
@@ -652,7 +699,12 @@ class table(
             else:
                 pagination = False
 
+        if style_cell is not None and style_page is not None:
+            raise ValueError(
+                "Only one of style_cell and style_page can be provided."
+            )
         self._style_cell = style_cell
+        self._style_page = style_page
         # Store hover callable vs string template separately
         self._hover_cell: Optional[Callable[[str, str, Any], str]] = None
         self._hover_template: Optional[str] = None
@@ -1154,7 +1206,6 @@ class table(
             format=data_format,
         )
 
-    @functools.lru_cache(maxsize=1)  # noqa: B019
     def _apply_filters_query_sort_cached(
         self,
         filters: Optional[tuple[Condition, ...]],
@@ -1162,10 +1213,13 @@ class table(
         sort: Optional[tuple[SortArgs, ...]],
     ) -> TableManager[Any]:
         """Cached version that expects hashable arguments."""
-        return self._apply_filters_query_sort(
-            list(filters) if filters else None,
-            query,
-            list(sort) if sort else None,
+        return self._query_cache.get_or_compute(
+            QueryKey(filters=filters, query=query, sort=sort),
+            lambda key: self._apply_filters_query_sort(
+                list(key.filters) if key.filters else None,
+                key.query,
+                list(key.sort) if key.sort else None,
+            ),
         )
 
     def _apply_filters_query_sort(
@@ -1176,6 +1230,14 @@ class table(
     ) -> TableManager[Any]:
         result = self._manager
 
+        # Searching and filtering both keep a subset of the rows, so the
+        # search can run first when it is answered by the index
+        if query and self._search_index is not None:
+            indexed = self._search_index.search(query)
+            if indexed is not None:
+                result = indexed
+                query = None
+
         if filters:
             # Filter out conditions for columns that don't exist
             existing_columns = set(result.get_column_names())
@@ -1232,25 +1294,14 @@ class table(
         )
         return column_preview
 
-    def _style_cells(
+    def _select_page_cells(
         self,
         skip: int,
         take: int,
         total_rows: Union[int, Literal["too_many"]],
-        descending: bool = False,
-    ) -> Optional[CellStyles]:
-        """Calculate the styling of the cells in the table."""
-        if self._style_cell is None:
-            return None
-
-        def do_style_cell(row: str, col: str) -> dict[str, Any]:
-            selected_cells = self._searched_manager.select_cells(
-                [TableCoordinate(row_id=row, column_name=col)]
-            )
-            if not selected_cells or self._style_cell is None:
-                return {}
-            return self._style_cell(row, col, selected_cells[0].value)
-
+        descending: bool,
+    ) -> tuple[Union[list[int], range], list[str], CellBlock]:
+        """Select the values of the cells on the requested page, in bulk."""
         columns = self._searched_manager.get_column_names()
         response = self._get_row_ids(EmptyArgs())
 
@@ -1269,8 +1320,51 @@ class table(
         else:
             row_ids = response.row_ids[skip : skip + take]
 
+        block = self._searched_manager.select_cell_block(
+            list(row_ids), columns
+        )
+        return row_ids, columns, block
+
+    def _style_cells(
+        self,
+        skip: int,
+        take: int,
+        total_rows: Union[int, Literal["too_many"]],
+        descending: bool = False,
+    ) -> Optional[CellStyles]:
+        """Calculate the styling of the cells in the table."""
+        if self._style_cell is None and self._style_page is None:
+            return None
+
+        row_ids, columns, block = self._select_page_cells(
+            skip, take, total_rows, descending
+        )
+        positions = {row_id: i for i, row_id in enumerate(block.row_ids)}
+
+        if self._style_page is not None:
+            page_styles = _normalize_page_styles(
+                self._style_page(block.data), len(block.row_ids)
+            )
+
+            def do_style_cell(row: int, col: str) -> dict[str, Any]:
+                position = positions.get(row)
+                column_styles = page_styles.get(col)
+                if position is None or column_styles is None:
+                    return {}
+                return column_styles[position] or {}
+
+        else:
+
+            def do_style_cell(row: int, col: str) -> dict[str, Any]:
+                position = positions.get(row)
+                if position is None or self._style_cell is None:
+                    return {}
+                return self._style_cell(
+                    str(row), col, block.values[col][position]
+                )
+
         return {
-            str(row): {col: do_style_cell(str(row), col) for col in columns}
+            str(row): {col: do_style_cell(row, col) for col in columns}
             for row in row_ids
         }
 
@@ -1285,15 +1379,18 @@ class table(
         if self._hover_cell is None:
             return None
 
-        def do_hover_cell(row: str, col: str) -> Optional[str]:
-            selected_cells = self._searched_manager.select_cells(
-                [TableCoordinate(row_id=row, column_name=col)]
-            )
-            if not selected_cells or self._hover_cell is None:
+        row_ids, columns, block = self._select_page_cells(
+            skip, take, total_rows, descending
+        )
+        positions = {row_id: i for i, row_id in enumerate(block.row_ids)}
+
+        def do_hover_cell(row: int, col: str) -> Optional[str]:
+            position = positions.get(row)
+            if position is None or self._hover_cell is None:
                 return None
             try:
-                value = selected_cells[0].value
-                result = self._hover_cell(row, col, value)
+                value = block.values[col][position]
+                result = self._hover_cell(str(row), col, value)
                 return str(result) if result is not None else None
             except BaseException as e:
                 LOGGER.warning(
@@ -1301,26 +1398,8 @@ class table(
                 )
                 return None
 
-        columns = self._searched_manager.get_column_names()
-        response = self._get_row_ids(EmptyArgs())
-
-        # Clamp the take to the total number of rows
-        if total_rows != "too_many" and skip + take > total_rows:
-            take = total_rows - skip
-
-        # Determine row range
-        row_ids: Union[list[int], range]
-        if response.all_rows or response.error:
-            row_ids = range(skip, skip + take)
-            if descending and total_rows != "too_many":
-                row_ids = range(
-                    total_rows - 1 - skip, total_rows - 1 - skip - take, -1
-                )
-        else:
-            row_ids = response.row_ids[skip : skip + take]
-
         return {
-            str(row): {col: do_hover_cell(str(row), col) for col in columns}
+            str(row): {col: do_hover_cell(row, col) for col in columns}
             for row in row_ids
         }
 
@@ -1417,7 +1496,9 @@ class table(
         else:
             total_rows = result.get_num_rows(force=True) or 0
 
-        if args.sort and (self._style_cell or self._hover_cell):
+        if args.sort and (
+            self._style_cell or self._style_page or self._hover_cell
+        ):
             for element in args.sort:
                 if element.descending:
                     descending = True
@@ -1505,6 +1586,45 @@ class table(
         return id(self)
 
 
+def _normalize_page_styles(
+    styles: Any, num_rows: int
+) -> dict[ColumnName, list[Optional[dict[str, Any]]]]:
+    """Convert the result of a `style_page` function to lists of styles.
+
+    Accepts a mapping from column name to a sequence of styles, or a
+    dataframe of the same shape as the page.
+    """
+    if styles is None:
+        return {}
+
+    if not isinstance(styles, Mapping):
+        if not can_narwhalify(styles, eager_only=True):
+            raise ValueError(
+                "style_page must return a mapping from column names to "
+                f"styles, or a dataframe. Got: {type(styles).__name__}"
+            )
+        styles = nw.from_native(styles, eager_only=True).to_dict(
+            as_series=False
+        )
+
+    normalized: dict[ColumnName, list[Optional[dict[str, Any]]]] = {}
+    for column, column_styles in styles.items():
+        column_styles = list(column_styles)
+        if len(column_styles) != num_rows:
+            raise ValueError(
+                f"style_page returned {len(column_styles)} styles for column "
+                f"'{column}', expected {num_rows}."
+            )
+        normalized[column] = [
+            # Struct columns contain every key, drop the unset ones
+            {key: value for key, value in style.items() if value is not None}
+            if style
+            else None
+            for style in column_styles
+        ]
+    return normalized
+
+
 def _validate_frozen_columns(
     freeze_columns_left: Optional[Sequence[str]],
     freeze_columns_right: Optional[Sequence[str]],
@@ -21,6 +21,7 @@ from marimo._plugins.ui._impl.tables.format import (
 )
 from marimo._plugins.ui._impl.tables.selection import INDEX_COLUMN_NAME
 from marimo._plugins.ui._impl.tables.table_manager import (
+    CellBlock,
     ColumnName,
     FieldType,
     FieldTypes,
@@ -52,6 +53,10 @@ NAN_VALUE = "NaN"
 POSITIVE_INF = str(float("inf"))
 NEGATIVE_INF = str(float("-inf"))
 
+# Searches are regular expressions; queries without these characters match
+# as plain text
+REGEX_SPECIAL_CHARS = frozenset(".^$*+?{}[]\\|()")
+
 
 class NarwhalsTableManager(
     TableManager[
@@ -174,6 +179,38 @@ class NarwhalsTableManager(
                 for row, col in cells
             ]
 
+    def select_cell_block(
+        self, row_ids: list[int], columns: list[str]
+    ) -> CellBlock:
+        if INDEX_COLUMN_NAME in self.nw_schema.names():
+            # Filter before collecting, so lazy frames only load the page
+            page = self.as_lazy_frame().filter(
+                nw.col(INDEX_COLUMN_NAME).is_in(row_ids)
+            )
+            page_frame = (
+                page.collect() if is_narwhals_lazyframe(page) else page
+            )
+            positions = {
+                row_id: position
+                for position, row_id in enumerate(
+                    page_frame.get_column(INDEX_COLUMN_NAME).to_list()
+                )
+            }
+            found = [row_id for row_id in row_ids if row_id in positions]
+            page_frame = page_frame[[positions[row_id] for row_id in found]]
+        else:
+            frame = self.as_frame()
+            num_rows = frame.shape[0]
+            found = [row_id for row_id in row_ids if 0 <= row_id < num_rows]
+            page_frame = frame[found]
+
+        page_frame = page_frame.select(columns)
+        return CellBlock(
+            row_ids=found,
+            values=page_frame.to_dict(as_series=False),
+            data=page_frame.to_native(),
+        )
+
     def drop_columns(self, columns: list[str]) -> TableManager[Any]:
         return self.with_new_data(self.data.drop(columns, strict=False))
 
@@ -303,15 +340,28 @@ class NarwhalsTableManager(
     def search(self, query: str) -> TableManager[Any]:
         query = query.lower()
 
-        expressions: list[Any] = []
+        expressions: list[Any] = [
+            # Cast to string as pandas may fail for certain values
+            nw.col(column).cast(nw.String).str.contains(f"(?i){query}")
+            for column in self.get_searchable_column_names()
+        ]
+
+        if not expressions:
+            return NarwhalsTableManager(self.data.filter(nw.lit(False)))
+
+        filtered = self.data.filter(
+            nw.any_horizontal(expressions, ignore_nulls=False)
+        )
+        return NarwhalsTableManager(filtered)
+
+    def get_searchable_column_names(self) -> list[str]:
+        """Columns whose string representation is matched by `search`."""
+        columns: list[str] = []
         for column, dtype in self.nw_schema.items():
             if column == INDEX_COLUMN_NAME:
                 continue
             if is_narwhals_string_type(dtype):
-                # Cast to string as pandas may fail for certain values
-                expressions.append(
-                    nw.col(column).cast(nw.String).str.contains(f"(?i){query}")
-                )
+                columns.append(column)
             elif dtype == nw.List(nw.String):
                 # TODO: Narwhals doesn't support list.contains
                 # expressions.append(
@@ -323,17 +373,8 @@ class NarwhalsTableManager(
                 or is_narwhals_temporal_type(dtype)
                 or dtype == nw.Boolean
             ):
-                expressions.append(
-                    nw.col(column).cast(nw.String).str.contains(f"(?i){query}")
-                )
-
-        if not expressions:
-            return NarwhalsTableManager(self.data.filter(nw.lit(False)))
-
-        filtered = self.data.filter(
-            nw.any_horizontal(expressions, ignore_nulls=False)
-        )
-        return NarwhalsTableManager(filtered)
+                columns.append(column)
+        return columns
 
     def get_stats(self, column: str) -> ColumnStats:
         stats = self._get_stats_internal(column)
@@ -0,0 +1,255 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import itertools
+import threading
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional
+
+from marimo import _loggers
+from marimo._plugins.ui._impl.tables.narwhals_table import (
+    REGEX_SPECIAL_CHARS,
+    NarwhalsTableManager,
+)
+from marimo._utils.narwhals_utils import is_narwhals_lazyframe
+
+if TYPE_CHECKING:
+    from marimo._plugins.ui._impl.dataframes.transforms.types import (
+        Condition,
+    )
+    from marimo._plugins.ui._impl.table import SortArgs
+    from marimo._plugins.ui._impl.tables.table_manager import TableManager
+
+LOGGER = _loggers.marimo_logger()
+
+DEFAULT_MAX_ENTRIES = 8
+# Memory held by cached results, shared by all the tables in the process
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class QueryKey(NamedTuple):
+    filters: Optional[tuple[Condition, ...]]
+    query: Optional[str]
+    sort: Optional[tuple[SortArgs, ...]]
+
+
+class QueryCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    # Misses answered by narrowing or re-sorting a cached result
+    refinements: int
+    maxsize: int
+    currsize: int
+    nbytes: int
+
+
+class _Entry(NamedTuple):
+    result: TableManager[Any]
+    nbytes: int
+
+
+class QueryCacheBudget:
+    """Memory budget shared by several query caches.
+
+    When the caches together hold more than `max_bytes`, the least recently
+    used entries of the least recently used cache are evicted first.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        # Guards the entries of all the caches sharing the budget
+        self.lock = threading.Lock()
+        self._caches: weakref.WeakSet[TableQueryCache] = weakref.WeakSet()
+        self._clock = itertools.count()
+
+    @property
+    def nbytes(self) -> int:
+        with self.lock:
+            return self._nbytes()
+
+    def register(self, cache: TableQueryCache) -> None:
+        with self.lock:
+            self._caches.add(cache)
+
+    def tick(self) -> int:
+        return next(self._clock)
+
+    def enforce(self) -> None:
+        """Evict entries until the caches fit; the lock must be held."""
+        nbytes = self._nbytes()
+        while nbytes > self.max_bytes:
+            caches = [cache for cache in self._caches if cache._entries]
+            if not caches:
+                return
+            oldest = min(caches, key=lambda cache: cache._last_used)
+            nbytes -= oldest._evict()
+
+    def _nbytes(self) -> int:
+        return sum(cache._nbytes for cache in self._caches)
+
+
+_SHARED_BUDGET = QueryCacheBudget(DEFAULT_MAX_BYTES)
+
+
+class TableQueryCache:
+    """LRU cache of filter/search/sort results for a single table.
+
+    Bounded by the number of entries and by their estimated size in
+    memory, both per table (`max_bytes`) and across all the tables sharing
+    `budget`, by default every table in the process. On a miss, the result
+    is derived from a cached one when possible:
+
+    - a cached unsorted result with the same filters and query is sorted;
+    - a cached result for a shorter query (e.g. "ab" for "abc") is searched
+      again, which only scans the rows that matched the shorter query.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: Optional[int] = None,
+        budget: Optional[QueryCacheBudget] = None,
+    ) -> None:
+        self._budget = budget if budget is not None else _SHARED_BUDGET
+        self._max_entries = max_entries
+        self._max_bytes = (
+            max_bytes if max_bytes is not None else self._budget.max_bytes
+        )
+        self._entries: OrderedDict[QueryKey, _Entry] = OrderedDict()
+        self._nbytes = 0
+        self._last_used = self._budget.tick()
+        self.hits = 0
+        self.misses = 0
+        self.refinements = 0
+        self._budget.register(self)
+
+    def get_or_compute(
+        self,
+        key: QueryKey,
+        compute: Callable[[QueryKey], TableManager[Any]],
+    ) -> TableManager[Any]:
+        with self._budget.lock:
+            self._last_used = self._budget.tick()
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry.result
+            self.misses += 1
+            # Other caches may evict entries while this result is computed
+            entries = dict(self._entries)
+
+        result = self._refine(key, entries)
+        if result is None:
+            result = compute(key)
+        else:
+            self.refinements += 1
+        self._put(key, result)
+        return result
+
+    def cache_info(self) -> QueryCacheInfo:
+        return QueryCacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            refinements=self.refinements,
+            maxsize=self._max_entries,
+            currsize=len(self._entries),
+            nbytes=self._nbytes,
+        )
+
+    def cache_clear(self) -> None:
+        with self._budget.lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def _refine(
+        self, key: QueryKey, entries: dict[QueryKey, _Entry]
+    ) -> Optional[TableManager[Any]]:
+        # Same rows, only the order differs
+        unsorted = entries.get(key._replace(sort=None))
+        if unsorted is not None and key.sort:
+            return _sort(unsorted.result, key.sort)
+
+        if not key.query or not _is_plain_query(key.query):
+            return None
+
+        # Narrow the longest cached query that the new query extends.
+        # Filtering keeps the order, so a result sorted the same way stays
+        # sorted; an unsorted one is sorted afterwards.
+        query = key.query.lower()
+        best: Optional[tuple[QueryKey, _Entry]] = None
+        for cached_key, entry in entries.items():
+            if (
+                cached_key.filters != key.filters
+                or cached_key.sort not in (None, key.sort)
+                or not cached_key.query
+                or not _is_plain_query(cached_key.query)
+                or cached_key.query.lower() not in query
+            ):
+                continue
+            if best is None or len(cached_key.query) > len(
+                best[0].query or ""
+            ):
+                best = (cached_key, entry)
+
+        if best is None:
+            return None
+
+        cached_key, entry = best
+        result = entry.result.search(key.query)
+        if key.sort and cached_key.sort is None:
+            result = _sort(result, key.sort)
+        return result
+
+    def _put(self, key: QueryKey, result: TableManager[Any]) -> None:
+        nbytes = _estimate_nbytes(result)
+        if nbytes > self._max_bytes or nbytes > self._budget.max_bytes:
+            return
+
+        with self._budget.lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._nbytes -= previous.nbytes
+            self._entries[key] = _Entry(result=result, nbytes=nbytes)
+            self._nbytes += nbytes
+            self._last_used = self._budget.tick()
+            while (
+                len(self._entries) > self._max_entries
+                or self._nbytes > self._max_bytes
+            ):
+                self._evict()
+            self._budget.enforce()
+
+    def _evict(self) -> int:
+        """Evict the least recently used entry; returns its size."""
+        _, evicted = self._entries.popitem(last=False)
+        self._nbytes -= evicted.nbytes
+        return evicted.nbytes
+
+
+def _sort(
+    result: TableManager[Any], sort: tuple[SortArgs, ...]
+) -> TableManager[Any]:
+    existing_columns = set(result.get_column_names())
+    valid_sort = [s for s in sort if s.by in existing_columns]
+    return result.sort_values(valid_sort) if valid_sort else result
+
+
+def _is_plain_query(query: str) -> bool:
+    # A query is only known to narrow another query's results if neither
+    # uses regex syntax
+    return not any(char in REGEX_SPECIAL_CHARS for char in query)
+
+
+def _estimate_nbytes(manager: TableManager[Any]) -> int:
+    """Estimate the memory held by a result; lazy results hold none."""
+    if not isinstance(manager, NarwhalsTableManager):
+        return 0
+    if is_narwhals_lazyframe(manager.data):
+        return 0
+    try:
+        return int(manager.data.estimated_size(unit="b"))
+    except Exception:
+        LOGGER.debug("Failed to estimate table size", exc_info=True)
+        return 0
@@ -0,0 +1,124 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, Optional
+
+import narwhals.stable.v2 as nw
+
+from marimo import _loggers
+from marimo._plugins.ui._impl.tables.narwhals_table import (
+    REGEX_SPECIAL_CHARS,
+    NarwhalsTableManager,
+)
+from marimo._utils.narwhals_utils import is_narwhals_lazyframe
+
+if TYPE_CHECKING:
+    from typing_extensions import TypeIs
+
+    from marimo._plugins.ui._impl.tables.table_manager import TableManager
+
+LOGGER = _loggers.marimo_logger()
+
+# Separates the values of a row in the index, so that a query is unlikely
+# to match across two columns
+_SEPARATOR = "\x1f"
+
+
+class SearchIndex:
+    """Precomputed row strings for searching a table.
+
+    Each row of the table is indexed as the lowercased concatenation of
+    its searchable values. A plain-text query is answered by a single
+    substring scan of the index, instead of casting and matching every
+    column, and the candidate rows are re-validated with the table's own
+    `search`.
+
+    The index is built in a background thread on the first search; until
+    it is ready (or for regex queries) `search` returns None and the
+    caller should fall back to `TableManager.search`.
+    """
+
+    def __init__(self, manager: NarwhalsTableManager[Any, Any]) -> None:
+        self._manager = manager
+        self._rows: Optional[nw.Series[Any]] = None
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._started = False
+
+    @staticmethod
+    def supports(
+        manager: TableManager[Any],
+    ) -> TypeIs[NarwhalsTableManager[Any, Any]]:
+        """Whether an index can be built for the given table."""
+        return isinstance(
+            manager, NarwhalsTableManager
+        ) and not is_narwhals_lazyframe(manager.data)
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def start(self) -> None:
+        """Build the index in a background thread, if not already started."""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        threading.Thread(
+            target=self.build,
+            name="marimo-table-search-index",
+            daemon=True,
+        ).start()
+
+    def build(self) -> None:
+        """Build the index in the current thread."""
+        with self._lock:
+            self._started = True
+        if self.ready:
+            return
+
+        columns = self._manager.get_searchable_column_names()
+        if not columns:
+            return
+
+        try:
+            frame = self._manager.as_frame()
+            self._rows = frame.select(
+                nw.concat_str(
+                    [nw.col(column).cast(nw.String) for column in columns],
+                    separator=_SEPARATOR,
+                    ignore_nulls=True,
+                )
+                .str.to_lowercase()
+                .alias("row")
+            )["row"]
+            self._ready.set()
+        except Exception:
+            LOGGER.debug("Failed to build table search index", exc_info=True)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the index is ready."""
+        return self._ready.wait(timeout)
+
+    def search(self, query: str) -> Optional[TableManager[Any]]:
+        """Search the table using the index.
+
+        Returns None if the index can't answer the query yet.
+        """
+        self.start()
+        if not self.ready or self._rows is None:
+            return None
+        # Only plain text is looked up in the index
+        if any(char in REGEX_SPECIAL_CHARS for char in query):
+            return None
+
+        rows = self._rows
+        mask = rows.str.contains(query.lower(), literal=True).fill_null(
+            value=False
+        )
+        candidates: NarwhalsTableManager[Any, Any] = NarwhalsTableManager(
+            self._manager.as_frame().filter(mask)
+        )
+        # Matches that span two values are not matches of the table's search
+        return candidates.search(query)
@@ -50,6 +50,20 @@ class TableCell:
         return getattr(self, key)
 
 
+@dataclass
+class CellBlock:
+    """The values of a block of cells, stored column by column.
+
+    `row_ids` holds the requested rows that exist, in the requested order;
+    each list in `values` is aligned with it.
+    """
+
+    row_ids: list[int]
+    values: dict[ColumnName, list[Any]]
+    # The block in the table's native format (e.g. a dataframe), if any
+    data: Any = None
+
+
 class TableManager(abc.ABC, Generic[T]):
     # Upper limit for column summaries
     # The only sets the default to show column summaries,
@@ -154,6 +168,34 @@ class TableManager(abc.ABC, Generic[T]):
     def select_cells(self, cells: list[TableCoordinate]) -> list[TableCell]:
         pass
 
+    def select_cell_block(
+        self, row_ids: list[int], columns: list[str]
+    ) -> CellBlock:
+        """Select the values of many cells at once.
+
+        Managers backed by a dataframe should override this to slice the
+        frame once instead of looking up every cell.
+        """
+        cells = self.select_cells(
+            [
+                TableCoordinate(row_id=row_id, column_name=column)
+                for row_id in row_ids
+                for column in columns
+            ]
+        )
+        values_by_row: dict[int, dict[ColumnName, Any]] = {}
+        for cell in cells:
+            values_by_row.setdefault(int(cell.row), {})[cell.column] = (
+                cell.value
+            )
+
+        found = [row_id for row_id in row_ids if row_id in values_by_row]
+        values = {
+            column: [values_by_row[row_id].get(column) for row_id in found]
+            for column in columns
+        }
+        return CellBlock(row_ids=found, values=values, data=values)
+
     @abc.abstractmethod
     def drop_columns(self, columns: list[str]) -> TableManager[Any]:
         pass
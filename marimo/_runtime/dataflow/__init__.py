@@ -101,35 +101,10 @@ def topological_sort(
 
     When multiple cells have the same parents (including no parents), the tie is broken by
     registration order - cells registered earlier are processed first.
+
+    The sort is memoized by the graph until it is next mutated.
     """
-    from heapq import heapify, heappop, heappush
-
-    # Use a list for O(1) lookup of registration order
-    registration_order = list(graph.cells.keys())
-    top_down_keys = {key: idx for idx, key in enumerate(registration_order)}
-
-    # Build adjacency lists and in-degree counts
-    parents, children = induced_subgraph(graph, cell_ids)
-    in_degree = {cid: len(parents[cid]) for cid in cell_ids}
-
-    # Initialize heap with roots
-    heap = [
-        (top_down_keys[cid], cid) for cid in cell_ids if in_degree[cid] == 0
-    ]
-    heapify(heap)
-
-    sorted_cell_ids: list[CellId_t] = []
-    while heap:
-        _, cid = heappop(heap)
-        sorted_cell_ids.append(cid)
-
-        # Process children
-        for child in children[cid]:
-            in_degree[child] -= 1
-            if in_degree[child] == 0:
-                heappush(heap, (top_down_keys[child], child))
-
-    return sorted_cell_ids
+    return graph.topological_sort(cell_ids)
 
 
 def prune_cells_for_overrides(
@@ -23,12 +23,24 @@ class CycleTracker:
     - Detect cycles when edges are added
     - Maintain cycle set
     - Remove broken cycles
+
+    While the graph is acyclic, a topological order of its cells is
+    maintained incrementally (Pearce-Kelly). An added edge that agrees with
+    the order can't create a cycle, so the graph is only searched when an
+    edge violates it, and then only between the edge's endpoints in the
+    order.
     """
 
     # The set of cycles in the graph
     # Each cycle is represented as a tuple of edges
     cycles: set[tuple[Edge, ...]] = field(default_factory=set)
 
+    # Position of each cell in a topological order of the graph; only
+    # meaningful when `_order_is_valid`
+    _order: dict[CellId_t, int] = field(default_factory=dict)
+    _next_position: int = 0
+    _order_is_valid: bool = True
+
     def detect_cycle_for_edge(
         self,
         edge: Edge,
@@ -45,6 +57,18 @@ class CycleTracker:
             The cycle includes the new edge plus the path from child back to parent.
         """
         parent, child = edge
+        if not self._order_is_valid and not self.cycles:
+            # The graph may have become acyclic again
+            self._rebuild_order(topology)
+
+        if self._order_is_valid:
+            position = self._position(parent)
+            if position < self._position(child):
+                # The edge agrees with the topological order
+                return None
+            if self._reorder(parent, child, topology):
+                return None
+
         # Check if there's a path from child back to parent
         # If so, adding this edge creates a cycle
         path = topology.get_path(child, parent)
@@ -52,9 +76,97 @@ class CycleTracker:
             # The cycle is: edge + path
             cycle = tuple([edge] + path)
             self.cycles.add(cycle)
+            self._order_is_valid = False
             return cycle
         return None
 
+    def remove_node(self, cell_id: CellId_t) -> None:
+        """Forget a cell that was removed from the graph.
+
+        A topological order restricted to the remaining cells is still a
+        topological order, so the order stays valid.
+        """
+        self._order.pop(cell_id, None)
+
+    def _position(self, cell_id: CellId_t) -> int:
+        if cell_id not in self._order:
+            # New cells have no edges yet, so they can go anywhere
+            self._order[cell_id] = self._next_position
+            self._next_position += 1
+        return self._order[cell_id]
+
+    def _reorder(
+        self, parent: CellId_t, child: CellId_t, topology: GraphTopology
+    ) -> bool:
+        """Restore the topological order after adding (parent, child).
+
+        Requires that the edge violates the order. Returns False, leaving the
+        order untouched, if the edge creates a cycle.
+        """
+        lower = self._order[child]
+        upper = self._order[parent]
+
+        # Cells reachable from child that precede parent in the order
+        forward: set[CellId_t] = set()
+        stack = [child]
+        while stack:
+            cid = stack.pop()
+            if cid == parent:
+                return False
+            if cid in forward:
+                continue
+            forward.add(cid)
+            stack.extend(
+                c
+                for c in topology.children[cid]
+                if c not in forward and self._position(c) <= upper
+            )
+
+        # Cells that reach parent and follow child in the order
+        backward: set[CellId_t] = set()
+        stack = [parent]
+        while stack:
+            cid = stack.pop()
+            if cid in backward:
+                continue
+            backward.add(cid)
+            stack.extend(
+                p
+                for p in topology.parents[cid]
+                if p not in backward and self._position(p) >= lower
+            )
+
+        # Move the backward set ahead of the forward set, reusing their
+        # positions
+        by_position = self._order.__getitem__
+        affected = sorted(backward, key=by_position) + sorted(
+            forward, key=by_position
+        )
+        positions = sorted(self._order[cid] for cid in affected)
+        for cid, position in zip(affected, positions):
+            self._order[cid] = position
+        return True
+
+    def _rebuild_order(self, topology: GraphTopology) -> None:
+        """Compute a topological order from scratch, if the graph has one."""
+        in_degree = {
+            cid: len(parents) for cid, parents in topology.parents.items()
+        }
+        queue = [cid for cid, degree in in_degree.items() if degree == 0]
+        order: dict[CellId_t, int] = {}
+        while queue:
+            cid = queue.pop()
+            order[cid] = len(order)
+            for child in topology.children[cid]:
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    queue.append(child)
+
+        if len(order) == len(in_degree):
+            self._order = order
+            self._next_position = len(order)
+            self._order_is_valid = True
+
     def remove_cycles_with_edge(self, edge: Edge) -> None:
         """Remove all cycles that contain the given edge.
 
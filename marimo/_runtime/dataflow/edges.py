@@ -12,6 +12,7 @@ if TYPE_CHECKING:
     from marimo._ast.sql_visitor import SQLRef
     from marimo._ast.visitor import Name
     from marimo._runtime.dataflow.definitions import DefinitionRegistry
+    from marimo._runtime.dataflow.references import ReferenceRegistry
     from marimo._runtime.dataflow.topology import GraphTopology
     from marimo._types.ids import CellId_t
 
@@ -20,10 +21,31 @@ from marimo._ast.sql_visitor import SQLTypes
 LOGGER = _loggers.marimo_logger()
 
 
+def _sql_cell_refers_to(name: Name, cell: CellImpl) -> bool:
+    """Whether the SQL `cell` has a direct or hierarchical ref to `name`."""
+    for ref in cell.refs:
+        # Direct reference match
+        if ref == name:
+            return True
+
+        sql_ref = cell.sql_refs.get(ref)
+
+        kind: SQLTypes = "any"
+        if name in cell.variable_data:
+            variable_data = cell.variable_data[name][-1]
+            kind = cast(SQLTypes, variable_data.kind)
+
+        # Hierarchical reference match
+        if sql_ref and sql_ref.matches_hierarchical_ref(name, ref, kind):
+            return True
+    return False
+
+
 def get_referring_cells(
     name: Name,
     language: Literal["python", "sql"],
     topology: GraphTopology,
+    references: Optional[ReferenceRegistry] = None,
 ) -> set[CellId_t]:
     """Get all cells that have a ref to `name`.
 
@@ -33,37 +55,30 @@ def get_referring_cells(
 
     Only does a local analysis of refs, without taking into consideration
     whether refs are defined by other cells.
+
+    If `references` is given, candidate cells are looked up in it instead of
+    scanning every cell in the topology.
     """
     if language == "sql":
         # For SQL, only return SQL cells that reference the name
-        cells = set()
-        for cid, cell in topology.cells.items():
-            if cell.language != "sql":
-                continue
-
-            for ref in cell.refs:
-                # Direct reference match
-                if ref == name:
-                    cells.add(cid)
-                    break
-
-                sql_ref = cell.sql_refs.get(ref)
-
-                kind: SQLTypes = "any"
-                if name in cell.variable_data:
-                    variable_data = cell.variable_data[name][-1]
-                    kind = cast(SQLTypes, variable_data.kind)
-
-                # Hierarchical reference match
-                if sql_ref and sql_ref.matches_hierarchical_ref(
-                    name, ref, kind
-                ):
-                    cells.add(cid)
-                    break
-
-        return cells
+        if references is not None:
+            candidates = (
+                (cid, topology.cells[cid])
+                for cid in references.get_sql_candidates(name)
+            )
+        else:
+            candidates = (
+                (cid, cell)
+                for cid, cell in topology.cells.items()
+                if cell.language == "sql"
+            )
+        return {
+            cid for cid, cell in candidates if _sql_cell_refers_to(name, cell)
+        }
     else:
         # For Python, return all cells that reference the name
+        if references is not None:
+            return references.get_referring_cells(name)
         return {
             cid for cid, cell in topology.cells.items() if name in cell.refs
         }
@@ -120,6 +135,7 @@ def compute_edges_for_cell(
     cell: CellImpl,
     topology: GraphTopology,
     definitions: DefinitionRegistry,
+    references: Optional[ReferenceRegistry] = None,
 ) -> tuple[set[CellId_t], set[CellId_t]]:
     """Compute parent and child edges for a cell being registered.
 
@@ -128,6 +144,8 @@ def compute_edges_for_cell(
         cell: The cell to compute edges for
         topology: The graph topology
         definitions: The definition registry
+        references: The reference registry, if any; used to look up
+            referring cells without scanning the topology
 
     Returns:
         Tuple of (parents, children) where:
@@ -151,6 +169,7 @@ def compute_edges_for_cell(
             name,
             language=variable.language,
             topology=topology,
+            references=references,
         ) - {cell_id}
 
         children.update(referring_cells)
@@ -240,7 +259,10 @@ def compute_edges_for_cell(
         other_ids_deleting_name: set[CellId_t] = {
             cid
             for cid in get_referring_cells(
-                name, language="python", topology=topology
+                name,
+                language="python",
+                topology=topology,
+                references=references,
             )
             if name in topology.cells[cid].deleted_refs
         } - {cell_id}
@@ -250,7 +272,10 @@ def compute_edges_for_cell(
     # all other cells that reference this variable.
     for name in cell.deleted_refs:
         referring_cells = get_referring_cells(
-            name, language="python", topology=topology
+            name,
+            language="python",
+            topology=topology,
+            references=references,
         ) - {cell_id}
         parents.update(referring_cells)
 
@@ -13,13 +13,14 @@ from marimo._ast.variables import is_mangled_local
 from marimo._runtime.dataflow import edges
 from marimo._runtime.dataflow.cycles import CycleTracker
 from marimo._runtime.dataflow.definitions import DefinitionRegistry
+from marimo._runtime.dataflow.references import ReferenceRegistry
 from marimo._runtime.dataflow.topology import (
     GraphTopology,
     MutableGraphTopology,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Collection, Mapping
 
     from marimo._ast.cell import CellImpl
     from marimo._ast.visitor import ImportData, Name, VariableData
@@ -33,7 +34,7 @@ class DirectedGraph(GraphTopology):
     """Main entry point that coordinates all graph operations.
 
     Responsibilities:
-    - Coordinate topology, definitions, cycles
+    - Coordinate topology, definitions, references, cycles
     - Execute register_cell/delete_cell operations
     - Maintain thread safety
     - Delegate to specialists
@@ -45,6 +46,9 @@ class DirectedGraph(GraphTopology):
     definition_registry: DefinitionRegistry = field(
         default_factory=DefinitionRegistry
     )
+    reference_registry: ReferenceRegistry = field(
+        default_factory=ReferenceRegistry
+    )
     cycle_tracker: CycleTracker = field(default_factory=CycleTracker)
 
     # This lock must be acquired during methods that mutate the graph; it's
@@ -78,7 +82,9 @@ class DirectedGraph(GraphTopology):
         Only does a local analysis of refs, without taking into consideration
         whether refs are defined by other cells.
         """
-        return edges.get_referring_cells(name, language, self.topology)
+        return edges.get_referring_cells(
+            name, language, self.topology, self.reference_registry
+        )
 
     def register_cell(self, cell_id: CellId_t, cell: CellImpl) -> None:
         """Add a cell to the graph.
@@ -90,37 +96,7 @@ class DirectedGraph(GraphTopology):
         LOGGER.debug("Acquiring graph lock to register cell %s", cell_id)
         with self.lock:
             LOGGER.debug("Acquired graph lock.")
-            assert cell_id not in self.topology.cells
-
-            # Add the cell to topology
-            self.topology.add_node(cell_id, cell)
-
-            # Process definitions and build sibling relationships FIRST
-            # This must happen before computing edges because edge computation
-            # needs to look up definitions
-            for name, variable_data in cell.variable_data.items():
-                self.definition_registry.register_definition(
-                    cell_id, name, variable_data
-                )
-            # Now compute edges (which can now find the definitions)
-            parents, children = edges.compute_edges_for_cell(
-                cell_id, cell, self.topology, self.definition_registry
-            )
-
-            # Add edges to topology
-            for parent_id in parents:
-                self.topology.add_edge(parent_id, cell_id)
-                # Detect cycle for this edge
-                self.cycle_tracker.detect_cycle_for_edge(
-                    (parent_id, cell_id), self.topology
-                )
-
-            for child_id in children:
-                self.topology.add_edge(cell_id, child_id)
-                # Detect cycle for this edge
-                self.cycle_tracker.detect_cycle_for_edge(
-                    (cell_id, child_id), self.topology
-                )
+            self._register_cell(cell_id, cell)
 
         LOGGER.debug("Registered cell %s and released graph lock", cell_id)
         if self.is_any_ancestor_stale(cell_id):
@@ -129,6 +105,133 @@ class DirectedGraph(GraphTopology):
         if self.is_any_ancestor_disabled(cell_id):
             cell.set_runtime_state(status="disabled-transitively")
 
+    def update(
+        self,
+        registrations: Mapping[CellId_t, CellImpl],
+        deletions: Collection[CellId_t] = (),
+    ) -> set[CellId_t]:
+        """Delete and register many cells at once.
+
+        Mutates the graph, acquiring `self.lock` once for all mutations.
+        Cells in `deletions` are removed before the cells in `registrations`
+        are added, so a cell can be replaced by deleting and registering its
+        id.
+
+        Equivalent to calling `delete_cell` and `register_cell` for each
+        cell, except that the staleness and disabled state that registered
+        cells inherit from their ancestors are computed once, after all
+        mutations.
+
+        Requires that the registered ids are not in the graph after
+        deletion.
+
+        Returns the ids of the children of the removed cells.
+        """
+        LOGGER.debug("Acquiring graph lock to update graph")
+        children: set[CellId_t] = set()
+        with self.lock:
+            LOGGER.debug("Acquired graph lock.")
+            for cell_id in deletions:
+                children |= self._delete_cell(cell_id)
+            for cell_id, cell in registrations.items():
+                self._register_cell(cell_id, cell)
+        LOGGER.debug(
+            "Deleted %d cells, registered %d cells and released graph lock",
+            len(deletions),
+            len(registrations),
+        )
+
+        self._inherit_ancestor_state(set(registrations.keys()))
+        return children
+
+    def _register_cell(self, cell_id: CellId_t, cell: CellImpl) -> None:
+        """Add a cell to the graph; requires `self.lock`."""
+        assert cell_id not in self.topology.cells
+
+        # Add the cell to topology
+        self.topology.add_node(cell_id, cell)
+
+        # Process definitions and build sibling relationships FIRST
+        # This must happen before computing edges because edge computation
+        # needs to look up definitions
+        for name, variable_data in cell.variable_data.items():
+            self.definition_registry.register_definition(
+                cell_id, name, variable_data
+            )
+        self.reference_registry.register_references(cell_id, cell)
+        # Now compute edges (which can now find the definitions)
+        parents, children = edges.compute_edges_for_cell(
+            cell_id,
+            cell,
+            self.topology,
+            self.definition_registry,
+            self.reference_registry,
+        )
+
+        # Add edges to topology
+        for parent_id in parents:
+            self.topology.add_edge(parent_id, cell_id)
+            # Detect cycle for this edge
+            self.cycle_tracker.detect_cycle_for_edge(
+                (parent_id, cell_id), self.topology
+            )
+
+        for child_id in children:
+            self.topology.add_edge(cell_id, child_id)
+            # Detect cycle for this edge
+            self.cycle_tracker.detect_cycle_for_edge(
+                (cell_id, child_id), self.topology
+            )
+
+    def _inherit_ancestor_state(self, cell_ids: set[CellId_t]) -> None:
+        """Mark cells stale or disabled if any of their ancestors are.
+
+        Visits the ancestors of `cell_ids` once, in topological order,
+        instead of walking the ancestors of each cell separately.
+        """
+        from marimo._runtime.dataflow import (
+            topological_sort,
+            transitive_closure,
+        )
+
+        if not cell_ids:
+            return
+
+        ancestors = transitive_closure(self, cell_ids, children=False)
+        order = topological_sort(self, ancestors)
+        if len(order) != len(ancestors):
+            # Cells on cycles have no topological order
+            for cell_id in cell_ids:
+                if self.is_any_ancestor_stale(cell_id):
+                    self.set_stale({cell_id})
+                if self.is_any_ancestor_disabled(cell_id):
+                    self.topology.cells[cell_id].set_runtime_state(
+                        status="disabled-transitively"
+                    )
+            return
+
+        # Whether any ancestor of a cell is stale (disabled)
+        stale_ancestor: dict[CellId_t, bool] = {}
+        disabled_ancestor: dict[CellId_t, bool] = {}
+        for cid in order:
+            parents = self.topology.parents[cid]
+            stale_ancestor[cid] = any(
+                stale_ancestor[pid] or self.topology.cells[pid].stale
+                for pid in parents
+            )
+            disabled_ancestor[cid] = any(
+                disabled_ancestor[pid]
+                or self.topology.cells[pid].config.disabled
+                for pid in parents
+            )
+
+        self.set_stale({cid for cid in cell_ids if stale_ancestor[cid]})
+        for cid in cell_ids:
+            if disabled_ancestor[cid]:
+                self.topology.cells[cid].set_runtime_state(
+                    status="disabled-transitively"
+                )
+
     def is_any_ancestor_stale(self, cell_id: CellId_t) -> bool:
         """Check if any ancestor of a cell is stale."""
         return any(
@@ -194,29 +297,34 @@ class DirectedGraph(GraphTopology):
         LOGGER.debug("Acquiring graph lock to delete cell %s", cell_id)
         with self.lock:
             LOGGER.debug("Acquired graph lock to delete cell %s", cell_id)
-            if cell_id not in self.topology.cells:
-                raise ValueError(f"Cell {cell_id} not found")
-
-            # Grab a reference to children before we remove it
-            children = self.topology.children[cell_id].copy()
+            children = self._delete_cell(cell_id)
 
-            # Removing this cell from its defs' definer sets
-            cell = self.topology.cells[cell_id]
-            self.definition_registry.unregister_definitions(cell_id, cell.defs)
+        LOGGER.debug("Deleted cell %s and Released graph lock.", cell_id)
+        return children
 
-            # Remove cycles that are broken from removing this cell
-            edges = [
-                (cell_id, child) for child in self.topology.children[cell_id]
-            ] + [
-                (parent, cell_id) for parent in self.topology.parents[cell_id]
-            ]
-            for e in edges:
-                self.cycle_tracker.remove_cycles_with_edge(e)
+    def _delete_cell(self, cell_id: CellId_t) -> set[CellId_t]:
+        """Remove a cell from the graph; requires `self.lock`."""
+        if cell_id not in self.topology.cells:
+            raise ValueError(f"Cell {cell_id} not found")
 
-            # Purge this cell from the graph topology
-            self.topology.remove_node(cell_id)
+        # Grab a reference to children before we remove it
+        children = self.topology.children[cell_id].copy()
 
-        LOGGER.debug("Deleted cell %s and Released graph lock.", cell_id)
+        # Removing this cell from its defs' definer sets
+        cell = self.topology.cells[cell_id]
+        self.definition_registry.unregister_definitions(cell_id, cell.defs)
+        self.reference_registry.unregister_references(cell_id, cell)
+
+        # Remove cycles that are broken from removing this cell
+        edges = [
+            (cell_id, child) for child in self.topology.children[cell_id]
+        ] + [(parent, cell_id) for parent in self.topology.parents[cell_id]]
+        for e in edges:
+            self.cycle_tracker.remove_cycles_with_edge(e)
+        self.cycle_tracker.remove_node(cell_id)
+
+        # Purge this cell from the graph topology
+        self.topology.remove_node(cell_id)
         return children
 
     def is_disabled(self, cell_id: CellId_t) -> bool:
@@ -390,6 +498,11 @@ class DirectedGraph(GraphTopology):
         """Get the children dictionary."""
         return self.topology.children
 
+    @property
+    def version(self) -> int:
+        """Incremented whenever cells or edges are added or removed."""
+        return self.topology.version
+
     def get_path(
         self, source: CellId_t, dst: CellId_t
     ) -> list[tuple[CellId_t, CellId_t]]:
@@ -404,6 +517,12 @@ class DirectedGraph(GraphTopology):
         """Get all ancestors of a cell."""
         return self.topology.ancestors(cell_id)
 
+    def topological_sort(
+        self, cell_ids: Collection[CellId_t]
+    ) -> list[CellId_t]:
+        """Sort `cell_ids` in a topological order."""
+        return self.topology.topological_sort(cell_ids)
+
     @property
     def definitions(self) -> Mapping[Name, set[CellId_t]]:
         """Get the definitions dictionary."""
@@ -0,0 +1,132 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Variable reference tracking for cells."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from marimo._ast.cell import CellImpl
+    from marimo._ast.visitor import Name
+    from marimo._types.ids import CellId_t
+
+
+@dataclass
+class ReferenceRegistry:
+    """Tracks variable references across cells.
+
+    The reverse of `DefinitionRegistry`: maps names to the cells that refer
+    to them, so that finding the cells referring to a name is a dictionary
+    lookup instead of a scan over every cell in the graph.
+
+    Responsibilities:
+    - Track which cells refer to which names
+    - Track which SQL cells refer to which SQL names, including the
+      components (catalog, schema, table) of hierarchical references
+    """
+
+    # A mapping from refs to the cells that refer to them
+    references: dict[Name, set[CellId_t]] = field(default_factory=dict)
+
+    # A mapping from refs to the SQL cells that refer to them
+    sql_references: dict[Name, set[CellId_t]] = field(default_factory=dict)
+
+    # A mapping from the (lowercased) components of hierarchical SQL refs to
+    # the SQL cells that refer to them
+    # e.g. "my_schema.my_table" -> {"my_schema", "my_table"}
+    sql_hierarchical_references: dict[str, set[CellId_t]] = field(
+        default_factory=dict
+    )
+
+    def register_references(self, cell_id: CellId_t, cell: CellImpl) -> None:
+        """Register all references of a cell.
+
+        Args:
+            cell_id: The cell that refers to the variables
+            cell: The cell
+        """
+        for name in cell.refs:
+            self.references.setdefault(name, set()).add(cell_id)
+
+        if cell.language != "sql":
+            return
+
+        for name in cell.refs:
+            self.sql_references.setdefault(name, set()).add(cell_id)
+        for component in _sql_ref_components(cell):
+            self.sql_hierarchical_references.setdefault(component, set()).add(
+                cell_id
+            )
+
+    def unregister_references(self, cell_id: CellId_t, cell: CellImpl) -> None:
+        """Unregister all references of a cell.
+
+        Args:
+            cell_id: The cell being removed
+            cell: The cell
+        """
+        _discard_all(self.references, cell.refs, cell_id)
+        if cell.language != "sql":
+            return
+        _discard_all(self.sql_references, cell.refs, cell_id)
+        _discard_all(
+            self.sql_hierarchical_references,
+            _sql_ref_components(cell),
+            cell_id,
+        )
+
+    def get_referring_cells(self, name: Name) -> set[CellId_t]:
+        """Get all cells that have a ref to `name`.
+
+        Args:
+            name: The variable name
+
+        Returns:
+            Set of cell IDs that refer to this name
+        """
+        return set(self.references.get(name, ()))
+
+    def get_sql_candidates(self, name: Name) -> set[CellId_t]:
+        """Get the SQL cells that may refer to `name`.
+
+        Includes the SQL cells that refer to `name` directly, and those with
+        a hierarchical ref that has `name` as a component. The latter still
+        need to be matched against the ref's hierarchy.
+
+        Args:
+            name: The SQL variable name
+
+        Returns:
+            Set of candidate cell IDs
+        """
+        return set(self.sql_references.get(name, ())) | set(
+            self.sql_hierarchical_references.get(name.lower(), ())
+        )
+
+
+def _sql_ref_components(cell: CellImpl) -> set[str]:
+    components: set[str] = set()
+    for ref, sql_ref in cell.sql_refs.items():
+        if ref not in cell.refs:
+            continue
+        components.add(sql_ref.table.lower())
+        if sql_ref.schema is not None:
+            components.add(sql_ref.schema.lower())
+        if sql_ref.catalog is not None:
+            components.add(sql_ref.catalog.lower())
+    return components
+
+
+def _discard_all(
+    index: dict[str, set[CellId_t]],
+    names: set[str],
+    cell_id: CellId_t,
+) -> None:
+    for name in names:
+        if name not in index:
+            continue
+        cell_ids = index[name]
+        cell_ids.discard(cell_id)
+        if not cell_ids:
+            del index[name]
@@ -13,7 +13,7 @@ from typing import TYPE_CHECKING, Protocol
 from marimo._runtime.dataflow.types import Edge
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Collection, Mapping
 
     from marimo._ast.cell import CellImpl
     from marimo._types.ids import CellId_t
@@ -41,6 +41,14 @@ class GraphTopology(Protocol):
 
     def descendants(self, cell_id: CellId_t) -> set[CellId_t]: ...
 
+    def topological_sort(
+        self, cell_ids: Collection[CellId_t]
+    ) -> list[CellId_t]: ...
+
+
+# Maximum number of memoized topological sorts
+_MAX_SORTED = 128
+
 
 @dataclass
 class MutableGraphTopology(GraphTopology):
@@ -50,6 +58,9 @@ class MutableGraphTopology(GraphTopology):
     - Store cells, parents, children mappings
     - Provide fast lookups and traversals
     - No business logic, just data structure
+
+    Traversals (ancestors, descendants, topological sorts) are memoized
+    until the next mutation.
     """
 
     # Nodes in the graph
@@ -62,6 +73,25 @@ class MutableGraphTopology(GraphTopology):
     # Reversed edges (parent pointers) for convenience
     _parents: dict[CellId_t, set[CellId_t]] = field(default_factory=dict)
 
+    # Incremented on every mutation, so that derived data can be cached
+    _version: int = 0
+
+    # Memoized traversals, cleared on every mutation
+    _ancestors: dict[CellId_t, frozenset[CellId_t]] = field(
+        default_factory=dict
+    )
+    _descendants: dict[CellId_t, frozenset[CellId_t]] = field(
+        default_factory=dict
+    )
+    _sorted: dict[frozenset[CellId_t], tuple[CellId_t, ...]] = field(
+        default_factory=dict
+    )
+    _registration_order: dict[CellId_t, int] | None = None
+
+    @property
+    def version(self) -> int:
+        return self._version
+
     @property
     def cells(self) -> Mapping[CellId_t, CellImpl]:
         return self._cells
@@ -78,15 +108,80 @@ class MutableGraphTopology(GraphTopology):
         """Get all ancestors of a cell."""
         from marimo._runtime.dataflow import transitive_closure
 
-        return transitive_closure(
-            self, {cell_id}, children=False, inclusive=False
-        )
+        if cell_id not in self._ancestors:
+            self._ancestors[cell_id] = frozenset(
+                transitive_closure(
+                    self, {cell_id}, children=False, inclusive=False
+                )
+            )
+        return set(self._ancestors[cell_id])
 
     def descendants(self, cell_id: CellId_t) -> set[CellId_t]:
         """Get all descendants of a cell."""
         from marimo._runtime.dataflow import transitive_closure
 
-        return transitive_closure(self, {cell_id}, inclusive=False)
+        if cell_id not in self._descendants:
+            self._descendants[cell_id] = frozenset(
+                transitive_closure(self, {cell_id}, inclusive=False)
+            )
+        return set(self._descendants[cell_id])
+
+    def topological_sort(
+        self, cell_ids: Collection[CellId_t]
+    ) -> list[CellId_t]:
+        """Sort `cell_ids` in a topological order using a heap queue.
+
+        When multiple cells have the same parents (including no parents), the
+        tie is broken by registration order - cells registered earlier are
+        processed first.
+        """
+        from heapq import heapify, heappop, heappush
+
+        key = frozenset(cell_ids)
+        if key in self._sorted:
+            return list(self._sorted[key])
+
+        if self._registration_order is None:
+            self._registration_order = {
+                cid: idx for idx, cid in enumerate(self._cells)
+            }
+        top_down_keys = self._registration_order
+
+        # In-degree counts, within the subgraph induced by cell_ids
+        in_degree = {cid: len(self._parents[cid] & key) for cid in key}
+
+        # Initialize heap with roots
+        heap = [
+            (top_down_keys[cid], cid) for cid in key if in_degree[cid] == 0
+        ]
+        heapify(heap)
+
+        sorted_cell_ids: list[CellId_t] = []
+        while heap:
+            _, cid = heappop(heap)
+            sorted_cell_ids.append(cid)
+
+            # Process children
+            for child in self._children[cid]:
+                if child not in key:
+                    continue
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    heappush(heap, (top_down_keys[child], child))
+
+        if len(self._sorted) >= _MAX_SORTED:
+            # Evict the oldest sort
+            del self._sorted[next(iter(self._sorted))]
+        self._sorted[key] = tuple(sorted_cell_ids)
+        return sorted_cell_ids
+
+    def _invalidate(self) -> None:
+        """Clear memoized traversals after a mutation."""
+        self._version += 1
+        self._ancestors.clear()
+        self._descendants.clear()
+        self._sorted.clear()
+        self._registration_order = None
 
     def add_node(self, cell_id: CellId_t, cell: CellImpl) -> None:
         """Add a cell to the graph topology."""
@@ -94,6 +189,7 @@ class MutableGraphTopology(GraphTopology):
         self._cells[cell_id] = cell
         self._children[cell_id] = set()
         self._parents[cell_id] = set()
+        self._invalidate()
 
     def remove_node(self, cell_id: CellId_t) -> None:
         """Remove a cell from the graph topology.
@@ -113,16 +209,19 @@ class MutableGraphTopology(GraphTopology):
         del self._cells[cell_id]
         del self._children[cell_id]
         del self._parents[cell_id]
+        self._invalidate()
 
     def add_edge(self, parent: CellId_t, child: CellId_t) -> None:
         """Add an edge from parent to child."""
         self.children[parent].add(child)
         self.parents[child].add(parent)
+        self._invalidate()
 
     def remove_edge(self, parent: CellId_t, child: CellId_t) -> None:
         """Remove an edge from parent to child."""
         self.children[parent].discard(child)
         self.parents[child].discard(parent)
+        self._invalidate()
 
     def get_path(self, source: CellId_t, dst: CellId_t) -> list[Edge]:
         """Get a path from `source` to `dst`, if any.
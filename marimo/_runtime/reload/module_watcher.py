@@ -1,14 +1,19 @@
 # Copyright 2026 Marimo. All rights reserved.
 from __future__ import annotations
 
+import asyncio
+import functools
 import itertools
+import os
 import pathlib
 import sys
+import sysconfig
 import threading
 import time
 from typing import TYPE_CHECKING, Callable, Literal
 
 from marimo import _loggers
+from marimo._dependencies.dependencies import DependencyManager
 from marimo._messaging.types import Stream
 from marimo._runtime import dataflow
 from marimo._runtime.reload.autoreload import (
@@ -16,6 +21,7 @@ from marimo._runtime.reload.autoreload import (
     modules_imported_by_cell,
     safe_getattr,
 )
+from marimo._utils.file_watcher import FileWatcherManager
 
 if TYPE_CHECKING:
     import types
@@ -80,7 +86,36 @@ def _is_third_party_module(module: types.ModuleType) -> bool:
     filepath = safe_getattr(module, "__file__", None)
     if filepath is None:
         return False
-    return "site-packages" in pathlib.Path(filepath).parts
+    parts = pathlib.Path(filepath).parts
+    # Debian installs packages to dist-packages
+    return "site-packages" in parts or "dist-packages" in parts
+
+
+@functools.cache
+def _library_paths() -> tuple[str, ...]:
+    """Directories of the standard library and installed packages"""
+    paths: set[str] = set()
+    for name in ("stdlib", "platstdlib", "purelib", "platlib"):
+        try:
+            path = sysconfig.get_path(name)
+        except KeyError:
+            continue
+        if path:
+            paths.add(os.path.join(os.path.realpath(path), ""))
+    return tuple(paths)
+
+
+def _is_library_module(module: types.ModuleType) -> bool:
+    """Whether a module is part of the standard library or a package
+
+    Only the other modules (the user's) are watched for changes.
+    """
+    if _is_third_party_module(module):
+        return True
+    filepath = safe_getattr(module, "__file__", None)
+    if filepath is None:
+        return False
+    return os.path.realpath(filepath).startswith(_library_paths())
 
 
 # Cache for excluded modules to avoid recomputing on every check
@@ -101,8 +136,7 @@ def _get_excluded_modules(modules: dict[str, types.ModuleType]) -> set[str]:
     result = set(
         modname
         for modname in modules
-        if (m := modules.get(modname)) is not None
-        and _is_third_party_module(m)
+        if (m := modules.get(modname)) is not None and _is_library_module(m)
     )
     _excluded_modules_cache = (cache_key, result)
     return result
@@ -112,12 +146,20 @@ def _check_modules(
     modules: dict[str, types.ModuleType],
     reloader: ModuleReloader,
     sys_modules: dict[str, types.ModuleType],
+    candidates: dict[str, types.ModuleType] | None = None,
 ) -> dict[str, types.ModuleType]:
-    """Returns the set of modules used by the graph that have been modified"""
+    """Returns the set of modules used by the graph that have been modified
+
+    Only the timestamps of `candidates` are checked, if given; otherwise, all
+    of `sys_modules` are checked.
+    """
     stale_modules: dict[str, types.ModuleType] = {}
-    modified_modules = reloader.check(modules=sys_modules, reload=False)
-    # TODO(akshayka): could also exclude modules part of the standard library;
-    # haven't found a reliable way to do this, however.
+    modified_modules = reloader.check(
+        modules=sys_modules if candidates is None else candidates,
+        reload=False,
+    )
+    if not modified_modules:
+        return stale_modules
     excludes = _get_excluded_modules(sys_modules)
 
     target_modules = set(m for m in modified_modules if m is not None)
@@ -137,6 +179,74 @@ def _check_modules(
     return stale_modules
 
 
+class GraphModules:
+    """The modules imported by the cells of a graph.
+
+    Collecting them requires the graph lock and a walk over every cell, so
+    they are only collected again when the graph or sys.modules changes.
+    """
+
+    def __init__(self, graph: dataflow.DirectedGraph) -> None:
+        self._graph = graph
+        self._key: tuple[int, int] | None = None
+        self._modules: dict[str, types.ModuleType] = {}
+        self._modname_to_cell_id: dict[str, CellId_t] = {}
+
+    def get(
+        self, sys_modules: dict[str, types.ModuleType]
+    ) -> tuple[dict[str, types.ModuleType], dict[str, CellId_t]]:
+        """Returns the modules used by the graph, and the cells using them"""
+        # Modules are only added to or removed from sys.modules in practice,
+        # so its size is a cheap proxy for changes.
+        key = (self._graph.version, len(sys_modules))
+        if key != self._key:
+            modules: dict[str, types.ModuleType] = {}
+            modname_to_cell_id: dict[str, CellId_t] = {}
+            with self._graph.lock:
+                for cell_id, cell in self._graph.cells.items():
+                    for modname in modules_imported_by_cell(cell, sys_modules):
+                        if modname in sys_modules:
+                            modules[modname] = sys_modules[modname]
+                            modname_to_cell_id[modname] = cell_id
+            self._modules = modules
+            self._modname_to_cell_id = modname_to_cell_id
+            self._key = key
+        return self._modules, self._modname_to_cell_id
+
+
+def _mark_stale(
+    graph: dataflow.DirectedGraph,
+    stale_modules: dict[str, types.ModuleType],
+    modname_to_cell_id: dict[str, CellId_t],
+    stream: Stream,
+) -> None:
+    LOGGER.debug("Found stale modules; acquiring lock to update graph.")
+    with graph.lock:
+        LOGGER.debug("Acquired graph lock.")
+        for modname in stale_modules.keys():
+            # prune definitions that are derived from stale modules
+            cell_id = modname_to_cell_id[modname]
+            cell = graph.cells[cell_id]
+            defs_to_prune = [
+                import_data.definition
+                for import_data in cell.imports
+                if import_data.module == modname
+            ]
+            cell.import_workspace.imported_defs -= set(defs_to_prune)
+
+        # If any modules are stale, communicate that to the FE
+        # and update the backend's view of the importing cells'
+        # staleness
+        stale_cell_ids = dataflow.transitive_closure(
+            graph,
+            set(modname_to_cell_id[modname] for modname in stale_modules),
+            relatives=dataflow.get_import_block_relatives(graph),
+        )
+        for cid in stale_cell_ids:
+            graph.cells[cid].set_stale(stale=True, stream=stream)
+    LOGGER.debug("Released graph lock and updated stale statuses.")
+
+
 MODULE_WATCHER_SLEEP_INTERVAL = 1.0
 
 # For testing only - do not use in production
@@ -162,16 +272,10 @@ def watch_modules(
     # in CPython, dict.copy() is atomic
     sys_modules = sys.modules.copy()
     sleep_interval = _TEST_SLEEP_INTERVAL or MODULE_WATCHER_SLEEP_INTERVAL
+    graph_modules = GraphModules(graph)
     while not should_exit.is_set():
         # Collect the modules used by each cell
-        modules: dict[str, types.ModuleType] = {}
-        modname_to_cell_id: dict[str, CellId_t] = {}
-        with graph.lock:
-            for cell_id, cell in graph.cells.items():
-                for modname in modules_imported_by_cell(cell, sys_modules):
-                    if modname in sys_modules:
-                        modules[modname] = sys_modules[modname]
-                        modname_to_cell_id[modname] = cell_id
+        modules, modname_to_cell_id = graph_modules.get(sys_modules)
 
         stale_modules = _check_modules(
             modules=modules,
@@ -180,37 +284,7 @@ def watch_modules(
         )
 
         if stale_modules:
-            LOGGER.debug(
-                "Found stale modules; acquiring lock to update graph."
-            )
-            with graph.lock:
-                LOGGER.debug("Acquired graph lock.")
-                for modname in stale_modules.keys():
-                    # prune definitions that are derived from stale modules
-                    cell_id = modname_to_cell_id[modname]
-                    cell = graph.cells[cell_id]
-                    defs_to_prune = [
-                        import_data.definition
-                        for import_data in cell.imports
-                        if import_data.module == modname
-                    ]
-                    cell.import_workspace.imported_defs -= set(defs_to_prune)
-
-                # If any modules are stale, communicate that to the FE
-                # and update the backend's view of the importing cells'
-                # staleness
-                stale_cell_ids = dataflow.transitive_closure(
-                    graph,
-                    set(
-                        modname_to_cell_id[modname]
-                        for modname in stale_modules
-                    ),
-                    relatives=dataflow.get_import_block_relatives(graph),
-                )
-                for cid in stale_cell_ids:
-                    graph.cells[cid].set_stale(stale=True, stream=stream)
-            LOGGER.debug("Released graph lock and updated stale statuses.")
-
+            _mark_stale(graph, stale_modules, modname_to_cell_id, stream)
             if mode == "autorun":
                 run_is_processed.clear()
                 enqueue_run_stale_cells()
@@ -223,7 +297,161 @@ def watch_modules(
         sys_modules = sys.modules.copy()
 
 
+def _user_module_files(
+    modules: dict[str, types.ModuleType],
+    reloader: ModuleReloader,
+    sys_modules: dict[str, types.ModuleType],
+) -> dict[str, set[str]]:
+    """Returns the source files of the user modules used by the graph
+
+    Includes the user modules that they import, recursively. Maps each file
+    to the names of the modules defined by it.
+    """
+    excludes = _get_excluded_modules(sys_modules)
+    files: dict[str, set[str]] = {}
+    for module in modules.values():
+        dependencies = reloader.get_module_dependencies(
+            module, excludes=excludes
+        )
+        for modname in itertools.chain([module.__name__], dependencies.keys()):
+            found = sys_modules.get(modname)
+            if found is None or _is_library_module(found):
+                continue
+            module_mtime = reloader.filename_and_mtime(found)
+            if module_mtime is not None:
+                files.setdefault(module_mtime.name, set()).add(modname)
+    return files
+
+
+class _ModuleFileWatcher:
+    """Watches the source files of the user modules used by the graph.
+
+    Unlike `watch_modules`, doesn't poll: the watcher only does work when a
+    watched file changes, or when it is told that the graph may import new
+    modules.
+    """
+
+    def __init__(
+        self,
+        graph: dataflow.DirectedGraph,
+        reloader: ModuleReloader,
+        mode: Literal["lazy", "autorun"],
+        enqueue_run_stale_cells: Callable[[], None],
+        should_exit: threading.Event,
+        run_is_processed: threading.Event,
+        stream: Stream,
+    ) -> None:
+        self.graph = graph
+        self.reloader = reloader
+        self.mode = mode
+        self.enqueue_run_stale_cells = enqueue_run_stale_cells
+        self.should_exit = should_exit
+        self.run_is_processed = run_is_processed
+        self.stream = stream
+
+        self._graph_modules = GraphModules(graph)
+        # file -> names of modules defined by it
+        self._watched: dict[str, set[str]] = {}
+        self._changed: set[str] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+
+    def run(self) -> None:
+        try:
+            asyncio.run(self._watch())
+        except Exception as e:
+            # eg, the OS limit on watches or inotify instances was reached
+            LOGGER.warning(
+                "Failed to watch module files, polling them instead: %s", e
+            )
+            self._loop = None
+            watch_modules(
+                self.graph,
+                self.reloader,
+                self.mode,
+                self.enqueue_run_stale_cells,
+                self.should_exit,
+                self.run_is_processed,
+                self.stream,
+            )
+
+    def wake(self) -> None:
+        """Wake the watcher, eg to watch newly imported modules."""
+        # If the loop hasn't started yet, its first update is still to come
+        if self._loop is None or self._wake is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._wake.set)
+        except RuntimeError:
+            # The loop is closed
+            pass
+
+    async def _on_file_changed(self, path: pathlib.Path) -> None:
+        self._changed.add(str(path))
+        assert self._wake is not None
+        self._wake.set()
+
+    async def _watch(self) -> None:
+        self._wake = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        manager = FileWatcherManager()
+        try:
+            while not self.should_exit.is_set():
+                await self._update(manager)
+                await self._wake.wait()
+                self._wake.clear()
+        finally:
+            manager.stop_all()
+
+    async def _update(self, manager: FileWatcherManager) -> None:
+        sys_modules = sys.modules.copy()
+        modules, modname_to_cell_id = self._graph_modules.get(sys_modules)
+        files = _user_module_files(modules, self.reloader, sys_modules)
+
+        for file in self._watched.keys() - files.keys():
+            manager.remove_callback(pathlib.Path(file), self._on_file_changed)
+        new_files = files.keys() - self._watched.keys()
+        for file in new_files:
+            manager.add_callback(pathlib.Path(file), self._on_file_changed)
+        self._watched = files
+
+        # Files may have changed before they were watched
+        changed = self._changed | new_files
+        self._changed = set()
+        candidates = {
+            modname: sys_modules[modname]
+            for file in changed
+            for modname in files.get(file, ())
+            if modname in sys_modules
+        }
+        if not candidates:
+            return
+
+        stale_modules = _check_modules(
+            modules=modules,
+            reloader=self.reloader,
+            sys_modules=sys_modules,
+            candidates=candidates,
+        )
+        if stale_modules:
+            _mark_stale(
+                self.graph, stale_modules, modname_to_cell_id, self.stream
+            )
+            if self.mode == "autorun":
+                self.run_is_processed.clear()
+                self.enqueue_run_stale_cells()
+                # Don't proceed until the stale cells have been rerun
+                await asyncio.to_thread(self.run_is_processed.wait)
+
+
 class ModuleWatcher:
+    """Marks cells stale when the modules they import are modified.
+
+    If `event_driven`, module files are watched with the file watcher
+    (watchdog, if installed); otherwise, all modules are polled.
+    Defaults to event-driven when watchdog is installed.
+    """
+
     def __init__(
         self,
         graph: dataflow.DirectedGraph,
@@ -231,6 +459,7 @@ class ModuleWatcher:
         mode: Literal["lazy", "autorun"],
         enqueue_run_stale_cells: Callable[[], None],
         stream: Stream,
+        event_driven: bool | None = None,
     ) -> None:
         # ModuleWatcher uses the graph to determine the modules used by the
         # notebook
@@ -248,19 +477,34 @@ class ModuleWatcher:
         self.mode = mode
         # A callable that signals the kernel to run stale cells
         self.enqueue_run_stale_cells = enqueue_run_stale_cells
-        threading.Thread(
-            target=watch_modules,
-            args=(
-                self.graph,
-                self.reloader,
-                self.mode,
-                self.enqueue_run_stale_cells,
-                self.should_exit,
-                self.run_is_processed,
-                self.stream,
-            ),
-            daemon=True,
-        ).start()
+        if event_driven is None:
+            event_driven = DependencyManager.watchdog.has()
+        self._file_watcher: _ModuleFileWatcher | None = None
+        args = (
+            self.graph,
+            self.reloader,
+            self.mode,
+            self.enqueue_run_stale_cells,
+            self.should_exit,
+            self.run_is_processed,
+            self.stream,
+        )
+        if event_driven:
+            self._file_watcher = _ModuleFileWatcher(*args)
+            threading.Thread(
+                target=self._file_watcher.run, daemon=True
+            ).start()
+        else:
+            threading.Thread(
+                target=watch_modules, args=args, daemon=True
+            ).start()
+
+    def refresh(self) -> None:
+        """Notify the watcher that cells may have imported new modules."""
+        if self._file_watcher is not None:
+            self._file_watcher.wake()
 
     def stop(self) -> None:
         self.should_exit.set()
+        if self._file_watcher is not None:
+            self._file_watcher.wake()
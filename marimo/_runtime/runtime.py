@@ -209,7 +209,13 @@ from marimo._utils.signals import restore_signals
 from marimo._utils.typed_connection import TypedConnection
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Iterator, Sequence
+    from collections.abc import (
+        Awaitable,
+        Collection,
+        Iterator,
+        Mapping,
+        Sequence,
+    )
     from types import ModuleType
 
     from marimo._plugins.ui._core.ui_element import UIElement
@@ -811,6 +817,20 @@ class Kernel:
         cell: CellImpl,
         stale: bool,
     ) -> None:
+        self._prepare_cell(cell_id, cell, stale)
+        self.graph.register_cell(cell_id, cell)
+        self._check_stale_modules(cell)
+        LOGGER.debug("registered cell %s", cell_id)
+        LOGGER.debug("parents: %s", self.graph.parents[cell_id])
+        LOGGER.debug("children: %s", self.graph.children[cell_id])
+
+    def _prepare_cell(
+        self,
+        cell_id: CellId_t,
+        cell: CellImpl,
+        stale: bool,
+    ) -> None:
+        """Restore a cell's config before it is added to the graph."""
         if cell_id in self.cell_metadata:
             # If we already have a config for this cell id, restore it
             # This can happen when a cell was previously deactivated (due to a
@@ -820,9 +840,11 @@ class Kernel:
         elif cell_id not in self.cell_metadata:
             self.cell_metadata[cell_id] = CellMetadata()
 
-        self.graph.register_cell(cell_id, cell)
         if stale:
-            self.graph.cells[cell_id].set_stale(stale=True, broadcast=False)
+            cell.set_stale(stale=True, broadcast=False)
+
+    def _check_stale_modules(self, cell: CellImpl) -> None:
+        """Mark a registered cell stale if it uses stale modules."""
         # leaky abstraction: the graph doesn't know about stale modules, so
         # we have to check for them here.
         module_reloader = self.module_reloader
@@ -831,9 +853,6 @@ class Kernel:
             and module_reloader.cell_uses_stale_modules(cell)
         ):
             self.graph.set_stale(set([cell.cell_id]), prune_imports=True)
-        LOGGER.debug("registered cell %s", cell_id)
-        LOGGER.debug("parents: %s", self.graph.parents[cell_id])
-        LOGGER.debug("children: %s", self.graph.children[cell_id])
 
     def _try_compiling_cell(
         self, cell_id: CellId_t, code: str, carried_imports: list[ImportData]
@@ -887,27 +906,6 @@ class Kernel:
                 error = UnknownError(msg=tmpio.read())
         return cell, error
 
-    def _try_registering_cell(
-        self,
-        cell_id: CellId_t,
-        code: str,
-        carried_imports: list[ImportData],
-        stale: bool,
-    ) -> Optional[Error]:
-        """Attempt to register a cell with given id and code.
-
-        Precondition: a cell with the supplied id must not already exist in the
-        graph.
-
-        If cell was unable to be registered, returns an Error object.
-        """
-        cell, error = self._try_compiling_cell(cell_id, code, carried_imports)
-
-        if cell is not None:
-            self._register_cell(cell_id, cell, stale)
-
-        return error
-
     def _maybe_register_cell(
         self, cell_id: CellId_t, code: str, stale: bool
     ) -> tuple[set[CellId_t], Optional[Error]]:
@@ -924,11 +922,45 @@ class Kernel:
           different code.
         - an `Error` if the cell couldn't be registered, `None` otherwise
         """
-        previous_children: set[CellId_t] = set()
-        error = None
-        if not self.graph.is_cell_cached(cell_id, code):
-            previous_cell = self.graph.cells.get(cell_id, None)
+        previous_children, errors = self._maybe_register_cells(
+            {cell_id: code},
+            deletions=(),
+            cells_starting_stale={cell_id} if stale else set(),
+        )
+        return previous_children, errors.get(cell_id)
+
+    def _maybe_register_cells(
+        self,
+        cells: Mapping[CellId_t, str],
+        deletions: Collection[CellId_t],
+        cells_starting_stale: set[CellId_t],
+    ) -> tuple[set[CellId_t], dict[CellId_t, Error]]:
+        """Register cells that aren't already registered and delete cells.
 
+        Like `_maybe_register_cell`, for many cells; also deletes the cells
+        in `deletions` that are in the graph. The graph is mutated once, for
+        all cells.
+
+        Returns:
+        - a set of ids for cells that were previously children of a
+          re-registered or deleted cell, but no longer are
+        - `Error`s for the cells that couldn't be registered
+        """
+        deletions = {cid for cid in deletions if cid in self.graph.cells}
+        registrations: dict[CellId_t, CellImpl] = {}
+        errors: dict[CellId_t, Error] = {}
+        # Cells removed from the graph (deleted, or replaced by a new
+        # version), mapped to their children that might become stale
+        removed: dict[CellId_t, set[CellId_t]] = {}
+        previous_cells: dict[CellId_t, CellImpl] = {}
+
+        for cell_id, code in cells.items():
+            if cell_id in deletions or self.graph.is_cell_cached(
+                cell_id, code
+            ):
+                continue
+
+            previous_cell = self.graph.cells.get(cell_id, None)
             if (
                 previous_cell is not None
                 and previous_cell.import_workspace.is_import_block
@@ -948,17 +980,35 @@ class Kernel:
 
             if previous_cell is not None:
                 LOGGER.debug("Deleting cell %s", cell_id)
-                previous_children = self._deactivate_cell(cell_id)
+                previous_cells[cell_id] = previous_cell
+                removed[cell_id] = self._deactivate_cell(cell_id)
 
-            error = self._try_registering_cell(
-                cell_id, code, carried_imports=carried_imports, stale=stale
+            cell, error = self._try_compiling_cell(
+                cell_id, code, carried_imports
             )
-            if error is not None and previous_cell is not None:
-                # The frontend keeps the cell around in the case of a
-                # registration error; let the FE know the cell is no longer
-                # stale.
-                previous_cell.set_stale(False)
-
+            if cell is not None:
+                self._prepare_cell(
+                    cell_id, cell, stale=cell_id in cells_starting_stale
+                )
+                registrations[cell_id] = cell
+            if error is not None:
+                errors[cell_id] = error
+                if previous_cell is not None:
+                    # The frontend keeps the cell around in the case of a
+                    # registration error; let the FE know the cell is no
+                    # longer stale.
+                    previous_cell.set_stale(False)
+
+        for cell_id in deletions:
+            del self.cell_metadata[cell_id]
+            self.graph.cells[cell_id].import_workspace.imported_defs = set()
+            # Note: we don't remove packages from the inline script-metadata.
+            removed[cell_id] = self._deactivate_cell(cell_id)
+
+        self.graph.update(registrations, deletions=removed.keys())
+
+        for cell_id, cell in registrations.items():
+            self._check_stale_modules(cell)
             # For any newly imported namespaces, add them to the metadata
             #
             # TODO(akshayka): Consider using the module watcher to discover
@@ -966,30 +1016,33 @@ class Kernel:
             # discovering transitive dependencies, ie if a notebook used a
             # local module that in turn used packages available on PyPI.
             if self.packages_callbacks.should_update_script_metadata():
-                cell = self.graph.cells.get(cell_id, None)
-                if cell:
-                    prev_imports: set[Name] = (
-                        set([im.namespace for im in previous_cell.imports])
-                        if previous_cell
-                        else set()
-                    )
-                    to_add = cell.imported_namespaces - prev_imports
-                    self.packages_callbacks.update_script_metadata(
-                        import_namespaces_to_add=list(to_add)
-                    )
+                previous_cell = previous_cells.get(cell_id, None)
+                prev_imports: set[Name] = (
+                    set([im.namespace for im in previous_cell.imports])
+                    if previous_cell
+                    else set()
+                )
+                to_add = cell.imported_namespaces - prev_imports
+                self.packages_callbacks.update_script_metadata(
+                    import_namespaces_to_add=list(to_add)
+                )
 
         LOGGER.debug(
-            "graph:\n\tcell id %s\n\tparents %s\n\tchildren %s",
-            cell_id,
+            "graph:\n\tcell ids %s\n\tparents %s\n\tchildren %s",
+            list(cells.keys()),
             self.graph.parents,
             self.graph.children,
         )
 
-        # We only return cells that were previously children of cell_id
-        # but are no longer children of the newly registered cell; these
-        # returned cells are stale.
-        children = self.graph.children.get(cell_id, set())
-        return previous_children - children, error
+        # We only return cells that were previously children of removed
+        # cells but are no longer children of the newly registered cells;
+        # these returned cells are stale.
+        previous_children: set[CellId_t] = set()
+        for cell_id, children in removed.items():
+            previous_children |= children - self.graph.children.get(
+                cell_id, set()
+            )
+        return previous_children, errors
 
     def _delete_variables(
         self,
@@ -1084,41 +1137,23 @@ class Kernel:
         broadcast_notification(RemoveUIElementsNotification(cell_id=cell_id))
 
     def _deactivate_cell(self, cell_id: CellId_t) -> set[CellId_t]:
-        """Deactivate: remove from graph, invalidate state, but keep metadata
+        """Invalidate state of a cell about to be removed from the graph.
 
         Keeps the cell's config, in case we see the same cell again.
 
-        In contrast to deleting a cell, which fully scrubs the cell
-        from the kernel and graph.
+        Returns the cell's children whose state was derived from it.
         """
         if cell_id not in self.errors:
             self._invalidate_cell_state(cell_id, deletion=True)
-            return self.graph.delete_cell(cell_id)
+            return self.graph.children[cell_id].copy()
         else:
             # An errored cell can be thought of as a cell that's in the graph
             # but that has no state in the kernel (because it was never run).
             # Its defs may overlap with defs of a non-errored cell, so we MUST
             # NOT delete/cleanup its defs from the kernel (i.e., an errored
             # cell shouldn't invalidate state of another cell).
-            self.graph.delete_cell(cell_id)
             return set()
 
-    def _delete_cell(self, cell_id: CellId_t) -> set[CellId_t]:
-        """Delete a cell from the kernel and the graph.
-
-        Deletion from the kernel involves removing cell's defs and
-        de-registering its UI Elements.
-
-        Deletion from graph is forwarded to graph object.
-        """
-        del self.cell_metadata[cell_id]
-        cell = self.graph.cells[cell_id]
-        cell.import_workspace.imported_defs = set()
-
-        # Note: we don't remove packages from the inline script-metadata.
-
-        return self._deactivate_cell(cell_id)
-
     def mutate_graph(
         self,
         execution_requests: Sequence[ExecuteCellCommand],
@@ -1151,35 +1186,30 @@ class Kernel:
             set() if cells_starting_stale is None else cells_starting_stale
         )
 
-        # The set of cells that were successfully registered
-        registered_cell_ids: set[CellId_t] = set()
-
-        # The set of cells that need to be re-run due to cells being
-        # deleted/re-registered.
-        cells_that_were_children_of_mutated_cells: set[CellId_t] = set()
-
-        # Cells that were unable to be added to the graph due to syntax errors
-        syntax_errors: dict[CellId_t, Error] = {}
-
-        # Register and delete cells
-        for er in execution_requests:
-            old_children, error = self._maybe_register_cell(
-                er.cell_id, er.code, stale=er.cell_id in cells_starting_stale
-            )
-            cells_that_were_children_of_mutated_cells |= old_children
-            if error is None:
-                registered_cell_ids.add(er.cell_id)
-            else:
-                syntax_errors[er.cell_id] = error
-
-        for dr in deletion_requests:
-            if dr.cell_id not in cells_before_mutation:
-                continue
-            cells_that_were_children_of_mutated_cells |= self._delete_cell(
-                dr.cell_id
-            )
+        # Register and delete cells, mutating the graph once.
+        #
+        # cells_that_were_children_of_mutated_cells: the set of cells that
+        # need to be re-run due to cells being deleted/re-registered.
+        #
+        # syntax_errors: cells that were unable to be added to the graph due
+        # to syntax errors
+        (
+            cells_that_were_children_of_mutated_cells,
+            syntax_errors,
+        ) = self._maybe_register_cells(
+            {er.cell_id: er.code for er in execution_requests},
+            deletions=[dr.cell_id for dr in deletion_requests],
+            cells_starting_stale=cells_starting_stale,
+        )
         cells_in_graph = set(self.graph.cells.keys())
 
+        # The set of cells that were successfully registered
+        registered_cell_ids: set[CellId_t] = {
+            er.cell_id
+            for er in execution_requests
+            if er.cell_id not in syntax_errors and er.cell_id in cells_in_graph
+        }
+
         # Check for semantic errors, like multiple definition errors, cycle
         # errors, and delete nonlocal errors.
         semantic_errors = check_for_errors(self.graph)
@@ -1369,6 +1399,9 @@ class Kernel:
                         self.graph.set_stale(cell_ids, prune_imports=True)
                         break
                 LOGGER.debug("Finished run.")
+            if self.module_watcher is not None:
+                # Cells may have imported modules that should be watched
+                self.module_watcher.refresh()
 
     async def _if_autorun_then_run_cells(
         self, cell_ids: set[CellId_t]
@@ -1595,7 +1628,7 @@ class Kernel:
             execution_requests_cell_ids = {
                 er.cell_id for er in execution_requests
             }
-            graph = dataflow.DirectedGraph()
+            registrations: dict[CellId_t, CellImpl] = {}
             # cells in execution_requests that should be initially marked as
             # stale:
             cells_starting_stale: set[CellId_t] = set()
@@ -1614,17 +1647,23 @@ class Kernel:
                 except Exception:
                     # The cell was not parsable.
                     continue
-                graph.register_cell(cell_id=cid, cell=cell)
+                registrations[cid] = cell
 
-            # Collect uninstantiated ancestors
-            ancestors: set[CellId_t] = set()
             for er in execution_requests:
                 try:
                     cell = compile_cell(er.code, cell_id=er.cell_id)
                 except Exception:
                     continue
-                graph.register_cell(cell_id=er.cell_id, cell=cell)
-                ancestors |= graph.ancestors(er.cell_id)
+                registrations[er.cell_id] = cell
+
+            graph = dataflow.DirectedGraph()
+            graph.update(registrations)
+
+            # Collect uninstantiated ancestors
+            ancestors: set[CellId_t] = set()
+            for er in execution_requests:
+                if er.cell_id in graph.cells:
+                    ancestors |= graph.ancestors(er.cell_id)
 
             # We run all uninstantiated ancestors of the requested cells
             previously_uninstantiated_requests: list[ExecuteCellCommand] = []
@@ -3305,10 +3344,10 @@ class CacheCallbacks:
 
         for obj in ctx.globals.values():
             if isinstance(obj, CacheContext):
-                hits, misses, _, _, time = obj.cache_info()
-                total_hits += hits
-                total_misses += misses
-                total_time += time
+                info = obj.cache_info()
+                total_hits += info.hits
+                total_misses += info.misses
+                total_time += info.time_saved
                 # d2f, dt = obj.loader.disk_usage()
         broadcast_notification(
             CacheInfoNotification(
@@ -3591,6 +3630,8 @@ def launch_kernel(
     # is shared between the main thread and mo.Thread's right now ...
     get_context().virtual_file_registry.shutdown()
     get_context().app_kernel_runner_registry.shutdown()
+    # Finish writing caches saved in the background
+    get_context().cache_store.flush()
     teardown_context()
     kernel.teardown()
     if isinstance(pipe, connection.Connection):
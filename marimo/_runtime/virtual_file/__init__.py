@@ -19,9 +19,11 @@ from marimo._runtime.virtual_file.virtual_file import (
     VirtualFileLifecycleItem,
     VirtualFileRegistry,
     VirtualFileRegistryItem,
+    content_filename,
     random_filename,
     read_virtual_file,
     read_virtual_file_chunked,
+    stream_virtual_file,
 )
 
 __all__ = [
@@ -36,7 +38,9 @@ __all__ = [
     "VirtualFileLifecycleItem",
     "VirtualFileRegistryItem",
     "VirtualFileRegistry",
+    "content_filename",
     "random_filename",
     "read_virtual_file",
     "read_virtual_file_chunked",
+    "stream_virtual_file",
 ]
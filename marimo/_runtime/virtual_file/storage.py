@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import sys
+import threading
+from collections import Counter
 from typing import TYPE_CHECKING, Protocol
 
 from marimo._utils.platform import is_pyodide
@@ -47,6 +49,24 @@ class VirtualFileStorage(Protocol):
         """
         ...
 
+    def stream(
+        self,
+        key: str,
+        start: int,
+        end: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes | memoryview]:
+        """Stream bytes [start, end) of the buffer by key.
+
+        Yields views of the stored buffer where the backend can keep them
+        valid after they are handed out (the server may hold on to a chunk
+        after requesting the next one), and copies of each chunk otherwise.
+
+        Raises:
+            KeyError: If key not found
+        """
+        ...
+
     def remove(self, key: str) -> None:
         """Remove stored data by key."""
         ...
@@ -101,12 +121,18 @@ class SharedMemoryStorage(VirtualFileStorage):
         # except FileNotFoundError:
         #   # virtual file was removed
         # ```
-        shm = shared_memory.SharedMemory(
-            name=key,
-            create=True,
-            size=len(buffer),
-        )
-        shm.buf[: len(buffer)] = buffer
+        try:
+            shm = shared_memory.SharedMemory(
+                name=key,
+                create=True,
+                size=len(buffer),
+            )
+            shm.buf[: len(buffer)] = buffer
+        except FileExistsError:
+            # Keys are derived from the buffer's contents, so a segment
+            # leaked by a previous process under this key holds the same
+            # contents; reuse it, and unlink it when it's removed.
+            shm = shared_memory.SharedMemory(name=key)
         # we can safely close this shm, since we don't need to access its
         # buffer; we do need to keep it around so we can unlink it later
         if sys.platform != "win32":
@@ -166,6 +192,37 @@ class SharedMemoryStorage(VirtualFileStorage):
             if shm is not None:
                 shm.close()
 
+    def stream(
+        self,
+        key: str,
+        start: int,
+        end: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes | memoryview]:
+        if is_pyodide():
+            raise RuntimeError(
+                "Shared memory is not supported on this platform"
+            )
+        shm = None
+        view = None
+        try:
+            shm = shared_memory.SharedMemory(name=key)
+            view = shm.buf[start:end]
+            for i in range(0, len(view), chunk_size):
+                # Chunks are copied: the server may still hold a chunk when
+                # the segment is closed (e.g. after a partial send), and
+                # close() fails while any view of it is alive.
+                yield bytes(view[i : i + chunk_size])
+        except FileNotFoundError as err:
+            raise KeyError(f"Virtual file not found: {key}") from err
+        finally:
+            # Release the memoryview before closing the shared memory,
+            # otherwise close() fails with "cannot close exported pointers".
+            if view is not None:
+                view.release()
+            if shm is not None:
+                shm.close()
+
     def remove(self, key: str) -> None:
         if key in self._storage:
             if sys.platform == "win32":
@@ -226,6 +283,19 @@ class InMemoryStorage(VirtualFileStorage):
         for i in range(0, end, chunk_size):
             yield buffer[i : min(i + chunk_size, end)]
 
+    def stream(
+        self,
+        key: str,
+        start: int,
+        end: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes | memoryview]:
+        if key not in self._storage:
+            raise KeyError(f"Virtual file not found: {key}")
+        view = memoryview(self._storage[key])[start:end]
+        for i in range(0, len(view), chunk_size):
+            yield view[i : i + chunk_size]
+
     def remove(self, key: str) -> None:
         if key in self._storage:
             del self._storage[key]
@@ -246,6 +316,11 @@ class VirtualFileStorageManager:
 
     _instance: VirtualFileStorageManager | None = None
     _storage: VirtualFileStorage | None = None
+    # Files stored in shared memory by kernels forked from a fork server,
+    # counted per kernel; only these are read from shared memory when the
+    # server has its own storage
+    _shared_files: Counter[str] = Counter()
+    _shared_files_lock = threading.Lock()
 
     def __new__(cls) -> VirtualFileStorageManager:
         if cls._instance is None:
@@ -262,6 +337,18 @@ class VirtualFileStorageManager:
     def storage(self, value: VirtualFileStorage | None) -> None:
         self._storage = value
 
+    def add_shared_file(self, filename: str) -> None:
+        """Record that a forked kernel stored `filename` in shared memory."""
+        with self._shared_files_lock:
+            self._shared_files[filename] += 1
+
+    def remove_shared_file(self, filename: str) -> None:
+        """Record that a forked kernel removed `filename` from shared memory."""
+        with self._shared_files_lock:
+            self._shared_files[filename] -= 1
+            if self._shared_files[filename] <= 0:
+                del self._shared_files[filename]
+
     def read(self, filename: str, byte_length: int) -> bytes:
         """Read from storage, with cross-process fallback for EDIT mode server.
 
@@ -269,12 +356,7 @@ class VirtualFileStorageManager:
             KeyError: If file not found
             RuntimeError: When ``SharedMemoryStorage`` is used on the Pyodide platform.
         """
-        storage = self.storage
-        if storage is None:
-            # Never initialized so in a separate thread from the kernel.
-            # Use SharedMemoryStorage to read by name across processes
-            return SharedMemoryStorage().read(filename, byte_length)
-        return storage.read(filename, byte_length)
+        return self._storage_for(filename).read(filename, byte_length)
 
     def read_chunked(
         self,
@@ -291,10 +373,40 @@ class VirtualFileStorageManager:
             KeyError: If file not found
             RuntimeError: When ``SharedMemoryStorage`` is used on the Pyodide platform.
         """
+        yield from self._storage_for(filename).read_chunked(
+            filename, byte_length, chunk_size
+        )
+
+    def stream(
+        self,
+        filename: str,
+        start: int,
+        end: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes | memoryview]:
+        """Stream a byte range from storage, with cross-process fallback.
+
+        Yields views of the stored buffer where possible; see
+        `VirtualFileStorage.stream`.
+
+        Raises:
+            KeyError: If file not found
+            RuntimeError: When ``SharedMemoryStorage`` is used on the Pyodide platform.
+        """
+        yield from self._storage_for(filename).stream(
+            filename, start, end, chunk_size
+        )
+
+    def _storage_for(self, filename: str) -> VirtualFileStorage:
         storage = self.storage
         if storage is None:
-            yield from SharedMemoryStorage().read_chunked(
-                filename, byte_length, chunk_size
-            )
-        else:
-            yield from storage.read_chunked(filename, byte_length, chunk_size)
+            # Never initialized so in a separate thread from the kernel.
+            # Use SharedMemoryStorage to read by name across processes
+            return SharedMemoryStorage()
+        if not storage.has(filename):
+            with self._shared_files_lock:
+                shared = filename in self._shared_files
+            if shared:
+                # The file belongs to a forked run-mode kernel
+                return SharedMemoryStorage()
+        return storage
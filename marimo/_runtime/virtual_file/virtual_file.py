@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import base64
 import dataclasses
+import hashlib
 import mimetypes
 import random
 import string
@@ -36,13 +37,35 @@ _ALPHABET = string.ascii_letters + string.digits
 def random_filename(ext: str) -> str:
     # adapted from: https://stackoverflow.com/questions/13484726/safe-enough-8-character-short-unique-random-string  # noqa: E501
     # TODO(akshayka): should callers redraw if they get a collision?
+    basename = _thread_id() + "-" + "".join(random.choices(_ALPHABET, k=8))
+    return f"{basename}.{ext}"
+
+
+def _thread_id() -> str:
     try:
-        tid = str(threading.get_native_id())
+        return str(threading.get_native_id())
     except AttributeError:
         # get_native_id() not implemented in pyodide/WASM
-        tid = "0"
-    basename = tid + "-" + "".join(random.choices(_ALPHABET, k=8))
-    return f"{basename}.{ext}"
+        return "0"
+
+
+def content_filename(buffer: bytes, ext: str) -> str:
+    """Name a virtual file after its contents.
+
+    Identical buffers get identical names, so they share storage and
+    browsers can cache them indefinitely. Names are prefixed with the
+    thread id, since sessions that share storage run in different threads.
+    Names are kept short because shared memory names are limited to 31
+    characters on macOS.
+    """
+    digest = int.from_bytes(
+        hashlib.blake2b(buffer, digest_size=9).digest(), "big"
+    )
+    chars: list[str] = []
+    while digest:
+        digest, index = divmod(digest, len(_ALPHABET))
+        chars.append(_ALPHABET[index])
+    return f"{_thread_id()}-{''.join(chars)}.{ext}"
 
 
 @dataclasses.dataclass
@@ -88,10 +111,13 @@ class VirtualFile:
 
         Falls back to a data URL if no runtime context is available,
         virtual files aren't supported, or the buffer is empty.
+
+        Files are named after their contents, so registering a buffer that
+        is already registered reuses the existing file.
         """
         from marimo._runtime.context import get_context
 
-        vfile_name = random_filename(ext)
+        vfile_name = content_filename(buffer, ext)
 
         def return_data_url() -> VirtualFile:
             return VirtualFile(
@@ -153,49 +179,35 @@ class VirtualFileLifecycleItem(CellLifecycleItem):
     def create(self, context: RuntimeContext | None) -> None:
         """Create the virtual file
 
-        Every virtual file gets a unique random name. Uniqueness is
-        required for reference counting.
+        Every virtual file is named after its contents. Items with the same
+        contents share a virtual file, which the registry keeps until every
+        item has removed it.
         """
-        filename = random_filename(self.ext)
+        filename = content_filename(self.buffer, self.ext)
         if context is None or not context.virtual_files_supported:
             self._virtual_file = VirtualFile(
                 filename=filename, buffer=self.buffer, as_data_url=True
             )
             return
 
-        registry = context.virtual_file_registry
-        # create a unique filename for the virtual file
-        tries = 0
-        max_tries = 100
-        while registry.has(filename) and tries < max_tries:
-            filename = random_filename(self.ext)
-            tries += 1
-        if tries > max_tries:
-            raise RuntimeError(
-                "Failed to add virtual file to registry. "
-                "This is a bug in marimo. Please file an issue."
-            )
         self._virtual_file = VirtualFile(filename, self.buffer)
         context.virtual_file_registry.add(self._virtual_file, context)
 
     def dispose(self, context: RuntimeContext, deletion: bool) -> bool:
-        # Remove the file if the refcount is 0, or if the cell is being
-        # deleted. (We can't rely on when the refcount will be decremented, so
-        # we need to check for deletion explicitly to prevent leaks.)
-        if deletion or (
-            context.virtual_file_registry.refcount(self.virtual_file.filename)
-            <= 0
-        ):
-            context.virtual_file_registry.remove(self.virtual_file)
-            return True
-        # refcount > 0, so need to keep this disposal hook around
-        return False
+        # Give up this item's registration; the registry frees the file once
+        # it has no registrations and no references. If the cell is being
+        # deleted, don't wait for the references: we can't rely on when the
+        # refcount will be decremented, so this prevents leaks.
+        context.virtual_file_registry.remove(self.virtual_file, force=deletion)
+        return True
 
 
 @dataclasses.dataclass
 class VirtualFileRegistryItem:
     # number of HTML objects that are referencing this virtual file
     refcount: int
+    # number of times this virtual file was added and not yet removed
+    registrations: int = 1
 
 
 @dataclasses.dataclass
@@ -208,6 +220,11 @@ class VirtualFileRegistry:
 
     The registry itself doesn't maintain the reference counts, it only
     exposes methods for incrementing, decrementing, and getting the counts.
+
+    Virtual files are named after their contents, so the same file may be
+    added more than once (e.g., by re-running a cell). The registry counts
+    these registrations and only frees the file's storage once each of them
+    has been removed and nothing references it.
     """
 
     storage: VirtualFileStorage
@@ -239,15 +256,32 @@ class VirtualFileRegistry:
     def filenames(self) -> Iterable[str]:
         return self.registry.keys()
 
-    def reference(self, filename: str) -> None:
-        """Increment the reference count"""
+    def reference(self, filename: str) -> VirtualFileRegistryItem | None:
+        """Increment the reference count
+
+        Returns the referenced item, to pass to `dereference`.
+        """
         if filename in self.registry:
-            self.registry[filename].refcount += 1
+            item = self.registry[filename]
+            item.refcount += 1
+            return item
+        return None
+
+    def dereference(
+        self, filename: str, item: VirtualFileRegistryItem | None = None
+    ) -> None:
+        """Decrement the reference count
 
-    def dereference(self, filename: str) -> None:
-        """Decrement the reference count"""
+        If `item` is given, the count is only decremented if the file is
+        still registered as `item`: a file with the same contents, and so
+        the same name, may have been removed and registered again since it
+        was referenced.
+        """
         if filename in self.registry:
+            if item is not None and self.registry[filename] is not item:
+                return
             self.registry[filename].refcount -= 1
+            self._maybe_free(filename)
 
     def refcount(self, filename: str) -> int:
         """Get the reference count"""
@@ -264,6 +298,7 @@ class VirtualFileRegistry:
             LOGGER.debug(
                 "Virtual file (key=%s) already registered", virtual_file
             )
+            self.registry[key].registrations += 1
             return
 
         buffer = virtual_file.buffer
@@ -274,11 +309,23 @@ class VirtualFileRegistry:
         self.storage.store(key, buffer)
         self.registry[key] = VirtualFileRegistryItem(refcount=0)
 
-    def remove(self, virtual_file: VirtualFile) -> None:
+    def remove(self, virtual_file: VirtualFile, force: bool = False) -> None:
+        """Remove a registration of the file
+
+        The file is freed once it has no registrations left, and no
+        references (unless `force`).
+        """
         key = virtual_file.filename
         if key in self.registry:
-            self.storage.remove(key)
-            del self.registry[key]
+            self.registry[key].registrations -= 1
+            self._maybe_free(key, force=force)
+
+    def _maybe_free(self, key: str, force: bool = False) -> None:
+        item = self.registry[key]
+        if item.registrations > 0 or (item.refcount > 0 and not force):
+            return
+        self.storage.remove(key)
+        del self.registry[key]
 
     def shutdown(self) -> None:
         # Try to make this method re-entrant since it's called in the
@@ -326,3 +373,21 @@ def read_virtual_file_chunked(
             HTTPStatus.NOT_FOUND,
             detail="File not found",
         ) from err
+
+
+def stream_virtual_file(
+    filename: str, start: int, end: int
+) -> Iterator[bytes | memoryview]:
+    """Stream bytes [start, end) of a virtual file for HTTP responses.
+
+    Yields views of the stored buffer instead of copies where possible,
+    so serving a file doesn't copy it in the server process; otherwise
+    only one chunk is copied at a time.
+    """
+    try:
+        yield from VirtualFileStorageManager().stream(filename, start, end)
+    except KeyError as err:
+        raise HTTPException(
+            HTTPStatus.NOT_FOUND,
+            detail="File not found",
+        ) from err
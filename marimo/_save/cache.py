@@ -59,9 +59,11 @@ CACHE_PREFIX: dict[CacheType, str] = {
 
 ValidCacheSha = namedtuple("ValidCacheSha", ("sha", "cache_type"))
 MetaKey = Literal["return", "version", "runtime"]
-# Matches functools
+# Matches functools, with marimo specific fields at the end
 CacheInfo = namedtuple(
-    "CacheInfo", ["hits", "misses", "maxsize", "currsize", "time_saved"]
+    "CacheInfo",
+    ["hits", "misses", "maxsize", "currsize", "time_saved", "nbytes"],
+    defaults=[0],
 )
 
 
@@ -409,6 +411,7 @@ class CacheContext(abc.ABC):
             maxsize=self.maxsize,
             currsize=self.currsize,
             time_saved=self.time_saved,
+            nbytes=self.nbytes,
         )
 
     @property
@@ -456,6 +459,13 @@ class CacheContext(abc.ABC):
             return 0.0
         return self.loader.time_saved
 
+    @property
+    def nbytes(self) -> int:
+        """Estimated bytes held in memory, if the cache has a byte budget."""
+        if self._loader is None:
+            return 0
+        return int(getattr(self.loader, "current_bytes", 0))
+
     @property
     @abc.abstractmethod
     def last_hash(self) -> Optional[str]:
@@ -465,6 +475,7 @@ class CacheContext(abc.ABC):
         return (
             f"<{self.__class__.__name__} hits={self.hits} "
             f"misses={self.misses} maxsize={self.maxsize} "
-            f"currsize={self.currsize} time_saved={self.time_saved:.4f}s "
+            f"currsize={self.currsize} nbytes={self.nbytes} "
+            f"time_saved={self.time_saved:.4f}s "
             f"last_hash={self.last_hash}>"
         )
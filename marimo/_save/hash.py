@@ -261,7 +261,25 @@ def common_container_to_bytes(value: Any) -> bytes:
 
 
 def data_to_buffer(data: Tensor) -> bytes:
-    data = standardize_tensor(data)
+    """Sign the contents of an array.
+
+    Large arrays are streamed through a digest rather than copied: their
+    contiguous memory is hashed in place, and strided arrays are copied
+    one chunk at a time.
+    """
+    array: Tensor = standardize_tensor(data)
+    if array.nbytes < DATA_STREAM_THRESHOLD:
+        return _small_data_to_buffer(array)
+    return _stream_data_to_buffer(array)
+
+
+# Arrays at least this large are hashed by streaming
+DATA_STREAM_THRESHOLD = 1024 * 1024
+# Strided arrays are copied this many bytes at a time for hashing
+DATA_CHUNK_BYTES = 16 * 1024 * 1024
+
+
+def _small_data_to_buffer(data: Tensor) -> bytes:
     # From joblib.hashing
     if data.shape == ():
         # 0d arrays need to be flattened because viewing them as bytes
@@ -273,12 +291,53 @@ def data_to_buffer(data: Tensor) -> bytes:
         data_c_contiguous = data.T
     else:
         # Cater for non-single-segment arrays, this creates a copy, and thus
-        # alleviates this issue. Note: There might be a more efficient way of
-        # doing this, check for joblib updates.
+        # alleviates this issue.
         data_c_contiguous = data.flatten()
     return type_sign(memoryview(data_c_contiguous.view("uint8")), "data")
 
 
+def _stream_data_to_buffer(data: Tensor) -> bytes:
+    # The memory of an F-ordered array is the C-ordered memory of its
+    # transpose; the order is signed to tell the two layouts apart.
+    flat, order = data, "C"
+    if not data.flags.c_contiguous and data.flags.f_contiguous:
+        flat, order = data.T, "F"
+
+    digest = _new_data_digest()
+    _update_data_digest(digest, flat)
+    meta = f"{data.dtype.descr}:{data.shape}:{order}:{digest.name}"
+    return type_sign(digest.digest() + bytes(meta, "utf-8"), "data-stream")
+
+
+def _new_data_digest() -> Any:
+    """The digest for array contents.
+
+    Signatures are persisted as cache keys, so the algorithm must not
+    depend on which libraries are installed.
+    """
+    return hashlib.new(DEFAULT_HASH, usedforsecurity=False)
+
+
+def _update_data_digest(digest: Any, data: Tensor) -> None:
+    """Feed the bytes of `data`, in C order, to `digest`."""
+    if data.flags.c_contiguous:
+        # Viewing a contiguous array doesn't copy
+        digest.update(memoryview(data.reshape(-1).view("uint8")))
+        return
+
+    import numpy
+
+    if data.ndim > 1 and data[0].nbytes > DATA_CHUNK_BYTES:
+        # Even a single row is too large to copy
+        for row in data:
+            _update_data_digest(digest, row)
+        return
+    step = max(1, DATA_CHUNK_BYTES // max(1, data[:1].nbytes))
+    for start in range(0, len(data), step):
+        chunk = numpy.ascontiguousarray(data[start : start + step])
+        digest.update(memoryview(chunk.reshape(-1).view("uint8")))
+
+
 def attempt_signed_bytes(value: bytes, label: str) -> bytes:
     # Prevents hash collisions like:
     # >>> fib(1)
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import dataclasses
 import json
-from typing import Any
+from typing import Any, Union
 
 from marimo._save.cache import Cache
 from marimo._save.hash import HashKey
@@ -16,9 +16,11 @@ class JsonLoader(BasePersistenceLoader):
     def __init__(self, name: str, **kwargs: Any) -> None:
         super().__init__(name, "json", **kwargs)
 
-    def restore_cache(self, key: HashKey, blob: bytes) -> Cache:
+    def restore_cache(
+        self, key: HashKey, blob: Union[bytes, memoryview]
+    ) -> Cache:
         del key
-        cache = json.loads(blob)
+        cache = json.loads(bytes(blob))
         # Handle unserializable stateful_refs
         cache["stateful_refs"] = set(cache["stateful_refs"])
         try:
@@ -5,7 +5,7 @@ import re
 import time
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 from marimo._runtime.context import get_context
 from marimo._runtime.context.types import ContextNotInitializedError
@@ -231,7 +231,7 @@ class BasePersistenceLoader(Loader):
 
     def load_cache(self, key: HashKey) -> Optional[Cache]:
         try:
-            blob: Optional[bytes] = self.store.get(str(self.build_path(key)))
+            blob = self.store.get_buffer(str(self.build_path(key)))
             if not blob:
                 return None
             return self.restore_cache(key, blob)
@@ -256,7 +256,9 @@ class BasePersistenceLoader(Loader):
             self.store.clear(key)
 
     @abstractmethod
-    def restore_cache(self, key: HashKey, blob: bytes) -> Cache:
+    def restore_cache(
+        self, key: HashKey, blob: Union[bytes, memoryview]
+    ) -> Cache:
         """May throw FileNotFoundError"""
 
     @abstractmethod
@@ -1,6 +1,7 @@
 # Copyright 2026 Marimo. All rights reserved.
 from __future__ import annotations
 
+import sys
 import threading
 from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, Union
@@ -16,21 +17,30 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 
+# Containers nested deeper than this are counted by their own size only
+_MAX_SIZE_DEPTH = 8
+
 
 class MemoryLoader(Loader):
-    """In memory loader for saved objects."""
+    """In memory loader for saved objects.
+
+    The cache is bounded by the number of entries (`max_size`, disabled if
+    not positive) and optionally by the estimated bytes the entries hold
+    (`max_bytes`); least recently used entries are evicted first.
+    """
 
     def __init__(
         self,
         *args: Any,
         max_size: int = 128,
+        max_bytes: Optional[int] = None,
         cache: Optional[OrderedDict[Path, Cache]] = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(*args, **kwargs)
 
         self._cache: Union[OrderedDict[Path, Cache], dict[Path, Cache]]
-        self.is_lru = max_size > 0
+        self.is_lru = max_size > 0 or max_bytes is not None
 
         # Normal python dicts are atomic, ordered dictionaries are not.
         # As such, default to normal dict if not LRU.
@@ -41,8 +51,15 @@ class MemoryLoader(Loader):
             self._cache = OrderedDict()
             self._cache_lock = threading.Lock()
         self._max_size = max_size
+        self._max_bytes = max_bytes
+        # Estimated sizes of the entries, only tracked with a byte budget
+        self._nbytes: dict[Path, int] = {}
+        self._total_nbytes = 0
         if cache is not None:
             self._maybe_lock(lambda: self._cache.update(cache))
+            if max_bytes is not None:
+                self._maybe_lock(self._measure)
+                self._maybe_lock(self._evict)
 
     def _maybe_lock(self, fn: Callable[..., T]) -> T:
         if self._cache_lock is not None:
@@ -72,33 +89,71 @@ class MemoryLoader(Loader):
         if self.is_lru:
             assert isinstance(self._cache, OrderedDict)
             assert self._cache_lock is not None
+            nbytes = (
+                _estimate_cache_nbytes(cache)
+                if self._max_bytes is not None
+                else 0
+            )
             with self._cache_lock:
+                if self._max_bytes is not None and nbytes > self._max_bytes:
+                    # Would evict everything else and still not fit
+                    return False
                 self._cache[path] = cache
                 self._cache.move_to_end(path)
-                if len(self._cache) > self.max_size:
-                    self._cache.popitem(last=False)
+                if self._max_bytes is not None:
+                    self._total_nbytes += nbytes - self._nbytes.get(path, 0)
+                    self._nbytes[path] = nbytes
+                self._evict()
+            return True
         self._cache[path] = cache
         return True
 
-    def resize(self, max_size: int) -> None:
-        if not self.is_lru:
-            self.is_lru = max_size > 0
-            if self.is_lru:
-                self._cache = OrderedDict(self._cache.items())
-                self._cache_lock = threading.Lock()
-            self._max_size = max_size
-            return
+    def _measure(self) -> None:
+        self._nbytes = {
+            path: _estimate_cache_nbytes(entry)
+            for path, entry in self._cache.items()
+        }
+        self._total_nbytes = sum(self._nbytes.values())
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until within limits.
+
+        Must hold the cache lock.
+        """
         assert isinstance(self._cache, OrderedDict)
-        assert self._cache_lock is not None
-        with self._cache_lock:
-            self.is_lru = max_size > 0
-            if not self.is_lru:
-                self._cache = dict(self._cache.items())
-                self._max_size = max_size
-                return
-            while len(self._cache) > max_size:
-                self._cache.popitem(last=False)
+        while self._cache and (
+            (self._max_size > 0 and len(self._cache) > self._max_size)
+            or (
+                self._max_bytes is not None
+                and self.current_bytes > self._max_bytes
+            )
+        ):
+            path, _ = self._cache.popitem(last=False)
+            self._total_nbytes -= self._nbytes.pop(path, 0)
+
+    def resize(self, max_size: int) -> None:
+        self._maybe_lock(lambda: self._set_limits(max_size, self._max_bytes))
+
+    def _set_limits(self, max_size: int, max_bytes: Optional[int]) -> None:
+        # Sizes aren't tracked without a budget
+        if max_bytes is not None and self._max_bytes is None:
+            self._measure()
+        elif max_bytes is None:
+            self._nbytes = {}
+            self._total_nbytes = 0
+
         self._max_size = max_size
+        self._max_bytes = max_bytes
+        is_lru = max_size > 0 or max_bytes is not None
+        if is_lru and not self.is_lru:
+            self._cache = OrderedDict(self._cache.items())
+            # Set without acquiring: only swapped in while not yet LRU
+            self._cache_lock = threading.Lock()
+        elif not is_lru and self.is_lru:
+            self._cache = dict(self._cache.items())
+        self.is_lru = is_lru
+        if is_lru:
+            self._evict()
 
     @property
     def max_size(self) -> int:
@@ -108,10 +163,82 @@ class MemoryLoader(Loader):
     def max_size(self, value: int) -> None:
         self.resize(value)
 
+    @property
+    def max_bytes(self) -> Optional[int]:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: Optional[int]) -> None:
+        self._maybe_lock(lambda: self._set_limits(self._max_size, value))
+
     @property
     def current_size(self) -> int:
         return len(self._cache)
 
+    @property
+    def current_bytes(self) -> int:
+        """Estimated bytes held by the cache, if it has a byte budget."""
+        return self._total_nbytes
+
     def clear(self) -> None:
         """Clear all cached items."""
-        self._maybe_lock(lambda: self._cache.clear())
+
+        def _clear() -> None:
+            self._cache.clear()
+            self._nbytes.clear()
+            self._total_nbytes = 0
+
+        self._maybe_lock(_clear)
+
+
+def _estimate_cache_nbytes(cache: Cache) -> int:
+    seen: set[int] = set()
+    return _estimate_nbytes(
+        list(cache.defs.values()), seen, 0
+    ) + _estimate_nbytes(cache.meta.get("return"), seen, 0)
+
+
+def _estimate_nbytes(value: Any, seen: set[int], depth: int) -> int:
+    """Estimate the memory held by a value.
+
+    Arrays and dataframes report their buffer sizes; containers are walked.
+    Shared objects are only counted once.
+    """
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    # polars
+    estimated_size = getattr(value, "estimated_size", None)
+    if callable(estimated_size):
+        try:
+            return int(estimated_size())
+        except Exception:
+            pass
+    # pandas; deep=True would walk every object in object columns
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage):
+        try:
+            usage = memory_usage(index=True, deep=False)
+            return int(usage.sum() if hasattr(usage, "sum") else usage)
+        except Exception:
+            pass
+    # numpy, pyarrow, ...
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+
+    try:
+        size = sys.getsizeof(value)
+    except TypeError:
+        size = 0
+    if depth >= _MAX_SIZE_DEPTH:
+        return size
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += _estimate_nbytes(key, seen, depth + 1)
+            size += _estimate_nbytes(item, seen, depth + 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += _estimate_nbytes(item, seen, depth + 1)
+    return size
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import pickle
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Union
 
 from marimo._save.cache import Cache
 from marimo._save.loaders.loader import BasePersistenceLoader, LoaderError
@@ -17,7 +17,9 @@ class PickleLoader(BasePersistenceLoader):
     def __init__(self, name: str, **kwargs: Any) -> None:
         super().__init__(name, "pickle", **kwargs)
 
-    def restore_cache(self, key: HashKey, blob: bytes) -> Cache:
+    def restore_cache(
+        self, key: HashKey, blob: Union[bytes, memoryview]
+    ) -> Cache:
         del key
         cache = pickle.loads(blob)
         if not isinstance(cache, Cache):
@@ -1000,6 +1000,7 @@ def lru_cache(
     fn: Optional[Callable[..., Any]] = None,
     maxsize: int = 128,
     pin_modules: bool = False,
+    maxbytes: Optional[int] = None,
 ) -> _cache_call: ...
 
 
@@ -1008,6 +1009,7 @@ def lru_cache(
     name: str,
     maxsize: int = 128,
     pin_modules: bool = False,
+    maxbytes: Optional[int] = None,
 ) -> _cache_call: ...
 
 
@@ -1016,6 +1018,7 @@ def lru_cache(  # type: ignore[misc]
     maxsize: int = 128,
     *args: Any,
     pin_modules: bool = False,
+    maxbytes: Optional[int] = None,
     _internal_interface_not_for_external_use: None = None,
     **kwargs: Any,
 ) -> Union[_cache_call, _cache_context]:
@@ -1041,6 +1044,9 @@ def lru_cache(  # type: ignore[misc]
             Setting to -1 disables cache limits.
         pin_modules: if True, the cache will be invalidated if module versions
             differ.
+        maxbytes: the maximum estimated size of the cached values, in bytes.
+            Arrays and dataframes are measured by their buffers. Values
+            larger than this are not cached. Defaults to no limit.
 
     ## Context manager for LRU caching the return value of a block of code.
 
@@ -1050,6 +1056,9 @@ def lru_cache(  # type: ignore[misc]
             Setting to -1 disables cache limits.
         pin_modules: if True, the cache will be invalidated if module versions
             differ.
+        maxbytes: the maximum estimated size of the cached values, in bytes.
+            Arrays and dataframes are measured by their buffers. Values
+            larger than this are not cached. Defaults to no limit.
         **kwargs: keyword arguments passed to `cache()`
         *args: positional arguments passed to `cache()`
     """
@@ -1068,7 +1077,7 @@ def lru_cache(  # type: ignore[misc]
             arg,
             *args,
             pin_modules=pin_modules,
-            loader=MemoryLoader.partial(max_size=maxsize),
+            loader=MemoryLoader.partial(max_size=maxsize, max_bytes=maxbytes),
             _frame_offset=2,
             **kwargs,
         ),
@@ -1,11 +1,27 @@
 # Copyright 2026 Marimo. All rights reserved.
 from __future__ import annotations
 
+import mmap
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, Union
 
+from marimo import _loggers
 from marimo._runtime.runtime import notebook_dir
+from marimo._save.stores.file_index import CacheIndex, GCResult
 from marimo._save.stores.store import Store
+from marimo._utils.files import atomic_write_bytes
+from marimo._utils.platform import is_windows
+
+LOGGER = _loggers.marimo_logger()
+
+# Blobs at least this large are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 64 * 1024 * 1024
+DEFAULT_MAX_PENDING_WRITES = 4
+# How often expired caches are looked for, in seconds
+GC_INTERVAL = 10 * 60
 
 
 def _valid_path(path: Path) -> bool:
@@ -13,12 +29,50 @@ def _valid_path(path: Path) -> bool:
 
 
 class FileStore(Store):
-    def __init__(self, save_path: Optional[str] = None) -> None:
+    """Store caches as files on disk.
+
+    Writes are atomic. With `write_behind=True`, they happen on a
+    background thread so that saving a large cache doesn't block cell
+    execution; at most `max_pending_writes` blobs are held in memory
+    before `put` waits for a write to finish. Pending writes are visible
+    to `get` and `hit`, and `flush` waits for them.
+
+    With `max_bytes` or `max_age` (in seconds), least recently used and
+    expired caches are removed in the background. Sizes and access times
+    are tracked in an index file in the cache directory.
+    """
+
+    def __init__(
+        self,
+        save_path: Optional[str] = None,
+        *,
+        write_behind: bool = False,
+        max_pending_writes: int = DEFAULT_MAX_PENDING_WRITES,
+        max_bytes: Optional[int] = None,
+        max_age: Optional[float] = None,
+    ) -> None:
         self.save_path = Path(save_path or self._default_save_path())
         # NB. construction may be called on store import, so do not create
         # directories until needed.
         self._initialized = False
 
+        self._write_behind = write_behind
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots = threading.BoundedSemaphore(max(1, max_pending_writes))
+        self._lock = threading.Lock()
+        self._pending: dict[str, bytes] = {}
+        self._futures: set[Future[Any]] = set()
+
+        self._max_bytes = max_bytes
+        self._max_age = max_age
+        self._index: Optional[CacheIndex] = (
+            CacheIndex(self.save_path)
+            if max_bytes is not None or max_age is not None
+            else None
+        )
+        self._gc_scheduled = False
+        self._last_gc = 0.0
+
     def _default_save_path(self) -> Path:
         if (root := notebook_dir()) is not None:
             return Path(root / "__marimo__" / "cache")
@@ -29,29 +83,160 @@ class FileStore(Store):
         self.save_path.mkdir(parents=True, exist_ok=True)
 
     def get(self, key: str) -> Optional[bytes]:
+        buffer = self.get_buffer(key)
+        if buffer is None or isinstance(buffer, bytes):
+            return buffer
+        return buffer.tobytes()
+
+    def get_buffer(self, key: str) -> Optional[Union[bytes, memoryview]]:
         if not self._initialized:
             self._init_save_path()
         self._initialized = True
+        with self._lock:
+            pending = self._pending.get(key)
+        if pending is not None:
+            return pending
+
         path = self.save_path / key
         if not _valid_path(path):
             return None
-        return path.read_bytes()
+        if self._index is not None:
+            self._index.touch(key)
+            self._maybe_collect()
+        # Windows can't replace a file while it is mapped
+        if path.stat().st_size < MMAP_THRESHOLD or is_windows():
+            return path.read_bytes()
+        # Writes replace the file rather than modifying it, so the mapping
+        # stays valid for as long as it is referenced.
+        with path.open("rb") as f:
+            return memoryview(
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            )
 
     def put(self, key: str, value: bytes) -> bool:
         path = self.save_path / key
-        path.parent.mkdir(parents=True, exist_ok=True)
         self._initialized = True
-        path.write_bytes(value)
+        if not self._write_behind:
+            atomic_write_bytes(path, value)
+            self._record(key, value)
+            return True
+
+        # Blocks while too many writes are pending
+        self._slots.acquire()
+        with self._lock:
+            self._pending[key] = value
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="marimo-cache-write"
+                )
+            future = self._executor.submit(self._write, key, path, value)
+        self._track(future)
         return True
 
+    def _track(self, future: Future[Any]) -> None:
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._forget)
+
+    def _forget(self, future: Future[Any]) -> None:
+        with self._lock:
+            self._futures.discard(future)
+
+    def _write(self, key: str, path: Path, value: bytes) -> None:
+        try:
+            atomic_write_bytes(path, value)
+            self._record(key, value)
+        except Exception as e:
+            LOGGER.error(f"Failed to write cache {key}: {e}")
+        finally:
+            with self._lock:
+                # A newer put for the same key may be pending
+                if self._pending.get(key) is value:
+                    del self._pending[key]
+            self._slots.release()
+
+    def flush(self) -> None:
+        with self._lock:
+            futures = list(self._futures)
+        wait(futures)
+        if self._index is not None:
+            self._index.save()
+
+    def _record(self, key: str, value: bytes) -> None:
+        if self._index is None:
+            return
+        self._index.record(key, len(value))
+        self._maybe_collect()
+
+    def _maybe_collect(self) -> None:
+        """Schedule a collection if over budget or due for an age sweep."""
+        if self._index is None:
+            return
+        over_budget = (
+            self._max_bytes is not None
+            and self._index.total_bytes > self._max_bytes
+        )
+        sweep_due = (
+            self._max_age is not None
+            and time.time() - self._last_gc > GC_INTERVAL
+        )
+        if not over_budget and not sweep_due:
+            return
+        with self._lock:
+            if self._gc_scheduled:
+                return
+            self._gc_scheduled = True
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="marimo-cache-write"
+                )
+            future = self._executor.submit(self._collect)
+        self._track(future)
+
+    def _collect(self) -> None:
+        try:
+            self.gc()
+        except Exception as e:
+            LOGGER.error(f"Failed to collect caches: {e}")
+        finally:
+            with self._lock:
+                self._gc_scheduled = False
+
+    def gc(
+        self,
+        *,
+        max_bytes: Optional[int] = None,
+        max_age: Optional[float] = None,
+    ) -> GCResult:
+        """Remove expired caches, then the least recently used ones until
+        the cache directory fits in `max_bytes`.
+
+        Defaults to the limits the store was created with.
+        """
+        index = self._index or CacheIndex(self.save_path)
+        self._last_gc = time.time()
+        return index.collect(
+            max_bytes=self._max_bytes if max_bytes is None else max_bytes,
+            max_age=self._max_age if max_age is None else max_age,
+        )
+
     def hit(self, key: str) -> bool:
+        with self._lock:
+            if key in self._pending:
+                return True
         path = self.save_path / key
         return _valid_path(path)
 
     def clear(self, key: str) -> bool:
+        with self._lock:
+            pending = key in self._pending
+        if pending:
+            self.flush()
         path = self.save_path / key
         path.parent.mkdir(parents=True, exist_ok=True)
         if not _valid_path(path):
             return False
         path.unlink()
+        if self._index is not None:
+            self._index.remove(key)
         return True
@@ -0,0 +1,274 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from marimo import _loggers
+from marimo._utils.files import TEMP_SUFFIX, atomic_write_bytes
+
+LOGGER = _loggers.marimo_logger()
+
+INDEX_FILENAME = ".index.json"
+INDEX_VERSION = 1
+# Temporary files older than this are left over from interrupted writes
+STALE_TEMP_AGE = 60 * 60
+
+
+@dataclass
+class IndexEntry:
+    size: int
+    # Last time the blob was written or read, in seconds since the epoch
+    accessed: float
+
+
+@dataclass
+class GCResult:
+    removed: int
+    freed_bytes: int
+    total_bytes: int
+
+
+class CacheIndex:
+    """Sizes and access times of the blobs in a cache directory.
+
+    The index is kept in memory and persisted to a small JSON file in the
+    directory, so that enforcing a size budget doesn't require walking the
+    tree. If the file is missing or unreadable, the index is rebuilt from
+    the directory. Several processes may share a directory: `save` merges
+    the entries on disk with the changes made by this process.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.path = root / INDEX_FILENAME
+        self._lock = threading.Lock()
+        self._entries: Optional[dict[str, IndexEntry]] = None
+        # Running sum of the entries' sizes
+        self._total_bytes = 0
+        # Changes since the index was last saved
+        self._updated: dict[str, IndexEntry] = {}
+        self._removed: set[str] = set()
+        self._dirty = False
+
+    @property
+    def entries(self) -> dict[str, IndexEntry]:
+        return self._load()
+
+    @property
+    def total_bytes(self) -> int:
+        self._load()
+        return self._total_bytes
+
+    def _load(self) -> dict[str, IndexEntry]:
+        with self._lock:
+            if self._entries is None:
+                entries = self._read()
+                if entries is None:
+                    entries = self._scan()
+                    self._dirty = True
+                self._set_entries(entries)
+                return entries
+            return self._entries
+
+    def _set_entries(self, entries: dict[str, IndexEntry]) -> None:
+        self._entries = entries
+        self._total_bytes = sum(entry.size for entry in entries.values())
+
+    def record(self, key: str, size: int) -> None:
+        """Record that a blob was written."""
+        key = _normalize_key(key)
+        self._update(key, IndexEntry(size=size, accessed=time.time()))
+
+    def touch(self, key: str) -> None:
+        """Record that a blob was read."""
+        key = _normalize_key(key)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self._update(
+                key, IndexEntry(size=entry.size, accessed=time.time())
+            )
+
+    def remove(self, key: str) -> None:
+        key = _normalize_key(key)
+        entries = self.entries
+        with self._lock:
+            previous = entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= previous.size
+            self._updated.pop(key, None)
+            self._removed.add(key)
+            self._dirty = True
+
+    def _update(self, key: str, entry: IndexEntry) -> None:
+        entries = self.entries
+        with self._lock:
+            previous = entries.get(key)
+            self._total_bytes += entry.size - (
+                previous.size if previous is not None else 0
+            )
+            entries[key] = entry
+            self._updated[key] = entry
+            self._removed.discard(key)
+            self._dirty = True
+
+    def save(self) -> None:
+        """Merge this process's changes into the index on disk."""
+        entries = self.entries
+        with self._lock:
+            if not self._dirty:
+                return
+            merged = self._read()
+            if merged is None:
+                merged = dict(entries)
+            for key, entry in self._updated.items():
+                current = merged.get(key)
+                if current is None or current.accessed <= entry.accessed:
+                    merged[key] = entry
+            for key in self._removed:
+                merged.pop(key, None)
+            self._updated.clear()
+            self._removed.clear()
+            self._dirty = False
+            self._set_entries(merged)
+            data = {
+                "version": INDEX_VERSION,
+                "entries": {
+                    key: [entry.size, entry.accessed]
+                    for key, entry in merged.items()
+                },
+            }
+        try:
+            atomic_write_bytes(self.path, json.dumps(data).encode("utf-8"))
+        except OSError as e:
+            LOGGER.warning(f"Failed to save cache index: {e}")
+
+    def collect(
+        self,
+        *,
+        max_bytes: Optional[int] = None,
+        max_age: Optional[float] = None,
+        now: Optional[float] = None,
+    ) -> GCResult:
+        """Remove expired blobs, then the least recently used ones until the
+        directory fits in `max_bytes`.
+        """
+        now = time.time() if now is None else now
+        self._reconcile()
+
+        removed = 0
+        freed_bytes = 0
+        by_access = sorted(
+            self.entries.items(), key=lambda item: item[1].accessed
+        )
+        total_bytes = sum(entry.size for _, entry in by_access)
+        for key, entry in by_access:
+            expired = max_age is not None and now - entry.accessed > max_age
+            over_budget = max_bytes is not None and total_bytes > max_bytes
+            if not expired and not over_budget:
+                continue
+            try:
+                (self.root / key).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                LOGGER.warning(f"Failed to remove cache {key}: {e}")
+                continue
+            self.remove(key)
+            removed += 1
+            freed_bytes += entry.size
+            total_bytes -= entry.size
+
+        self.save()
+        return GCResult(
+            removed=removed, freed_bytes=freed_bytes, total_bytes=total_bytes
+        )
+
+    def _reconcile(self) -> None:
+        """Bring the entries up to date with the blobs in the directory.
+
+        Blobs may have been written by stores that don't keep an index, or
+        by processes that exited before saving theirs, and removed by other
+        processes.
+        """
+        on_disk = self._scan()
+        for key in list(self.entries):
+            if key not in on_disk:
+                self.remove(key)
+        entries = self.entries
+        for key, scanned in on_disk.items():
+            entry = entries.get(key)
+            if entry is None:
+                self._update(key, scanned)
+            elif entry.size != scanned.size:
+                # Rewritten by another process
+                self._update(
+                    key,
+                    IndexEntry(
+                        size=scanned.size,
+                        accessed=max(entry.accessed, scanned.accessed),
+                    ),
+                )
+
+    def _read(self) -> Optional[dict[str, IndexEntry]]:
+        try:
+            data = json.loads(self.path.read_bytes())
+            if data.get("version") != INDEX_VERSION:
+                return None
+            return {
+                key: IndexEntry(size=int(size), accessed=float(accessed))
+                for key, (size, accessed) in data["entries"].items()
+            }
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError, KeyError, AttributeError) as e:
+            LOGGER.warning(f"Ignoring invalid cache index: {e}")
+            return None
+
+    def _scan(self) -> dict[str, IndexEntry]:
+        entries: dict[str, IndexEntry] = {}
+        for path in self._files():
+            if path.name.startswith("."):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            key = path.relative_to(self.root).as_posix()
+            entries[key] = IndexEntry(
+                size=stat.st_size,
+                accessed=max(stat.st_atime, stat.st_mtime),
+            )
+        return entries
+
+    def _files(self) -> list[Path]:
+        files: list[Path] = []
+        for dirpath, _, filenames in os.walk(self.root):
+            files.extend(Path(dirpath) / name for name in filenames)
+        return files
+
+    def remove_stale_temp_files(self, now: Optional[float] = None) -> int:
+        """Remove temporary files left over from interrupted writes."""
+        now = time.time() if now is None else now
+        removed = 0
+        for path in self._files():
+            if not (
+                path.name.startswith(".") and path.name.endswith(TEMP_SUFFIX)
+            ):
+                continue
+            try:
+                if now - path.stat().st_mtime > STALE_TEMP_AGE:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+
+def _normalize_key(key: str) -> str:
+    return Path(key).as_posix()
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Union
 
 
 class Store(ABC):
@@ -10,6 +10,10 @@ class Store(ABC):
     def get(self, key: str) -> Optional[bytes]:
         """Get the bytes of a cache from the store"""
 
+    def get_buffer(self, key: str) -> Optional[Union[bytes, memoryview]]:
+        """Get the cache as a buffer, which may avoid copying it"""
+        return self.get(key)
+
     @abstractmethod
     def put(self, key: str, value: bytes) -> bool:
         """Put a cache into the store"""
@@ -18,6 +22,10 @@ class Store(ABC):
     def hit(self, key: str) -> bool:
         """Check if the cache is in the store"""
 
+    def flush(self) -> None:
+        """Wait for pending writes to complete"""
+        return
+
     def clear(self, key: str) -> bool:
         """Check if the cache is in the store"""
         del key
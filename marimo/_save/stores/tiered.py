@@ -64,6 +64,14 @@ class TieredStore(Store):
 
         return False
 
+    def flush(self) -> None:
+        """Wait for pending writes in all stores."""
+        for i, store in enumerate(self.stores):
+            try:
+                store.flush()
+            except Exception as e:
+                LOGGER.error(f"Error flushing store {i}: {e}")
+
     def _update_preceding_stores(
         self, key: str, value: bytes, found_index: int
     ) -> None:
@@ -23,7 +23,7 @@ from marimo._config.manager import get_default_config_manager
 from marimo._output.utils import uri_decode_component, uri_encode_component
 from marimo._runtime.virtual_file import (
     EMPTY_VIRTUAL_FILE,
-    read_virtual_file_chunked,
+    stream_virtual_file,
 )
 from marimo._server.api.deps import AppState
 from marimo._server.files.path_validator import PathValidator
@@ -390,6 +390,10 @@ def virtual_file(
                 application/octet-stream:
                     schema:
                         type: string
+        206:
+            description: Get a byte range of a virtual file
+        304:
+            description: The virtual file has not been modified
         404:
             description: Invalid virtual file request
         404:
@@ -413,18 +417,109 @@ def virtual_file(
             detail="Invalid byte length in virtual file request",
         )
 
-    chunks = read_virtual_file_chunked(filename, int(byte_length))
+    # Virtual files are named after their contents, so the name is a strong
+    # validator and the contents behind a URL never change.
+    etag = f'"{filename_and_length}"'
+    cache_headers = {
+        "Cache-Control": "max-age=31536000, immutable",
+        "ETag": etag,
+    }
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=cache_headers)
+
+    length = int(byte_length)
+    cache_headers["Accept-Ranges"] = "bytes"
+    byte_range = None
+    if_range = request.headers.get("if-range")
+    if if_range is None or if_range.strip() == etag:
+        try:
+            byte_range = _parse_byte_range(
+                request.headers.get("range"), length
+            )
+        except ValueError:
+            return Response(
+                status_code=416,
+                headers={
+                    **cache_headers,
+                    "Content-Range": f"bytes */{length}",
+                },
+            )
+
     mimetype, _ = mimetypes.guess_type(filename)
+    if byte_range is None:
+        return StreamingResponse(
+            content=stream_virtual_file(filename, 0, length),
+            media_type=mimetype,
+            headers={
+                **cache_headers,
+                "Content-Length": byte_length,
+            },
+        )
+
+    start, end = byte_range
     return StreamingResponse(
-        content=chunks,
+        content=stream_virtual_file(filename, start, end),
+        status_code=206,
         media_type=mimetype,
         headers={
-            "Cache-Control": "max-age=86400",
-            "Content-Length": byte_length,
+            **cache_headers,
+            "Content-Length": str(end - start),
+            "Content-Range": f"bytes {start}-{end - 1}/{length}",
         },
     )
 
 
+def _parse_byte_range(
+    range_header: str | None, length: int
+) -> tuple[int, int] | None:
+    """Parse a Range header into a [start, end) byte range.
+
+    Only single byte ranges are supported; other ranges are ignored, and
+    the whole file is served.
+
+    Returns:
+        The byte range, or None if the whole file should be served.
+
+    Raises:
+        ValueError: If the range can't be satisfied.
+    """
+    if range_header is None:
+        return None
+    unit, _, spec = range_header.partition("=")
+    if unit.strip() != "bytes" or "," in spec:
+        return None
+    first, _, last = spec.strip().partition("-")
+    if (first and not first.isdigit()) or (last and not last.isdigit()):
+        return None
+
+    if not first:
+        # Suffix range: the last N bytes
+        if not last or int(last) == 0:
+            raise ValueError(range_header)
+        return max(0, length - int(last)), length
+
+    start = int(first)
+    if start >= length:
+        raise ValueError(range_header)
+    if not last:
+        return start, length
+    if int(last) < start:
+        return None
+    return start, min(int(last) + 1, length)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
 @router.get("/public-files-sw.js")
 async def public_files_service_worker(request: Request) -> Response:
     """
@@ -19,6 +19,8 @@ LOGGER = _loggers.marimo_logger()
 SESSION_QUERY_PARAM_KEY = "session_id"
 FILE_QUERY_PARAM_KEY = "file"
 KIOSK_QUERY_PARAM_KEY = "kiosk"
+BATCH_QUERY_PARAM_KEY = "batch"
+BINARY_QUERY_PARAM_KEY = "binary"
 
 
 @dataclass
@@ -30,6 +32,8 @@ class ConnectionParams:
     kiosk: bool
     auto_instantiate: bool
     rtc_enabled: bool
+    batch: bool = False
+    binary: bool = False
 
 
 class WebSocketConnectionValidator:
@@ -85,6 +89,12 @@ class WebSocketConnectionValidator:
         # Extract kiosk mode
         kiosk = self.app_state.query_params(KIOSK_QUERY_PARAM_KEY) == "true"
 
+        # Extract batch mode: coalesced messages, sent in batched frames
+        batch = self.app_state.query_params(BATCH_QUERY_PARAM_KEY) == "true"
+
+        # Extract binary mode: large messages sent as compressed binary frames
+        binary = self.app_state.query_params(BINARY_QUERY_PARAM_KEY) == "true"
+
         # Extract config-based parameters
         config = self.app_state.config_manager_at_file(file_key).get_config()
         rtc_enabled = config.get("experimental", {}).get("rtc_v2", False)
@@ -96,6 +106,8 @@ class WebSocketConnectionValidator:
             kiosk=kiosk,
             auto_instantiate=auto_instantiate,
             rtc_enabled=rtc_enabled,
+            batch=batch,
+            binary=binary,
         )
 
     async def extract_file_key_only(self) -> Optional[MarimoFileKey]:
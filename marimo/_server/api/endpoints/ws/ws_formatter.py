@@ -3,10 +3,14 @@
 
 This module handles the wire format for WebSocket transport:
 wrapping serialized notification data with operation metadata.
+
+Connections in binary mode additionally receive large wire messages as
+compressed binary frames; see `format_binary_wire_message`.
 """
 
 from __future__ import annotations
 
+import zlib
 from typing import TYPE_CHECKING
 
 from marimo._messaging.serde import serialize_kernel_message
@@ -14,6 +18,16 @@ from marimo._messaging.serde import serialize_kernel_message
 if TYPE_CHECKING:
     from marimo._messaging.notification import NotificationMessage
 
+# Wire messages at least this long (in characters) are sent as compressed
+# binary frames in binary mode; smaller ones are sent as text.
+BINARY_FRAME_THRESHOLD = 16 * 1024
+
+# Binary frame flag: the payload is zlib-compressed
+BINARY_FRAME_COMPRESSED = 0x01
+
+# Favor latency over compression ratio
+_COMPRESSION_LEVEL = 1
+
 
 def format_wire_message(op: str, data: bytes) -> str:
     """Format a serialized message for WebSocket transport.
@@ -31,6 +45,34 @@ def format_wire_message(op: str, data: bytes) -> str:
     return f'{{"op": "{op}", "data": {data.decode("utf-8")}}}'
 
 
+def format_binary_wire_message(op: str, text: str) -> bytes:
+    """Format a wire message as a compressed binary frame.
+
+    The frame is a header followed by the payload:
+
+    - 1 byte: flags (see `BINARY_FRAME_COMPRESSED`)
+    - 1 byte: length of the operation name
+    - the operation name, UTF-8 encoded
+    - the wire message, UTF-8 encoded and zlib-compressed
+
+    The payload decompresses to the same text as a text frame, so the
+    frontend handles both with the same message handler.
+
+    Args:
+        op: The operation name, used to route the frame without
+            decompressing it
+        text: The wire message, as returned by `format_wire_message`
+
+    Returns:
+        The binary frame
+    """
+    op_bytes = op.encode("utf-8")
+    if len(op_bytes) > 0xFF:
+        raise ValueError(f"Operation name too long: {op}")
+    header = bytes((BINARY_FRAME_COMPRESSED, len(op_bytes))) + op_bytes
+    return header + zlib.compress(text.encode("utf-8"), _COMPRESSION_LEVEL)
+
+
 def serialize_notification_for_websocket(
     notification: NotificationMessage,
 ) -> str:
@@ -13,7 +13,14 @@ from marimo._messaging.notification import (
 )
 from marimo._messaging.serde import deserialize_kernel_notification_name
 from marimo._messaging.types import KernelMessage
-from marimo._server.api.endpoints.ws.ws_formatter import format_wire_message
+from marimo._server.api.endpoints.ws.ws_formatter import (
+    BINARY_FRAME_THRESHOLD,
+    format_binary_wire_message,
+    format_wire_message,
+)
+from marimo._server.api.endpoints.ws.ws_message_queue import (
+    coalesce_messages,
+)
 
 if TYPE_CHECKING:
     from starlette.websockets import WebSocket
@@ -30,9 +37,18 @@ KIOSK_EXCLUDED_OPERATIONS = {
     CompletionResultNotification.name,
 }
 
+# Maximum number of messages sent in a single frame in batch mode
+MAX_BATCH_SIZE = 256
+
 
 class WebSocketMessageLoop:
-    """Handles the async message send/receive loops for WebSocket."""
+    """Handles the async message send/receive loops for WebSocket.
+
+    In batch mode, all messages that are queued when the loop is ready to
+    send are coalesced and sent as a single frame, a JSON array of wire
+    messages. A consumer that falls behind then receives fewer, larger
+    frames instead of a growing backlog of small ones.
+    """
 
     def __init__(
         self,
@@ -41,12 +57,16 @@ class WebSocketMessageLoop:
         kiosk: bool,
         on_disconnect: Callable[[Exception, Callable[[], Any]], None],
         on_check_status_update: Callable[[], None],
+        batch: bool = False,
+        binary: bool = False,
     ):
         self.websocket = websocket
         self.message_queue = message_queue
         self.kiosk = kiosk
         self.on_disconnect = on_disconnect
         self.on_check_status_update = on_check_status_update
+        self.batch = batch
+        self.binary = binary
         self._listen_messages_task: asyncio.Task[None] | None = None
         self._listen_disconnect_task: asyncio.Task[None] | None = None
 
@@ -72,42 +92,73 @@ class WebSocketMessageLoop:
     async def _listen_for_messages(self) -> None:
         """Listen for messages from kernel and send to frontend."""
         while True:
-            data = await self.message_queue.get()
-            op: str = deserialize_kernel_notification_name(data)
-
-            if self._should_filter_operation(op):
+            messages = [await self.message_queue.get()]
+            if self.batch:
+                while (
+                    len(messages) < MAX_BATCH_SIZE
+                    and not self.message_queue.empty()
+                ):
+                    messages.append(self.message_queue.get_nowait())
+                if len(messages) > 1:
+                    messages = coalesce_messages(messages)
+
+            formatted = [
+                wire_message
+                for data in messages
+                if (wire_message := self._format_message(data)) is not None
+            ]
+            if not formatted:
                 continue
+            if len(formatted) == 1:
+                op, text = formatted[0]
+            else:
+                op = "batch"
+                text = "[" + ",".join(text for _, text in formatted) + "]"
+            await self._send(op, text)
 
-            # Serialize message
-            try:
-                text = format_wire_message(op, data)
-            except Exception as e:
-                LOGGER.error("Failed to deserialize message: %s", str(e))
-                LOGGER.error("Message: %s", data)
-                continue
+    def _format_message(self, data: KernelMessage) -> tuple[str, str] | None:
+        """Format a kernel message for the wire.
+
+        Returns:
+            The operation name and wire message, or None if the message
+            should not be sent.
+        """
+        op: str = deserialize_kernel_notification_name(data)
 
-            # Send to WebSocket
-            try:
+        if self._should_filter_operation(op):
+            return None
+
+        # Serialize message
+        try:
+            return op, format_wire_message(op, data)
+        except Exception as e:
+            LOGGER.error("Failed to deserialize message: %s", str(e))
+            LOGGER.error("Message: %s", data)
+            return None
+
+    async def _send(self, op: str, text: str) -> None:
+        """Send a wire message to the WebSocket."""
+        try:
+            if self.binary and len(text) >= BINARY_FRAME_THRESHOLD:
+                await self.websocket.send_bytes(
+                    format_binary_wire_message(op, text)
+                )
+            else:
                 await self.websocket.send_text(text)
-            except WebSocketDisconnect as e:
+        except WebSocketDisconnect as e:
+            self.on_disconnect(e, self._cancel_disconnect_task)
+        except RuntimeError as e:
+            # Starlette can raise a runtime error if a message is sent
+            # when the socket is closed. In case the disconnection
+            # error hasn't made its way to listen_for_disconnect, do
+            # the cleanup here.
+            if self.websocket.application_state == WebSocketState.DISCONNECTED:
                 self.on_disconnect(e, self._cancel_disconnect_task)
-            except RuntimeError as e:
-                # Starlette can raise a runtime error if a message is sent
-                # when the socket is closed. In case the disconnection
-                # error hasn't made its way to listen_for_disconnect, do
-                # the cleanup here.
-                if (
-                    self.websocket.application_state
-                    == WebSocketState.DISCONNECTED
-                ):
-                    self.on_disconnect(e, self._cancel_disconnect_task)
-                else:
-                    LOGGER.error(
-                        "Error sending message to frontend: %s", str(e)
-                    )
-            except Exception as e:
+            else:
                 LOGGER.error("Error sending message to frontend: %s", str(e))
-                raise e
+        except Exception as e:
+            LOGGER.error("Error sending message to frontend: %s", str(e))
+            raise e
 
     async def _listen_for_disconnect(self) -> None:
         """Listen for WebSocket disconnect."""
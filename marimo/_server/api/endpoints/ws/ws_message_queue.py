@@ -0,0 +1,217 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Coalescing of queued kernel messages for slow WebSocket consumers."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, Optional
+
+import msgspec
+
+from marimo import _loggers
+from marimo._messaging.notification import (
+    CellNotification,
+    ModelLifecycleNotification,
+)
+from marimo._messaging.serde import deserialize_kernel_notification_name
+from marimo._messaging.types import KernelMessage
+
+LOGGER = _loggers.marimo_logger()
+
+# Number of queued messages at which a queue is compacted
+DEFAULT_HIGH_WATER_MARK = 1024
+
+# Number of queued messages at which a queue's backlog is dropped in favor
+# of a resync of the session's full state
+DEFAULT_MAX_SIZE = 16 * DEFAULT_HIGH_WATER_MARK
+
+# Output channels that the frontend treats as errors
+_ERROR_CHANNELS = {"marimo-error", "stderr"}
+
+
+def coalesce_messages(messages: list[KernelMessage]) -> list[KernelMessage]:
+    """Coalesce notifications that a later notification makes redundant.
+
+    Only `cell-op` and `model-lifecycle` messages are coalesced; every other
+    message is kept as is, in order. Applying the coalesced messages in the
+    frontend yields the same cell and model state as applying the original
+    ones:
+
+    - A cell-op that only replaces a cell's output is dropped if a later
+      cell-op for the same cell (and run) replaces the output again.
+    - Consecutive console-only cell-ops for the same cell are merged into
+      one, at the position of the later one.
+    - A model update is dropped if the next message for the same model
+      closes it, or is an update that replaces all of the same traits.
+
+    UI element messages are kept, since their payloads are only understood
+    by the plugin receiving them (e.g., the chunks of a streamed response).
+
+    Args:
+        messages: Messages in the order they were sent by the kernel
+
+    Returns:
+        The coalesced messages, in order
+    """
+    result: list[KernelMessage | None] = list(messages)
+    # cell id -> (index, decoded) of the next kept cell-op for that cell
+    later: dict[str, tuple[int, dict[str, Any]]] = {}
+    # model id -> the next kept message for that model
+    later_models: dict[str, dict[str, Any]] = {}
+
+    for i in reversed(range(len(messages))):
+        message = messages[i]
+        name = deserialize_kernel_notification_name(message)
+        if name == ModelLifecycleNotification.name:
+            notification: dict[str, Any] = msgspec.json.decode(message)
+            model_id = notification["model_id"]
+            if model_id in later_models and _is_model_update_superseded(
+                notification["message"], later_models[model_id]["message"]
+            ):
+                result[i] = None
+            else:
+                later_models[model_id] = notification
+            continue
+        if name != CellNotification.name:
+            continue
+
+        current: dict[str, Any] = msgspec.json.decode(message)
+        cell_id = current["cell_id"]
+        if cell_id in later:
+            j, following = later[cell_id]
+            if _is_superseded(current, following):
+                result[i] = None
+                continue
+            if _is_console_only(current) and _is_console_only(following):
+                merged = {
+                    **following,
+                    "console": _as_list(current["console"])
+                    + _as_list(following["console"]),
+                }
+                result[i] = None
+                result[j] = KernelMessage(msgspec.json.encode(merged))
+                later[cell_id] = (j, merged)
+                continue
+        later[cell_id] = (i, current)
+
+    return [message for message in result if message is not None]
+
+
+def _is_superseded(current: dict[str, Any], following: dict[str, Any]) -> bool:
+    if current.get("status") is not None:
+        return False
+    if current.get("console") is not None:
+        return False
+    if current.get("run_id") != following.get("run_id"):
+        return False
+    output = current.get("output")
+    if output is not None:
+        if following.get("output") is None:
+            return False
+        if output.get("channel") in _ERROR_CHANNELS:
+            return False
+    if current.get("stale_inputs") is not None:
+        return following.get("stale_inputs") is not None
+    return True
+
+
+def _is_model_update_superseded(
+    current: dict[str, Any], following: dict[str, Any]
+) -> bool:
+    if current.get("method") != "update":
+        return False
+    if following.get("method") == "close":
+        return True
+    # Buffers are at paths within the state, so they're replaced with it
+    return following.get("method") == "update" and set(
+        current["state"]
+    ).issubset(following["state"])
+
+
+def _is_console_only(notification: dict[str, Any]) -> bool:
+    # An empty list clears the console, so it can't be merged
+    return (
+        bool(notification.get("console"))
+        and notification.get("status") is None
+        and notification.get("output") is None
+        and notification.get("stale_inputs") is None
+    )
+
+
+def _as_list(console: Any) -> list[Any]:
+    return console if isinstance(console, list) else [console]
+
+
+class CoalescingMessageQueue(asyncio.Queue[KernelMessage]):
+    """A message queue that coalesces its messages when it grows too long.
+
+    When the queue holds `high_water_mark` messages, because its consumer
+    can't keep up with the kernel, the queued messages are coalesced with
+    `coalesce_messages`.
+
+    To keep compaction linear in the number of messages, the queue is only
+    compacted again once it has doubled in size, or after it has drained
+    below the high-water mark.
+
+    If the queue still grows past `max_size`, its backlog is dropped and
+    `on_overflow` is called to queue the session's full state instead.
+    Without `on_overflow`, messages are never dropped, since the frontend's
+    state is built from every message it receives.
+    """
+
+    def __init__(
+        self,
+        high_water_mark: int = DEFAULT_HIGH_WATER_MARK,
+        max_size: int = DEFAULT_MAX_SIZE,
+        on_overflow: Optional[Callable[[], None]] = None,
+    ):
+        super().__init__()
+        self.high_water_mark = high_water_mark
+        self.max_size = max_size
+        self.on_overflow = on_overflow
+        self._compact_at = high_water_mark
+        self._overflow_at = max_size
+        self._resyncing = False
+
+    def put_nowait(self, item: KernelMessage) -> None:
+        if self.qsize() < self.high_water_mark:
+            self._compact_at = self.high_water_mark
+            self._overflow_at = self.max_size
+        super().put_nowait(item)
+        if self.qsize() >= self._compact_at:
+            self.compact()
+        if self.qsize() > self._overflow_at and not self._resyncing:
+            self.resync()
+
+    def compact(self) -> None:
+        """Coalesce the queued messages."""
+        for message in coalesce_messages(self._drain()):
+            super().put_nowait(message)
+        self._compact_at = max(self.high_water_mark, 2 * self.qsize())
+
+    def resync(self) -> None:
+        """Replace the queued messages with the session's full state."""
+        if self.on_overflow is None:
+            return
+        dropped = len(self._drain())
+        self._resyncing = True
+        try:
+            self.on_overflow()
+        finally:
+            self._resyncing = False
+        LOGGER.warning(
+            "Dropped %s queued messages for a slow connection, "
+            "and resent the notebook's state instead",
+            dropped,
+        )
+        # The state itself may be large; don't resync again until the
+        # queue has doubled in size
+        self._compact_at = max(self.high_water_mark, 2 * self.qsize())
+        self._overflow_at = max(self.max_size, 2 * self.qsize())
+
+    def _drain(self) -> list[KernelMessage]:
+        messages: list[KernelMessage] = []
+        while not self.empty():
+            messages.append(self.get_nowait())
+            self.task_done()
+        return messages
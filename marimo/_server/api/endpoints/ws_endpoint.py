@@ -37,6 +37,9 @@ from marimo._server.api.endpoints.ws.ws_kernel_ready import (
 from marimo._server.api.endpoints.ws.ws_message_loop import (
     WebSocketMessageLoop,
 )
+from marimo._server.api.endpoints.ws.ws_message_queue import (
+    CoalescingMessageQueue,
+)
 from marimo._server.api.endpoints.ws.ws_rtc_handler import RTCWebSocketHandler
 from marimo._server.api.endpoints.ws.ws_session_connector import (
     SessionConnector,
@@ -308,6 +311,14 @@ class WebSocketHandler(SessionConsumer):
             LOGGER.debug("Replaying notification %s", notif)
             self._serialize_and_notify(notif)
 
+    def _resync(self) -> None:
+        """Resend the session's full state, in place of a dropped backlog."""
+        session = self.manager.get_session(self.params.session_id)
+        if session is None:
+            return
+        self._write_kernel_ready_from_session_view(session, self.params.kiosk)
+        self._replay_previous_session(session)
+
     def _on_disconnect(
         self,
         e: Exception,
@@ -381,7 +392,11 @@ class WebSocketHandler(SessionConsumer):
         # Accept the websocket connection
         await self.websocket.accept()
         # Create a new queue for this session
-        self.message_queue = asyncio.Queue()
+        self.message_queue = (
+            CoalescingMessageQueue(on_overflow=self._resync)
+            if self.params.batch
+            else asyncio.Queue()
+        )
 
         LOGGER.debug(
             "Websocket open request for session with id %s",
@@ -420,6 +435,8 @@ class WebSocketHandler(SessionConsumer):
             kiosk=self.params.kiosk,
             on_disconnect=self._on_disconnect,
             on_check_status_update=self._check_status_update,
+            batch=self.params.batch,
+            binary=self.params.binary,
         )
 
         try:
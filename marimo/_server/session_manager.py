@@ -15,6 +15,7 @@ from typing import TYPE_CHECKING, Optional, TypeVar
 from marimo import _loggers
 from marimo._cli.sandbox import SandboxMode
 from marimo._config.manager import MarimoConfigManager
+from marimo._config.settings import GLOBAL_SETTINGS
 from marimo._runtime.commands import (
     SerializedCLIArgs,
     SerializedQueryParams,
@@ -42,6 +43,7 @@ from marimo._session.file_change_handler import (
 from marimo._session.file_watcher_integration import (
     SessionFileWatcherExtension,
 )
+from marimo._session.managers import ForkServer, KernelPool
 from marimo._session.model import ConnectionState, SessionMode
 from marimo._session.session import Session, SessionImpl
 from marimo._session.session_repository import SessionRepository
@@ -65,6 +67,8 @@ class SessionManager:
     - SessionEventBus: coordinates lifecycle events
     - ResumeStrategy: handles session resumption logic
     - FileWatcherLifecycle: manages file watching
+    - KernelPool: pre-starts edit-mode kernels, if enabled
+    - ForkServer: forks run-mode kernels after the setup cell, if enabled
     """
 
     def __init__(
@@ -133,6 +137,38 @@ class SessionManager:
         self.watch = watch
         self._file_change_coordinator = self._create_file_change_coordinator()
 
+        # Pre-started kernels for edit-mode sessions. Sandboxed notebooks
+        # each get their own environment, so they can't use pooled kernels.
+        self._kernel_pool: Optional[KernelPool] = None
+        if (
+            mode is SessionMode.EDIT
+            and sandbox_mode is not SandboxMode.MULTI
+            and GLOBAL_SETTINGS.KERNEL_POOL_SIZE > 0
+        ):
+            self._kernel_pool = KernelPool(
+                size=GLOBAL_SETTINGS.KERNEL_POOL_SIZE,
+                preload=GLOBAL_SETTINGS.KERNEL_POOL_PRELOAD,
+            )
+            self._kernel_pool.start()
+
+        # Templates for forking run-mode kernels, by file path
+        self._fork_servers: dict[str, ForkServer] = {}
+        if (
+            mode is SessionMode.RUN
+            and GLOBAL_SETTINGS.RUN_FORK_SERVER
+            and file_router.get_unique_file_key() is not None
+        ):
+            LOGGER.info(
+                "Forking run-mode kernels from a process that has run the "
+                "setup cell; resources it opens are shared by all sessions"
+            )
+            # Run the setup cell before the first session is created
+            self._get_fork_server(
+                file_router.get_single_app_file_manager(
+                    AppDefaults.from_config_manager(config_manager)
+                )
+            )
+
     @property
     def auth_token(self) -> AuthToken:
         """Get the auth token."""
@@ -218,6 +254,8 @@ class SessionManager:
             auto_instantiate=auto_instantiate,
             extensions=extensions,
             sandbox_mode=self.sandbox_mode,
+            kernel_pool=self._kernel_pool,
+            fork_server=self._get_fork_server(app_file_manager),
         )
 
         # Add to repository
@@ -228,6 +266,38 @@ class SessionManager:
 
         return session
 
+    def _get_fork_server(
+        self, app_file_manager: AppFileManager
+    ) -> Optional[ForkServer]:
+        """Get the fork server for an app, starting it if needed.
+
+        Apps without a setup cell have nothing to share, so they aren't
+        forked. The fork server is restarted if the setup cell changes.
+        """
+        if (
+            self.mode is not SessionMode.RUN
+            or self.sandbox_mode is SandboxMode.MULTI
+            or not GLOBAL_SETTINGS.RUN_FORK_SERVER
+            or not ForkServer.is_supported()
+        ):
+            return None
+
+        path = app_file_manager.path
+        cell_manager = app_file_manager.app.cell_manager
+        setup_code = cell_manager.get_cell_code(cell_manager.setup_cell_id)
+        if path is None or not setup_code:
+            return None
+
+        fork_server = self._fork_servers.get(path)
+        if fork_server is not None and fork_server.setup_code != setup_code:
+            fork_server.shutdown()
+            fork_server = None
+        if fork_server is None:
+            fork_server = ForkServer(filename=path, setup_code=setup_code)
+            fork_server.start()
+            self._fork_servers[path] = fork_server
+        return fork_server
+
     def _create_file_change_coordinator(self) -> FileChangeCoordinator:
         """Create a file change coordinator."""
         reload_strategy = create_reload_strategy(
@@ -391,6 +461,11 @@ class SessionManager:
         self.close_all_sessions()
         self.lsp_server.stop()
         self._watcher_manager.stop_all()
+        if self._kernel_pool is not None:
+            self._kernel_pool.shutdown()
+        for fork_server in self._fork_servers.values():
+            fork_server.shutdown()
+        self._fork_servers.clear()
 
     def should_send_code_to_frontend(self) -> bool:
         """Returns True if the server can send messages to the frontend."""
@@ -11,13 +11,26 @@ Standard implementations (QueueManagerImpl, KernelManagerImpl):
 IPC implementations (IPCQueueManagerImpl, IPCKernelManagerImpl):
     Launch kernel as subprocess with ZeroMQ IPC.
     Each notebook gets its own sandboxed virtual environment.
+
+KernelPool:
+    Keeps pre-started edit-mode kernel processes for KernelManagerImpl.
+
+Fork implementations (ForkQueueManagerImpl, ForkKernelManagerImpl):
+    Fork run-mode kernels from a ForkServer, a template process that has
+    already run the app's setup cell.
 """
 
+from marimo._session.managers.fork import (
+    ForkKernelManagerImpl,
+    ForkQueueManagerImpl,
+    ForkServer,
+)
 from marimo._session.managers.ipc import (
     IPCKernelManagerImpl,
     IPCQueueManagerImpl,
 )
 from marimo._session.managers.kernel import KernelManagerImpl
+from marimo._session.managers.pool import KernelPool
 from marimo._session.managers.queue import QueueManagerImpl
 
 __all__ = [
@@ -25,4 +38,8 @@ __all__ = [
     "KernelManagerImpl",
     "IPCQueueManagerImpl",
     "IPCKernelManagerImpl",
+    "KernelPool",
+    "ForkQueueManagerImpl",
+    "ForkKernelManagerImpl",
+    "ForkServer",
 ]
@@ -0,0 +1,794 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Run-mode kernels forked from a template process.
+
+In run mode, each session's kernel re-executes the whole notebook, so an
+expensive setup cell (loading a model or a large dataset) is paid for once
+per visitor. A `ForkServer` runs the app's setup cell once, in a template
+process, and forks a kernel process from the template for each session:
+the setup cell's definitions are shared copy-on-write, and each kernel
+imports them instead of running the setup cell again.
+
+Forked kernels are separate processes, so sessions talk to them over
+sockets: commands are sent over one connection, and kernel messages are
+received over another, as in edit mode.
+
+Everything the setup cell creates is inherited by every forked kernel,
+including open resources: files, sockets, database connections and HTTP
+clients would be shared by all sessions, which corrupts their state. The
+template warns when the setup cell leaves file descriptors open; such
+resources should be opened outside the setup cell.
+"""
+
+from __future__ import annotations
+
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+from multiprocessing import connection, get_context
+from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar, Union
+
+import msgspec
+
+from marimo import _loggers
+from marimo._ast.names import SETUP_CELL_NAME
+from marimo._config.settings import GLOBAL_SETTINGS
+from marimo._messaging.types import KernelMessage
+from marimo._runtime import commands
+from marimo._runtime.virtual_file.storage import (
+    SharedMemoryStorage,
+    VirtualFileStorageManager,
+)
+from marimo._session.queue import QueueType
+from marimo._session.types import KernelManager, QueueManager
+from marimo._types.ids import CellId_t
+from marimo._utils.typed_connection import TypedConnection
+
+if TYPE_CHECKING:
+    import types
+    from collections.abc import Iterable
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+
+    from marimo._ast.cell import CellConfig
+    from marimo._config.manager import MarimoConfigReader
+    from marimo._runtime.commands import AppMetadata
+    from marimo._session.model import SessionMode
+
+LOGGER = _loggers.marimo_logger()
+
+T = TypeVar("T")
+
+# Module under which the template's setup globals are imported by kernels
+SETUP_MODULE_NAME = "__marimo_setup__"
+
+# Requests to the template
+_FORK = "fork"
+_IS_ALIVE = "is_alive"
+_TERMINATE = "terminate"
+_SHUTDOWN = "shutdown"
+
+# Names of the command channels sent to forked kernels
+_CONTROL = "control"
+_SET_UI_ELEMENT = "set_ui_element"
+_COMPLETION = "completion"
+_INPUT = "input"
+
+# Notices sent back by forked kernels about their virtual files
+_ADD_FILE = "add_file"
+_REMOVE_FILE = "remove_file"
+
+# Seconds between checks for whether a command channel was closed
+_POLL_INTERVAL = 0.1
+
+# Seconds a forked kernel has to connect to its session
+_CONNECT_TIMEOUT = 30.0
+
+
+class ForkServer:
+    """A template process that runs an app's setup cell, then forks kernels.
+
+    The template is started with `start` and becomes `ready` once the setup
+    cell has run. Sessions created before then (or after the template has
+    failed) should use regular run-mode kernels.
+
+    Forking is only supported on platforms with `os.fork`. Libraries that
+    start threads on import may not work in forked kernels, and resources
+    opened by the setup cell are shared by all forked kernels.
+    """
+
+    def __init__(self, filename: Optional[str], setup_code: str) -> None:
+        self.filename = filename
+        self.setup_code = setup_code
+        self._process: BaseProcess | None = None
+        self._conn: Connection | None = None
+        self._lock = threading.Lock()
+        self._ready = False
+        self._failed = False
+
+    @staticmethod
+    def is_supported() -> bool:
+        return sys.platform != "win32" and hasattr(os, "fork")
+
+    def start(self) -> None:
+        """Start the template process, which runs the setup cell."""
+        # The server is multi-threaded, so the template is spawned rather
+        # than forked; only the template (which is single-threaded) forks.
+        context = get_context("spawn")
+        conn, child_conn = context.Pipe()
+        self._process = context.Process(
+            target=run_fork_server,
+            args=(
+                child_conn,
+                self.filename,
+                self.setup_code,
+                GLOBAL_SETTINGS.LOG_LEVEL,
+            ),
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+        self._conn = conn
+
+    @property
+    def ready(self) -> bool:
+        """Whether the template has run the setup cell and can fork."""
+        with self._lock:
+            if self._failed or self._conn is None or self._process is None:
+                return False
+            if not self._ready and self._conn.poll():
+                try:
+                    status, detail = self._conn.recv()
+                except (EOFError, OSError):
+                    status, detail = "error", "the process exited"
+                if status == "ready":
+                    self._ready = True
+                else:
+                    LOGGER.warning(
+                        "Failed to run the setup cell in the fork server: %s",
+                        detail,
+                    )
+                    self._failed = True
+            if not self._process.is_alive():
+                self._failed = True
+            return self._ready and not self._failed
+
+    def fork(self, address: Any, *launch_args: Any) -> ForkedProcess:
+        """Fork a kernel from the template.
+
+        Args:
+            address: Address the kernel connects to, first to receive
+                commands, then to send kernel messages.
+            launch_args: The arguments of `runtime.launch_kernel` that
+                follow the socket address.
+
+        Raises:
+            RuntimeError: If the template isn't ready.
+        """
+        if not self.ready:
+            raise RuntimeError("Fork server is not ready")
+        pid: int = self._request(_FORK, address, launch_args)
+        return ForkedProcess(self, pid)
+
+    def is_child_alive(self, pid: int) -> bool:
+        """Whether a kernel forked by the template is still running."""
+        try:
+            alive: bool = self._request(_IS_ALIVE, pid)
+        except RuntimeError:
+            # The template reaps its kernels, so without it we can't tell;
+            # kernels exit once their session's connections are closed
+            return False
+        return alive
+
+    def terminate_child(self, pid: int) -> None:
+        """Terminate a kernel forked by the template."""
+        try:
+            self._request(_TERMINATE, pid)
+        except RuntimeError:
+            pass
+
+    def shutdown(self) -> None:
+        """Stop forking kernels.
+
+        The template keeps running until the kernels it has forked exit,
+        so they can still be terminated.
+        """
+        with self._lock:
+            self._failed = True
+            ready = self._ready
+        if ready:
+            try:
+                self._request(_SHUTDOWN)
+                return
+            except RuntimeError:
+                pass
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        if self._process is not None and self._process.is_alive():
+            self._process.terminate()
+
+    def _request(self, *request: Any) -> Any:
+        with self._lock:
+            if self._conn is None:
+                raise RuntimeError("Fork server exited")
+            try:
+                self._conn.send(request)
+                return self._conn.recv()
+            except (EOFError, OSError) as e:
+                self._failed = True
+                raise RuntimeError("Fork server exited") from e
+
+
+class ForkedProcess:
+    """A kernel process forked by the fork server.
+
+    Forked kernels are children of the template, not of the server, so the
+    server asks the template whether they're alive and to terminate them.
+    The template only reaps a kernel after it exits, so its PID can't be
+    reused for another process in the meantime.
+    """
+
+    def __init__(self, fork_server: ForkServer, pid: int) -> None:
+        self._fork_server = fork_server
+        self._pid = pid
+
+    @property
+    def pid(self) -> int | None:
+        return self._pid
+
+    def is_alive(self) -> bool:
+        return self._fork_server.is_child_alive(self._pid)
+
+    def terminate(self) -> None:
+        self._fork_server.terminate_child(self._pid)
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        start = time.monotonic()
+        while self.is_alive():
+            if timeout is not None and time.monotonic() - start > timeout:
+                return
+            time.sleep(0.05)
+
+
+class _CommandChannel:
+    """Sends commands to a forked kernel, once it has connected.
+
+    Commands sent before the kernel connects are buffered. The kernel
+    sends back the names of the virtual files it stores in shared memory,
+    which are registered with the server's storage manager until the
+    kernel removes them or exits.
+    """
+
+    def __init__(self) -> None:
+        self._conn: Connection | None = None
+        self._buffer: list[tuple[str, Any]] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def connect(self, conn: Connection) -> None:
+        with self._lock:
+            self._conn = conn
+            for message in self._buffer:
+                self._send(message)
+            self._buffer.clear()
+        threading.Thread(
+            target=self._receive_files, args=(conn,), daemon=True
+        ).start()
+
+    def _receive_files(self, conn: Connection) -> None:
+        # This thread owns the connection, and closes it once the channel
+        # is closed: closing it while another thread is in `recv` is unsafe
+        manager = VirtualFileStorageManager()
+        files: set[str] = set()
+        try:
+            while not self._closed:
+                if not conn.poll(_POLL_INTERVAL):
+                    continue
+                notice, filename = conn.recv()
+                if notice == _ADD_FILE and filename not in files:
+                    files.add(filename)
+                    manager.add_shared_file(filename)
+                elif notice == _REMOVE_FILE and filename in files:
+                    files.remove(filename)
+                    manager.remove_shared_file(filename)
+        except (EOFError, OSError):
+            # The kernel exited
+            pass
+        finally:
+            with self._lock:
+                self._closed = True
+                conn.close()
+            for filename in files:
+                manager.remove_shared_file(filename)
+
+    def send(self, channel: str, obj: Any) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            if self._conn is None:
+                self._buffer.append((channel, obj))
+            else:
+                self._send((channel, obj))
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+
+    def _send(self, message: tuple[str, Any]) -> None:
+        assert self._conn is not None
+        try:
+            self._conn.send(message)
+        except OSError as e:
+            # The kernel exited
+            LOGGER.debug("Failed to send command to forked kernel: %s", e)
+
+
+class ChannelQueue(QueueType[T], Generic[T]):
+    """Queue for sending commands to a forked kernel (sender side only)."""
+
+    def __init__(self, channel: _CommandChannel, name: str) -> None:
+        self._channel = channel
+        self._name = name
+
+    def put(
+        self,
+        obj: T,
+        block: bool = True,  # noqa: ARG002
+        timeout: float | None = None,  # noqa: ARG002
+    ) -> None:
+        """Put an item into the queue."""
+        self._channel.send(self._name, obj)
+
+    def put_nowait(self, obj: T) -> None:
+        """Put an item into the queue without blocking."""
+        self.put(obj, block=False)
+
+    def get(self, block: bool = True, timeout: float | None = None) -> T:  # noqa: FBT001, FBT002
+        """Get an item from the queue (stub - not implemented)."""
+        msg = "ChannelQueue does not support get operations"
+        raise NotImplementedError(msg)
+
+    def get_nowait(self) -> T:
+        """Get an item from the queue without blocking (stub - not implemented)."""
+        msg = "ChannelQueue does not support get operations"
+        raise NotImplementedError(msg)
+
+    def empty(self) -> bool:
+        """Return True if the queue is empty (stub - not implemented)."""
+        msg = "ChannelQueue does not support empty() operation"
+        raise NotImplementedError(msg)
+
+
+class ForkQueueManagerImpl(QueueManager):
+    """Manages queues for a session whose kernel is forked."""
+
+    def __init__(self) -> None:
+        self.channel = _CommandChannel()
+        self.control_queue: QueueType[commands.CommandMessage] = ChannelQueue(
+            self.channel, _CONTROL
+        )
+        self.set_ui_element_queue: QueueType[commands.BatchableCommand] = (
+            ChannelQueue(self.channel, _SET_UI_ELEMENT)
+        )
+        self.completion_queue: QueueType[commands.CodeCompletionCommand] = (
+            ChannelQueue(self.channel, _COMPLETION)
+        )
+        self.input_queue: QueueType[str] = ChannelQueue(self.channel, _INPUT)
+        self.win32_interrupt_queue: Optional[QueueType[bool]] = None
+        # Kernel messages are received over the kernel connection
+        self.stream_queue: Optional[QueueType[Union[KernelMessage, None]]] = (
+            None
+        )
+
+    def close_queues(self) -> None:
+        self.channel.close()
+
+    def put_control_request(self, request: commands.CommandMessage) -> None:
+        # Completions are on their own queue
+        if isinstance(request, commands.CodeCompletionCommand):
+            self.completion_queue.put(request)
+            return
+
+        self.control_queue.put(request)
+        # UI element updates and model commands are on both queues
+        # so they can be batched
+        if isinstance(
+            request,
+            (commands.UpdateUIElementCommand, commands.ModelCommand),
+        ):
+            self.set_ui_element_queue.put(request)
+
+    def put_input(self, text: str) -> None:
+        self.input_queue.put(text)
+
+
+class ForkKernelManagerImpl(KernelManager):
+    """Kernel manager for run-mode kernels forked by a `ForkServer`."""
+
+    def __init__(
+        self,
+        *,
+        queue_manager: ForkQueueManagerImpl,
+        fork_server: ForkServer,
+        mode: SessionMode,
+        configs: dict[CellId_t, CellConfig],
+        app_metadata: AppMetadata,
+        config_manager: MarimoConfigReader,
+        virtual_files_supported: bool,
+        redirect_console_to_browser: bool,
+    ) -> None:
+        self.queue_manager = queue_manager
+        self.fork_server = fork_server
+        self.mode = mode
+        self.configs = configs
+        self.app_metadata = app_metadata
+        self.config_manager = config_manager
+        self.virtual_files_supported = virtual_files_supported
+        self.redirect_console_to_browser = redirect_console_to_browser
+
+        self.kernel_task: ForkedProcess | None = None
+        self._read_conn: Optional[TypedConnection[KernelMessage]] = None
+
+    def start_kernel(self) -> None:
+        if self.kernel_task is None and not self.fork_kernel():
+            raise RuntimeError("Forked kernel failed to connect")
+
+    def fork_kernel(self) -> bool:
+        """Fork a kernel and wait for it to connect.
+
+        Returns:
+            Whether the kernel connected; if it didn't (for example, it
+            crashed), it is terminated and the session should use another
+            kernel.
+        """
+        deadline = time.monotonic() + _CONNECT_TIMEOUT
+        with socket.create_server(("localhost", 0)) as server:
+            try:
+                self.kernel_task = self.fork_server.fork(
+                    server.getsockname(),
+                    self.configs,
+                    self.app_metadata,
+                    self.config_manager.get_config(hide_secrets=False),
+                    self.virtual_files_supported,
+                    self.redirect_console_to_browser,
+                    GLOBAL_SETTINGS.LOG_LEVEL,
+                )
+                # The kernel connects for commands before launching, then
+                # connects again to send messages
+                self.queue_manager.channel.connect(_accept(server, deadline))
+                self._read_conn = TypedConnection[KernelMessage].of(
+                    _accept(server, deadline)
+                )
+            except (RuntimeError, OSError) as e:
+                LOGGER.warning("Failed to start a forked kernel: %s", e)
+                self.queue_manager.close_queues()
+                if self.kernel_task is not None:
+                    self.kernel_task.terminate()
+                    self.kernel_task = None
+                return False
+        return True
+
+    @property
+    def pid(self) -> int | None:
+        if self.kernel_task is None:
+            return None
+        return self.kernel_task.pid
+
+    @property
+    def profile_path(self) -> str | None:
+        return None
+
+    def is_alive(self) -> bool:
+        return self.kernel_task is not None and self.kernel_task.is_alive()
+
+    def interrupt_kernel(self) -> None:
+        # no interruptions in run mode
+        return
+
+    def close_kernel(self) -> None:
+        assert self.kernel_task is not None, "kernel not started"
+        self.queue_manager.close_queues()
+        if self.kernel_task.is_alive():
+            self.kernel_task.terminate()
+        if self._read_conn is not None:
+            self._read_conn.close()
+
+    @property
+    def kernel_connection(self) -> TypedConnection[KernelMessage]:
+        assert self._read_conn is not None, "connection not started"
+        return self._read_conn
+
+
+def _accept(server: socket.socket, deadline: float) -> Connection:
+    """Accept a connection made with `multiprocessing.connection.Client`."""
+    timeout = deadline - time.monotonic()
+    if timeout <= 0:
+        raise TimeoutError("timed out waiting for the kernel to connect")
+    server.settimeout(timeout)
+    sock, _ = server.accept()
+    sock.setblocking(True)
+    return connection.Connection(sock.detach())
+
+
+def run_fork_server(
+    conn: Connection,
+    filename: Optional[str],
+    setup_code: str,
+    log_level: int,
+) -> None:
+    """Entrypoint of the template process.
+
+    Runs the setup cell, then serves requests received on `conn`: forks a
+    kernel for each fork request, replying with the kernel's PID, and
+    checks on or terminates the kernels it has forked.
+    """
+    # Leave interrupts to the server, which shuts the template down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _loggers.set_level(log_level)
+
+    # Import the runtime once, so forked kernels don't have to
+    from marimo._runtime import runtime  # noqa: F401
+
+    fds = _open_fds()
+    try:
+        setup_defs = _run_setup_cell(filename, setup_code)
+    except BaseException as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+        return
+    leaked_fds = _open_fds() - fds
+    if leaked_fds:
+        LOGGER.warning(
+            "The setup cell left %d file descriptor(s) open, such as files, "
+            "sockets or database connections. Forked kernels share them, "
+            "so sessions may interfere with each other; open them outside "
+            "the setup cell instead.",
+            len(leaked_fds),
+        )
+    conn.send(("ready", None))
+
+    # Forked kernels are reaped once they have exited; until then, their
+    # PIDs can't be reused
+    children: set[int] = set()
+    shutting_down = False
+    while not (shutting_down and not children):
+        _reap_children(children)
+        try:
+            if not conn.poll(_POLL_INTERVAL):
+                continue
+            request, *args = conn.recv()
+        except (EOFError, OSError):
+            # The server shut the template down
+            return
+
+        if request == _FORK and not shutting_down:
+            address, launch_args = args
+            pid = os.fork()
+            if pid == 0:
+                try:
+                    conn.close()
+                    _launch_forked_kernel(
+                        address, setup_code, setup_defs, *launch_args
+                    )
+                finally:
+                    # Never return into the template's loop
+                    os._exit(0)
+            children.add(pid)
+            conn.send(pid)
+        elif request == _IS_ALIVE:
+            conn.send(args[0] in children)
+        elif request == _TERMINATE:
+            if args[0] in children:
+                os.kill(args[0], signal.SIGTERM)
+            conn.send(None)
+        elif request == _SHUTDOWN:
+            shutting_down = True
+            conn.send(None)
+        else:
+            conn.send(None)
+
+
+def _reap_children(children: set[int]) -> None:
+    for pid in list(children):
+        try:
+            done, _ = os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            done = pid
+        if done:
+            children.remove(pid)
+
+
+def _open_fds() -> set[int]:
+    """File descriptors open in this process, where they can be listed."""
+    try:
+        listed = os.listdir("/dev/fd")
+    except OSError:
+        return set()
+    fds = set()
+    for name in listed:
+        try:
+            fd = int(name)
+            # Skip the descriptor used to list the directory
+            os.fstat(fd)
+        except (ValueError, OSError):
+            continue
+        fds.add(fd)
+    return fds
+
+
+def _run_setup_cell(filename: Optional[str], setup_code: str) -> list[str]:
+    """Run the setup cell in a module registered as `SETUP_MODULE_NAME`.
+
+    Returns:
+        The names defined by the setup cell.
+    """
+    from marimo._ast.compiler import compile_cell
+    from marimo._runtime.patches import create_main_module
+
+    cell = compile_cell(
+        setup_code, cell_id=CellId_t(SETUP_CELL_NAME), filename=filename
+    )
+    module: types.ModuleType = create_main_module(
+        file=filename, input_override=None, print_override=None
+    )
+    sys.modules[SETUP_MODULE_NAME] = module
+    glbls = module.__dict__
+    exec(cell.body, glbls)
+    if cell.last_expr is not None:
+        eval(cell.last_expr, glbls)
+    # Definitions can be conditional
+    return sorted(name for name in cell.defs if name in glbls)
+
+
+def _launch_forked_kernel(
+    address: Any,
+    setup_code: str,
+    setup_defs: list[str],
+    configs: dict[CellId_t, CellConfig],
+    app_metadata: AppMetadata,
+    user_config: Any,
+    virtual_files_supported: bool,
+    redirect_console_to_browser: bool,
+    log_level: int,
+) -> None:
+    import queue
+
+    from marimo._runtime import runtime
+
+    command_conn = connection.Client(address)
+    # The server reads this kernel's virtual files from shared memory
+    VirtualFileStorageManager().storage = _ReportingSharedMemoryStorage(
+        command_conn
+    )
+
+    control_queue: queue.Queue[commands.CommandMessage] = queue.Queue()
+    set_ui_element_queue: queue.Queue[commands.BatchableCommand] = (
+        queue.Queue()
+    )
+    completion_queue: queue.Queue[commands.CodeCompletionCommand] = (
+        queue.Queue()
+    )
+    input_queue: queue.Queue[str] = queue.Queue(maxsize=1)
+    receivers: dict[str, queue.Queue[Any]] = {
+        _CONTROL: control_queue,
+        _SET_UI_ELEMENT: set_ui_element_queue,
+        _COMPLETION: completion_queue,
+        _INPUT: input_queue,
+    }
+
+    threading.Thread(
+        target=_receive_commands,
+        args=(command_conn, receivers, setup_code, setup_defs),
+        daemon=True,
+    ).start()
+
+    runtime.launch_kernel(
+        control_queue,
+        set_ui_element_queue,
+        completion_queue,
+        input_queue,
+        # stream queue unused
+        None,
+        address,
+        False,
+        configs,
+        app_metadata,
+        user_config,
+        virtual_files_supported,
+        redirect_console_to_browser,
+        # win32 interrupt queue
+        None,
+        # profile path
+        None,
+        log_level,
+        # Like IPC kernels, forked kernels are run-mode subprocesses
+        is_ipc=True,
+    )
+
+
+class _ReportingSharedMemoryStorage(SharedMemoryStorage):
+    """Shared memory storage that reports its files to the server.
+
+    The server only reads names from shared memory that a forked kernel
+    has reported, so requests can't open arbitrary shared memory segments.
+    """
+
+    def __init__(self, conn: Connection) -> None:
+        super().__init__()
+        self._conn = conn
+        self._conn_lock = threading.Lock()
+
+    def store(self, key: str, buffer: bytes) -> None:
+        stored = self.has(key)
+        super().store(key, buffer)
+        if not stored:
+            self._notify(_ADD_FILE, key)
+
+    def remove(self, key: str) -> None:
+        stored = self.has(key)
+        super().remove(key)
+        if stored:
+            self._notify(_REMOVE_FILE, key)
+
+    def shutdown(self, keys: Iterable[str] | None = None) -> None:
+        stored = list(self._storage)
+        super().shutdown(keys)
+        for key in stored:
+            self._notify(_REMOVE_FILE, key)
+
+    def _notify(self, notice: str, key: str) -> None:
+        with self._conn_lock:
+            try:
+                self._conn.send((notice, key))
+            except OSError as e:
+                # The session was closed
+                LOGGER.debug("Failed to send notice to the server: %s", e)
+
+
+def _receive_commands(
+    conn: Connection,
+    receivers: dict[str, QueueType[Any]],
+    setup_code: str,
+    setup_defs: list[str],
+) -> None:
+    while True:
+        try:
+            channel, obj = conn.recv()
+        except (EOFError, OSError):
+            # The session was closed
+            receivers[_CONTROL].put(commands.StopKernelCommand())
+            return
+        if isinstance(obj, commands.CreateNotebookCommand):
+            obj = import_setup_cell(obj, setup_code, setup_defs)
+        receivers[channel].put(obj)
+
+
+def import_setup_cell(
+    request: commands.CreateNotebookCommand,
+    setup_code: str,
+    setup_defs: list[str],
+) -> commands.CreateNotebookCommand:
+    """Replace the setup cell with an import of the template's definitions.
+
+    The setup cell keeps its definitions, so the dataflow graph is
+    unchanged. If the setup cell's code differs from the code the template
+    ran, it's left as is.
+    """
+    setup_id = CellId_t(SETUP_CELL_NAME)
+    code = (
+        f"from {SETUP_MODULE_NAME} import {', '.join(setup_defs)}"
+        if setup_defs
+        else ""
+    )
+    execution_requests = tuple(
+        msgspec.structs.replace(er, code=code)
+        if er.cell_id == setup_id and er.code == setup_code
+        else er
+        for er in request.execution_requests
+    )
+    return msgspec.structs.replace(
+        request, execution_requests=execution_requests
+    )
@@ -27,6 +27,7 @@ if TYPE_CHECKING:
     from marimo._ast.cell import CellConfig
     from marimo._config.manager import MarimoConfigReader
     from marimo._runtime.commands import AppMetadata
+    from marimo._session.managers.pool import PooledKernel
     from marimo._types.ids import CellId_t
 
 LOGGER = _loggers.marimo_logger()
@@ -37,6 +38,10 @@ class KernelManagerImpl(KernelManager):
 
     Uses Process for edit mode (allows SIGINT interrupts) and Thread for
     run mode (lower memory overhead).
+
+    In edit mode, the kernel may be a pre-started process from a
+    `KernelPool`, in which case `queue_manager` must be the pooled kernel's
+    queue manager.
     """
 
     def __init__(
@@ -49,6 +54,7 @@ class KernelManagerImpl(KernelManager):
         config_manager: MarimoConfigReader,
         virtual_files_supported: bool,
         redirect_console_to_browser: bool,
+        pooled_kernel: Optional[PooledKernel] = None,
     ) -> None:
         self.kernel_task: Optional[Union[ProcessLike, threading.Thread]] = None
         self.queue_manager = queue_manager
@@ -61,6 +67,7 @@ class KernelManagerImpl(KernelManager):
         # Only used in edit mode
         self._read_conn: Optional[TypedConnection[KernelMessage]] = None
         self._virtual_files_supported = virtual_files_supported
+        self._pooled_kernel = pooled_kernel
 
     def start_kernel(self) -> None:
         # We use a process in edit mode so that we can interrupt the app
@@ -71,6 +78,11 @@ class KernelManagerImpl(KernelManager):
         if is_edit_mode:
             # Need to use a socket for windows compatibility
             listener = connection.Listener(family="AF_INET")
+            if self._bind_pooled_kernel(listener.address):
+                self._read_conn = TypedConnection[KernelMessage].of(
+                    listener.accept()
+                )
+                return
             self.kernel_task = Process(
                 target=runtime.launch_kernel,
                 args=(
@@ -159,6 +171,36 @@ class KernelManagerImpl(KernelManager):
                 listener.accept()
             )
 
+    def _bind_pooled_kernel(self, address: Any) -> bool:
+        """Bind the pooled kernel, if any, to this session.
+
+        Returns:
+            Whether a pooled kernel was bound.
+        """
+        pooled_kernel = self._pooled_kernel
+        if pooled_kernel is None:
+            return False
+        self._pooled_kernel = None
+        try:
+            pooled_kernel.bind(
+                address,
+                True,
+                self.configs,
+                self.app_metadata,
+                self.config_manager.get_config(hide_secrets=False),
+                self._virtual_files_supported,
+                self.redirect_console_to_browser,
+                self.profile_path,
+                GLOBAL_SETTINGS.LOG_LEVEL,
+            )
+        except OSError as e:
+            # The pooled process exited; its queues are still usable by a
+            # freshly started process
+            LOGGER.warning("Failed to bind pooled kernel: %s", e)
+            return False
+        self.kernel_task = pooled_kernel.process
+        return True
+
     @property
     def pid(self) -> int | None:
         """Get the PID of the kernel."""
@@ -0,0 +1,223 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Pool of pre-started kernel processes for edit-mode sessions.
+
+Starting a kernel process means importing marimo (and, usually, the
+notebook's heavy dependencies) before the first cell can run. The pool keeps
+a few kernel processes that have already done so, waiting to be bound to a
+session; binding sends them the session's configuration, after which they
+launch the kernel as usual.
+"""
+
+from __future__ import annotations
+
+import importlib
+import signal
+import threading
+from collections import deque
+from dataclasses import dataclass
+from multiprocessing import Pipe, Process
+from typing import TYPE_CHECKING, Any
+
+from marimo import _loggers
+from marimo._session.managers.queue import QueueManagerImpl
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from multiprocessing.connection import Connection
+
+LOGGER = _loggers.marimo_logger()
+
+
+@dataclass
+class PooledKernel:
+    """An idle kernel process, waiting to be bound to a session."""
+
+    # Queues inherited by the process; they become the session's queues
+    queue_manager: QueueManagerImpl
+    process: Process
+    # Write end of the pipe the process waits on for its launch arguments
+    bootstrap: Connection
+
+    def bind(self, *launch_args: Any) -> None:
+        """Launch the kernel with the session's arguments.
+
+        Args:
+            launch_args: The arguments of `runtime.launch_kernel` that
+                follow the queues, starting with the socket address.
+        """
+        self.bootstrap.send(launch_args)
+        self.bootstrap.close()
+
+    def discard(self) -> None:
+        """Stop the idle process and release its resources."""
+        self.bootstrap.close()
+        self.queue_manager.close_queues()
+        if self.process.is_alive():
+            self.process.terminate()
+
+
+class KernelPool:
+    """A pool of pre-started kernel processes for edit mode.
+
+    Kernels are taken from the pool with `acquire`, which starts replacing
+    them in the background. Each pooled process imports the modules in
+    `preload` before waiting to be bound, so they are already imported when
+    the notebook runs.
+    """
+
+    def __init__(self, size: int, preload: Sequence[str] = ()) -> None:
+        self.size = size
+        self.preload = tuple(preload)
+        self._idle: deque[PooledKernel] = deque()
+        self._lock = threading.Lock()
+        self._replenishing = False
+        self._closed = False
+
+    def start(self) -> None:
+        """Fill the pool in the background."""
+        self._replenish()
+
+    def acquire(self) -> PooledKernel | None:
+        """Take an idle kernel from the pool, if there is one.
+
+        Returns:
+            An idle kernel, or None if the pool is empty or closed.
+        """
+        kernel = None
+        with self._lock:
+            while self._idle and kernel is None:
+                candidate = self._idle.popleft()
+                if candidate.process.is_alive():
+                    kernel = candidate
+                else:
+                    candidate.discard()
+        self._replenish()
+        return kernel
+
+    def shutdown(self) -> None:
+        """Stop all idle kernels; kernels already bound are unaffected."""
+        with self._lock:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+        for kernel in idle:
+            kernel.discard()
+
+    def _replenish(self) -> None:
+        with self._lock:
+            if self._closed or self._replenishing:
+                return
+            if len(self._idle) >= self.size:
+                return
+            self._replenishing = True
+        threading.Thread(target=self._fill, daemon=True).start()
+
+    def _fill(self) -> None:
+        try:
+            while True:
+                with self._lock:
+                    if self._closed or len(self._idle) >= self.size:
+                        return
+                try:
+                    kernel = self._spawn()
+                except Exception as e:
+                    LOGGER.warning("Failed to start pooled kernel: %s", e)
+                    return
+                with self._lock:
+                    if not self._closed:
+                        self._idle.append(kernel)
+                        continue
+                kernel.discard()
+                return
+        finally:
+            with self._lock:
+                self._replenishing = False
+
+    def _spawn(self) -> PooledKernel:
+        queue_manager = QueueManagerImpl(use_multiprocessing=True)
+        reader, writer = Pipe(duplex=False)
+        process = Process(
+            target=launch_pooled_kernel,
+            args=(
+                reader,
+                self.preload,
+                queue_manager.control_queue,
+                queue_manager.set_ui_element_queue,
+                queue_manager.completion_queue,
+                queue_manager.input_queue,
+                queue_manager.win32_interrupt_queue,
+            ),
+            # Like other edit-mode kernels, the process can't be a daemon,
+            # because daemonic processes can't create children
+            daemon=False,
+        )
+        process.start()
+        reader.close()
+        return PooledKernel(
+            queue_manager=queue_manager, process=process, bootstrap=writer
+        )
+
+
+def launch_pooled_kernel(
+    bootstrap: Connection,
+    preload: Sequence[str],
+    control_queue: Any,
+    set_ui_element_queue: Any,
+    completion_queue: Any,
+    input_queue: Any,
+    win32_interrupt_queue: Any,
+) -> None:
+    """Entrypoint of pooled kernel processes.
+
+    Imports marimo's runtime and the preloaded modules, then waits to be
+    bound to a session before launching the kernel.
+    """
+    # While idle, leave interrupts to the server, which shuts the pool down;
+    # the kernel restores the default handlers when it launches.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    from marimo._runtime import runtime
+
+    for module in preload:
+        try:
+            importlib.import_module(module)
+        except Exception:
+            # Preloading is best-effort; the notebook may not need it
+            LOGGER.debug("Failed to preload module %s", module)
+
+    try:
+        (socket_addr, *launch_args) = bootstrap.recv()
+    except (EOFError, OSError):
+        # The pool was shut down before this kernel was bound
+        return
+    finally:
+        bootstrap.close()
+
+    (
+        is_edit_mode,
+        configs,
+        app_metadata,
+        user_config,
+        virtual_files_supported,
+        redirect_console_to_browser,
+        profile_path,
+        log_level,
+    ) = launch_args
+    runtime.launch_kernel(
+        control_queue,
+        set_ui_element_queue,
+        completion_queue,
+        input_queue,
+        # stream queue unused
+        None,
+        socket_addr,
+        is_edit_mode,
+        configs,
+        app_metadata,
+        user_config,
+        virtual_files_supported,
+        redirect_console_to_browser,
+        win32_interrupt_queue,
+        profile_path,
+        log_level,
+    )
@@ -59,6 +59,8 @@ if TYPE_CHECKING:
     from collections.abc import Mapping
 
     from marimo._server.models.models import InstantiateNotebookRequest
+    from marimo._session.managers.fork import ForkServer
+    from marimo._session.managers.pool import KernelPool
 
 LOGGER = _loggers.marimo_logger()
 
@@ -90,9 +92,16 @@ class SessionImpl(Session):
         ttl_seconds: Optional[int],
         extensions: list[SessionExtension] | None = None,
         sandbox_mode: SandboxMode | None = None,
+        kernel_pool: KernelPool | None = None,
+        fork_server: ForkServer | None = None,
     ) -> Session:
         """
         Create a new session.
+
+        In edit mode, the session's kernel is taken from `kernel_pool` when
+        it has an idle kernel. In run mode, the kernel is forked from
+        `fork_server` once it is ready, falling back to a thread kernel if
+        the forked kernel fails to connect.
         """
         # Inherit config from the session manager
         # and override with any script-level config
@@ -102,6 +111,32 @@ class SessionImpl(Session):
 
         configs = app_file_manager.app.cell_manager.config_map()
 
+        fork_kernel_manager = None
+        if (
+            sandbox_mode is not SandboxMode.MULTI
+            and fork_server is not None
+            and mode == SessionMode.RUN
+            and fork_server.ready
+        ):
+            from marimo._session.managers import (
+                ForkKernelManagerImpl,
+                ForkQueueManagerImpl,
+            )
+
+            fork_kernel_manager = ForkKernelManagerImpl(
+                queue_manager=ForkQueueManagerImpl(),
+                fork_server=fork_server,
+                mode=mode,
+                configs=configs,
+                app_metadata=app_metadata,
+                config_manager=config_manager,
+                virtual_files_supported=virtual_files_supported,
+                redirect_console_to_browser=redirect_console_to_browser,
+            )
+            if not fork_kernel_manager.fork_kernel():
+                # Fall back to a thread kernel
+                fork_kernel_manager = None
+
         # Create kernel manager
         # SandboxMode.MULTI uses IPC kernels with per-notebook sandboxed venvs
         queue_manager: QueueManager
@@ -125,11 +160,21 @@ class SessionImpl(Session):
                 virtual_files_supported=virtual_files_supported,
                 redirect_console_to_browser=redirect_console_to_browser,
             )
+        elif fork_kernel_manager is not None:
+            queue_manager = fork_kernel_manager.queue_manager
+            kernel_manager = fork_kernel_manager
         else:
             # Original kernel: Process for edit, Thread for run
             use_multiprocessing = mode == SessionMode.EDIT
-            queue_manager = QueueManagerImpl(
-                use_multiprocessing=use_multiprocessing
+            pooled_kernel = (
+                kernel_pool.acquire()
+                if kernel_pool is not None and use_multiprocessing
+                else None
+            )
+            queue_manager = (
+                pooled_kernel.queue_manager
+                if pooled_kernel is not None
+                else QueueManagerImpl(use_multiprocessing=use_multiprocessing)
             )
             kernel_manager = KernelManagerImpl(
                 queue_manager=queue_manager,
@@ -139,6 +184,7 @@ class SessionImpl(Session):
                 config_manager=config_manager,
                 virtual_files_supported=virtual_files_supported,
                 redirect_console_to_browser=redirect_console_to_browser,
+                pooled_kernel=pooled_kernel,
             )
 
         extensions = [
@@ -344,8 +390,10 @@ class SessionImpl(Session):
             notification = operation
         else:
             notification = serialize_kernel_message(operation)
-        self.room.broadcast(notification, except_consumer=from_consumer_id)
+        # Update the session view first, so consumers that resync from it
+        # while handling the notification see it
         self._event_bus.emit_notification_sent(self, notification)
+        self.room.broadcast(notification, except_consumer=from_consumer_id)
 
     def close(self) -> None:
         """
@@ -0,0 +1,206 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Bounded, append-only console outputs of a cell."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING, Optional, Union
+
+from marimo._messaging.cell_output import CellChannel, CellOutput
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from marimo._messaging.mimetypes import KnownMimeType
+
+
+class _TextRun:
+    """Consecutive text/plain outputs on one channel, kept as chunks."""
+
+    def __init__(self, output: CellOutput) -> None:
+        self.channel = output.channel
+        self.mimetype: KnownMimeType = output.mimetype
+        self.timestamp = output.timestamp
+        self.chunks: deque[str] = deque()
+        self._joined: Optional[str] = None
+
+    def append(self, chunk: str) -> None:
+        self.chunks.append(chunk)
+        self._joined = None
+
+    def popleft(self) -> str:
+        self._joined = None
+        return self.chunks.popleft()
+
+    @property
+    def data(self) -> str:
+        if self._joined is None:
+            self._joined = "".join(self.chunks)
+        return self._joined
+
+    def to_output(self) -> CellOutput:
+        return CellOutput(
+            channel=self.channel,
+            mimetype=self.mimetype,
+            data=self.data,
+            timestamp=self.timestamp,
+        )
+
+
+def _is_text(output: CellOutput) -> bool:
+    return output.mimetype == "text/plain" and isinstance(output.data, str)
+
+
+def _size(data: object) -> int:
+    return len(data) if isinstance(data, str) else 0
+
+
+def _lines(data: object) -> int:
+    # Outputs other than text take up at least a line
+    return max(data.count("\n"), 1) if isinstance(data, str) else 1
+
+
+class ConsoleBuffer:
+    """The console outputs of a cell.
+
+    Appending an output takes time proportional to the output's size,
+    independent of how much has already been written: consecutive
+    text/plain outputs on the same channel are kept as chunks, which are
+    only joined (once) when the outputs are read.
+
+    The buffer keeps the most recent outputs, up to `max_size` characters
+    and `max_lines` lines (`None` for no limit); older outputs are dropped,
+    and replaced by a marker saying how many lines were truncated.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        max_lines: Optional[int] = None,
+    ) -> None:
+        self.max_size = max_size
+        self.max_lines = max_lines
+        self._entries: deque[Union[_TextRun, CellOutput]] = deque()
+        self._size = 0
+        self._lines = 0
+        self.truncated_lines = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+        self._lines = 0
+        self.truncated_lines = 0
+
+    def extend(self, outputs: Iterable[CellOutput]) -> None:
+        for output in outputs:
+            self.append(output)
+
+    def append(self, output: CellOutput) -> None:
+        if not _is_text(output):
+            self._entries.append(output)
+            self._size += _size(output.data)
+            self._lines += _lines(output.data)
+            self._evict()
+            return
+
+        assert isinstance(output.data, str)
+        chunk = self._trim(output.data)
+        last = self._entries[-1] if self._entries else None
+        if not (isinstance(last, _TextRun) and last.channel == output.channel):
+            last = _TextRun(output)
+            self._entries.append(last)
+        last.append(chunk)
+        self._size += len(chunk)
+        self._lines += chunk.count("\n")
+        self._evict()
+
+    def outputs(self) -> list[CellOutput]:
+        """The retained outputs, with consecutive text merged."""
+        outputs: list[CellOutput] = []
+        if self.truncated_lines:
+            outputs.append(
+                CellOutput(
+                    channel=CellChannel.STDOUT,
+                    mimetype="text/plain",
+                    data=f"[truncated {self.truncated_lines} lines]\n",
+                )
+            )
+        for entry in self._entries:
+            outputs.append(
+                entry.to_output() if isinstance(entry, _TextRun) else entry
+            )
+        return outputs
+
+    def resolve_stdin(self, stdin: str) -> bool:
+        """Answer the first input() prompt with `stdin`.
+
+        Returns:
+            Whether there was a prompt waiting for input.
+        """
+        for entry in self._entries:
+            if entry.channel != CellChannel.STDIN:
+                continue
+            data = f"{entry.data} {stdin}\n"
+            if isinstance(entry, _TextRun):
+                self._lines -= entry.data.count("\n")
+                self._size -= len(entry.data)
+                entry.chunks.clear()
+                entry.append(data)
+                self._lines += data.count("\n")
+            else:
+                self._lines -= _lines(entry.data)
+                self._size -= _size(entry.data)
+                entry.data = data
+                self._lines += _lines(data)
+            entry.channel = CellChannel.STDOUT
+            self._size += len(data)
+            return True
+        return False
+
+    def _trim(self, chunk: str) -> str:
+        """Keep the end of a chunk that alone exceeds the limits."""
+        if self.max_size is not None and len(chunk) > self.max_size:
+            self.truncated_lines += max(
+                chunk.count("\n", 0, -self.max_size), 1
+            )
+            chunk = chunk[-self.max_size :]
+        if self.max_lines is not None and chunk.count("\n") > self.max_lines:
+            # Keep the last `max_lines` newlines, and what follows them
+            start = len(chunk)
+            for _ in range(self.max_lines + 1):
+                start = chunk.rindex("\n", 0, start)
+            self.truncated_lines += chunk.count("\n", 0, start + 1)
+            chunk = chunk[start + 1 :]
+        return chunk
+
+    def _over_limit(self) -> bool:
+        return (self.max_size is not None and self._size > self.max_size) or (
+            self.max_lines is not None and self._lines > self.max_lines
+        )
+
+    def _evict(self) -> None:
+        """Drop the oldest chunks until the buffer is within its limits.
+
+        The most recent chunk is always kept.
+        """
+        while self._over_limit():
+            first = self._entries[0]
+            if isinstance(first, _TextRun):
+                if len(self._entries) == 1 and len(first.chunks) == 1:
+                    return
+                chunk = first.popleft()
+                if not first.chunks:
+                    self._entries.popleft()
+                size, lines = len(chunk), chunk.count("\n")
+            else:
+                if len(self._entries) == 1:
+                    return
+                self._entries.popleft()
+                size, lines = _size(first.data), _lines(first.data)
+            self._size -= size
+            self._lines -= lines
+            # A chunk without newlines is (part of) a line
+            self.truncated_lines += max(lines, 1)
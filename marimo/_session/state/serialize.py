@@ -3,7 +3,6 @@ from __future__ import annotations
 
 import asyncio
 import json
-import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, Union, cast
@@ -39,9 +38,9 @@ from marimo._schemas.session import (
 )
 from marimo._session.state.session_view import SessionView
 from marimo._types.ids import CellId_t
-from marimo._utils.async_path import AsyncPath
 from marimo._utils.background_task import AsyncBackgroundTask
 from marimo._utils.code import hash_code
+from marimo._utils.files import atomic_write_bytes
 from marimo._utils.lists import as_list
 from marimo._version import __version__
 
@@ -76,6 +75,82 @@ def _normalize_error(error: Union[MarimoError, dict[str, Any]]) -> ErrorOutput:
         )
 
 
+def _notebook_cell_ids(
+    view: SessionView, cell_ids: Iterable[CellId_t] | None
+) -> Iterable[CellId_t]:
+    if cell_ids is not None:
+        return cell_ids
+    if view.cell_ids is not None:
+        return view.cell_ids.cell_ids
+    # TODO: This is a problem for exporting to HTML, but not for caching the session view for replays. Something seems off.
+    LOGGER.debug(
+        "When serializing session view, the notebook-order of cells was "
+        "not known. This may cause issues when attempting to "
+        "reconstruct the notebook state from the serialized session "
+        "view."
+    )
+    return view.cell_notifications.keys()
+
+
+def _serialize_cell(view: SessionView, cell_id: CellId_t) -> Cell:
+    cell_notif = view.cell_notifications.get(cell_id)
+    if cell_notif is None:
+        # We haven't seen any outputs or notifications for this cell.
+        return Cell(id=cell_id, code_hash=None, outputs=[], console=[])
+    outputs: list[OutputType] = []
+    console: list[ConsoleType] = []
+
+    # Convert output
+    if cell_notif.output:
+        if cell_notif.output.channel == CellChannel.MARIMO_ERROR:
+            for error in cast(
+                list[Union[MarimoError, dict[str, Any]]],
+                cell_notif.output.data,
+            ):
+                outputs.append(_normalize_error(error))
+        else:
+            outputs.append(
+                DataOutput(
+                    type="data",
+                    data={
+                        cell_notif.output.mimetype: cell_notif.output.data,
+                    },
+                )
+            )
+
+    # Convert console outputs
+    for console_out in as_list(cell_notif.console):
+        assert isinstance(console_out, CellOutput)
+        if console_out.channel == CellChannel.MEDIA:
+            console.append(
+                StreamMediaOutput(
+                    type="streamMedia",
+                    name="media",
+                    mimetype=console_out.mimetype,
+                    data=str(console_out.data),
+                )
+            )
+        else:
+            # catch all for everything else
+            console.append(
+                StreamOutput(
+                    type="stream",
+                    name="stderr"
+                    if console_out.channel == CellChannel.STDERR
+                    else "stdout",
+                    text=str(console_out.data),
+                    mimetype=console_out.mimetype,
+                )
+            )
+
+    return Cell(
+        id=cell_id,
+        code_hash=_hash_code(view.last_executed_code.get(cell_id)),
+        outputs=outputs,
+        console=console,
+    )
+
+
 def serialize_session_view(
     view: SessionView,
     cell_ids: Iterable[CellId_t] | None = None,
@@ -88,85 +163,10 @@ def serialize_session_view(
     schema). When not provided, this method attempts to recover the notebook
     order from the SessionView object, but this is not always possible.
     """
-    cells: list[Cell] = []
-
-    if cell_ids is None:
-        if view.cell_ids is not None:
-            cell_ids = view.cell_ids.cell_ids
-        else:
-            # TODO: This is a problem for exporting to HTML, but not for caching the session view for replays. Something seems off.
-            LOGGER.debug(
-                "When serializing session view, the notebook-order of cells was "
-                "not known. This may cause issues when attempting to "
-                "reconstruct the notebook state from the serialized session "
-                "view."
-            )
-            cell_ids = view.cell_notifications.keys()
-
-    for cell_id in cell_ids:
-        cell_notif = view.cell_notifications.get(cell_id)
-        if cell_notif is None:
-            # We haven't seen any outputs or notifications for this cell.
-            cells.append(
-                Cell(id=cell_id, code_hash=None, outputs=[], console=[])
-            )
-            continue
-        outputs: list[OutputType] = []
-        console: list[ConsoleType] = []
-
-        # Convert output
-        if cell_notif.output:
-            if cell_notif.output.channel == CellChannel.MARIMO_ERROR:
-                for error in cast(
-                    list[Union[MarimoError, dict[str, Any]]],
-                    cell_notif.output.data,
-                ):
-                    outputs.append(_normalize_error(error))
-            else:
-                outputs.append(
-                    DataOutput(
-                        type="data",
-                        data={
-                            cell_notif.output.mimetype: cell_notif.output.data,
-                        },
-                    )
-                )
-
-        # Convert console outputs
-        for console_out in as_list(cell_notif.console):
-            assert isinstance(console_out, CellOutput)
-            if console_out.channel == CellChannel.MEDIA:
-                console.append(
-                    StreamMediaOutput(
-                        type="streamMedia",
-                        name="media",
-                        mimetype=console_out.mimetype,
-                        data=str(console_out.data),
-                    )
-                )
-            else:
-                # catch all for everything else
-                console.append(
-                    StreamOutput(
-                        type="stream",
-                        name="stderr"
-                        if console_out.channel == CellChannel.STDERR
-                        else "stdout",
-                        text=str(console_out.data),
-                        mimetype=console_out.mimetype,
-                    )
-                )
-
-        code_hash = _hash_code(view.last_executed_code.get(cell_id))
-
-        cells.append(
-            Cell(
-                id=cell_id,
-                code_hash=code_hash,
-                outputs=outputs,
-                console=console,
-            )
-        )
+    cells = [
+        _serialize_cell(view, cell_id)
+        for cell_id in _notebook_cell_ids(view, cell_ids)
+    ]
 
     return NotebookSessionV1(
         version=VERSION,
@@ -379,8 +379,124 @@ def _script_metadata_hash(path: Path | str | None) -> str | None:
     return script_metadata_hash_from_filename(str(path))
 
 
+@dataclass
+class _CellRecord:
+    """A cell's encoded JSON, and what it was encoded from."""
+
+    notification: Optional[CellNotification]
+    output: Optional[CellOutput]
+    mimetype: Optional[str]
+    data: object
+    console: object
+    code: Optional[str]
+    encoded: str
+
+    def matches(
+        self, notification: Optional[CellNotification], code: Optional[str]
+    ) -> bool:
+        output = notification.output if notification is not None else None
+        return (
+            self.notification is notification
+            and self.output is output
+            and (output is None or self.data is output.data)
+            and (output is None or self.mimetype == output.mimetype)
+            and (notification is None or self.console is notification.console)
+            and self.code == code
+        )
+
+
+class IncrementalSessionSerializer:
+    """Serializes a SessionView to JSON, re-encoding only changed cells.
+
+    The result is the same as `json.dumps(serialize_session_view(view),
+    indent=2)`. The encoded JSON of each cell is kept along with the
+    notification, outputs, and code it was encoded from; the cell is
+    encoded again only when one of these has been replaced.
+    """
+
+    def __init__(self) -> None:
+        self._records: dict[CellId_t, _CellRecord] = {}
+        self._header: Optional[str] = None
+        # Whether the last serialization differs from the one before it
+        self.changed = True
+
+    def serialize(
+        self,
+        view: SessionView,
+        cell_ids: Iterable[CellId_t] | None = None,
+        script_metadata_hash: str | None = None,
+    ) -> str:
+        notifications = view.cell_notifications
+        records: dict[CellId_t, _CellRecord] = {}
+        for cell_id in _notebook_cell_ids(view, cell_ids):
+            notification = notifications.get(cell_id)
+            code = view.last_executed_code.get(cell_id)
+            record = self._records.get(cell_id)
+            if record is None or not record.matches(notification, code):
+                record = self._encode(view, cell_id, notification, code)
+            records[cell_id] = record
+
+        header = json.dumps(
+            {
+                "version": VERSION,
+                "metadata": NotebookSessionMetadata(
+                    marimo_version=__version__,
+                    script_metadata_hash=script_metadata_hash,
+                ),
+            },
+            indent=2,
+        )
+        self.changed = (
+            header != self._header
+            or list(records) != list(self._records)
+            or any(
+                record is not self._records[cell_id]
+                for cell_id, record in records.items()
+            )
+        )
+        self._header = header
+        # Forget cells that are no longer in the notebook
+        self._records = records
+
+        # Replace the closing brace with the cells
+        if not records:
+            return header[:-2] + ',\n  "cells": []\n}'
+        return (
+            header[:-2]
+            + ',\n  "cells": [\n'
+            + ",\n".join(record.encoded for record in records.values())
+            + "\n  ]\n}"
+        )
+
+    @staticmethod
+    def _encode(
+        view: SessionView,
+        cell_id: CellId_t,
+        notification: Optional[CellNotification],
+        code: Optional[str],
+    ) -> _CellRecord:
+        output = notification.output if notification is not None else None
+        encoded = json.dumps(_serialize_cell(view, cell_id), indent=2)
+        # Newlines in strings are escaped, so every line break is one that
+        # json added; indent the cell to its depth in the notebook session.
+        return _CellRecord(
+            notification=notification,
+            output=output,
+            mimetype=output.mimetype if output is not None else None,
+            data=output.data if output is not None else None,
+            console=notification.console if notification is not None else None,
+            code=code,
+            encoded="    " + encoded.replace("\n", "\n    "),
+        )
+
+
 class SessionCacheWriter(AsyncBackgroundTask):
-    """Periodically writes a SessionView to a file."""
+    """Periodically writes a SessionView to a file.
+
+    Only the cells that changed since the last write are serialized again,
+    and the file is replaced atomically, so readers never see a partial
+    write.
+    """
 
     def __init__(
         self,
@@ -392,19 +508,16 @@ class SessionCacheWriter(AsyncBackgroundTask):
         super().__init__()
         self.session_view = session_view
         self.notebook_path = notebook_path
-        # Windows does not support our async path implementation
-        self.path: AsyncPath | Path = path
-        if os.name != "nt":
-            self.path = AsyncPath(path)
+        self.path = path
         self.interval = interval
+        self._serializer = IncrementalSessionSerializer()
 
     async def startup(self) -> None:
         # Create parent directories if they don't exist
         try:
-            if isinstance(self.path, AsyncPath):
-                await self.path.parent.mkdir(parents=True, exist_ok=True)
-            else:
-                self.path.parent.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(
+                self.path.parent.mkdir, parents=True, exist_ok=True
+            )
         except Exception as e:
             LOGGER.error(f"Failed to create parent directories: {e}")
             raise
@@ -414,17 +527,19 @@ class SessionCacheWriter(AsyncBackgroundTask):
             try:
                 if self.session_view.needs_export("session"):
                     self.session_view.mark_auto_export_session()
-                    LOGGER.debug(f"Writing session view to cache {self.path}")
-                    data = serialize_session_view(
+                    data = self._serializer.serialize(
                         self.session_view,
                         script_metadata_hash=_script_metadata_hash(
                             self.notebook_path
                         ),
                     )
-                    if isinstance(self.path, AsyncPath):
-                        await self.path.write_text(json.dumps(data, indent=2))
-                    else:
-                        self.path.write_text(json.dumps(data, indent=2))
+                    if self._serializer.changed:
+                        LOGGER.debug(
+                            f"Writing session view to cache {self.path}"
+                        )
+                        await asyncio.to_thread(
+                            atomic_write_bytes, self.path, data.encode()
+                        )
                 await asyncio.sleep(self.interval)
             except asyncio.CancelledError:
                 raise
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from typing import Any, Literal, Optional, Union, cast
 
 from marimo import _loggers
+from marimo._config.settings import GLOBAL_SETTINGS
 from marimo._data.models import DataSourceConnection, DataTable
 from marimo._messaging.cell_output import CellChannel, CellOutput
 from marimo._messaging.mimetypes import KnownMimeType, MimeBundleTuple
@@ -41,6 +42,7 @@ from marimo._runtime.commands import (
     SyncGraphCommand,
     UpdateUIElementCommand,
 )
+from marimo._session.state.console_buffer import ConsoleBuffer
 from marimo._sql.connection_utils import (
     update_table_in_connection,
     update_table_list_in_connection,
@@ -145,7 +147,16 @@ class SessionView:
         # Last seen notebook-order of cell IDs
         self.cell_ids: Optional[UpdateCellIdsNotification] = None
         # A mapping from cell (IDs) to their last seen notification
-        self.cell_notifications: dict[CellId_t, CellNotification] = {}
+        self._cell_notifications: dict[CellId_t, CellNotification] = {}
+        # Console outputs of each cell, and the notification they belong to;
+        # the notification's console is only updated when it is read
+        self._consoles: dict[
+            CellId_t, tuple[CellNotification, ConsoleBuffer]
+        ] = {}
+        self._stale_consoles: set[CellId_t] = set()
+        # Limits on the console outputs kept per cell
+        self.console_max_size = GLOBAL_SETTINGS.CONSOLE_MAX_SIZE
+        self.console_max_lines = GLOBAL_SETTINGS.CONSOLE_MAX_LINES
         # The most recent datasets notification.
         self.datasets = DatasetsNotification(tables=[])
         # The most recent data-connectors notification
@@ -189,6 +200,32 @@ class SessionView:
         # Auto-saving
         self.auto_export_state = AutoExportState()
 
+    @property
+    def cell_notifications(self) -> dict[CellId_t, CellNotification]:
+        """A mapping from cell (IDs) to their last seen notification."""
+        for cell_id in self._stale_consoles:
+            notification, console = self._consoles[cell_id]
+            notification.console = console.outputs()
+        self._stale_consoles.clear()
+        return self._cell_notifications
+
+    def _console(
+        self, cell_id: CellId_t, notification: CellNotification
+    ) -> ConsoleBuffer:
+        """Get the console buffer of a cell's notification."""
+        entry = self._consoles.get(cell_id)
+        if entry is not None and entry[0] is notification:
+            return entry[1]
+        # The notification was added without the buffer (e.g., when
+        # deserializing a session); start from its console outputs.
+        console = ConsoleBuffer(
+            max_size=self.console_max_size, max_lines=self.console_max_lines
+        )
+        console.extend(as_list(notification.console))
+        self._consoles[cell_id] = (notification, console)
+        self._stale_consoles.discard(cell_id)
+        return console
+
     def _add_ui_value(self, name: str, value: Any) -> None:
         self.ui_values[name] = value
 
@@ -223,13 +260,10 @@ class SessionView:
 
         """Add a stdin request to the session view."""
         # Find the first cell that is waiting for stdin.
-        for cell_notif in self.cell_notifications.values():
-            console_outputs: list[CellOutput] = as_list(cell_notif.console)
-            for cell_output in console_outputs:
-                if cell_output.channel == CellChannel.STDIN:
-                    cell_output.channel = CellChannel.STDOUT
-                    cell_output.data = f"{cell_output.data} {stdin}\n"
-                    return
+        for cell_id, cell_notif in self.cell_notifications.items():
+            if self._console(cell_id, cell_notif).resolve_stdin(stdin):
+                self._stale_consoles.add(cell_id)
+                return
 
     def add_notification(self, notification: NotificationMessage) -> None:
         """Add a notification to the session view."""
@@ -237,12 +271,17 @@ class SessionView:
         self.auto_export_state.mark_all_stale()
 
         if isinstance(notification, CellNotification):
-            previous = self.cell_notifications.get(notification.cell_id)
-            self.cell_notifications[notification.cell_id] = (
-                merge_cell_notification(previous, notification)
-            )
-            if not previous:
+            cell_id = notification.cell_id
+            previous = self._cell_notifications.get(cell_id)
+            if previous is None:
+                self._cell_notifications[cell_id] = notification
                 return
+            console = self._console(cell_id, previous)
+            self._cell_notifications[cell_id] = merge_cell_notification(
+                previous, notification, console
+            )
+            self._consoles[cell_id] = (notification, console)
+            self._stale_consoles.add(cell_id)
             if (
                 previous.status == "queued"
                 and notification.status == "running"
@@ -597,43 +636,19 @@ class SessionView:
         self.auto_export_state.mark_all_stale()
 
 
-def _merge_consecutive_console_outputs(
-    console: list[CellOutput],
-) -> list[CellOutput]:
-    """Merge consecutive text/plain outputs with the same channel."""
-    if not console:
-        return console
-
-    merged: list[CellOutput] = []
-
-    for output in console:
-        # Check if we can merge with the last output
-        if (
-            merged
-            and merged[-1].mimetype == "text/plain"
-            and output.mimetype == "text/plain"
-            and merged[-1].channel == output.channel
-            and isinstance(merged[-1].data, str)
-            and isinstance(output.data, str)
-        ):
-            # Merge by concatenating the data
-            merged[-1] = CellOutput(
-                channel=merged[-1].channel,
-                mimetype=merged[-1].mimetype,
-                data=merged[-1].data + output.data,
-                timestamp=merged[-1].timestamp,
-            )
-        else:
-            merged.append(output)
-
-    return merged
-
-
 def merge_cell_notification(
     previous: Optional[CellNotification],
     current: CellNotification,
+    console: Optional[ConsoleBuffer] = None,
 ) -> CellNotification:
-    """Merge two cell notifications."""
+    """Merge two cell notifications.
+
+    Consecutive text/plain console outputs with the same channel are
+    merged. If `console` is given, it holds the previous console outputs,
+    and the current ones are appended to it in place; the merged
+    notification's console is left for the caller to fill from it.
+    Otherwise, the merged console is computed from `previous`.
+    """
     if previous is None:
         return current
 
@@ -642,13 +657,19 @@ def merge_cell_notification(
     if current.status is None:
         current.status = previous.status
 
+    materialize = console is None
+    if console is None:
+        console = ConsoleBuffer()
+        console.extend(as_list(previous.console))
+
     # If we went from queued to running, clear the console.
     if current.status == "running" and previous.status == "queued":
-        current.console = []
+        console.clear()
     else:
-        combined_console: list[CellOutput] = as_list(previous.console)
-        combined_console.extend(as_list(current.console))
-        current.console = _merge_consecutive_console_outputs(combined_console)
+        console.extend(as_list(current.console))
+
+    if materialize:
+        current.console = console.outputs()
 
     # If we went from running to running, use the previous timestamp.
     if current.status == "running" and previous.status == "running":
@@ -14,7 +14,12 @@ from marimo._data.models import (
     Schema,
 )
 from marimo._sql.engines.types import InferenceConfig, SQLConnection
-from marimo._sql.utils import CHEAP_DISCOVERY_DATABASES, convert_to_output
+from marimo._sql.utils import (
+    CHEAP_DISCOVERY_DATABASES,
+    arrow_to_polars,
+    convert_to_output,
+    read_record_batches,
+)
 from marimo._types.ids import VariableName
 
 LOGGER = _loggers.marimo_logger()
@@ -40,6 +45,8 @@ class AdbcDbApiCursor(Protocol):
 
     def fetch_arrow_table(self) -> pa.Table: ...
 
+    def fetch_record_batch(self) -> pa.RecordBatchReader: ...
+
     def close(self) -> None: ...
 
 
@@ -495,7 +502,11 @@ class AdbcDBAPIEngine(SQLConnection[AdbcDbApiConnection]):
         )
 
     def execute(
-        self, query: str, parameters: Optional[Sequence[Any]] = None
+        self,
+        query: str,
+        parameters: Optional[Sequence[Any]] = None,
+        *,
+        limit: Optional[int] = None,
     ) -> Any:
         sql_output_format = self.sql_output_format()
         cursor = self._connection.cursor()
@@ -513,12 +524,16 @@ class AdbcDBAPIEngine(SQLConnection[AdbcDbApiConnection]):
                 _try_commit()
                 return None
 
-            arrow_table = cursor.fetch_arrow_table()
+            if limit is None:
+                arrow_table = cursor.fetch_arrow_table()
+            else:
+                # Stream batches so rows past the limit are never read
+                arrow_table = read_record_batches(
+                    cursor.fetch_record_batch(), limit=limit
+                )
 
             def convert_to_polars() -> pl.DataFrame | pl.Series:
-                import polars as pl
-
-                return pl.from_arrow(arrow_table)
+                return arrow_to_polars(arrow_table)
 
             def convert_to_pandas() -> pd.DataFrame:
                 return arrow_table.to_pandas()
@@ -536,3 +551,6 @@ class AdbcDBAPIEngine(SQLConnection[AdbcDbApiConnection]):
                 cursor.close()
             except Exception:
                 LOGGER.info("Failed to close cursor", exc_info=True)
+
+    def execute_with_limit(self, query: str, limit: int) -> Any:
+        return self.execute(query, limit=limit)
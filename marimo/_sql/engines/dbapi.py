@@ -6,7 +6,12 @@ from typing import TYPE_CHECKING, Any, Optional, Protocol
 
 from marimo import _loggers
 from marimo._sql.engines.types import QueryEngine
-from marimo._sql.utils import convert_to_output
+from marimo._sql.utils import (
+    add_limit_to_query,
+    arrow_to_polars,
+    convert_to_output,
+    fetch_arrow_or_rows,
+)
 
 LOGGER = _loggers.marimo_logger()
 
@@ -39,10 +44,18 @@ class DBAPIEngine(QueryEngine[DBAPIConnection]):
             return "sql"
 
     def execute(
-        self, query: str, parameters: Optional[Sequence[Any]] = None
+        self,
+        query: str,
+        parameters: Optional[Sequence[Any]] = None,
+        *,
+        limit: Optional[int] = None,
     ) -> Any:
         sql_output_format = self.sql_output_format()
 
+        if limit is not None and sql_output_format != "native":
+            # Ask the database to cap the rows, when we know the dialect
+            query = add_limit_to_query(query, limit, self.dialect) or query
+
         cursor = self._connection.cursor()
         should_close = True
         try:
@@ -52,21 +65,23 @@ class DBAPIEngine(QueryEngine[DBAPIConnection]):
                 should_close = False
                 return cursor
 
-            rows = cursor.fetchall() if cursor.description else None
+            if not cursor.description:
+                self._try_commit()
+                return None
 
-            try:
-                self._connection.commit()
-            except Exception:
-                LOGGER.info("Unable to commit transaction", exc_info=True)
+            columns = [col[0] for col in cursor.description]
+            fetched = fetch_arrow_or_rows(cursor, columns, limit=limit)
+            self._try_commit()
 
-            if rows is None:
-                return None
+            if not isinstance(fetched, list):
+                arrow_table = fetched
+                return convert_to_output(
+                    sql_output_format=sql_output_format,
+                    to_polars=lambda: arrow_to_polars(arrow_table),
+                    to_pandas=lambda: arrow_table.to_pandas(),
+                )
 
-            # Get column names from cursor description
-            if cursor.description:
-                columns = [col[0] for col in cursor.description]
-            else:
-                columns = []
+            rows = fetched
 
             def convert_to_polars() -> pl.DataFrame:
                 import polars as pl
@@ -91,6 +106,15 @@ class DBAPIEngine(QueryEngine[DBAPIConnection]):
             if should_close:
                 cursor.close()
 
+    def execute_with_limit(self, query: str, limit: int) -> Any:
+        return self.execute(query, limit=limit)
+
+    def _try_commit(self) -> None:
+        try:
+            self._connection.commit()
+        except Exception:
+            LOGGER.info("Unable to commit transaction", exc_info=True)
+
     @staticmethod
     def is_compatible(var: Any) -> bool:
         """Check if a variable is a DB-API 2.0 compatible connection.
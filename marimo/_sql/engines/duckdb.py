@@ -75,8 +75,18 @@ class DuckDBEngine(SQLConnection[Optional["duckdb.DuckDBPyConnection"]]):
         return duckdb.sql(query, params=params)
 
     def execute(self, query: str) -> Any:
-        relation = wrapped_sql(query, self._connection)
+        return self._convert_relation(wrapped_sql(query, self._connection))
 
+    def execute_with_limit(self, query: str, limit: int) -> Any:
+        relation = wrapped_sql(query, self._connection)
+        if relation is not None:
+            # Relations are lazy, so the limit is pushed into the query plan
+            relation = relation.limit(limit)
+        return self._convert_relation(relation)
+
+    def _convert_relation(
+        self, relation: Optional[duckdb.DuckDBPyRelation]
+    ) -> Any:
         # Invalid / empty query
         if relation is None:
             return None
@@ -16,7 +16,10 @@ from marimo._dependencies.dependencies import DependencyManager
 from marimo._sql.engines.types import InferenceConfig, SQLConnection
 from marimo._sql.utils import (
     CHEAP_DISCOVERY_DATABASES,
+    add_limit_to_query,
+    arrow_to_polars,
     convert_to_output,
+    fetch_arrow_or_rows,
     sql_type_to_data_type,
 )
 from marimo._types.ids import VariableName
@@ -24,8 +27,11 @@ from marimo._types.ids import VariableName
 LOGGER = _loggers.marimo_logger()
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     import pandas as pd
     import polars as pl
+    import pyarrow as pa
     from sqlalchemy import Engine, Inspector
     from sqlalchemy.engine.cursor import CursorResult
     from sqlalchemy.sql.type_api import TypeEngine
@@ -60,35 +66,57 @@ class SQLAlchemyEngine(SQLConnection["Engine"]):
     def dialect(self) -> str:
         return str(self._connection.dialect.name)
 
-    def execute(self, query: str) -> Any:
+    def execute(self, query: str, *, limit: Optional[int] = None) -> Any:
         sql_output_format = self.sql_output_format()
 
         from sqlalchemy import text
 
+        if limit is not None and sql_output_format != "native":
+            query = add_limit_to_query(query, limit, self.dialect) or query
+
         with self._connection.connect() as connection:
+            if limit is not None and sql_output_format != "native":
+                # Use a server-side cursor where the driver supports it, so
+                # that rows past the limit are never sent to the client
+                connection = connection.execution_options(stream_results=True)
             result = connection.execute(text(query))
             if sql_output_format == "native":
                 return result
 
-            rows = result.fetchall() if result.returns_rows else None
+            fetched: Optional[Union[pa.Table, list[Sequence[Any]]]] = None
+            columns: list[str] = []
+            if result.returns_rows:
+                columns = list(result.keys())
+                fetched = fetch_arrow_or_rows(result, columns, limit=limit)
+                result.close()
 
             try:
                 connection.commit()
             except Exception:
                 LOGGER.info("Unable to commit transaction", exc_info=True)
 
-            if rows is None:
+            if fetched is None:
                 return None
 
+            if not isinstance(fetched, list):
+                arrow_table = fetched
+                return convert_to_output(
+                    sql_output_format=sql_output_format,
+                    to_polars=lambda: arrow_to_polars(arrow_table),
+                    to_pandas=lambda: arrow_table.to_pandas(),
+                )
+
+            rows = fetched
+
             def convert_to_polars() -> pl.DataFrame:
                 import polars as pl
 
-                return pl.DataFrame(rows)
+                return pl.DataFrame(rows, schema=columns, orient="row")
 
             def convert_to_pandas() -> pd.DataFrame:
                 import pandas as pd
 
-                return pd.DataFrame(rows)
+                return pd.DataFrame(rows, columns=columns)
 
             return convert_to_output(
                 sql_output_format=sql_output_format,
@@ -96,6 +124,9 @@ class SQLAlchemyEngine(SQLConnection["Engine"]):
                 to_pandas=convert_to_pandas,
             )
 
+    def execute_with_limit(self, query: str, limit: int) -> Any:
+        return self.execute(query, limit=limit)
+
     @staticmethod
     def is_compatible(var: Any) -> bool:
         if not DependencyManager.sqlalchemy.imported():
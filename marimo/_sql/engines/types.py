@@ -133,6 +133,16 @@ class QueryEngine(BaseEngine[CONN], ABC):
         """Execute a SQL query and return a dataframe."""
         pass
 
+    def execute_with_limit(self, query: str, limit: int) -> Any:
+        """Execute a SQL query, fetching at most `limit` rows.
+
+        Engines that can cap the number of rows before they are materialized
+        in Python override this. The default executes the full query, so
+        callers must still truncate the result themselves.
+        """
+        del limit  # unused
+        return self.execute(query)
+
     def sql_output_format(self) -> SqlOutputType:
         if runtime_context_installed():
             try:
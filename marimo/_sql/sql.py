@@ -79,8 +79,25 @@ def sql(
                 "Unsupported engine. Must be a SQLAlchemy, Ibis, Clickhouse, DuckDB, Redshift or DBAPI 2.0 compatible engine."
             )
 
+    has_limit = False
     try:
-        df = sql_engine.execute(query)
+        default_result_limit = get_default_result_limit()
+        if default_result_limit is not None:
+            has_limit = _query_includes_limit(query)
+    except OSError:
+        default_result_limit = None
+
+    enforce_own_limit = not has_limit and default_result_limit is not None
+
+    try:
+        if enforce_own_limit:
+            # Fetch one extra row so we can tell if the result was truncated,
+            # without materializing the full result
+            df = sql_engine.execute_with_limit(
+                query, cast(int, default_result_limit) + 1
+            )
+        else:
+            df = sql_engine.execute(query)
     except Exception as e:
         if is_sql_parse_error(e):
             # NB. raising _from_ creates a noisier stack trace, but preserves
@@ -97,16 +114,6 @@ def sql(
     if df is None:
         return None
 
-    has_limit = False
-    try:
-        default_result_limit = get_default_result_limit()
-        if default_result_limit is not None:
-            has_limit = _query_includes_limit(query)
-    except OSError:
-        default_result_limit = None
-
-    enforce_own_limit = not has_limit and default_result_limit is not None
-
     custom_total_count: Optional[Literal["too_many"]] = None
     if enforce_own_limit:
         if DependencyManager.polars.has():
@@ -14,9 +14,12 @@ from marimo._runtime.context.types import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
     import duckdb
     import pandas as pd
     import polars as pl
+    import pyarrow as pa
     from polars._typing import ConnectionOrCursor
 
 LOGGER = _loggers.marimo_logger()
@@ -125,6 +128,152 @@ def try_convert_to_polars(
         return None, e
 
 
+# Number of rows requested per round-trip when streaming a result into Arrow
+FETCH_BATCH_SIZE = 10_000
+
+
+def fetch_arrow_or_rows(
+    cursor: Any,
+    columns: list[str],
+    *,
+    limit: Optional[int] = None,
+    batch_size: int = FETCH_BATCH_SIZE,
+) -> Union[pa.Table, list[Sequence[Any]]]:
+    """Fetch the result of an executed cursor as a pyarrow Table.
+
+    Uses the driver's native Arrow support when it has any (ADBC, DuckDB),
+    otherwise calls `fetchmany` in batches and converts each batch to Arrow
+    column-wise, so at most one batch of Python rows is alive at a time.
+    The batches are concatenated without copying.
+
+    Args:
+        cursor: A DB-API cursor, or anything with a `fetchmany` method
+            (e.g. a SQLAlchemy result).
+        columns: The column names of the result.
+        limit: The maximum number of rows to fetch.
+        batch_size: The number of rows to fetch per batch.
+
+    Returns:
+        A pyarrow Table, or the fetched rows if pyarrow is not installed or
+        the values can't be represented in Arrow (e.g. mixed types).
+    """
+    if not DependencyManager.pyarrow.has():
+        if limit is None:
+            return list(cursor.fetchall())
+        return list(cursor.fetchmany(limit))
+
+    import pyarrow as pa
+
+    native_table = _fetch_native_arrow(cursor, limit=limit)
+    if native_table is not None:
+        return native_table
+
+    row_batches = _iter_row_batches(
+        cursor.fetchmany, limit=limit, batch_size=batch_size
+    )
+    tables: list[pa.Table] = []
+    for rows in row_batches:
+        try:
+            tables.append(_rows_to_arrow(rows, columns))
+        except (pa.ArrowException, OverflowError):
+            LOGGER.debug(
+                "Failed to convert rows to Arrow, using rows", exc_info=True
+            )
+            fetched: list[Sequence[Any]] = [
+                row for table in tables for row in _arrow_to_rows(table)
+            ]
+            fetched.extend(rows)
+            for remaining_rows in row_batches:
+                fetched.extend(remaining_rows)
+            return fetched
+
+    if not tables:
+        return pa.Table.from_arrays(
+            [pa.nulls(0) for _ in columns], names=columns
+        )
+    try:
+        return pa.concat_tables(tables, promote_options="permissive")
+    except pa.ArrowException:
+        # The batches have incompatible types (e.g. ints, then strings)
+        LOGGER.debug(
+            "Failed to concatenate Arrow batches, using rows", exc_info=True
+        )
+        return [row for table in tables for row in _arrow_to_rows(table)]
+
+
+def arrow_to_polars(table: pa.Table) -> Union[pl.DataFrame, pl.Series]:
+    """Convert a pyarrow Table to polars, keeping its chunks (no copy)."""
+    import polars as pl
+
+    return pl.from_arrow(table, rechunk=False)
+
+
+def _fetch_native_arrow(
+    cursor: Any, *, limit: Optional[int]
+) -> Optional[pa.Table]:
+    fetch_record_batch = getattr(cursor, "fetch_record_batch", None)
+    if callable(fetch_record_batch):
+        return read_record_batches(fetch_record_batch(), limit=limit)
+
+    fetch_arrow_table = getattr(cursor, "fetch_arrow_table", None)
+    if callable(fetch_arrow_table):
+        table: pa.Table = fetch_arrow_table()
+        return table if limit is None else table.slice(0, limit)
+
+    return None
+
+
+def read_record_batches(
+    reader: pa.RecordBatchReader, *, limit: Optional[int] = None
+) -> pa.Table:
+    """Read a stream of record batches into a Table, stopping at `limit` rows."""
+    import pyarrow as pa
+
+    batches: list[pa.RecordBatch] = []
+    remaining = limit
+    for batch in reader:
+        if remaining is not None:
+            if remaining <= 0:
+                break
+            batch = batch.slice(0, remaining)
+            remaining -= batch.num_rows
+        batches.append(batch)
+    return pa.Table.from_batches(batches, schema=reader.schema)
+
+
+def _iter_row_batches(
+    fetchmany: Callable[[int], Sequence[Sequence[Any]]],
+    *,
+    limit: Optional[int],
+    batch_size: int,
+) -> Iterator[Sequence[Sequence[Any]]]:
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = batch_size if remaining is None else min(batch_size, remaining)
+        rows = fetchmany(size)
+        if not rows:
+            return
+        if remaining is not None:
+            remaining -= len(rows)
+        yield rows
+
+
+def _rows_to_arrow(
+    rows: Sequence[Sequence[Any]], columns: list[str]
+) -> pa.Table:
+    import pyarrow as pa
+
+    values = list(zip(*rows))
+    return pa.Table.from_arrays(
+        [pa.array(column_values) for column_values in values],
+        names=columns,
+    )
+
+
+def _arrow_to_rows(table: pa.Table) -> list[tuple[Any, ...]]:
+    return list(zip(*(column.to_pylist() for column in table.columns)))
+
+
 def convert_to_output(
     *,
     sql_output_format: SqlOutputType,
@@ -228,6 +377,60 @@ def sql_type_to_data_type(type_str: str) -> DataType:
         return "string"
 
 
+# SQLAlchemy dialect names that differ from their sqlglot equivalents
+_SQLGLOT_DIALECT_ALIASES = {
+    "postgresql": "postgres",
+    "mssql": "tsql",
+}
+
+
+def add_limit_to_query(query: str, limit: int, dialect: str) -> Optional[str]:
+    """Rewrite a query so that the database returns at most `limit` rows.
+
+    Only single SELECT-like statements without an existing LIMIT are
+    rewritten, since those are the only ones we can cap without changing
+    their meaning.
+
+    Returns:
+        The rewritten query, or None if the query can't be safely rewritten
+        (sqlglot missing, unknown dialect, multiple statements, ...).
+    """
+    if not DependencyManager.sqlglot.has():
+        return None
+
+    import sqlglot
+    from sqlglot import exp
+    from sqlglot.dialects.dialect import Dialect
+
+    dialect = _SQLGLOT_DIALECT_ALIASES.get(dialect, dialect)
+    try:
+        Dialect.get_or_raise(dialect)
+    except ValueError:
+        return None
+
+    try:
+        with _loggers.suppress_warnings_logs("sqlglot"):
+            expressions = sqlglot.parse(query.strip(), dialect=dialect)
+    except Exception:
+        return None
+
+    statements = [expr for expr in expressions if expr is not None]
+    if len(statements) != 1:
+        return None
+
+    statement = statements[0]
+    if not isinstance(statement, exp.Query):
+        return None
+    if statement.args.get("limit") is not None or statement.args.get("fetch"):
+        return None
+
+    try:
+        return statement.limit(limit).sql(dialect=dialect)
+    except Exception:
+        LOGGER.debug("Failed to add limit to query", exc_info=True)
+        return None
+
+
 def is_explain_query(query: str) -> bool:
     """Check if a SQL query is an EXPLAIN query."""
     import re
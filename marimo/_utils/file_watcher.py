@@ -3,11 +3,12 @@ from __future__ import annotations
 
 import asyncio
 import os
+import threading
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from collections.abc import Awaitable, Coroutine
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
 from marimo import _loggers
 from marimo._dependencies.dependencies import DependencyManager
@@ -94,12 +95,59 @@ class PollingFileWatcher(FileWatcher):
             await asyncio.sleep(self.POLL_SECONDS)
 
 
+class _DirectoryObserver:
+    """A watchdog observer shared by the watched files of one directory.
+
+    Each observer runs a thread and, on Linux, holds an inotify instance,
+    both of which are limited; so files are watched per directory rather
+    than each with its own observer.
+    """
+
+    def __init__(self, directory: str) -> None:
+        import watchdog.events  # type: ignore[import-not-found,import-untyped,unused-ignore] # noqa: E501
+        import watchdog.observers  # type: ignore[import-not-found,import-untyped,unused-ignore] # noqa: E501
+
+        # Watched file -> callbacks to notify of changes, from the
+        # observer's thread
+        self.watchers: dict[str, set[Callable[[], None]]] = defaultdict(set)
+        event_handler = watchdog.events.FileSystemEventHandler()  # type: ignore
+        event_handler.on_modified = self._on_modified  # type: ignore
+        event_handler.on_moved = self._on_moved  # type: ignore
+        self.observer = watchdog.observers.Observer()
+        self.observer.schedule(  # type: ignore
+            event_handler, directory, recursive=False
+        )
+        self.observer.start()  # type: ignore
+
+    def stop(self) -> None:
+        self.observer.stop()  # type: ignore
+        self.observer.join()
+
+    def _notify(self, path: str | bytes) -> None:
+        if isinstance(path, bytes):
+            path = path.decode("utf-8")
+        with _observers_lock:
+            watchers = list(self.watchers.get(os.path.abspath(path), ()))
+        for notify in watchers:
+            notify()
+
+    def _on_modified(self, event: Any) -> None:
+        self._notify(event.src_path)
+
+    def _on_moved(self, event: Any) -> None:
+        # Handle editors that save by creating a temp file and moving it
+        # (e.g., Claude Code, some vim configurations)
+        self._notify(event.dest_path)
+
+
+# Directory -> its observer
+_observers: dict[str, _DirectoryObserver] = {}
+_observers_lock = threading.Lock()
+
+
 def _create_watchdog(
     path: Path, callback: Callback, loop: asyncio.AbstractEventLoop
 ) -> FileWatcher:
-    import watchdog.events  # type: ignore[import-not-found,import-untyped,unused-ignore] # noqa: E501
-    import watchdog.observers  # type: ignore[import-not-found,import-untyped,unused-ignore] # noqa: E501
-
     class WatchdogFileWatcher(FileWatcher):
         def __init__(
             self,
@@ -109,50 +157,33 @@ def _create_watchdog(
         ):
             super().__init__(path, callback)
             self.loop = loop
-            self.observer = watchdog.observers.Observer()
+            self._file = os.path.abspath(path)
+            self._directory = os.path.dirname(self._file)
 
-        def on_modified(
-            self,
-            event: watchdog.events.FileModifiedEvent
-            | watchdog.events.DirModifiedEvent,
-        ) -> None:
-            del event
+        def notify(self) -> None:
             asyncio.run_coroutine_threadsafe(self.on_file_changed(), self.loop)
 
-        def on_moved(
-            self,
-            event: watchdog.events.FileMovedEvent
-            | watchdog.events.DirMovedEvent,
-        ) -> None:
-            # Handle editors that save by creating a temp file and moving it
-            # (e.g., Claude Code, some vim configurations)
-            dest_path_str = (
-                event.dest_path
-                if isinstance(event.dest_path, str)
-                else event.dest_path.decode("utf-8")
-            )
-
-            if self.path == Path(dest_path_str):
-                asyncio.run_coroutine_threadsafe(
-                    self.on_file_changed(), self.loop
-                )
-
         def start(self) -> None:
-            event_handler = watchdog.events.PatternMatchingEventHandler(  # type: ignore # noqa: E501
-                patterns=[str(self.path)]
-            )
-            event_handler.on_modified = self.on_modified  # type: ignore
-            event_handler.on_moved = self.on_moved  # type: ignore
-            self.observer.schedule(  # type: ignore
-                event_handler,
-                str(self.path.parent),
-                recursive=False,
-            )
-            self.observer.start()  # type: ignore
+            with _observers_lock:
+                observer = _observers.get(self._directory)
+                if observer is None:
+                    observer = _DirectoryObserver(self._directory)
+                    _observers[self._directory] = observer
+                observer.watchers[self._file].add(self.notify)
 
         def stop(self) -> None:
-            self.observer.stop()  # type: ignore
-            self.observer.join()
+            with _observers_lock:
+                observer = _observers.get(self._directory)
+                if observer is None:
+                    return
+                watchers = observer.watchers.get(self._file, set())
+                watchers.discard(self.notify)
+                if not watchers:
+                    observer.watchers.pop(self._file, None)
+                if observer.watchers:
+                    return
+                del _observers[self._directory]
+            observer.stop()
 
     return WatchdogFileWatcher(path, callback, loop)
 
@@ -184,7 +215,11 @@ class FileWatcherManager:
                     await cb(changed_path)
 
             watcher = FileWatcher.create(path, shared_callback)
-            watcher.start()
+            try:
+                watcher.start()
+            except Exception:
+                self._callbacks.pop(path_str, None)
+                raise
             self._watchers[path_str] = watcher
             LOGGER.debug(f"Created new watcher for {path_str}")
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 import fnmatch
 import os
 import re
+import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING, Union
 
@@ -14,6 +15,9 @@ if TYPE_CHECKING:
 
 _SPLIT_NUMBERS = re.compile(r"([0-9]+)").split
 
+# Suffix of the temporary files written by `atomic_write_bytes`
+TEMP_SUFFIX = ".tmp"
+
 
 def natural_sort(filename: str) -> list[Union[int, str]]:
     return [
@@ -21,6 +25,53 @@ def natural_sort(filename: str) -> list[Union[int, str]]:
     ]
 
 
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write to a temporary file and rename it over `path`.
+
+    Readers see either the previous contents or the complete new ones,
+    never a partially written file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=TEMP_SUFFIX
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # mkstemp creates files readable by the owner only; give the file
+        # the mode that `open` would have
+        os.chmod(tmp, 0o666 & ~_UMASK)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _read_umask() -> int:
+    # Linux reports the umask without changing it
+    try:
+        with open(
+            "/proc/self/status", encoding="utf-8", errors="replace"
+        ) as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+    # Elsewhere, the umask can only be read by setting it
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+# Read once, at import: setting the umask to read it would race with other
+# threads creating files
+_UMASK = _read_umask()
+
+
 def get_files(folder: str) -> Generator[Path, None, None]:
     """Recursively get all files from a folder."""
     with os.scandir(folder) as scan:
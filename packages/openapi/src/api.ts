@@ -32,6 +32,20 @@ export interface paths {
             "application/octet-stream": string;
           };
         };
+        /** @description Get a byte range of a virtual file */
+        206: {
+          headers: {
+            [name: string]: unknown;
+          };
+          content?: never;
+        };
+        /** @description The virtual file has not been modified */
+        304: {
+          headers: {
+            [name: string]: unknown;
+          };
+          content?: never;
+        };
         /** @description Invalid byte length in virtual file request */
         404: {
           headers: {
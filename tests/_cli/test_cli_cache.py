@@ -0,0 +1,61 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import os
+import time
+from typing import TYPE_CHECKING
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from marimo._cli.cache.commands import _parse_age, _parse_size, gc
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _write(path: Path, size: int, age: float = 0) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    accessed = time.time() - age
+    os.utime(path, (accessed, accessed))
+
+
+def test_parse_size() -> None:
+    assert _parse_size(None, None, None) is None
+    assert _parse_size(None, None, "100") == 100
+    assert _parse_size(None, None, "2KB") == 2048
+    assert _parse_size(None, None, "1.5gb") == int(1.5 * 1024**3)
+    with pytest.raises(click.BadParameter):
+        _parse_size(None, None, "10 apples")
+
+
+def test_parse_age() -> None:
+    assert _parse_age(None, None, None) is None
+    assert _parse_age(None, None, "30") == 30
+    assert _parse_age(None, None, "2h") == 7200
+    assert _parse_age(None, None, "7d") == 7 * 24 * 60 * 60
+    with pytest.raises(click.BadParameter):
+        _parse_age(None, None, "soon")
+
+
+def test_gc(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "notebooks" / "__marimo__" / "cache"
+    _write(cache_dir / "fn" / "old.pickle", 100, age=3 * 24 * 60 * 60)
+    _write(cache_dir / "fn" / "lru.pickle", 100, age=60)
+    _write(cache_dir / "fn" / "new.pickle", 100)
+
+    result = CliRunner().invoke(
+        gc, [str(tmp_path), "--max-age", "1d", "--max-size", "150"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "removed 2" in result.output
+    assert sorted(os.listdir(cache_dir / "fn")) == ["new.pickle"]
+
+
+def test_gc_no_cache_dirs(tmp_path: Path) -> None:
+    result = CliRunner().invoke(gc, [str(tmp_path)])
+    assert result.exit_code == 0, result.output
+    assert "No marimo cache directories found" in result.output
@@ -6,11 +6,16 @@ import pytest
 
 from marimo._dependencies.dependencies import DependencyManager
 from marimo._output.formatters.formatters import register_formatters
-from marimo._output.formatters.plotly_formatters import PlotlyFormatter
+from marimo._output.formatters.plotly_formatters import (
+    TYPED_ARRAY_MIN_SIZE,
+    PlotlyFormatter,
+    encode_typed_arrays,
+)
 from marimo._output.formatting import get_formatter
 
 HAS_DEPS = DependencyManager.plotly.has()
 HAS_ANYWIDGET = DependencyManager.anywidget.has()
+HAS_NUMPY = DependencyManager.numpy.has()
 
 
 @pytest.mark.skipif(not HAS_DEPS, reason="plotly not installed")
@@ -65,3 +70,80 @@ def test_plotly_figure_widget_uses_anywidget_formatter():
     assert mimetype == "text/html"
     assert "marimo-anywidget" in data
     assert "marimo-plotly" not in data
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+def test_encode_typed_arrays():
+    import base64
+
+    import numpy as np
+
+    n = TYPED_ARRAY_MIN_SIZE
+    floats = [i / 3 for i in range(n)]
+    figure = {
+        "data": [
+            {
+                "type": "scattergl",
+                "x": list(range(n)),
+                "y": floats,
+                "text": [str(i) for i in range(n)],
+                "marker": {"color": [i - 200 for i in range(n)]},
+                "customdata": [None] * n,
+            },
+            {"type": "heatmap", "z": [[1.5] * (n // 10)] * 10},
+            {"type": "scatter", "x": [1, 2, 3]},
+            {
+                "type": "splom",
+                "dimensions": [{"label": "a", "values": floats}],
+            },
+        ],
+        "layout": {"xaxis": {"range": [0, n]}},
+    }
+    encoded = encode_typed_arrays(figure)
+
+    def decode(typed_array: dict[str, str]) -> list[object]:
+        values = np.frombuffer(
+            base64.b64decode(typed_array["bdata"]),
+            dtype=f"<{typed_array['dtype']}",
+        )
+        return values.tolist()
+
+    scatter = encoded["data"][0]
+    assert scatter["x"]["dtype"] == "i2"
+    assert decode(scatter["x"]) == list(range(n))
+    assert scatter["y"]["dtype"] == "f8"
+    assert decode(scatter["y"]) == floats
+    assert scatter["marker"]["color"]["dtype"] == "i2"
+    # Not numeric
+    assert scatter["text"] == figure["data"][0]["text"]
+    assert scatter["customdata"] == [None] * n
+
+    heatmap = encoded["data"][1]
+    assert heatmap["z"]["shape"] == f"10, {n // 10}"
+    assert decode(heatmap["z"]) == [1.5] * (n // 10 * 10)
+
+    # Small arrays are kept as is
+    assert encoded["data"][2] == figure["data"][2]
+    assert decode(encoded["data"][3]["dimensions"][0]["values"]) == floats
+    assert encoded["layout"] == figure["layout"]
+
+    # The figure is not modified
+    assert figure["data"][0]["x"] == list(range(n))
+
+    # Integers that don't fit in 32 bits are kept as is
+    large = {"data": [{"x": [2**40] * n}]}
+    assert encode_typed_arrays(large) == large
+
+
+@pytest.mark.skipif(
+    not (HAS_DEPS and HAS_NUMPY), reason="plotly or numpy not installed"
+)
+def test_plotly_large_figure_is_encoded():
+    import plotly.graph_objects as go
+    import plotly.io as pio
+
+    n = TYPED_ARRAY_MIN_SIZE
+    fig = go.Figure(data=[go.Scattergl(x=list(range(n)), y=[0.5] * n)])
+    result = PlotlyFormatter.render_plotly_dict(json.loads(pio.to_json(fig)))
+    assert "bdata" in result.text
+    assert "0.5, 0.5" not in result.text
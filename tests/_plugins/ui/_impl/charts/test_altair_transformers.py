@@ -3,7 +3,7 @@ from __future__ import annotations
 import base64
 import datetime
 import json
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -307,3 +307,34 @@ def test_sanitize_nan_infs_preserves_df_type(df: IntoDataFrame):
     result = sanitize_nan_infs(df)
 
     assert type(result) is original_type
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+@pytest.mark.parametrize(
+    "df",
+    create_dataframes(
+        {"x": list(range(1000)), "y": [i % 7 for i in range(1000)]},
+        include=["pandas", "polars"],
+    ),
+)
+def test_transformers_downsample(df: IntoDataFrame):
+    import altair as alt
+
+    register_transformers()
+    chart = alt.Chart(df).mark_line().encode(x="x", y="y")
+    with alt.data_transformers.enable("marimo_json"):
+        full = chart.to_dict()
+    with alt.data_transformers.enable(
+        "marimo_json", max_points=100, x="x", y="y"
+    ):
+        downsampled = chart.to_dict()
+
+    def _rows(spec: dict[str, Any]) -> list[dict[str, Any]]:
+        data = spec["data"]["url"].split(",", 1)[1]
+        return json.loads(base64.b64decode(data))
+
+    assert len(_rows(full)) == 1000
+    rows = _rows(downsampled)
+    assert len(rows) == 100
+    assert (rows[0]["x"], rows[0]["y"]) == (0, 0)
+    assert (rows[-1]["x"], rows[-1]["y"]) == (999, 999 % 7)
@@ -0,0 +1,171 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+
+import narwhals.stable.v2 as nw
+import pytest
+
+from marimo._dependencies.dependencies import DependencyManager
+from marimo._plugins.ui._impl.charts.downsample import (
+    downsample,
+    downsample_indices,
+    lttb_indices,
+    minmax_indices,
+)
+from tests._data.mocks import create_dataframes
+
+if TYPE_CHECKING:
+    from narwhals.typing import IntoDataFrame
+
+HAS_NUMPY = DependencyManager.numpy.has()
+
+N = 1000
+
+
+def _series(n: int = N) -> dict[str, list[float]]:
+    # A flat line with a single spike
+    return {
+        "x": [float(i) for i in range(n)],
+        "y": [100.0 if i == n // 2 else float(i % 2) for i in range(n)],
+    }
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+class TestIndices:
+    def test_lttb(self) -> None:
+        import numpy as np
+
+        data = _series()
+        x, y = np.array(data["x"]), np.array(data["y"])
+        indices = lttb_indices(x, y, 50)
+        assert len(indices) == 50
+        assert indices[0] == 0
+        assert indices[-1] == N - 1
+        assert np.all(np.diff(indices) > 0)
+        # The spike is kept
+        assert N // 2 in indices
+
+    def test_lttb_small(self) -> None:
+        import numpy as np
+
+        x = np.arange(10, dtype=np.float64)
+        assert lttb_indices(x, x, 10).tolist() == list(range(10))
+        assert lttb_indices(x, x, 2).tolist() == list(range(10))
+
+    def test_minmax(self) -> None:
+        import numpy as np
+
+        y = np.array(_series()["y"])
+        indices = minmax_indices(y, 50)
+        assert len(indices) <= 50
+        assert indices[0] == 0
+        assert indices[-1] == N - 1
+        assert N // 2 in indices
+
+    def test_unsorted_and_missing(self) -> None:
+        import numpy as np
+
+        x = np.array([3.0, 1.0, np.nan, 0.0, 2.0, 4.0])
+        y = np.array([1.0, 5.0, 1.0, 0.0, np.nan, 1.0])
+        indices = downsample_indices(x, y, 10)
+        assert indices.tolist() == [0, 1, 3, 5]
+
+    def test_x_range(self) -> None:
+        import numpy as np
+
+        x = np.arange(N, dtype=np.float64)
+        indices = downsample_indices(x, x, 50, x_range=(100, 110))
+        # Includes the neighbours on either side of the range
+        assert indices.tolist() == list(range(99, 112))
+
+    def test_unknown_method(self) -> None:
+        import numpy as np
+
+        x = np.arange(N, dtype=np.float64)
+        with pytest.raises(ValueError, match="Unknown downsampling method"):
+            downsample_indices(x, x, 50, method="mean")  # type: ignore[arg-type]
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+@pytest.mark.parametrize(
+    "df", create_dataframes(_series(), include=["pandas", "polars", "pyarrow"])
+)
+def test_downsample(df: IntoDataFrame) -> None:
+    result, rows = downsample(df, x="x", y="y", max_points=50)
+    assert type(result) is type(df)
+    assert rows is not None
+    assert len(rows) == 50
+
+    # The kept rows are the original rows
+    result_nw = nw.from_native(result, eager_only=True)
+    assert result_nw["x"].to_list() == [float(i) for i in rows]
+    assert 100.0 in result_nw["y"].to_list()
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+@pytest.mark.parametrize(
+    "df", create_dataframes(_series(10), include=["pandas", "polars"])
+)
+def test_downsample_small(df: IntoDataFrame) -> None:
+    result, rows = downsample(df, x="x", y="y", max_points=50)
+    assert result is df
+    assert rows is None
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+@pytest.mark.parametrize(
+    "df",
+    create_dataframes(
+        {
+            **_series(),
+            "series": ["a" if i % 4 == 0 else "b" for i in range(N)],
+        },
+        include=["pandas", "polars"],
+    ),
+)
+def test_downsample_group_by(df: IntoDataFrame) -> None:
+    result, rows = downsample(
+        df, x="x", y="y", max_points=50, group_by=["series"]
+    )
+    assert rows is not None
+    counts = (
+        nw.from_native(result, eager_only=True)["series"]
+        .value_counts()
+        .sort("series")
+    )
+    assert counts["series"].to_list() == ["a", "b"]
+    assert counts["count"].to_list() == [25, 25]
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+@pytest.mark.parametrize(
+    "df",
+    create_dataframes(
+        {
+            "date": [
+                datetime.datetime(2024, 1, 1) + datetime.timedelta(hours=i)
+                for i in range(N)
+            ],
+            "value": [float(i % 10) if i % 7 else None for i in range(N)],
+        },
+        include=["pandas", "polars"],
+    ),
+)
+def test_downsample_temporal(df: IntoDataFrame) -> None:
+    start = datetime.datetime(2024, 1, 2, tzinfo=datetime.timezone.utc)
+    start_ms = start.timestamp() * 1000
+    hour_ms = 60 * 60 * 1000
+    result, rows = downsample(
+        df,
+        x="date",
+        y="value",
+        max_points=50,
+        method="minmax",
+        x_range=(start_ms, start_ms + 10 * hour_ms),
+    )
+    assert rows is not None
+    # Rows with missing values are dropped
+    assert rows.tolist() == [i for i in range(23, 37) if i % 7]
+    assert len(nw.from_native(result, eager_only=True)) == len(rows)
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from datetime import date
 from typing import Any, Optional, cast
+from unittest.mock import patch
 
 import narwhals.stable.v2 as nw
 import pytest
@@ -1444,12 +1445,8 @@ class TestTransformHandler:
             where=[Condition(column_id="A", operator=">=", value=2)],
         )
         transformations = Transformations([sort_transform, filter_transform])
-        # Verify the next transformation
-        assert container._is_superset(transformations) is False
-        assert (
-            container._get_next_transformations(transformations)
-            == transformations
-        )
+        # Nothing has been applied yet
+        assert container._common_prefix_length(transformations) == 0
 
         # Apply the transformations
         result, field_types = container.apply(transformations)
@@ -1475,11 +1472,8 @@ class TestTransformHandler:
         transformations = Transformations(
             [sort_transform, filter_transform, filter_again_transform]
         )
-        # Verify the next transformation
-        assert container._is_superset(transformations) is True
-        assert container._get_next_transformations(
-            transformations
-        ) == Transformations([filter_again_transform])
+        # Only the new transformation is applied
+        assert container._common_prefix_length(transformations) == 2
         result, field_types = container.apply(
             transformations,
         )
@@ -1490,12 +1484,8 @@ class TestTransformHandler:
         assert_frame_equal(undo(result), expected2)
 
         transformations = Transformations([sort_transform, filter_transform])
-        # Verify the next transformation
-        assert container._is_superset(transformations) is False
-        assert (
-            container._get_next_transformations(transformations)
-            == transformations
-        )
+        # Both steps are kept
+        assert container._common_prefix_length(transformations) == 2
         # Reapply by removing the last transform
         result, field_types = container.apply(
             transformations,
@@ -1506,6 +1496,135 @@ class TestTransformHandler:
         # Check that the transformations were applied correctly
         assert_frame_equal(undo(result), expected)
 
+    @staticmethod
+    def test_transforms_container_recomputes_changed_steps() -> None:
+        import polars as pl
+
+        handler = NarwhalsTransformHandler()
+        handled: list[Transform] = []
+        original = handler.handle_filter_rows
+
+        def handle_filter_rows(df: Any, transform: Any) -> Any:
+            handled.append(transform)
+            return original(df, transform)
+
+        handler.handle_filter_rows = handle_filter_rows  # type: ignore[method-assign]
+
+        def keep(value: int) -> FilterRowsTransform:
+            return FilterRowsTransform(
+                type=TransformType.FILTER_ROWS,
+                operation="keep_rows",
+                where=[Condition(column_id="A", operator=">=", value=value)],
+            )
+
+        nw_df, undo = make_lazy(pl.DataFrame({"A": [1, 2, 3, 4, 5]}))
+        container = TransformsContainer(nw_df, handler)
+        container.apply(Transformations([keep(1), keep(2), keep(3)]))
+        assert len(handled) == 3
+
+        # Editing the second step only recomputes it and the third
+        handled.clear()
+        result, field_types = container.apply(
+            Transformations([keep(1), keep(4), keep(3)])
+        )
+        assert handled == [keep(4), keep(3)]
+        assert len(field_types) == 4
+        assert_frame_equal(undo(result), pl.DataFrame({"A": [4, 5]}))
+
+        # Removing a step and adding it back reuses it
+        handled.clear()
+        container.apply(Transformations([keep(1)]))
+        result, _ = container.apply(
+            Transformations([keep(1), keep(4), keep(3)])
+        )
+        assert handled == []
+        assert_frame_equal(undo(result), pl.DataFrame({"A": [4, 5]}))
+
+    @staticmethod
+    def test_transforms_container_materializes_group_by() -> None:
+        import polars as pl
+
+        group_by = GroupByTransform(
+            type=TransformType.GROUP_BY,
+            column_ids=["group"],
+            drop_na=False,
+            aggregation="sum",
+            aggregation_column_ids=[],
+        )
+        sort = SortColumnTransform(
+            type=TransformType.SORT_COLUMN,
+            column_id="group",
+            ascending=True,
+            na_position="last",
+        )
+        data = {"group": ["a", "a", "b"], "value": [1, 2, 3]}
+        expected = pl.DataFrame({"group": ["a", "b"], "value_sum": [3, 3]})
+
+        nw_df, undo = make_lazy(pl.LazyFrame(data))
+        container = TransformsContainer(nw_df, NarwhalsTransformHandler())
+        result, _ = container.apply(Transformations([group_by, sort]))
+        assert container._materialized_bytes > 0
+        assert container._steps[0].nbytes == container._materialized_bytes
+        assert_frame_equal(undo(result).collect(), expected)
+
+        # Results that don't fit in the budget stay lazy
+        nw_df, undo = make_lazy(pl.LazyFrame(data))
+        container = TransformsContainer(
+            nw_df, NarwhalsTransformHandler(), max_materialized_bytes=0
+        )
+        result, _ = container.apply(Transformations([group_by, sort]))
+        assert container._materialized_bytes == 0
+        assert_frame_equal(undo(result).collect(), expected)
+
+        # Dropping the step releases its budget
+        container = TransformsContainer(nw_df, NarwhalsTransformHandler())
+        container.apply(Transformations([group_by]))
+        assert container._materialized_bytes > 0
+        container.apply(Transformations([sort]))
+        assert container._materialized_bytes == 0
+
+    @staticmethod
+    def test_transforms_container_bounds_materialized_results() -> None:
+        import polars as pl
+
+        from marimo._plugins.ui._impl.dataframes.transforms import apply
+
+        group_by = GroupByTransform(
+            type=TransformType.GROUP_BY,
+            column_ids=["group"],
+            drop_na=False,
+            aggregation="sum",
+            aggregation_column_ids=[],
+        )
+        num_groups = 10 * apply.MATERIALIZE_SAMPLE_ROWS
+        data = {
+            "group": list(range(num_groups)) * 2,
+            "value": [1] * (2 * num_groups),
+        }
+
+        collected_rows: list[int] = []
+        original = apply.collect_and_preserve_type
+
+        def collect_and_preserve_type(df: Any) -> Any:
+            collected, undo = original(df)
+            collected_rows.append(len(collected))
+            return collected, undo
+
+        nw_df, undo = make_lazy(pl.LazyFrame(data))
+        # Fits the sample, but not the whole result
+        container = TransformsContainer(
+            nw_df, NarwhalsTransformHandler(), max_materialized_bytes=50_000
+        )
+        with patch.object(
+            apply, "collect_and_preserve_type", collect_and_preserve_type
+        ):
+            result, _ = container.apply(Transformations([group_by]))
+
+        assert container._materialized_bytes == 0
+        assert collected_rows
+        assert max(collected_rows) < num_groups
+        assert undo(result).collect().height == num_groups
+
     @staticmethod
     @pytest.mark.parametrize(
         "df",
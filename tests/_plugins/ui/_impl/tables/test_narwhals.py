@@ -23,6 +23,7 @@ from marimo._plugins.ui._impl.tables.narwhals_table import (
     POSITIVE_INF,
     NarwhalsTableManager,
 )
+from marimo._plugins.ui._impl.tables.selection import INDEX_COLUMN_NAME
 from marimo._plugins.ui._impl.tables.table_manager import (
     TableCell,
     TableCoordinate,
@@ -219,6 +220,31 @@ class TestNarwhalsTableManagerFactory(unittest.TestCase):
         ]
         assert selected_cells == expected_cells
 
+    def test_select_cell_block(self) -> None:
+        block = self.manager.select_cell_block([2, 0, 5], ["A", "B"])
+        assert block.row_ids == [2, 0]
+        assert block.values == {"A": [3, 1], "B": ["c", "aaa"]}
+        assert block.data.columns == ["A", "B"]
+
+    def test_select_cell_block_with_index_column(self) -> None:
+        import polars as pl
+
+        data = pl.DataFrame(
+            {INDEX_COLUMN_NAME: [10, 11, 12], "A": ["x", "y", "z"]}
+        )
+        manager = NarwhalsTableManager.from_dataframe(data)
+        block = manager.select_cell_block([12, 10, 99], ["A"])
+        assert block.row_ids == [12, 10]
+        assert block.values == {"A": ["z", "x"]}
+
+        # Matches the per-cell lookup
+        assert [
+            cell.value
+            for cell in manager.select_cells(
+                [TableCoordinate(row_id=12, column_name="A")]
+            )
+        ] == ["z"]
+
     def test_drop_columns(self) -> None:
         columns = ["A"]
         dropped_manager = self.manager.drop_columns(columns)
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from marimo._dependencies.dependencies import DependencyManager
+from marimo._plugins.ui._impl.table import SortArgs
+from marimo._plugins.ui._impl.tables.query_cache import (
+    QueryCacheBudget,
+    QueryKey,
+    TableQueryCache,
+)
+from marimo._plugins.ui._impl.tables.table_manager import TableManager
+from marimo._plugins.ui._impl.tables.utils import get_table_manager
+
+HAS_DEPS = DependencyManager.polars.has()
+
+
+@pytest.fixture
+def manager() -> TableManager[Any]:
+    import polars as pl
+
+    return get_table_manager(
+        pl.DataFrame(
+            {
+                "name": ["abc", "abd", "xyz", "zabc"],
+                "value": [3, 1, 2, 4],
+            }
+        )
+    )
+
+
+def _compute(manager: TableManager[Any], calls: list[QueryKey]) -> Any:
+    def compute(key: QueryKey) -> TableManager[Any]:
+        calls.append(key)
+        result = manager
+        if key.query:
+            result = result.search(key.query)
+        if key.sort:
+            result = result.sort_values(list(key.sort))
+        return result
+
+    return compute
+
+
+def _names(result: Any) -> list[str]:
+    return result.as_frame()["name"].to_list()
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="polars not installed")
+class TestTableQueryCache:
+    def test_hits_and_misses(self, manager: TableManager[Any]) -> None:
+        cache = TableQueryCache()
+        calls: list[QueryKey] = []
+        key = QueryKey(filters=None, query="xyz", sort=None)
+
+        first = cache.get_or_compute(key, _compute(manager, calls))
+        second = cache.get_or_compute(key, _compute(manager, calls))
+
+        assert first is second
+        assert len(calls) == 1
+        info = cache.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+        assert info.currsize == 1
+        assert info.nbytes > 0
+
+    def test_keeps_several_results(self, manager: TableManager[Any]) -> None:
+        cache = TableQueryCache()
+        calls: list[QueryKey] = []
+        a = QueryKey(filters=None, query="xyz", sort=None)
+        b = QueryKey(filters=None, query="zab", sort=None)
+
+        cache.get_or_compute(a, _compute(manager, calls))
+        cache.get_or_compute(b, _compute(manager, calls))
+        cache.get_or_compute(a, _compute(manager, calls))
+        cache.get_or_compute(b, _compute(manager, calls))
+
+        assert len(calls) == 2
+        assert cache.cache_info().hits == 2
+
+    def test_evicts_least_recently_used(
+        self, manager: TableManager[Any]
+    ) -> None:
+        cache = TableQueryCache(max_entries=2)
+        calls: list[QueryKey] = []
+        keys = [
+            QueryKey(filters=None, query=query, sort=None)
+            for query in ["xyz", "zab", "abd"]
+        ]
+
+        cache.get_or_compute(keys[0], _compute(manager, calls))
+        cache.get_or_compute(keys[1], _compute(manager, calls))
+        # Touch the first key so the second one is evicted
+        cache.get_or_compute(keys[0], _compute(manager, calls))
+        cache.get_or_compute(keys[2], _compute(manager, calls))
+
+        assert cache.cache_info().currsize == 2
+        cache.get_or_compute(keys[0], _compute(manager, calls))
+        assert len(calls) == 3
+        cache.get_or_compute(keys[1], _compute(manager, calls))
+        assert len(calls) == 4
+
+    def test_bounded_by_bytes(self, manager: TableManager[Any]) -> None:
+        cache = TableQueryCache(max_bytes=1)
+        calls: list[QueryKey] = []
+        key = QueryKey(filters=None, query="xyz", sort=None)
+
+        cache.get_or_compute(key, _compute(manager, calls))
+        cache.get_or_compute(key, _compute(manager, calls))
+
+        assert len(calls) == 2
+        assert cache.cache_info().currsize == 0
+        assert cache.cache_info().nbytes == 0
+
+    def test_budget_is_shared(self, manager: TableManager[Any]) -> None:
+        key = QueryKey(filters=None, query="xyz", sort=None)
+        sizing = TableQueryCache(budget=QueryCacheBudget(2**20))
+        sizing.get_or_compute(key, _compute(manager, []))
+        result_bytes = sizing.cache_info().nbytes
+
+        # Room for one result across both caches
+        budget = QueryCacheBudget(result_bytes)
+        first = TableQueryCache(budget=budget)
+        second = TableQueryCache(budget=budget)
+        calls: list[QueryKey] = []
+        first.get_or_compute(key, _compute(manager, calls))
+        second.get_or_compute(key, _compute(manager, calls))
+
+        assert budget.nbytes == result_bytes
+        assert first.cache_info().currsize == 0
+        assert second.cache_info().currsize == 1
+
+        # The least recently used cache is evicted first
+        first.get_or_compute(key, _compute(manager, calls))
+        assert first.cache_info().currsize == 1
+        assert second.cache_info().currsize == 0
+        assert len(calls) == 3
+
+    def test_refines_longer_query(self, manager: TableManager[Any]) -> None:
+        cache = TableQueryCache()
+        calls: list[QueryKey] = []
+
+        cache.get_or_compute(
+            QueryKey(filters=None, query="ab", sort=None),
+            _compute(manager, calls),
+        )
+        result = cache.get_or_compute(
+            QueryKey(filters=None, query="ABC", sort=None),
+            _compute(manager, calls),
+        )
+
+        assert len(calls) == 1
+        assert cache.cache_info().refinements == 1
+        assert _names(result) == ["abc", "zabc"]
+
+    def test_refines_and_sorts(self, manager: TableManager[Any]) -> None:
+        cache = TableQueryCache()
+        calls: list[QueryKey] = []
+        sort = (SortArgs(by="value", descending=True),)
+
+        cache.get_or_compute(
+            QueryKey(filters=None, query="ab", sort=None),
+            _compute(manager, calls),
+        )
+        result = cache.get_or_compute(
+            QueryKey(filters=None, query="ab", sort=sort),
+            _compute(manager, calls),
+        )
+        assert _names(result) == ["zabc", "abc", "abd"]
+
+        result = cache.get_or_compute(
+            QueryKey(filters=None, query="abc", sort=sort),
+            _compute(manager, calls),
+        )
+        assert _names(result) == ["zabc", "abc"]
+
+        assert len(calls) == 1
+        assert cache.cache_info().refinements == 2
+
+    def test_does_not_refine_other_sort(
+        self, manager: TableManager[Any]
+    ) -> None:
+        cache = TableQueryCache()
+        calls: list[QueryKey] = []
+
+        cache.get_or_compute(
+            QueryKey(
+                filters=None,
+                query="ab",
+                sort=(SortArgs(by="value", descending=True),),
+            ),
+            _compute(manager, calls),
+        )
+        result = cache.get_or_compute(
+            QueryKey(
+                filters=None,
+                query="abc",
+                sort=(SortArgs(by="value", descending=False),),
+            ),
+            _compute(manager, calls),
+        )
+
+        assert len(calls) == 2
+        assert _names(result) == ["abc", "zabc"]
+
+    def test_does_not_refine_regex(self, manager: TableManager[Any]) -> None:
+        cache = TableQueryCache()
+        calls: list[QueryKey] = []
+
+        cache.get_or_compute(
+            QueryKey(filters=None, query="a.", sort=None),
+            _compute(manager, calls),
+        )
+        cache.get_or_compute(
+            QueryKey(filters=None, query="a.c", sort=None),
+            _compute(manager, calls),
+        )
+        cache.get_or_compute(
+            QueryKey(filters=None, query="x|z", sort=None),
+            _compute(manager, calls),
+        )
+
+        assert len(calls) == 3
+        assert cache.cache_info().refinements == 0
+
+    def test_cache_clear(self, manager: TableManager[Any]) -> None:
+        cache = TableQueryCache()
+        calls: list[QueryKey] = []
+        key = QueryKey(filters=None, query="xyz", sort=None)
+
+        cache.get_or_compute(key, _compute(manager, calls))
+        cache.cache_clear()
+        cache.get_or_compute(key, _compute(manager, calls))
+
+        assert len(calls) == 2
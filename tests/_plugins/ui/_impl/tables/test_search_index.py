@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import datetime
+from typing import Any
+
+import pytest
+
+from marimo._plugins.ui._impl.tables.search_index import SearchIndex
+from marimo._plugins.ui._impl.tables.utils import get_table_manager
+from tests._data.mocks import NON_EAGER_LIBS, create_dataframes
+
+DATA = {
+    "name": ["Alice", "Bob", "alicia", None],
+    "age": [31, 42, 13, 7],
+    "date": [
+        datetime.date(2021, 1, 1),
+        datetime.date(2022, 2, 2),
+        datetime.date(2023, 3, 3),
+        datetime.date(2024, 4, 4),
+    ],
+}
+
+
+def _search_both(df: Any, query: str) -> tuple[Any, Any]:
+    manager = get_table_manager(df)
+    index = SearchIndex(manager)
+    index.build()
+    assert index.ready
+    indexed = index.search(query)
+    assert indexed is not None
+    return indexed.to_json(), manager.search(query).to_json()
+
+
+@pytest.mark.parametrize("df", create_dataframes(DATA, exclude=NON_EAGER_LIBS))
+@pytest.mark.parametrize("query", ["ali", "ALI", "13", "1", "2022", "zzz"])
+def test_search_matches_table_search(df: Any, query: str) -> None:
+    indexed, scanned = _search_both(df, query)
+    assert indexed == scanned
+
+
+@pytest.mark.parametrize("df", create_dataframes(DATA, exclude=NON_EAGER_LIBS))
+def test_search_does_not_match_across_values(df: Any) -> None:
+    # "Alice" followed by 31 must not match "e3"
+    manager = get_table_manager(df)
+    index = SearchIndex(manager)
+    index.build()
+    result = index.search("e3")
+    assert result is not None
+    assert result.get_num_rows() == 0
+
+
+@pytest.mark.parametrize("df", create_dataframes(DATA, exclude=NON_EAGER_LIBS))
+def test_regex_query_not_indexed(df: Any) -> None:
+    index = SearchIndex(get_table_manager(df))
+    index.build()
+    assert index.search("^ali") is None
+    assert index.search("a.c") is None
+
+
+@pytest.mark.parametrize("df", create_dataframes(DATA, exclude=NON_EAGER_LIBS))
+def test_builds_in_background(df: Any) -> None:
+    index = SearchIndex(get_table_manager(df))
+    assert not index.ready
+
+    # The first search starts the build and falls back to scanning
+    index.search("ali")
+    assert index.wait(timeout=10)
+    result = index.search("ali")
+    assert result is not None
+    assert result.get_num_rows() == 2
+
+
+@pytest.mark.parametrize(
+    "df", create_dataframes(DATA, include=["lazy-polars"])
+)
+def test_lazy_not_supported(df: Any) -> None:
+    assert not SearchIndex.supports(get_table_manager(df))
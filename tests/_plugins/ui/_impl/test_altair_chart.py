@@ -16,6 +16,7 @@ from marimo._dependencies.dependencies import DependencyManager
 from marimo._plugins.ui._impl.altair_chart import (
     ChartDataType,
     ChartSelection,
+    GetDownsampledDataArgs,
     _filter_dataframe,
     _get_binned_fields,
     _has_binning,
@@ -1965,3 +1966,57 @@ def test_filter_dataframe_preserves_df_type(df: ChartDataType) -> None:
 
     # Type should be preserved
     assert type(result) is original_type
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+def test_max_points() -> None:
+    import altair as alt
+
+    n = 1000
+    data = pd.DataFrame(
+        {
+            "x": range(n),
+            "y": [float(i % 10) for i in range(n)],
+            "series": ["a" if i % 2 else "b" for i in range(n)],
+        }
+    )
+    chart = alt.Chart(data).mark_line().encode(x="x", y="y", color="series")
+    marimo_chart = altair_chart(chart, max_points=100)
+
+    assert marimo_chart._component_args["downsample"] == {"field": "x"}
+    assert marimo_chart._downsample_fields is not None
+    assert marimo_chart._downsample_fields.group_by == ["series"]
+    assert len(marimo_chart._downsample()) == 100
+
+    # Selections apply to all rows, not just the drawn ones
+    assert marimo_chart.dataframe is data
+    value = marimo_chart._convert_value({"select_interval": {"x": [0, 499]}})
+    assert get_len(value) == 500
+
+    # Zooming in re-queries the visible range
+    response = marimo_chart._get_downsampled_data(
+        GetDownsampledDataArgs(x_range=[10, 20])
+    )
+    assert response.format == {"type": "arrow"}
+    # Each series is extended to the points just outside the range
+    assert len(marimo_chart._downsample((10, 20))) == 15
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+def test_max_points_unsupported() -> None:
+    import altair as alt
+
+    data = pd.DataFrame({"x": range(100), "y": range(100)})
+    chart = alt.Chart(data).mark_bar().encode(x="x", y="sum(y)")
+
+    stderr = io.StringIO()
+    with redirect_stderr(stderr):
+        marimo_chart = altair_chart(chart, max_points=10)
+    assert "max_points is only supported" in stderr.getvalue()
+    assert marimo_chart._component_args["downsample"] is None
+
+    # Charts without max_points are not downsampled
+    chart = alt.Chart(data).mark_line().encode(x="x", y="y")
+    assert altair_chart(chart)._component_args["downsample"] is None
+    with pytest.raises(ValueError, match="not downsampled"):
+        altair_chart(chart)._get_downsampled_data(GetDownsampledDataArgs())
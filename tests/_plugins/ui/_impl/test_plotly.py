@@ -39,6 +39,27 @@ def test_basic_scatter_plot() -> None:
     assert plot.indices == []
 
 
+def test_large_scatter_plot_selection() -> None:
+    """Test that selections work when the figure is sent as typed arrays."""
+    from marimo._output.formatters.plotly_formatters import (
+        TYPED_ARRAY_MIN_SIZE,
+    )
+
+    n = TYPED_ARRAY_MIN_SIZE
+    fig = go.Figure(
+        data=go.Scattergl(x=list(range(n)), y=list(range(n)), mode="markers")
+    )
+    plot = plotly(fig)
+    figure = plot._args.args["figure"]
+    assert figure["data"][0]["x"]["dtype"] == "i2"
+    assert "bdata" in figure["data"][0]["y"]
+
+    value = plot._convert_value(
+        {"range": {"x": [10, 12], "y": [0, n]}, "points": [], "indices": []}
+    )
+    assert [point["x"] for point in value] == [10, 11, 12]
+
+
 def test_plotly_express_scatter() -> None:
     """Test creating a plot with plotly express."""
     import pandas as pd
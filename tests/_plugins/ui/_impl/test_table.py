@@ -1848,6 +1848,105 @@ def test_cell_search_df_styles_sorted(df: Any):
     }
 
 
+@pytest.mark.parametrize(
+    "df",
+    create_dataframes(
+        {"a": [1, 2, 3, 4], "b": ["w", "x", "y", "z"]},
+        exclude=NON_EAGER_LIBS,
+    ),
+)
+def test_cell_styles_use_bulk_selection(df: Any):
+    def style_cell(_row, _col, value):
+        return {"color": "red" if value in (2, "z") else "black"}
+
+    table = ui.table(df, style_cell=style_cell, hover_template=style_cell)
+    with patch.object(
+        type(table._searched_manager),
+        "select_cells",
+        side_effect=AssertionError("select_cells should not be called"),
+    ):
+        page = table._search(SearchTableArgs(page_size=2, page_number=1))
+    assert page.cell_styles is not None
+    assert page.cell_styles["2"]["a"] == {"color": "black"}
+    assert page.cell_styles["3"]["b"] == {"color": "red"}
+    assert page.cell_hover_texts is not None
+    assert set(page.cell_hover_texts) == {"2", "3"}
+
+
+@pytest.mark.parametrize(
+    "df",
+    create_dataframes(
+        {"a": [1, 2, 3, 4], "b": ["w", "x", "y", "z"]},
+        exclude=NON_EAGER_LIBS,
+    ),
+)
+def test_style_page(df: Any):
+    import narwhals.stable.v2 as nw
+
+    calls: list[Any] = []
+
+    def style_page(page: Any) -> dict[str, list[Any]]:
+        calls.append(page)
+        values = nw.from_native(page, eager_only=True)["a"].to_list()
+        return {"a": [{"color": "red"} if v > 2 else None for v in values]}
+
+    table = ui.table(df, page_size=2, style_page=style_page)
+    initial_styles = table._args.args["cell-styles"]
+    assert initial_styles["0"]["a"] == {}
+    assert initial_styles["1"]["b"] == {}
+    # The page is passed in the same format as the data
+    assert type(calls[0]) is type(df)
+
+    page = table._search(SearchTableArgs(page_size=2, page_number=1))
+    assert page.cell_styles is not None
+    assert page.cell_styles["2"]["a"] == {"color": "red"}
+    assert page.cell_styles["3"]["b"] == {}
+    assert len(calls) == 2
+
+
+@pytest.mark.skipif(
+    not DependencyManager.polars.has(), reason="Polars not installed"
+)
+def test_style_page_returns_dataframe():
+    import polars as pl
+
+    def style_page(page: pl.DataFrame) -> pl.DataFrame:
+        return page.select(
+            pl.when(pl.col("a") > 1)
+            .then(pl.struct(color=pl.lit("red")))
+            .otherwise(None)
+            .alias("a")
+        )
+
+    table = ui.table(
+        pl.DataFrame({"a": [1, 2]}), selection=None, style_page=style_page
+    )
+    assert table._args.args["cell-styles"] == {
+        "0": {"a": {}},
+        "1": {"a": {"color": "red"}},
+    }
+
+
+def test_style_page_with_list_data():
+    def style_page(page: dict[str, list[Any]]) -> dict[str, list[Any]]:
+        return {"value": [{"color": "red"} for _ in page["value"]]}
+
+    table = ui.table([1, 2], selection=None, style_page=style_page)
+    assert table._args.args["cell-styles"] == {
+        "0": {"value": {"color": "red"}},
+        "1": {"value": {"color": "red"}},
+    }
+
+
+def test_style_page_and_style_cell_are_exclusive():
+    with pytest.raises(ValueError, match="Only one of"):
+        ui.table(
+            [1, 2],
+            style_cell=lambda _row, _col, _value: {},
+            style_page=lambda _page: {},
+        )
+
+
 @pytest.mark.parametrize(
     "df",
     create_dataframes(
@@ -2610,3 +2709,35 @@ def test_polars_enums_in_list():
         response_next_page.data
         == '[{"value":["C"]},{"value":["D"]},{"value":["A"]},{"value":["B"]},{"value":["C"]}]'
     )
+
+
+@pytest.mark.parametrize(
+    "df",
+    create_dataframes(
+        {"a": ["apple", "banana", "cherry"], "b": [1, 2, 3]},
+        exclude=NON_EAGER_LIBS,
+    ),
+)
+def test_search_with_search_index(df: Any) -> None:
+    table = ui.table(df, search_index=True)
+    assert table._search_index is not None
+
+    table._search(SearchTableArgs(query="an", page_size=10, page_number=0))
+    assert table._search_index.wait(timeout=10)
+
+    # Answered by the index, combined with filters
+    response = table._search(
+        SearchTableArgs(
+            query="a",
+            filters=[Condition(column_id="b", operator=">", value=1)],
+            page_size=10,
+            page_number=0,
+        )
+    )
+    assert response.total_rows == 1
+    assert "banana" in response.data
+
+
+def test_search_index_not_built_for_lists() -> None:
+    table = ui.table(["apple", "banana"], search_index=True)
+    assert table._search_index is None
@@ -16,9 +16,13 @@ from marimo._dependencies.dependencies import DependencyManager
 from marimo._runtime.commands import UpdateUserConfigCommand
 from marimo._runtime.reload.autoreload import ModuleReloader
 from marimo._runtime.reload.module_watcher import (
+    GraphModules,
+    ModuleWatcher,
     _check_modules,
     _depends_on,
     _get_excluded_modules,
+    _is_library_module,
+    _user_module_files,
 )
 from marimo._runtime.runtime import Kernel
 from tests.conftest import ExecReqProvider
@@ -642,6 +646,16 @@ class TestIsThirdPartyModule:
         mod.__file__ = "/usr/lib/python3.10/site-packages/numpy/__init__.py"
         assert _is_third_party_module(mod)
 
+    def test_dist_packages_module(self):
+        from marimo._runtime.reload.module_watcher import (
+            _is_third_party_module,
+        )
+
+        # Module in Debian's dist-packages
+        mod = types.ModuleType("test_module")
+        mod.__file__ = "/usr/lib/python3/dist-packages/numpy/__init__.py"
+        assert _is_third_party_module(mod)
+
     def test_local_module(self):
         from marimo._runtime.reload.module_watcher import (
             _is_third_party_module,
@@ -679,6 +693,39 @@ class TestIsThirdPartyModule:
         assert not _is_third_party_module(sys)
 
 
+class TestIsLibraryModule:
+    def test_stdlib_module(self):
+        import json
+
+        assert _is_library_module(json)
+        assert _is_library_module(asyncio)
+
+    def test_third_party_module(self):
+        assert _is_library_module(pytest)
+        mod = types.ModuleType("test_module")
+        mod.__file__ = "/usr/lib/python3/dist-packages/numpy/__init__.py"
+        assert _is_library_module(mod)
+
+    def test_local_module(self):
+        mod = types.ModuleType("test_module")
+        mod.__file__ = "/home/user/project/mymodule.py"
+        assert not _is_library_module(mod)
+        assert not _is_library_module(sys)
+
+    def test_user_module_files_skips_libraries(self, tmp_path: pathlib.Path):
+        import importlib
+
+        sys.path.append(str(tmp_path))
+        py_file = tmp_path / "test_user_files_mod.py"
+        py_file.write_text("import json\nimport asyncio\nimport pytest")
+        mod = importlib.import_module("test_user_files_mod")
+
+        files = _user_module_files(
+            {"test_user_files_mod": mod}, ModuleReloader(), sys.modules
+        )
+        assert files == {str(py_file): {"test_user_files_mod"}}
+
+
 class TestDependsOn:
     """Unit tests for the _depends_on function"""
 
@@ -868,6 +915,71 @@ class TestCheckModules:
         assert len(stale) == 0
 
 
+class TestGraphModules:
+    async def test_cached_until_graph_changes(
+        self,
+        tmp_path: pathlib.Path,
+        py_modname: str,
+        execution_kernel: Kernel,
+        exec_req: ExecReqProvider,
+    ):
+        k = execution_kernel
+        sys.path.append(str(tmp_path))
+        (tmp_path / f"{py_modname}.py").write_text("x = 1")
+        await k.run([exec_req.get("import os")])
+
+        graph_modules = GraphModules(k.graph)
+        modules, modname_to_cell_id = graph_modules.get(sys.modules)
+        assert "os" in modules
+        assert graph_modules.get(sys.modules)[0] is modules
+
+        await k.run([er := exec_req.get(f"import {py_modname}")])
+        modules, modname_to_cell_id = graph_modules.get(sys.modules)
+        assert modname_to_cell_id[py_modname] == er.cell_id
+
+
+@pytest.mark.parametrize("event_driven", [True, False])
+async def test_module_watcher_modes(
+    tmp_path: pathlib.Path,
+    py_modname: str,
+    execution_kernel: Kernel,
+    exec_req: ExecReqProvider,
+    event_driven: bool,
+):
+    k = execution_kernel
+    sys.path.append(str(tmp_path))
+    py_file = tmp_path / f"{py_modname}.py"
+    py_file.write_text("def foo(): return 1")
+    await k.run(
+        [
+            er_1 := exec_req.get(f"from {py_modname} import foo"),
+            er_2 := exec_req.get("pass"),
+        ]
+    )
+
+    watcher = ModuleWatcher(
+        k.graph,
+        reloader=ModuleReloader(),
+        mode="lazy",
+        enqueue_run_stale_cells=lambda: None,
+        stream=k.stream,
+        event_driven=event_driven,
+    )
+    try:
+        watcher.refresh()
+        update_file(py_file, "def foo(): return 2")
+
+        # Without watchdog, the file watcher polls every second
+        for _ in range(20):
+            await asyncio.sleep(INTERVAL)
+            if k.graph.cells[er_1.cell_id].stale:
+                break
+        assert k.graph.cells[er_1.cell_id].stale
+        assert not k.graph.cells[er_2.cell_id].stale
+    finally:
+        watcher.stop()
+
+
 class TestModuleWatcherStop:
     """Tests for ModuleWatcher.stop method"""
 
@@ -1003,3 +1115,46 @@ class TestModuleWatcherEdgeCases:
 
         # The cache should handle the modified imports correctly
         assert not k.graph.cells[er_1.cell_id].stale
+
+
+async def test_module_watcher_falls_back_to_polling(
+    tmp_path: pathlib.Path,
+    py_modname: str,
+    execution_kernel: Kernel,
+    exec_req: ExecReqProvider,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from marimo._utils.file_watcher import FileWatcherManager
+
+    def add_callback(*args: object) -> None:
+        del args
+        raise OSError(24, "inotify instance limit reached")
+
+    monkeypatch.setattr(FileWatcherManager, "add_callback", add_callback)
+
+    k = execution_kernel
+    sys.path.append(str(tmp_path))
+    py_file = tmp_path / f"{py_modname}.py"
+    py_file.write_text("def foo(): return 1")
+    await k.run([er := exec_req.get(f"from {py_modname} import foo")])
+
+    watcher = ModuleWatcher(
+        k.graph,
+        reloader=ModuleReloader(),
+        mode="lazy",
+        enqueue_run_stale_cells=lambda: None,
+        stream=k.stream,
+        event_driven=True,
+    )
+    try:
+        watcher.refresh()
+        await asyncio.sleep(INTERVAL)
+        update_file(py_file, "def foo(): return 2")
+
+        for _ in range(20):
+            await asyncio.sleep(INTERVAL)
+            if k.graph.cells[er.cell_id].stale:
+                break
+        assert k.graph.cells[er.cell_id].stale
+    finally:
+        watcher.stop()
@@ -0,0 +1,102 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import random
+from functools import partial
+
+from marimo._ast import compiler
+from marimo._runtime.dataflow.cycles import CycleTracker
+from marimo._runtime.dataflow.topology import MutableGraphTopology
+
+parse_cell = partial(compiler.compile_cell, cell_id="0")
+
+
+class TestCycleTracker:
+    """Tests for incremental cycle detection."""
+
+    def setup_method(self) -> None:
+        self.topology = MutableGraphTopology()
+        self.tracker = CycleTracker()
+        for cid in "abcde":
+            self.topology.add_node(cid, parse_cell("pass"))
+
+    def _add_edge(self, parent: str, child: str):
+        self.topology.add_edge(parent, child)
+        return self.tracker.detect_cycle_for_edge(
+            (parent, child), self.topology
+        )
+
+    def _assert_order_is_topological(self) -> None:
+        assert self.tracker._order_is_valid
+        order = self.tracker._order
+        for parent, children in self.topology.children.items():
+            for child in children:
+                assert order[parent] < order[child]
+
+    def test_edges_in_order(self) -> None:
+        assert self._add_edge("a", "b") is None
+        assert self._add_edge("b", "c") is None
+        assert self._add_edge("a", "c") is None
+        assert not self.tracker.cycles
+        self._assert_order_is_topological()
+
+    def test_edges_against_order_are_reordered(self) -> None:
+        assert self._add_edge("c", "b") is None
+        assert self._add_edge("b", "a") is None
+        assert self._add_edge("e", "c") is None
+        assert self._add_edge("d", "e") is None
+        assert not self.tracker.cycles
+        self._assert_order_is_topological()
+
+    def test_detects_cycle(self) -> None:
+        assert self._add_edge("a", "b") is None
+        assert self._add_edge("b", "c") is None
+        cycle = self._add_edge("c", "a")
+        assert cycle == (("c", "a"), ("a", "b"), ("b", "c"))
+        assert self.tracker.cycles == {cycle}
+
+        # Edges are still checked while the graph is cyclic
+        assert self._add_edge("d", "e") is None
+        assert self._add_edge("e", "d") is not None
+        assert len(self.tracker.cycles) == 2
+
+    def test_order_is_restored_when_cycles_are_broken(self) -> None:
+        self._add_edge("a", "b")
+        cycle = self._add_edge("b", "a")
+        assert cycle is not None
+
+        self.topology.remove_edge("b", "a")
+        self.tracker.remove_cycles_with_edge(("b", "a"))
+        assert not self.tracker.cycles
+
+        assert self._add_edge("c", "a") is None
+        self._assert_order_is_topological()
+        assert self._add_edge("b", "c") is not None
+
+    def test_remove_node(self) -> None:
+        self._add_edge("a", "b")
+        self._add_edge("b", "c")
+        self.topology.remove_node("b")
+        self.tracker.remove_node("b")
+        assert "b" not in self.tracker._order
+
+        assert self._add_edge("c", "a") is None
+        self._assert_order_is_topological()
+
+    def test_matches_path_search(self) -> None:
+        rng = random.Random(0)
+        topology = MutableGraphTopology()
+        tracker = CycleTracker()
+        cell_ids = [str(i) for i in range(30)]
+        for cid in cell_ids:
+            topology.add_node(cid, parse_cell("pass"))
+
+        for _ in range(60):
+            parent, child = rng.sample(cell_ids, 2)
+            if child in topology.children[parent]:
+                continue
+            # Whether the edge closes a cycle, computed before adding it
+            expected = bool(topology.get_path(child, parent))
+            topology.add_edge(parent, child)
+            cycle = tracker.detect_cycle_for_edge((parent, child), topology)
+            assert (cycle is not None) == expected
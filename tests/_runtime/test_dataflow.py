@@ -332,6 +332,61 @@ def test_register_with_stale_ancestor() -> None:
     assert graph.get_stale() == set(["0", "1"])
 
 
+def test_update_registers_and_deletes() -> None:
+    graph = dataflow.DirectedGraph()
+    graph.register_cell("0", parse_cell("x = 0"))
+    graph.register_cell("1", parse_cell("y = x"))
+
+    # Replace 0, delete 1, and add two cells in one update
+    children = graph.update(
+        {
+            "0": parse_cell("x = 1"),
+            "2": parse_cell("z = x"),
+            "3": parse_cell("w = z"),
+        },
+        deletions=["0", "1"],
+    )
+    assert children == {"1"}
+    assert set(graph.cells.keys()) == {"0", "2", "3"}
+    assert graph.parents == {"0": set(), "2": {"0"}, "3": {"2"}}
+    assert graph.get_referring_cells("y", language="python") == set()
+    assert graph.get_referring_cells("x", language="python") == {"2"}
+
+
+def test_update_with_stale_and_disabled_ancestors() -> None:
+    # 0 [stale] --> 1 --> 2
+    # 3 [disabled] --> 4
+    graph = dataflow.DirectedGraph()
+    graph.register_cell("0", parse_cell("x = 0"))
+    graph.set_stale({"0"})
+    disabled_cell = parse_cell("a = 0")
+    disabled_cell.configure({"disabled": True})
+    graph.register_cell("3", disabled_cell)
+
+    # Registered out of topological order
+    graph.update(
+        {
+            "2": parse_cell("z = y"),
+            "1": parse_cell("y = x"),
+            "4": parse_cell("b = a"),
+            "5": parse_cell("c = 0"),
+        }
+    )
+    assert graph.get_stale() == {"0", "1", "2"}
+    assert graph.cells["4"].disabled_transitively
+    assert not graph.cells["5"].disabled_transitively
+    assert not graph.cells["1"].disabled_transitively
+
+
+def test_update_with_cycle() -> None:
+    graph = dataflow.DirectedGraph()
+    graph.register_cell("0", parse_cell("x = 0"))
+    graph.set_stale({"0"})
+    graph.update({"1": parse_cell("y = x; z"), "2": parse_cell("z = y")})
+    assert graph.cycles
+    assert graph.get_stale() == {"0", "1", "2"}
+
+
 def test_topological_sort_single_node() -> None:
     graph = dataflow.DirectedGraph()
     code = "x = 0"
@@ -9,6 +9,7 @@ from marimo._ast import compiler
 from marimo._dependencies.dependencies import DependencyManager
 from marimo._runtime.dataflow import edges
 from marimo._runtime.dataflow.definitions import DefinitionRegistry
+from marimo._runtime.dataflow.references import ReferenceRegistry
 from marimo._runtime.dataflow.topology import MutableGraphTopology
 
 parse_cell = partial(compiler.compile_cell, cell_id="0")
@@ -561,3 +562,77 @@ class TestEdgeComputer:
             "cell_1", cell1, self.topology, self.definitions
         )
         assert children1 == {"cell_2", "cell_3", "cell_4"}
+
+
+class TestReferenceRegistry:
+    """Tests for the name -> referring cells index."""
+
+    def setup_method(self) -> None:
+        self.topology = MutableGraphTopology()
+        self.references = ReferenceRegistry()
+
+    def _add(self, cell_id: str, code: str) -> None:
+        cell = parse_cell(code)
+        self.topology.add_node(cell_id, cell)
+        self.references.register_references(cell_id, cell)
+
+    def test_python_refs(self) -> None:
+        self._add("cell_1", "x = 1")
+        self._add("cell_2", "y = x")
+        self._add("cell_3", "z = x + y")
+
+        assert self.references.get_referring_cells("x") == {
+            "cell_2",
+            "cell_3",
+        }
+        assert self.references.get_referring_cells("y") == {"cell_3"}
+        assert self.references.get_referring_cells("z") == set()
+
+    def test_unregister(self) -> None:
+        self._add("cell_1", "y = x")
+        self._add("cell_2", "z = x")
+
+        self.references.unregister_references(
+            "cell_1", self.topology.cells["cell_1"]
+        )
+        assert self.references.get_referring_cells("x") == {"cell_2"}
+
+        self.references.unregister_references(
+            "cell_2", self.topology.cells["cell_2"]
+        )
+        assert "x" not in self.references.references
+
+    def test_returns_copy(self) -> None:
+        self._add("cell_1", "y = x")
+        self.references.get_referring_cells("x").add("cell_2")
+        assert self.references.get_referring_cells("x") == {"cell_1"}
+
+    @pytest.mark.skipif(not HAS_SQL, reason="requires duckdb and polars")
+    @pytest.mark.parametrize(
+        ("name", "language"),
+        [
+            ("t1", "sql"),
+            ("t1", "python"),
+            ("my_schema", "sql"),
+            ("my_table", "sql"),
+            ("my_db", "sql"),
+            ("nonexistent", "sql"),
+        ],
+    )
+    def test_matches_scan(self, name: str, language: str) -> None:
+        self._add("cell_1", "mo.sql('CREATE TABLE t1 (i INTEGER)')")
+        self._add("cell_2", "mo.sql('SELECT * FROM t1')")
+        self._add("cell_3", "t1")
+        self._add("cell_4", "mo.sql('SELECT * FROM my_schema.my_table')")
+        self._add("cell_5", "mo.sql('SELECT * FROM my_db.my_schema.my_table')")
+
+        assert edges.get_referring_cells(
+            name,
+            language=language,  # type: ignore[arg-type]
+            topology=self.topology,
+            references=self.references,
+        ) == edges.get_referring_cells(
+            name,
+            language=language,  # type: ignore[arg-type]
+            topology=self.topology,
+        )
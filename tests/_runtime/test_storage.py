@@ -53,6 +53,26 @@ class TestInMemoryStorageReadChunked:
         assert b"".join(chunks) == data
 
 
+class TestInMemoryStorageStream:
+    def test_stream_range(self) -> None:
+        storage = InMemoryStorage()
+        storage.store("test_key", b"hello world")
+        chunks = list(storage.stream("test_key", 2, 9, chunk_size=3))
+        assert [bytes(chunk) for chunk in chunks] == [b"llo", b" wo", b"r"]
+
+    def test_stream_is_zero_copy(self) -> None:
+        storage = InMemoryStorage()
+        storage.store("test_key", b"hello world")
+        (chunk,) = storage.stream("test_key", 0, 11)
+        assert isinstance(chunk, memoryview)
+        assert chunk.obj is storage._storage["test_key"]
+
+    def test_stream_nonexistent_raises_keyerror(self) -> None:
+        storage = InMemoryStorage()
+        with pytest.raises(KeyError, match="Virtual file not found"):
+            list(storage.stream("nonexistent", 0, 10))
+
+
 class TestInMemoryStorage:
     def test_store_and_read(self) -> None:
         storage = InMemoryStorage()
@@ -271,6 +291,48 @@ class TestSharedMemoryStorage:
             storage.shutdown()
 
 
+class TestSharedMemoryStorageStream:
+    def test_stream_range(self) -> None:
+        storage = SharedMemoryStorage()
+        try:
+            data = bytes(range(256)) * 4
+            storage.store("marimo_stream_1", data)
+            received = b"".join(
+                bytes(chunk)
+                for chunk in storage.stream(
+                    "marimo_stream_1", 100, 900, chunk_size=64
+                )
+            )
+            assert received == data[100:900]
+        finally:
+            storage.shutdown()
+
+    def test_stream_chunks_outlive_segment(self) -> None:
+        storage = SharedMemoryStorage()
+        try:
+            storage.store("marimo_stream_2", b"hello world")
+            stream = storage.stream("marimo_stream_2", 0, 11, chunk_size=4)
+            first = next(stream)
+            # The server may still hold a chunk (e.g. after a partial
+            # send) when the stream is closed
+            held = memoryview(first)[2:]
+            next(stream)
+            # Closing the stream early closes the segment without errors
+            stream.close()
+            assert first == b"hell"
+            assert bytes(held) == b"ll"
+        finally:
+            storage.shutdown()
+
+    def test_stream_nonexistent_raises_keyerror(self) -> None:
+        storage = SharedMemoryStorage()
+        try:
+            with pytest.raises(KeyError, match="Virtual file not found"):
+                list(storage.stream("nonexistent_stream", 0, 10))
+        finally:
+            storage.shutdown()
+
+
 class TestVirtualFileStorageManager:
     def test_singleton(self) -> None:
         manager1 = VirtualFileStorageManager()
@@ -341,3 +403,24 @@ class TestVirtualFileStorageManager:
         finally:
             manager.storage = original_storage
             shm_storage.shutdown()
+
+    def test_only_shared_files_fall_back_to_shared_memory(self) -> None:
+        manager = VirtualFileStorageManager()
+        original_storage = manager.storage
+        shm_storage = SharedMemoryStorage()
+        try:
+            shm_storage.store("marimo_fb_forked", b"forked data")
+            manager.storage = InMemoryStorage()
+            # Not stored by a forked kernel, so not read from shared memory
+            with pytest.raises(KeyError):
+                manager.read("marimo_fb_forked", 11)
+
+            manager.add_shared_file("marimo_fb_forked")
+            assert manager.read("marimo_fb_forked", 11) == b"forked data"
+
+            manager.remove_shared_file("marimo_fb_forked")
+            with pytest.raises(KeyError):
+                manager.read("marimo_fb_forked", 11)
+        finally:
+            manager.storage = original_storage
+            shm_storage.shutdown()
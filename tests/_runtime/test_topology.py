@@ -460,3 +460,63 @@ class TestMutableGraphTopology:
         graph.remove_node("cell_3")
         assert graph.descendants("cell_1") == {"cell_2"}
         assert "cell_3" not in graph.cells
+
+    def test_closures_are_memoized_until_mutation(self) -> None:
+        """Test that closures are cached and invalidated on mutation."""
+        graph = MutableGraphTopology()
+        for cid in ("cell_1", "cell_2", "cell_3"):
+            graph.add_node(cid, parse_cell("pass"))
+        graph.add_edge("cell_1", "cell_2")
+
+        assert graph.descendants("cell_1") == {"cell_2"}
+        assert graph.ancestors("cell_2") == {"cell_1"}
+        assert "cell_1" in graph._descendants
+
+        # Returned sets are copies of the cached closures
+        graph.descendants("cell_1").add("cell_3")
+        assert graph.descendants("cell_1") == {"cell_2"}
+
+        graph.add_edge("cell_2", "cell_3")
+        assert not graph._descendants
+        assert graph.descendants("cell_1") == {"cell_2", "cell_3"}
+        assert graph.ancestors("cell_3") == {"cell_1", "cell_2"}
+
+        graph.remove_edge("cell_1", "cell_2")
+        assert graph.descendants("cell_1") == set()
+        assert graph.ancestors("cell_3") == {"cell_2"}
+
+    def test_topological_sort_is_memoized_until_mutation(self) -> None:
+        """Test that sorts are cached and invalidated on mutation."""
+        graph = MutableGraphTopology()
+        for cid in ("cell_1", "cell_2", "cell_3"):
+            graph.add_node(cid, parse_cell("pass"))
+        graph.add_edge("cell_3", "cell_1")
+
+        assert graph.topological_sort(["cell_1", "cell_2", "cell_3"]) == [
+            "cell_2",
+            "cell_3",
+            "cell_1",
+        ]
+        # The subgraph induced by the cells is sorted
+        assert graph.topological_sort(["cell_1", "cell_2"]) == [
+            "cell_1",
+            "cell_2",
+        ]
+        assert len(graph._sorted) == 2
+
+        graph.remove_edge("cell_3", "cell_1")
+        assert not graph._sorted
+        assert graph.topological_sort(["cell_1", "cell_2", "cell_3"]) == [
+            "cell_1",
+            "cell_2",
+            "cell_3",
+        ]
+
+        graph.remove_node("cell_1")
+        graph.add_node("cell_1", parse_cell("pass"))
+        # Registration order is updated
+        assert graph.topological_sort(["cell_1", "cell_2", "cell_3"]) == [
+            "cell_2",
+            "cell_3",
+            "cell_1",
+        ]
@@ -76,8 +76,7 @@ async def test_cached_virtual_file_not_deleted(
                 """
                 @functools.lru_cache()
                 def create_vfile(arg):
-                    del arg
-                    bytestream = io.BytesIO(b"hello world")
+                    bytestream = io.BytesIO(f"hello world {arg}".encode())
                     return mo.pdf(bytestream)
                 """
             ),
@@ -206,11 +205,11 @@ async def test_vfile_refcount_decremented(
     assert ctx.virtual_file_registry.refcount(vfile) == 0
 
     # this should dispose the old vfile (because its refcount is 0) and create
-    # a new one
+    # a new one, with the same contents and so the same name
     await k.run([make_vfile])
-    # the previous vfile should not be in the registry
-    assert vfile not in ctx.virtual_file_registry.registry
     assert len(ctx.virtual_file_registry.registry) == 1
+    # the previous registration should have been removed
+    assert ctx.virtual_file_registry.registry[vfile].registrations == 1
 
 
 async def test_cached_vfile_disposal(
@@ -260,10 +259,11 @@ async def test_cached_vfile_disposal(
     await k.run([exec_req.get("import gc; gc.collect()")])
     assert ctx.virtual_file_registry.refcount(vfile) == 0
 
-    # create another vfile. the old one should be deleted
+    # create another vfile. the old one should be deleted, and the new one
+    # registered under the same name
     await k.run([append_vfile])
     assert len(ctx.virtual_file_registry.registry) == 1
-    assert vfile not in ctx.virtual_file_registry.filenames()
+    assert ctx.virtual_file_registry.registry[vfile].registrations == 1
 
 
 async def test_virtual_files_not_supported(
@@ -401,3 +401,52 @@ def test_create_and_register_preserves_extension(
     for ext in ("pdf", "png", "csv"):
         vfile = VirtualFile.create_and_register(b"content", ext)
         assert vfile.filename.endswith(f".{ext}")
+
+
+def test_identical_buffers_share_a_virtual_file(
+    run_mode_kernel: MockedKernel,  # noqa: ARG001
+) -> None:
+    ctx = get_context()
+    registry = ctx.virtual_file_registry
+
+    first = VirtualFileLifecycleItem(ext="pdf", buffer=b"abc")
+    first.create(context=ctx)
+    second = VirtualFileLifecycleItem(ext="pdf", buffer=b"abc")
+    second.create(context=ctx)
+    other = VirtualFileLifecycleItem(ext="pdf", buffer=b"xyz")
+    other.create(context=ctx)
+
+    filename = first.virtual_file.filename
+    assert second.virtual_file.url == first.virtual_file.url
+    assert other.virtual_file.filename != filename
+    assert len(registry.registry) == 2
+    assert registry.registry[filename].registrations == 2
+
+    # The file is kept until every registration is removed
+    first.dispose(ctx, deletion=True)
+    assert read_virtual_file(filename, 3) == b"abc"
+    second.dispose(ctx, deletion=True)
+    assert not registry.has(filename)
+
+
+async def test_rerun_with_referenced_contents_does_not_leak(
+    execution_kernel: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k = execution_kernel
+    await k.run(
+        [
+            exec_req.get("import io; import marimo as mo"),
+            exec_req.get("held = mo.pdf(io.BytesIO(b'hello world'))"),
+            rerun := exec_req.get("mo.pdf(io.BytesIO(b'hello world'))"),
+        ]
+    )
+    ctx = get_context()
+    (vfile,) = ctx.virtual_file_registry.filenames()
+
+    for _ in range(10):
+        await k.run([rerun])
+
+    # The re-run cell gives up its registration each time, even though
+    # another cell still references the same contents
+    assert len(ctx.cell_lifecycle_registry.registry[rerun.cell_id]) == 1
+    assert ctx.virtual_file_registry.registry[vfile].registrations == 2
@@ -148,6 +148,73 @@ class TestMemoryLoader(ABCTestLoader):
         )
 
 
+def _cache_of(value: object, name: str) -> Cache:
+    return Cache(
+        defs={"var1": value},
+        hash=name,
+        cache_type="Pure",
+        stateful_refs=set(),
+        hit=False,
+        meta={},
+    )
+
+
+class TestMemoryLoaderBudget:
+    def test_evicts_by_bytes(self) -> None:
+        loader = MemoryLoader("test", max_size=-1, max_bytes=3000)
+        for name in ("a", "b", "c"):
+            assert loader.save_cache(_cache_of(b"x" * 1000, name))
+        assert loader.current_size == 2
+        assert 2000 <= loader.current_bytes <= 3000
+
+        # The least recently used entry is evicted
+        assert not loader.cache_hit(key("a", "Pure"))
+        assert loader.load_cache(key("b", "Pure")) is not None
+        loader.save_cache(_cache_of(b"x" * 1000, "d"))
+        assert loader.cache_hit(key("b", "Pure"))
+        assert not loader.cache_hit(key("c", "Pure"))
+
+    def test_entry_larger_than_budget(self) -> None:
+        loader = MemoryLoader("test", max_bytes=100)
+        assert not loader.save_cache(_cache_of(b"x" * 1000, "a"))
+        assert loader.current_size == 0
+        assert loader.current_bytes == 0
+
+    def test_count_and_bytes(self) -> None:
+        loader = MemoryLoader("test", max_size=1, max_bytes=10_000)
+        loader.save_cache(_cache_of(1, "a"))
+        loader.save_cache(_cache_of(2, "b"))
+        assert loader.current_size == 1
+        assert loader.cache_hit(key("b", "Pure"))
+
+    def test_set_max_bytes(self) -> None:
+        loader = MemoryLoader("test", max_size=-1)
+        assert not loader.is_lru
+        for name in ("a", "b", "c"):
+            loader.save_cache(_cache_of(b"x" * 1000, name))
+        assert loader.current_bytes == 0
+
+        loader.max_bytes = 2500
+        assert loader.is_lru
+        assert loader.current_size == 2
+        assert loader.current_bytes > 0
+
+        loader.max_bytes = None
+        assert not loader.is_lru
+        assert loader.current_bytes == 0
+
+        loader.clear()
+        assert loader.current_size == 0
+
+    def test_estimates_arrays(self) -> None:
+        np = pytest.importorskip("numpy")
+        loader = MemoryLoader("test", max_size=-1, max_bytes=10**9)
+        array = np.zeros(1_000_000)
+        # Shared values are only counted once
+        loader.save_cache(_cache_of([array, array, {"a": array}], "a"))
+        assert array.nbytes <= loader.current_bytes < 2 * array.nbytes
+
+
 class TestJsonLoader(ABCTestLoader):
     suffix = "json"
 
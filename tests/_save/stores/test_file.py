@@ -2,7 +2,15 @@
 
 from __future__ import annotations
 
+import os
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from marimo._save.stores import file as file_module
 from marimo._save.stores.file import FileStore
+from marimo._utils.platform import is_windows
 
 
 class TestFileStore:
@@ -42,3 +50,131 @@ class TestFileStore:
         # Clear non-existent key
         result = store.clear("nonexistent")
         assert result is False
+
+    def test_put_is_atomic(self, tmp_path) -> None:
+        """Test that put leaves no temporary files behind."""
+        store = FileStore(tmp_path / "test_store")
+        store.put("dir/key", b"first")
+        store.put("dir/key", b"second")
+        assert store.get("dir/key") == b"second"
+        assert os.listdir(tmp_path / "test_store" / "dir") == ["key"]
+
+    def test_failed_put_keeps_previous(self, tmp_path) -> None:
+        """Test that a failed write doesn't truncate the existing blob."""
+        store = FileStore(tmp_path / "test_store")
+        store.put("key", b"first")
+        with patch("os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                store.put("key", b"second")
+        assert store.get("key") == b"first"
+        assert os.listdir(tmp_path / "test_store") == ["key"]
+
+    @pytest.mark.skipif(is_windows(), reason="POSIX permissions")
+    def test_put_respects_umask(self, tmp_path) -> None:
+        """Test that blobs get the same mode as files created with open."""
+        store = FileStore(tmp_path / "test_store")
+        store.put("key", b"hello")
+        (tmp_path / "reference").write_bytes(b"hello")
+        mode = (tmp_path / "test_store" / "key").stat().st_mode & 0o777
+        assert mode == (tmp_path / "reference").stat().st_mode & 0o777
+
+    def test_write_behind(self, tmp_path) -> None:
+        """Test that writes happen in the background and can be flushed."""
+        store = FileStore(tmp_path / "test_store", write_behind=True)
+        release = threading.Event()
+
+        original_write = file_module.atomic_write_bytes
+
+        def slow_write(path, value):
+            release.wait(timeout=10)
+            original_write(path, value)
+
+        with patch.object(file_module, "atomic_write_bytes", slow_write):
+            assert store.put("key", b"hello")
+            # Pending writes are visible before they reach disk
+            assert not (tmp_path / "test_store" / "key").exists()
+            assert store.hit("key")
+            assert store.get("key") == b"hello"
+            release.set()
+            store.flush()
+
+        assert (tmp_path / "test_store" / "key").read_bytes() == b"hello"
+        assert store.get("key") == b"hello"
+        assert store._pending == {}
+
+    def test_write_behind_bounded(self, tmp_path) -> None:
+        """Test that put waits when too many writes are pending."""
+        store = FileStore(
+            tmp_path / "test_store", write_behind=True, max_pending_writes=1
+        )
+        release = threading.Event()
+        original_write = file_module.atomic_write_bytes
+
+        def slow_write(path, value):
+            release.wait(timeout=10)
+            original_write(path, value)
+
+        with patch.object(file_module, "atomic_write_bytes", slow_write):
+            store.put("key1", b"one")
+            second = threading.Thread(target=store.put, args=("key2", b"two"))
+            second.start()
+            second.join(timeout=0.2)
+            assert second.is_alive()
+            release.set()
+            second.join(timeout=10)
+            assert not second.is_alive()
+            store.flush()
+
+        assert store.get("key1") == b"one"
+        assert store.get("key2") == b"two"
+
+    def test_get_buffer_mmap(self, tmp_path) -> None:
+        """Test that large blobs are memory-mapped."""
+        store = FileStore(tmp_path / "test_store")
+        data = b"x" * 1024
+        store.put("key", data)
+        with patch.object(file_module, "MMAP_THRESHOLD", 16):
+            buffer = store.get_buffer("key")
+        if is_windows():
+            assert buffer == data
+        else:
+            assert isinstance(buffer, memoryview)
+            assert buffer == data
+        assert store.get("key") == data
+
+    def test_max_bytes(self, tmp_path) -> None:
+        """Test that least recently used caches are removed."""
+        store = FileStore(tmp_path / "test_store", max_bytes=25)
+        store.put("a/one", b"x" * 10)
+        store.put("a/two", b"x" * 10)
+        store.get("a/one")
+        store.put("a/three", b"x" * 10)
+        store.flush()
+
+        assert store.hit("a/one")
+        assert not store.hit("a/two")
+        assert store.hit("a/three")
+        assert (tmp_path / "test_store" / ".index.json").exists()
+
+    def test_gc(self, tmp_path) -> None:
+        """Test collecting caches on demand."""
+        store = FileStore(tmp_path / "test_store")
+        store.put("a/one", b"x" * 10)
+        store.put("a/two", b"x" * 10)
+
+        result = store.gc(max_bytes=10)
+        assert result.removed == 1
+        assert result.total_bytes == 10
+
+    def test_gc_counts_blobs_written_after_index(self, tmp_path) -> None:
+        """Test that blobs missing from a saved index are collected."""
+        store = FileStore(tmp_path / "test_store")
+        store.put("a/one", b"x" * 10)
+        store.gc(max_bytes=100)
+        assert (tmp_path / "test_store" / ".index.json").exists()
+
+        store.put("a/two", b"x" * 10)
+        store.put("a/three", b"x" * 10)
+        result = store.gc(max_bytes=1)
+        assert result.removed == 3
+        assert result.total_bytes == 0
@@ -0,0 +1,151 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import TYPE_CHECKING
+
+from marimo._save.stores.file_index import (
+    INDEX_FILENAME,
+    STALE_TEMP_AGE,
+    CacheIndex,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _write(root: Path, key: str, size: int) -> None:
+    path = root / key
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+
+
+class TestCacheIndex:
+    def test_rebuilds_from_directory(self, tmp_path: Path) -> None:
+        _write(tmp_path, "a/one.pickle", 10)
+        _write(tmp_path, "b/two.pickle", 20)
+        _write(tmp_path, "a/.one.pickle.123.tmp", 5)
+
+        index = CacheIndex(tmp_path)
+        assert set(index.entries) == {"a/one.pickle", "b/two.pickle"}
+        assert index.total_bytes == 30
+
+        index.save()
+        data = json.loads((tmp_path / INDEX_FILENAME).read_text())
+        assert set(data["entries"]) == {"a/one.pickle", "b/two.pickle"}
+
+    def test_reads_saved_index(self, tmp_path: Path) -> None:
+        index = CacheIndex(tmp_path)
+        _write(tmp_path, "a/one.pickle", 10)
+        index.record("a/one.pickle", 10)
+        index.save()
+
+        # Files not in the saved index are not picked up by walking
+        _write(tmp_path, "a/two.pickle", 20)
+        assert set(CacheIndex(tmp_path).entries) == {"a/one.pickle"}
+
+    def test_save_merges_other_processes(self, tmp_path: Path) -> None:
+        first = CacheIndex(tmp_path)
+        second = CacheIndex(tmp_path)
+        first.record("a/one.pickle", 10)
+        second.record("a/two.pickle", 20)
+        first.save()
+        second.save()
+
+        assert set(CacheIndex(tmp_path).entries) == {
+            "a/one.pickle",
+            "a/two.pickle",
+        }
+
+        first.remove("a/one.pickle")
+        first.save()
+        assert set(CacheIndex(tmp_path).entries) == {"a/two.pickle"}
+
+    def test_invalid_index_is_rebuilt(self, tmp_path: Path) -> None:
+        _write(tmp_path, "a/one.pickle", 10)
+        (tmp_path / INDEX_FILENAME).write_text("not json")
+        assert set(CacheIndex(tmp_path).entries) == {"a/one.pickle"}
+
+    def test_collect_by_size(self, tmp_path: Path) -> None:
+        index = CacheIndex(tmp_path)
+        for i, key in enumerate(["a/old", "a/mid", "a/new"]):
+            _write(tmp_path, key, 10)
+            index.record(key, 10)
+            index.entries[key].accessed = 1000 + i
+        # Reading a cache makes it recently used
+        index.touch("a/old")
+
+        result = index.collect(max_bytes=20)
+
+        assert result.removed == 1
+        assert result.freed_bytes == 10
+        assert result.total_bytes == 20
+        assert not (tmp_path / "a/mid").exists()
+        assert set(CacheIndex(tmp_path).entries) == {"a/old", "a/new"}
+
+    def test_collect_by_age(self, tmp_path: Path) -> None:
+        index = CacheIndex(tmp_path)
+        now = time.time()
+        for key, accessed in [("a/old", now - 100), ("a/new", now)]:
+            _write(tmp_path, key, 10)
+            index.record(key, 10)
+            index.entries[key].accessed = accessed
+
+        result = index.collect(max_age=50, now=now)
+
+        assert result.removed == 1
+        assert not (tmp_path / "a/old").exists()
+        assert (tmp_path / "a/new").exists()
+
+    def test_collect_forgets_missing_files(self, tmp_path: Path) -> None:
+        index = CacheIndex(tmp_path)
+        _write(tmp_path, "a/one", 10)
+        index.record("a/one", 10)
+        index.record("a/gone", 10)
+
+        result = index.collect()
+
+        assert result.removed == 0
+        assert result.total_bytes == 10
+        assert set(index.entries) == {"a/one"}
+
+    def test_collect_picks_up_untracked_files(self, tmp_path: Path) -> None:
+        index = CacheIndex(tmp_path)
+        _write(tmp_path, "a/one", 10)
+        index.record("a/one", 10)
+        index.save()
+        # Written by a store that doesn't keep the index
+        _write(tmp_path, "a/two", 20)
+        old = time.time() - 100
+        os.utime(tmp_path / "a/two", (old, old))
+
+        index = CacheIndex(tmp_path)
+        assert index.total_bytes == 10
+        result = index.collect(max_bytes=25)
+
+        assert result.removed == 1
+        assert result.freed_bytes == 20
+        assert result.total_bytes == 10
+        assert not (tmp_path / "a/two").exists()
+        assert set(CacheIndex(tmp_path).entries) == {"a/one"}
+
+    def test_total_bytes(self, tmp_path: Path) -> None:
+        index = CacheIndex(tmp_path)
+        index.record("a/one", 10)
+        index.record("a/two", 20)
+        index.record("a/one", 5)
+        assert index.total_bytes == 25
+        index.remove("a/two")
+        index.remove("a/missing")
+        assert index.total_bytes == 5
+
+    def test_remove_stale_temp_files(self, tmp_path: Path) -> None:
+        _write(tmp_path, "a/.one.123.tmp", 10)
+        _write(tmp_path, "a/.two.456.tmp", 10)
+        old = time.time() - STALE_TEMP_AGE - 10
+        os.utime(tmp_path / "a/.one.123.tmp", (old, old))
+
+        assert CacheIndex(tmp_path).remove_stale_temp_files() == 1
+        assert os.listdir(tmp_path / "a") == [".two.456.tmp"]
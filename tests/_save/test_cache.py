@@ -2689,6 +2689,40 @@ class TestCacheStatistics:
         info2 = k.globals["info2"]
         assert info2.currsize == 0
 
+    async def test_lru_cache_maxbytes(
+        self, k: Kernel, exec_req: ExecReqProvider
+    ) -> None:
+        """Verify lru_cache evicts by bytes and reports them in cache_info()."""
+        await k.run(
+            [
+                exec_req.get(
+                    """
+                    from marimo._save.save import lru_cache
+
+                    @lru_cache(maxsize=-1, maxbytes=5000)
+                    def blob(x):
+                        return b"x" * 2000
+
+                    blob(1)
+                    blob(2)
+                    info1 = blob.cache_info()
+                    blob(3)
+                    info2 = blob.cache_info()
+                    """
+                ),
+            ]
+        )
+
+        assert not k.stderr.messages, k.stderr
+
+        info1 = k.globals["info1"]
+        assert info1.currsize == 2
+        assert 4000 <= info1.nbytes <= 5000
+
+        info2 = k.globals["info2"]
+        assert info2.currsize == 2
+        assert info2.nbytes <= 5000
+
     async def test_persistent_cache_clear(
         self, k: Kernel, exec_req: ExecReqProvider
     ) -> None:
@@ -2491,3 +2491,93 @@ hash_val = cached_query._last_hash
         f"Expected different hashes when decorator ref changes, "
         f"got {first_hash} == {second_hash}"
     )
+
+
+@pytest.mark.skipif(
+    not DependencyManager.numpy.has(),
+    reason="optional dependencies not installed",
+)
+class TestDataToBuffer:
+    @staticmethod
+    @pytest.fixture(autouse=True)
+    def small_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+        from marimo._save import hash as hash_module
+
+        # Stream even small arrays, in chunks of a few rows
+        monkeypatch.setattr(hash_module, "DATA_STREAM_THRESHOLD", 0)
+        monkeypatch.setattr(hash_module, "DATA_CHUNK_BYTES", 64)
+
+    @staticmethod
+    def test_strided_matches_contiguous() -> None:
+        import numpy as np
+
+        from marimo._save.hash import data_to_buffer
+
+        base = np.arange(4000, dtype=np.float64).reshape(40, 100)
+        strided = base[::2, ::3]
+        assert not strided.flags.c_contiguous
+        assert data_to_buffer(strided) == data_to_buffer(
+            np.ascontiguousarray(strided)
+        )
+        # Rows larger than a chunk are walked one at a time
+        wide = base.T[::2]
+        assert wide[0].nbytes > 64
+        assert data_to_buffer(wide) == data_to_buffer(wide.copy())
+
+    @staticmethod
+    def test_layout_dtype_and_shape_are_signed() -> None:
+        import numpy as np
+
+        from marimo._save.hash import data_to_buffer
+
+        data = np.arange(12, dtype=np.int64).reshape(3, 4)
+        fortran = np.asfortranarray(data)
+        # Same memory, different contents
+        same_memory = np.frombuffer(
+            fortran.T.tobytes(), dtype=np.int64
+        ).reshape(3, 4)
+        assert data_to_buffer(fortran) != data_to_buffer(same_memory)
+        assert data_to_buffer(data) != data_to_buffer(data.reshape(4, 3))
+        assert data_to_buffer(data) != data_to_buffer(data.view(np.float64))
+        assert data_to_buffer(data) != data_to_buffer(data + 1)
+        assert data_to_buffer(np.array(1.0)) == data_to_buffer(np.array(1.0))
+
+    @staticmethod
+    def test_small_arrays_unchanged(monkeypatch: pytest.MonkeyPatch) -> None:
+        import numpy as np
+
+        from marimo._save import hash as hash_module
+        from marimo._save.hash import data_to_buffer, type_sign
+
+        monkeypatch.setattr(hash_module, "DATA_STREAM_THRESHOLD", 1024)
+        data = np.arange(10, dtype=np.int32)
+        assert data_to_buffer(data) == type_sign(
+            memoryview(data.view("uint8")), "data"
+        )
+
+    @staticmethod
+    def test_in_place_modification_changes_signature() -> None:
+        import numpy as np
+
+        from marimo._save.hash import data_to_buffer
+
+        data = np.arange(10)
+        signed = data_to_buffer(data)
+        assert data_to_buffer(data) == signed
+        data[0] = 100
+        assert data_to_buffer(data) != signed
+
+    @staticmethod
+    def test_digest_is_pinned() -> None:
+        import hashlib
+
+        import numpy as np
+
+        from marimo._save.hash import DEFAULT_HASH, data_to_buffer, type_sign
+
+        data = np.arange(10, dtype=np.int64)
+        digest = hashlib.new(DEFAULT_HASH, data.tobytes()).digest()
+        meta = f"{data.dtype.descr}:{data.shape}:C:{DEFAULT_HASH}"
+        assert data_to_buffer(data) == type_sign(
+            digest + bytes(meta, "utf-8"), "data-stream"
+        )
@@ -8,6 +8,10 @@ from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING, Any, cast
 from unittest.mock import Mock, patch
 
+from marimo._runtime.virtual_file import (
+    InMemoryStorage,
+    VirtualFileStorageManager,
+)
 from marimo._server.api.deps import AppState
 from marimo._server.api.endpoints.assets import _inject_service_worker
 from marimo._server.api.utils import parse_title
@@ -133,6 +137,86 @@ def test_vfile(client: TestClient) -> None:
     assert response.json() == {"detail": "Invalid virtual file request"}
 
 
+def test_vfile_caching(client: TestClient) -> None:
+    manager = VirtualFileStorageManager()
+    previous_storage = manager.storage
+    storage = InMemoryStorage()
+    storage.store("1-abc.txt", b"hello")
+    manager.storage = storage
+    try:
+        response = client.get("/@file/5-1-abc.txt", headers=token_header())
+        assert response.status_code == 200, response.text
+        assert response.content == b"hello"
+        etag = response.headers["etag"]
+        assert etag == '"5-1-abc.txt"'
+        assert "immutable" in response.headers["cache-control"]
+
+        response = client.get(
+            "/@file/5-1-abc.txt",
+            headers={**token_header(), "If-None-Match": etag},
+        )
+        assert response.status_code == 304, response.text
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        response = client.get(
+            "/@file/5-1-abc.txt",
+            headers={**token_header(), "If-None-Match": '"5-1-xyz.txt"'},
+        )
+        assert response.status_code == 200, response.text
+    finally:
+        manager.storage = previous_storage
+
+
+def test_vfile_range_requests(client: TestClient) -> None:
+    manager = VirtualFileStorageManager()
+    previous_storage = manager.storage
+    storage = InMemoryStorage()
+    storage.store("1-abc.bin", b"0123456789")
+    manager.storage = storage
+    url = "/@file/10-1-abc.bin"
+
+    def get(range_header: str, **headers: str) -> Any:
+        return client.get(
+            url, headers={**token_header(), "Range": range_header, **headers}
+        )
+
+    try:
+        response = get("bytes=2-5")
+        assert response.status_code == 206, response.text
+        assert response.content == b"2345"
+        assert response.headers["content-range"] == "bytes 2-5/10"
+        assert response.headers["content-length"] == "4"
+        assert response.headers["accept-ranges"] == "bytes"
+
+        response = get("bytes=7-")
+        assert response.status_code == 206
+        assert response.content == b"789"
+
+        response = get("bytes=-3")
+        assert response.status_code == 206
+        assert response.content == b"789"
+
+        response = get("bytes=8-100")
+        assert response.status_code == 206
+        assert response.content == b"89"
+        assert response.headers["content-range"] == "bytes 8-9/10"
+
+        response = get("bytes=10-")
+        assert response.status_code == 416
+        assert response.headers["content-range"] == "bytes */10"
+
+        # Multiple ranges and mismatched If-Range serve the whole file
+        response = get("bytes=0-1,4-5")
+        assert response.status_code == 200
+        assert response.content == b"0123456789"
+        response = get("bytes=0-1", **{"If-Range": '"other"'})
+        assert response.status_code == 200
+        assert response.content == b"0123456789"
+    finally:
+        manager.storage = previous_storage
+
+
 def test_public_file_serving(client: TestClient) -> None:
     # Setup app state with a mock notebook
     app_state = AppState.from_app(cast(Any, client.app))
@@ -2,12 +2,15 @@
 from __future__ import annotations
 
 import json
+import zlib
 
 from marimo._messaging.notification import (
     AlertNotification,
     KernelStartupErrorNotification,
 )
 from marimo._server.api.endpoints.ws.ws_formatter import (
+    BINARY_FRAME_COMPRESSED,
+    format_binary_wire_message,
     format_wire_message,
     serialize_notification_for_websocket,
 )
@@ -68,6 +71,31 @@ class TestFormatWireMessage:
         assert parsed["data"] == {}
 
 
+class TestFormatBinaryWireMessage:
+    """Tests for format_binary_wire_message function."""
+
+    def test_frame_layout(self) -> None:
+        """Test the header and compressed payload of a binary frame."""
+        text = format_wire_message(
+            "cell-op", '{"text": "Hello 世界"}'.encode()
+        )
+        frame = format_binary_wire_message("cell-op", text)
+
+        assert frame[0] == BINARY_FRAME_COMPRESSED
+        op_length = frame[1]
+        assert frame[2 : 2 + op_length] == b"cell-op"
+        payload = zlib.decompress(frame[2 + op_length :])
+        assert payload.decode("utf-8") == text
+
+    def test_compresses_large_messages(self) -> None:
+        """Test that repetitive payloads shrink."""
+        text = format_wire_message(
+            "cell-op", b'{"html": "' + b"<td>1</td>" * 10000 + b'"}'
+        )
+        frame = format_binary_wire_message("cell-op", text)
+        assert len(frame) < len(text) // 10
+
+
 class TestSerializeNotificationForWebsocket:
     """Tests for serialize_notification_for_websocket function."""
 
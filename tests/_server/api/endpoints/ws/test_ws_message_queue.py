@@ -0,0 +1,309 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import asyncio
+import json
+import zlib
+from typing import Any
+
+from marimo._messaging.cell_output import CellChannel, CellOutput
+from marimo._messaging.context import RunId_t
+from marimo._messaging.notification import (
+    AlertNotification,
+    CellNotification,
+    ModelClose,
+    ModelCustom,
+    ModelLifecycleNotification,
+    ModelUpdate,
+    UIElementMessageNotification,
+)
+from marimo._messaging.serde import serialize_kernel_message
+from marimo._messaging.types import KernelMessage
+from marimo._server.api.endpoints.ws.ws_formatter import (
+    BINARY_FRAME_THRESHOLD,
+)
+from marimo._server.api.endpoints.ws.ws_message_loop import (
+    WebSocketMessageLoop,
+)
+from marimo._server.api.endpoints.ws.ws_message_queue import (
+    CoalescingMessageQueue,
+    coalesce_messages,
+)
+from marimo._types.ids import CellId_t, UIElementId, WidgetModelId
+
+
+def _output(data: str, channel: CellChannel = CellChannel.OUTPUT) -> Any:
+    return CellOutput(channel=channel, mimetype="text/plain", data=data)
+
+
+def _cell_op(cell_id: str = "a", **kwargs: Any) -> KernelMessage:
+    kwargs.setdefault("run_id", RunId_t("run"))
+    return serialize_kernel_message(
+        CellNotification(cell_id=CellId_t(cell_id), **kwargs)
+    )
+
+
+def _alert(title: str) -> KernelMessage:
+    return serialize_kernel_message(
+        AlertNotification(title=title, description="")
+    )
+
+
+def _model_update(
+    model_id: str = "m", buffers: list[bytes] | None = None, **state: Any
+) -> KernelMessage:
+    return serialize_kernel_message(
+        ModelLifecycleNotification(
+            model_id=WidgetModelId(model_id),
+            message=ModelUpdate(
+                state=state,
+                buffer_paths=[[key] for key in state][: len(buffers or [])],
+                buffers=buffers or [],
+            ),
+        )
+    )
+
+
+def _decode(messages: list[KernelMessage]) -> list[dict[str, Any]]:
+    return [json.loads(message) for message in messages]
+
+
+class TestCoalesceMessages:
+    def test_superseded_outputs_are_dropped(self) -> None:
+        messages = [
+            _cell_op(output=_output("1")),
+            _cell_op(output=_output("2")),
+            _cell_op(output=_output("3"), status="idle"),
+        ]
+        coalesced = _decode(coalesce_messages(messages))
+        assert len(coalesced) == 1
+        assert coalesced[0]["output"]["data"] == "3"
+        assert coalesced[0]["status"] == "idle"
+
+    def test_other_cells_and_messages_are_kept_in_order(self) -> None:
+        messages = [
+            _cell_op("a", output=_output("1")),
+            _alert("hello"),
+            _cell_op("b", output=_output("2")),
+            _cell_op("a", output=_output("3")),
+        ]
+        coalesced = _decode(coalesce_messages(messages))
+        assert [m.get("cell_id", m["op"]) for m in coalesced] == [
+            "alert",
+            "b",
+            "a",
+        ]
+
+    def test_status_transitions_are_kept(self) -> None:
+        messages = [
+            _cell_op(status="queued"),
+            _cell_op(status="running"),
+            _cell_op(output=_output("1"), status="idle"),
+        ]
+        assert coalesce_messages(messages) == messages
+
+    def test_errors_and_other_runs_are_kept(self) -> None:
+        messages = [
+            _cell_op(output=_output("1", CellChannel.MARIMO_ERROR)),
+            _cell_op(output=_output("2")),
+            _cell_op(output=_output("3"), run_id=RunId_t("other")),
+        ]
+        assert coalesce_messages(messages) == messages
+
+    def test_console_outputs_are_merged(self) -> None:
+        messages = [
+            _cell_op(console=_output("1", CellChannel.STDOUT)),
+            _cell_op(
+                console=[
+                    _output("2", CellChannel.STDOUT),
+                    _output("3", CellChannel.STDERR),
+                ]
+            ),
+            _cell_op(console=_output("4", CellChannel.STDOUT)),
+        ]
+        coalesced = _decode(coalesce_messages(messages))
+        assert len(coalesced) == 1
+        assert [c["data"] for c in coalesced[0]["console"]] == [
+            "1",
+            "2",
+            "3",
+            "4",
+        ]
+
+    def test_cleared_console_is_not_merged(self) -> None:
+        messages = [
+            _cell_op(console=_output("1", CellChannel.STDOUT)),
+            _cell_op(console=[]),
+            _cell_op(console=_output("2", CellChannel.STDOUT)),
+        ]
+        assert coalesce_messages(messages) == messages
+
+
+class TestCoalesceModelMessages:
+    def test_superseded_updates_are_dropped(self) -> None:
+        messages = [
+            _model_update(value=1),
+            _model_update(value=2, label="a", buffers=[b"x"]),
+            _model_update(value=3, label="b"),
+        ]
+        assert coalesce_messages(messages) == [messages[2]]
+
+    def test_partial_updates_are_kept(self) -> None:
+        messages = [
+            _model_update(value=1, label="a"),
+            _model_update(value=2),
+            _model_update("other", value=3),
+        ]
+        assert coalesce_messages(messages) == messages
+
+    def test_custom_messages_are_kept(self) -> None:
+        custom = serialize_kernel_message(
+            ModelLifecycleNotification(
+                model_id=WidgetModelId("m"),
+                message=ModelCustom(content={"x": 1}, buffers=[]),
+            )
+        )
+        messages = [_model_update(value=1), custom, _model_update(value=2)]
+        assert coalesce_messages(messages) == messages
+
+    def test_updates_before_close_are_dropped(self) -> None:
+        close = serialize_kernel_message(
+            ModelLifecycleNotification(
+                model_id=WidgetModelId("m"), message=ModelClose()
+            )
+        )
+        messages = [_model_update(value=1), _model_update(label="a"), close]
+        assert coalesce_messages(messages) == [close]
+
+    def test_ui_element_messages_are_kept(self) -> None:
+        messages = [
+            serialize_kernel_message(
+                UIElementMessageNotification(
+                    ui_element=UIElementId("chat"),
+                    message={"type": "stream_chunk", "content": chunk},
+                )
+            )
+            for chunk in ("a", "b")
+        ]
+        assert coalesce_messages(messages) == messages
+
+
+class TestCoalescingMessageQueue:
+    def test_compacts_at_high_water_mark(self) -> None:
+        queue = CoalescingMessageQueue(high_water_mark=4)
+        for i in range(3):
+            queue.put_nowait(_cell_op(output=_output(str(i))))
+        assert queue.qsize() == 3
+
+        queue.put_nowait(_cell_op(output=_output("3")))
+        assert queue.qsize() == 1
+        assert json.loads(queue.get_nowait())["output"]["data"] == "3"
+
+    def test_never_drops_messages(self) -> None:
+        queue = CoalescingMessageQueue(high_water_mark=2)
+        for i in range(10):
+            queue.put_nowait(_alert(str(i)))
+        assert queue.qsize() == 10
+        titles = [json.loads(queue.get_nowait())["title"] for _ in range(10)]
+        assert titles == [str(i) for i in range(10)]
+
+    def test_resyncs_when_full(self) -> None:
+        queue: CoalescingMessageQueue
+
+        def resync() -> None:
+            queue.put_nowait(_alert("state"))
+
+        queue = CoalescingMessageQueue(
+            high_water_mark=2, max_size=8, on_overflow=resync
+        )
+        for i in range(8):
+            queue.put_nowait(_alert(str(i)))
+        assert queue.qsize() == 8
+
+        # The backlog is replaced by the full state
+        queue.put_nowait(_alert("8"))
+        assert queue.qsize() == 1
+        assert json.loads(queue.get_nowait())["title"] == "state"
+
+    def test_large_state_does_not_resync_again(self) -> None:
+        resyncs = 0
+        queue: CoalescingMessageQueue
+
+        def resync() -> None:
+            nonlocal resyncs
+            resyncs += 1
+            for i in range(6):
+                queue.put_nowait(_alert(f"state {i}"))
+
+        queue = CoalescingMessageQueue(
+            high_water_mark=2, max_size=4, on_overflow=resync
+        )
+        for i in range(8):
+            queue.put_nowait(_alert(str(i)))
+        assert resyncs == 1
+        assert queue.qsize() == 9
+
+
+class _FakeWebSocket:
+    def __init__(self) -> None:
+        self.sent: list[str | bytes] = []
+
+    async def send_text(self, text: str) -> None:
+        self.sent.append(text)
+
+    async def send_bytes(self, data: bytes) -> None:
+        self.sent.append(data)
+
+
+async def test_message_loop_sends_batches() -> None:
+    websocket = _FakeWebSocket()
+    queue: asyncio.Queue[KernelMessage] = asyncio.Queue()
+    loop = WebSocketMessageLoop(
+        websocket=websocket,  # type: ignore[arg-type]
+        message_queue=queue,
+        kiosk=False,
+        on_disconnect=lambda _e, _cancel: None,
+        on_check_status_update=lambda: None,
+        batch=True,
+    )
+    queue.put_nowait(_cell_op(output=_output("1")))
+    queue.put_nowait(_cell_op(output=_output("2")))
+    queue.put_nowait(_alert("hello"))
+
+    task = asyncio.create_task(loop._listen_for_messages())
+    await asyncio.sleep(0)
+    task.cancel()
+
+    assert len(websocket.sent) == 1
+    frame = json.loads(websocket.sent[0])
+    assert [m["op"] for m in frame] == ["cell-op", "alert"]
+    assert frame[0]["data"]["output"]["data"] == "2"
+
+
+async def test_message_loop_sends_large_messages_as_binary() -> None:
+    websocket = _FakeWebSocket()
+    queue: asyncio.Queue[KernelMessage] = asyncio.Queue()
+    loop = WebSocketMessageLoop(
+        websocket=websocket,  # type: ignore[arg-type]
+        message_queue=queue,
+        kiosk=False,
+        on_disconnect=lambda _e, _cancel: None,
+        on_check_status_update=lambda: None,
+        binary=True,
+    )
+    large = "x" * BINARY_FRAME_THRESHOLD
+    queue.put_nowait(_alert("small"))
+    queue.put_nowait(_alert(large))
+
+    task = asyncio.create_task(loop._listen_for_messages())
+    await asyncio.sleep(0)
+    task.cancel()
+
+    small_frame, large_frame = websocket.sent
+    assert isinstance(small_frame, str)
+    assert json.loads(small_frame)["data"]["title"] == "small"
+    assert isinstance(large_frame, bytes)
+    op_length = large_frame[1]
+    assert large_frame[2 : 2 + op_length] == b"alert"
+    message = json.loads(zlib.decompress(large_frame[2 + op_length :]))
+    assert message["data"]["title"] == large
@@ -0,0 +1,275 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import json
+import re
+import subprocess
+import sys
+import time
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from marimo._ast.app_config import _AppConfig
+from marimo._config.manager import get_default_config_manager
+from marimo._runtime.commands import (
+    AppMetadata,
+    CreateNotebookCommand,
+    ExecuteCellCommand,
+    UpdateUIElementCommand,
+)
+from marimo._runtime.virtual_file.storage import (
+    InMemoryStorage,
+    VirtualFileStorageManager,
+)
+from marimo._session.managers import (
+    ForkKernelManagerImpl,
+    ForkQueueManagerImpl,
+    ForkServer,
+    fork as fork_module,
+)
+from marimo._session.managers.fork import (
+    SETUP_MODULE_NAME,
+    _open_fds,
+    import_setup_cell,
+)
+from marimo._session.model import SessionMode
+from marimo._types.ids import CellId_t
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _create_notebook(setup_code: str, code: str) -> CreateNotebookCommand:
+    return CreateNotebookCommand(
+        execution_requests=(
+            ExecuteCellCommand(cell_id=CellId_t("setup"), code=setup_code),
+            ExecuteCellCommand(cell_id=CellId_t("1"), code=code),
+        ),
+        set_ui_element_value_request=UpdateUIElementCommand(
+            object_ids=[], values=[]
+        ),
+        auto_run=True,
+    )
+
+
+class TestImportSetupCell:
+    def test_setup_cell_is_replaced(self) -> None:
+        request = _create_notebook("import os\nx = 1", "y = x")
+        rewritten = import_setup_cell(request, "import os\nx = 1", ["os", "x"])
+        setup, cell = rewritten.execution_requests
+        assert setup.code == f"from {SETUP_MODULE_NAME} import os, x"
+        assert cell == request.execution_requests[1]
+
+    def test_changed_setup_cell_is_kept(self) -> None:
+        request = _create_notebook("x = 2", "y = x")
+        assert import_setup_cell(request, "x = 1", ["x"]) == request
+
+    def test_setup_cell_without_definitions(self) -> None:
+        request = _create_notebook("print('hi')", "y = 1")
+        rewritten = import_setup_cell(request, "print('hi')", [])
+        assert rewritten.execution_requests[0].code == ""
+
+
+@pytest.mark.skipif(
+    not ForkServer.is_supported(), reason="fork is not supported"
+)
+def test_open_fds(tmp_path: Path) -> None:
+    before = _open_fds()
+    with (tmp_path / "file.txt").open("w") as f:
+        assert _open_fds() - before == {f.fileno()}
+    assert _open_fds() == before
+
+
+def _wait_until_ready(fork_server: ForkServer, timeout: float = 20) -> None:
+    start_time = time.time()
+    while time.time() < start_time + timeout:
+        if fork_server.ready:
+            return
+        time.sleep(0.05)
+    raise AssertionError("fork server did not become ready")
+
+
+def _wait_for_output(
+    kernel_manager: ForkKernelManagerImpl, cell_id: str, timeout: float = 20
+) -> Any:
+    conn = kernel_manager.kernel_connection
+    start_time = time.time()
+    while time.time() < start_time + timeout:
+        if not conn.poll(0.1):
+            continue
+        message = json.loads(conn.recv())
+        if (
+            message["op"] == "cell-op"
+            and message["cell_id"] == cell_id
+            and message.get("output") is not None
+        ):
+            return message["output"]["data"]
+    raise AssertionError("no output received")
+
+
+def _create_kernel_manager(fork_server: ForkServer) -> ForkKernelManagerImpl:
+    return ForkKernelManagerImpl(
+        queue_manager=ForkQueueManagerImpl(),
+        fork_server=fork_server,
+        mode=SessionMode.RUN,
+        configs={},
+        app_metadata=AppMetadata(
+            query_params={},
+            filename=None,
+            cli_args={},
+            argv=None,
+            app_config=_AppConfig(),
+        ),
+        config_manager=get_default_config_manager(current_path=None),
+        virtual_files_supported=True,
+        redirect_console_to_browser=False,
+    )
+
+
+def _start_kernel(fork_server: ForkServer) -> ForkKernelManagerImpl:
+    kernel_manager = _create_kernel_manager(fork_server)
+    kernel_manager.start_kernel()
+    return kernel_manager
+
+
+@pytest.mark.skipif(
+    not ForkServer.is_supported(), reason="fork is not supported"
+)
+@pytest.mark.skipif(sys.platform == "darwin", reason="slow on macOS")
+class TestForkServer:
+    def test_setup_cell_runs_once(self, tmp_path: Path) -> None:
+        marker = tmp_path / "marker.txt"
+        setup_code = (
+            "from pathlib import Path\n"
+            f"with Path({str(marker)!r}).open('a') as f:\n"
+            "    f.write('x')\n"
+            "value = 41"
+        )
+        fork_server = ForkServer(filename=None, setup_code=setup_code)
+        fork_server.start()
+        kernel_managers: list[ForkKernelManagerImpl] = []
+        try:
+            _wait_until_ready(fork_server)
+            for _ in range(2):
+                kernel_manager = _start_kernel(fork_server)
+                kernel_managers.append(kernel_manager)
+                assert kernel_manager.is_alive()
+                assert kernel_manager.pid is not None
+
+                kernel_manager.queue_manager.put_control_request(
+                    _create_notebook(setup_code, "value + 1")
+                )
+                assert "42" in _wait_for_output(kernel_manager, "1")
+
+            assert marker.read_text() == "x"
+        finally:
+            for kernel_manager in kernel_managers:
+                kernel_manager.close_kernel()
+            fork_server.shutdown()
+
+        for kernel_manager in kernel_managers:
+            assert kernel_manager.kernel_task is not None
+            kernel_manager.kernel_task.join(timeout=5)
+            assert not kernel_manager.is_alive()
+
+    def test_kernel_that_does_not_connect(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        fork_server = ForkServer(filename=None, setup_code="value = 1")
+        fork_server.start()
+        try:
+            _wait_until_ready(fork_server)
+            monkeypatch.setattr(fork_module, "_CONNECT_TIMEOUT", 0)
+            kernel_manager = _create_kernel_manager(fork_server)
+            assert not kernel_manager.fork_kernel()
+            assert kernel_manager.kernel_task is None
+            with pytest.raises(RuntimeError, match="failed to connect"):
+                kernel_manager.start_kernel()
+
+            # The template keeps forking kernels
+            monkeypatch.undo()
+            kernel_manager = _start_kernel(fork_server)
+            assert kernel_manager.is_alive()
+            kernel_manager.close_kernel()
+        finally:
+            fork_server.shutdown()
+
+    def test_failed_setup_cell(self) -> None:
+        fork_server = ForkServer(filename=None, setup_code="1 / 0")
+        fork_server.start()
+        try:
+            start_time = time.time()
+            while fork_server._process is not None and (
+                fork_server._process.is_alive()
+                and time.time() < start_time + 20
+            ):
+                time.sleep(0.05)
+            assert not fork_server.ready
+            with pytest.raises(RuntimeError):
+                fork_server.fork(("localhost", 0))
+        finally:
+            fork_server.shutdown()
+
+    def test_virtual_files_are_shared(self) -> None:
+        manager = VirtualFileStorageManager()
+        original_storage = manager.storage
+        # The run-mode server's own storage
+        manager.storage = InMemoryStorage()
+        fork_server = ForkServer(filename=None, setup_code="import io")
+        fork_server.start()
+        kernel_manager = None
+        try:
+            _wait_until_ready(fork_server)
+            kernel_manager = _start_kernel(fork_server)
+            kernel_manager.queue_manager.put_control_request(
+                _create_notebook(
+                    "import io",
+                    "import marimo as mo\nmo.pdf(io.BytesIO(b'forked file'))",
+                )
+            )
+            output = _wait_for_output(kernel_manager, "1")
+            match = re.search(r"@file/\d+-([^\s\"']+)", output)
+            assert match is not None
+            filename = match.group(1)
+            assert manager.read(filename, 11) == b"forked file"
+
+            kernel_manager.close_kernel()
+            assert kernel_manager.kernel_task is not None
+            kernel_manager.kernel_task.join(timeout=5)
+            start_time = time.time()
+            while filename in manager._shared_files:
+                assert time.time() < start_time + 5
+                time.sleep(0.05)
+            with pytest.raises(KeyError):
+                manager.read(filename, 11)
+        finally:
+            if kernel_manager is not None and kernel_manager.is_alive():
+                kernel_manager.close_kernel()
+            fork_server.shutdown()
+            manager.storage = original_storage
+
+    def test_only_forked_kernels_are_terminated(self) -> None:
+        fork_server = ForkServer(filename=None, setup_code="x = 1")
+        fork_server.start()
+        # Stands in for an unrelated process that reused a kernel's PID
+        other = subprocess.Popen(
+            [sys.executable, "-c", "input()"], stdin=subprocess.PIPE
+        )
+        try:
+            _wait_until_ready(fork_server)
+            assert not fork_server.is_child_alive(other.pid)
+            fork_server.terminate_child(other.pid)
+            time.sleep(0.2)
+            assert other.poll() is None
+
+            kernel_manager = _start_kernel(fork_server)
+            assert kernel_manager.kernel_task is not None
+            kernel_manager.kernel_task.terminate()
+            kernel_manager.kernel_task.join(timeout=5)
+            assert not kernel_manager.is_alive()
+            kernel_manager.close_kernel()
+        finally:
+            other.kill()
+            other.wait()
+            fork_server.shutdown()
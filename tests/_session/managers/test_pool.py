@@ -0,0 +1,87 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import sys
+import time
+
+import pytest
+
+from marimo._ast.app_config import _AppConfig
+from marimo._config.manager import get_default_config_manager
+from marimo._runtime.commands import AppMetadata
+from marimo._session.managers import KernelManagerImpl, KernelPool
+from marimo._session.model import SessionMode
+
+app_metadata = AppMetadata(
+    query_params={},
+    filename="test.py",
+    cli_args={},
+    argv=None,
+    app_config=_AppConfig(),
+)
+
+
+def _wait_until_full(pool: KernelPool, timeout: float = 10) -> None:
+    start_time = time.time()
+    while time.time() < start_time + timeout:
+        with pool._lock:
+            if len(pool._idle) >= pool.size:
+                return
+        time.sleep(0.05)
+    raise AssertionError("pool was not filled")
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="process startup is slow on Windows"
+)
+class TestKernelPool:
+    def test_acquire_and_bind(self) -> None:
+        pool = KernelPool(size=1)
+        pool.start()
+        try:
+            _wait_until_full(pool)
+            pooled_kernel = pool.acquire()
+            assert pooled_kernel is not None
+            assert pooled_kernel.process.is_alive()
+
+            kernel_manager = KernelManagerImpl(
+                queue_manager=pooled_kernel.queue_manager,
+                mode=SessionMode.EDIT,
+                configs={},
+                app_metadata=app_metadata,
+                config_manager=get_default_config_manager(current_path=None),
+                virtual_files_supported=True,
+                redirect_console_to_browser=False,
+                pooled_kernel=pooled_kernel,
+            )
+            kernel_manager.start_kernel()
+            assert kernel_manager.kernel_task is pooled_kernel.process
+            assert kernel_manager._read_conn is not None
+            assert kernel_manager.is_alive()
+
+            # The acquired kernel is replaced in the background
+            _wait_until_full(pool)
+
+            kernel_manager.close_kernel()
+            kernel_manager.kernel_task.join(timeout=5)
+            assert not kernel_manager.is_alive()
+        finally:
+            pool.shutdown()
+
+    def test_shutdown_stops_idle_kernels(self) -> None:
+        pool = KernelPool(size=2)
+        pool.start()
+        _wait_until_full(pool)
+        idle = list(pool._idle)
+
+        pool.shutdown()
+        for kernel in idle:
+            kernel.process.join(timeout=5)
+            assert not kernel.process.is_alive()
+        assert pool.acquire() is None
+
+    def test_empty_pool(self) -> None:
+        pool = KernelPool(size=0)
+        pool.start()
+        assert pool.acquire() is None
+        pool.shutdown()
@@ -0,0 +1,112 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+from marimo._messaging.cell_output import CellChannel, CellOutput
+from marimo._session.state.console_buffer import ConsoleBuffer
+
+
+def _data(console: ConsoleBuffer) -> list[object]:
+    return [output.data for output in console.outputs()]
+
+
+def test_merges_consecutive_text() -> None:
+    console = ConsoleBuffer()
+    console.extend(
+        [
+            CellOutput.stdout("a"),
+            CellOutput.stdout("b"),
+            CellOutput.stderr("c"),
+            CellOutput.stdout("d", mimetype="text/html"),
+            CellOutput.stdout("e"),
+            CellOutput.stdout("f"),
+        ]
+    )
+    outputs = console.outputs()
+    assert [output.data for output in outputs] == ["ab", "c", "d", "ef"]
+    assert [output.channel for output in outputs] == [
+        CellChannel.STDOUT,
+        CellChannel.STDERR,
+        CellChannel.STDOUT,
+        CellChannel.STDOUT,
+    ]
+
+
+def test_keeps_first_timestamp() -> None:
+    console = ConsoleBuffer()
+    first = CellOutput.stdout("a")
+    first.timestamp = 1
+    second = CellOutput.stdout("b")
+    second.timestamp = 2
+    console.extend([first, second])
+    assert console.outputs()[0].timestamp == 1
+
+
+def test_max_lines() -> None:
+    console = ConsoleBuffer(max_lines=2)
+    for i in range(5):
+        console.append(CellOutput.stdout(f"{i}\n"))
+    assert _data(console) == ["[truncated 3 lines]\n", "3\n4\n"]
+    assert console.truncated_lines == 3
+
+
+def test_max_size() -> None:
+    console = ConsoleBuffer(max_size=4)
+    for i in range(5):
+        console.append(CellOutput.stdout(f"{i}\n"))
+    assert _data(console) == ["[truncated 3 lines]\n", "3\n4\n"]
+
+
+def test_trims_large_chunks() -> None:
+    console = ConsoleBuffer(max_lines=2)
+    console.append(CellOutput.stdout("0\n1\n2\n3\n4"))
+    assert _data(console) == ["[truncated 2 lines]\n", "2\n3\n4"]
+
+    console = ConsoleBuffer(max_size=4)
+    console.append(CellOutput.stdout("0\n1\n2\n"))
+    assert _data(console) == ["[truncated 1 lines]\n", "1\n2\n"]
+
+
+def test_evicts_other_outputs() -> None:
+    console = ConsoleBuffer(max_lines=1)
+    console.append(CellOutput.stdout("<b>hi</b>", mimetype="text/html"))
+    console.append(CellOutput.stderr("error\n"))
+    assert _data(console) == ["[truncated 1 lines]\n", "error\n"]
+
+
+def test_keeps_latest_output() -> None:
+    console = ConsoleBuffer(max_size=1)
+    console.append(CellOutput.stdout("<b>hi</b>", mimetype="text/html"))
+    assert _data(console) == ["<b>hi</b>"]
+
+
+def test_clear() -> None:
+    console = ConsoleBuffer(max_lines=1)
+    console.extend([CellOutput.stdout("a\n"), CellOutput.stdout("b\n")])
+    console.clear()
+    assert console.outputs() == []
+    assert len(console) == 0
+
+
+def test_resolve_stdin() -> None:
+    console = ConsoleBuffer()
+    console.extend(
+        [CellOutput.stdout("Hello"), CellOutput.stdin("What is your name?")]
+    )
+    assert console.resolve_stdin("marimo")
+    assert _data(console) == ["Hello", "What is your name? marimo\n"]
+    assert not console.resolve_stdin("again")
+
+    # Later output is merged into the answered prompt
+    console.append(CellOutput.stdout("Hi marimo"))
+    assert _data(console) == ["Hello", "What is your name? marimo\nHi marimo"]
+
+
+def test_many_appends() -> None:
+    console = ConsoleBuffer(max_lines=1000)
+    for i in range(100_000):
+        console.append(CellOutput.stdout(f"{i}\n"))
+    outputs = console.outputs()
+    assert outputs[0].data == "[truncated 99000 lines]\n"
+    assert isinstance(outputs[1].data, str)
+    assert outputs[1].data.startswith("99000\n")
+    assert outputs[1].data.endswith("99999\n")
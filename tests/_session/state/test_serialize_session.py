@@ -17,6 +17,7 @@ from marimo._messaging.notification import CellNotification
 from marimo._runtime.commands import ExecuteCellsCommand
 from marimo._schemas.session import NotebookSessionV1
 from marimo._session.state.serialize import (
+    IncrementalSessionSerializer,
     SessionCacheKey,
     SessionCacheManager,
     SessionCacheWriter,
@@ -564,6 +565,139 @@ async def test_session_cache_writer_no_writes(session_view: SessionView):
         await writer.stop()
 
 
+async def test_session_cache_writer_skips_unchanged(
+    session_view: SessionView,
+):
+    """Test AsyncWriter does not rewrite an unchanged snapshot"""
+    view = session_view
+    view.cell_notifications["cell1"] = CellNotification(
+        cell_id="cell1",
+        status="idle",
+        output=CellOutput.stdout("test data"),
+        console=[],
+        timestamp=0,
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "session.json"
+        writer = SessionCacheWriter(view, path, interval=0.1)
+        writer.start()
+        await asyncio.sleep(0.2)
+        mtime = path.stat().st_mtime_ns
+
+        # Touched, but nothing that is serialized changed
+        view._touch()
+        await asyncio.sleep(0.2)
+        assert path.stat().st_mtime_ns == mtime
+        assert json.loads(path.read_text())["cells"][0]["id"] == "cell1"
+
+        await writer.stop()
+
+
+class TestIncrementalSessionSerializer:
+    @staticmethod
+    def _view() -> SessionView:
+        view = SessionView()
+        view.add_control_request(
+            ExecuteCellsCommand(
+                cell_ids=["cell1", "cell2"], codes=["a", "print(b)"]
+            )
+        )
+        view.add_notification(
+            CellNotification(
+                cell_id="cell1",
+                status="idle",
+                output=CellOutput(
+                    channel=CellChannel.OUTPUT,
+                    mimetype="text/html",
+                    data="<b>hello\nworld</b>",
+                ),
+                console=[],
+                timestamp=0,
+            )
+        )
+        view.add_notification(
+            CellNotification(
+                cell_id="cell2",
+                status="idle",
+                output=CellOutput.errors(
+                    [UnknownError(msg="boom", error_type="ValueError")]
+                ),
+                console=[CellOutput.stderr("error\n")],
+                timestamp=0,
+            )
+        )
+        return view
+
+    def test_matches_serialize_session_view(self):
+        view = self._view()
+        serializer = IncrementalSessionSerializer()
+        assert serializer.serialize(
+            view, script_metadata_hash="abc"
+        ) == json.dumps(
+            serialize_session_view(view, script_metadata_hash="abc"),
+            indent=2,
+        )
+
+        # Outputs change, and cells are removed
+        view.add_notification(
+            CellNotification(
+                cell_id="cell2",
+                status="idle",
+                output=None,
+                console=[CellOutput.stdout("more")],
+                timestamp=0,
+            )
+        )
+        for cell_ids in (None, ["cell2"], []):
+            assert serializer.serialize(view, cell_ids) == json.dumps(
+                serialize_session_view(view, cell_ids), indent=2
+            )
+
+    def test_encodes_only_changed_cells(self, monkeypatch: pytest.MonkeyPatch):
+        from marimo._session.state import serialize
+
+        view = self._view()
+        serializer = IncrementalSessionSerializer()
+        encoded: list[CellId_t] = []
+        original = serialize._serialize_cell
+
+        def _serialize_cell(view: SessionView, cell_id: CellId_t):
+            encoded.append(cell_id)
+            return original(view, cell_id)
+
+        monkeypatch.setattr(serialize, "_serialize_cell", _serialize_cell)
+
+        serializer.serialize(view)
+        assert encoded == ["cell1", "cell2"]
+        assert serializer.changed
+
+        encoded.clear()
+        serializer.serialize(view)
+        assert encoded == []
+        assert not serializer.changed
+
+        view.add_notification(
+            CellNotification(
+                cell_id="cell1",
+                status="idle",
+                output=CellOutput.stdout("changed"),
+                console=[],
+                timestamp=0,
+            )
+        )
+        serializer.serialize(view)
+        assert encoded == ["cell1"]
+        assert serializer.changed
+
+        # Outputs updated in place
+        encoded.clear()
+        view.update_cell_outputs(
+            {CellId_t("cell1"): ("image/png", "data:image/png;base64,")}
+        )
+        serializer.serialize(view)
+        assert encoded == ["cell1"]
+
+
 def test_get_session_cache_file():
     is_windows = sys.platform == "win32"
     # Linux path
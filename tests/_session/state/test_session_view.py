@@ -1014,6 +1014,56 @@ def test_combine_console_outputs(
     ]
 
 
+@patch("time.time", return_value=123)
+def test_console_outputs_are_truncated(
+    time_mock: Any, session_view: SessionView
+) -> None:
+    del time_mock
+    session_view.console_max_lines = 2
+    session_view.add_notification(
+        CellNotification(cell_id=cell_id, status="running")
+    )
+    for i in range(5):
+        session_view.add_notification(
+            CellNotification(
+                cell_id=cell_id,
+                console=CellOutput.stdout(f"{i}\n"),
+                status="running",
+            )
+        )
+
+    expected = [
+        CellOutput.stdout("[truncated 3 lines]\n"),
+        CellOutput.stdout("3\n4\n"),
+    ]
+    assert session_view.cell_notifications[cell_id].console == expected
+    # The truncated console is replayed
+    (replayed,) = [
+        notification
+        for notification in session_view.notifications
+        if isinstance(notification, CellNotification)
+    ]
+    assert replayed.console == expected
+
+    # A notification added directly (e.g., from a saved session) is
+    # appended to
+    session_view.cell_notifications[cell_id] = CellNotification(
+        cell_id=cell_id,
+        console=[CellOutput.stdout("a\n")],
+        status="running",
+    )
+    session_view.add_notification(
+        CellNotification(
+            cell_id=cell_id,
+            console=CellOutput.stdout("b\n"),
+            status="running",
+        )
+    )
+    assert session_view.cell_notifications[cell_id].console == [
+        CellOutput.stdout("a\nb\n")
+    ]
+
+
 @patch("time.time", return_value=123)
 def test_stdin(time_mock: Any, session_view: SessionView) -> None:
     del time_mock
@@ -62,6 +62,7 @@ class FakeAdbcDbApiCursor:
         self._arrow_table: pa.Table | None = arrow_table
         self.did_execute = False
         self.did_fetch_arrow = False
+        self.did_fetch_record_batch = False
         self.did_close = False
 
     def execute(
@@ -76,6 +77,15 @@ class FakeAdbcDbApiCursor:
         assert self._arrow_table is not None
         return self._arrow_table
 
+    def fetch_record_batch(self) -> pa.RecordBatchReader:
+        import pyarrow as pa
+
+        self.did_fetch_record_batch = True
+        assert self._arrow_table is not None
+        return pa.RecordBatchReader.from_batches(
+            self._arrow_table.schema, self._arrow_table.to_batches(1)
+        )
+
     def close(self) -> None:
         self.did_close = True
 
@@ -380,6 +390,29 @@ def test_adbc_execute_native_returns_arrow_table(monkeypatch) -> None:
     assert cursor.did_close is True
 
 
+def test_adbc_execute_with_limit_streams_batches(monkeypatch) -> None:
+    pa = pytest.importorskip("pyarrow")
+
+    cursor = FakeAdbcDbApiCursor(
+        description=[("col", None)],
+        arrow_table=pa.table({"col": list(range(10))}),
+    )
+    conn = FakeAdbcDbApiConnection(
+        cursor=cursor,
+        objects_pylist=[],
+        table_schema=FakeAdbcTableSchema([]),
+    )
+    engine = AdbcDBAPIEngine(conn)
+
+    monkeypatch.setattr(engine, "sql_output_format", lambda: "native")
+    result = engine.execute_with_limit("SELECT col FROM t", 3)
+
+    assert result.column("col").to_pylist() == [0, 1, 2]
+    assert cursor.did_fetch_record_batch is True
+    assert cursor.did_fetch_arrow is False
+    assert cursor.did_close is True
+
+
 def test_adbc_is_compatible_does_not_create_cursor() -> None:
     conn = FakeAdbcDbApiConnection(
         cursor=FakeAdbcDbApiCursor(description=None),
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import sqlite3
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -145,6 +145,50 @@ def test_execute_with_parameters(dbapi_engine: DBAPIEngine) -> None:
         assert result.iloc[0].to_dict() == {"id": 1, "name": "a", "value": 1.0}
 
 
+def test_execute_with_limit(dbapi_engine: DBAPIEngine) -> None:
+    pytest.importorskip("pandas")
+
+    with patch.object(
+        dbapi_engine, "sql_output_format", return_value="pandas"
+    ):
+        result = dbapi_engine.execute_with_limit(
+            "SELECT * FROM test ORDER BY id", 2
+        )
+        assert len(result) == 2
+        assert list(result["name"]) == ["a", "b"]
+
+        # Limit larger than the result
+        result = dbapi_engine.execute_with_limit("SELECT * FROM test", 10)
+        assert len(result) == 3
+
+        # Statements without results are unaffected
+        assert (
+            dbapi_engine.execute_with_limit(
+                "CREATE TABLE other (id INTEGER)", 2
+            )
+            is None
+        )
+
+
+def test_execute_with_limit_fetches_at_most_limit(
+    dbapi_engine: DBAPIEngine,
+) -> None:
+    pytest.importorskip("pandas")
+
+    cursor = dbapi_engine._connection.cursor()
+    mock_connection = MagicMock(wraps=dbapi_engine._connection)
+    mock_connection.cursor.return_value = MagicMock(wraps=cursor)
+    mock_connection.cursor.return_value.description = None
+
+    engine = DBAPIEngine(connection=mock_connection)
+    with patch.object(engine, "sql_output_format", return_value="pandas"):
+        mock_cursor = mock_connection.cursor.return_value
+        mock_cursor.description = (("id",), ("name",), ("value",))
+        engine.execute_with_limit("SELECT * FROM test", 2)
+        mock_cursor.fetchmany.assert_called_once_with(2)
+        mock_cursor.fetchall.assert_not_called()
+
+
 def test_is_dbapi_cursor() -> None:
     cursor = sqlite3.connect(":memory:").cursor()
     assert DBAPIEngine.is_dbapi_cursor(cursor)
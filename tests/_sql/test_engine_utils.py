@@ -1,13 +1,13 @@
 # Copyright 2026 Marimo. All rights reserved.
 from __future__ import annotations
 
-from typing import Literal
+from typing import Any, Literal
 from unittest.mock import Mock, patch
 
 import pytest
 
 from marimo._dependencies.dependencies import DependencyManager
-from marimo._sql.utils import convert_to_output
+from marimo._sql.utils import convert_to_output, fetch_arrow_or_rows
 
 native_result = {"data": "native_result"}
 polars_result = {"data": "polars_result"}
@@ -427,3 +427,97 @@ class TestAllOutputFormats:
 
         assert result == polars_result
         assert_only_one_called(mock_functions, "to_polars")
+
+
+@pytest.mark.requires("pyarrow")
+class TestFetchArrowOrRows:
+    """Test fetching cursor results into Arrow in batches."""
+
+    @pytest.fixture
+    def cursor(self) -> Any:
+        import sqlite3
+
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE t (id INTEGER, name TEXT)")
+        conn.executemany(
+            "INSERT INTO t VALUES (?, ?)",
+            [(i, f"name_{i}") for i in range(25)],
+        )
+        return conn.execute("SELECT * FROM t ORDER BY id")
+
+    def test_batches_are_concatenated(self, cursor: Any) -> None:
+        import pyarrow as pa
+
+        table = fetch_arrow_or_rows(cursor, ["id", "name"], batch_size=10)
+        assert isinstance(table, pa.Table)
+        assert table.num_rows == 25
+        # One chunk per batch, no copies
+        assert table.column("id").num_chunks == 3
+        assert table.column("id").to_pylist() == list(range(25))
+
+    def test_limit(self, cursor: Any) -> None:
+        table = fetch_arrow_or_rows(
+            cursor, ["id", "name"], limit=12, batch_size=10
+        )
+        assert not isinstance(table, list)
+        assert table.column("id").to_pylist() == list(range(12))
+
+    def test_empty_result(self) -> None:
+        import sqlite3
+
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE t (id INTEGER)")
+        cursor = conn.execute("SELECT * FROM t")
+        table = fetch_arrow_or_rows(cursor, ["id"])
+        assert not isinstance(table, list)
+        assert table.num_rows == 0
+        assert table.column_names == ["id"]
+
+    def test_batches_with_different_types_are_promoted(self) -> None:
+        cursor = Mock()
+        cursor.fetchmany.side_effect = [[(None,), (None,)], [(1,)], []]
+        del cursor.fetch_record_batch
+        del cursor.fetch_arrow_table
+        table = fetch_arrow_or_rows(cursor, ["a"], batch_size=2)
+        assert not isinstance(table, list)
+        assert table.column("a").to_pylist() == [None, None, 1]
+
+    def test_falls_back_to_rows_for_mixed_types(self) -> None:
+        cursor = Mock()
+        cursor.fetchmany.side_effect = [
+            [(1,), (2,)],
+            [("a",), (3,)],
+            [(4,)],
+            [],
+        ]
+        del cursor.fetch_record_batch
+        del cursor.fetch_arrow_table
+        rows = fetch_arrow_or_rows(cursor, ["a"], batch_size=2)
+        assert rows == [(1,), (2,), ("a",), (3,), (4,)]
+
+    def test_falls_back_to_rows_for_incompatible_batches(self) -> None:
+        import sqlite3
+
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE t (a)")
+        conn.executemany("INSERT INTO t VALUES (?)", [(1,), (2,), ("x",)])
+        cursor = conn.execute("SELECT * FROM t ORDER BY rowid")
+        # Each batch converts on its own, but int and string columns
+        # can't be concatenated
+        rows = fetch_arrow_or_rows(cursor, ["a"], batch_size=2)
+        assert rows == [(1,), (2,), ("x",)]
+
+    def test_uses_native_record_batches(self) -> None:
+        import pyarrow as pa
+
+        table = pa.table({"a": list(range(6))})
+        cursor = Mock()
+        cursor.fetch_record_batch.return_value = (
+            pa.RecordBatchReader.from_batches(
+                table.schema, table.to_batches(2)
+            )
+        )
+        result = fetch_arrow_or_rows(cursor, ["a"], limit=3)
+        assert not isinstance(result, list)
+        assert result.column("a").to_pylist() == [0, 1, 2]
+        cursor.fetchmany.assert_not_called()
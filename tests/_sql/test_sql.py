@@ -16,6 +16,7 @@ from marimo._sql.engines.ibis import IbisEngine
 from marimo._sql.engines.sqlalchemy import SQLAlchemyEngine
 from marimo._sql.sql import _query_includes_limit, sql
 from marimo._sql.utils import (
+    add_limit_to_query,
     extract_explain_content,
     is_explain_query,
     is_query_empty,
@@ -252,6 +253,65 @@ def test_query_includes_limit() -> None:
     )
 
 
+@pytest.mark.skipif(not HAS_SQLGLOT, reason="sqlglot not installed")
+def test_add_limit_to_query() -> None:
+    assert (
+        add_limit_to_query("SELECT * FROM t", 10, "duckdb")
+        == "SELECT * FROM t LIMIT 10"
+    )
+    assert (
+        add_limit_to_query("SELECT * FROM t ORDER BY id", 5, "postgresql")
+        == "SELECT * FROM t ORDER BY id LIMIT 5"
+    )
+    assert (
+        add_limit_to_query("SELECT a FROM t", 5, "mssql")
+        == "SELECT TOP 5 a FROM t"
+    )
+    assert (
+        add_limit_to_query("WITH x AS (SELECT 1) SELECT * FROM x", 1, "sqlite")
+        == "WITH x AS (SELECT 1) SELECT * FROM x LIMIT 1"
+    )
+
+    # Not rewritten
+    assert add_limit_to_query("SELECT * FROM t", 10, "sql") is None
+    assert add_limit_to_query("SELECT * FROM t LIMIT 3", 10, "duckdb") is None
+    assert add_limit_to_query("SELECT 1; SELECT 2", 10, "duckdb") is None
+    assert add_limit_to_query("INSERT INTO t VALUES (1)", 10, "duckdb") is None
+    assert add_limit_to_query("NOT A VALID SQL QUERY", 10, "duckdb") is None
+
+
+@patch("marimo._sql.sql.replace")
+@pytest.mark.requires("polars", "sqlalchemy")
+def test_applies_limit_sqlalchemy(
+    mock_replace: MagicMock, sqlite_engine: sa.Engine
+) -> None:
+    with patch.dict(os.environ, {"MARIMO_SQL_DEFAULT_LIMIT": "2"}):
+        with patch.object(
+            SQLAlchemyEngine,
+            "execute",
+            wraps=SQLAlchemyEngine.execute,
+            autospec=True,
+        ) as mock_execute:
+            assert len(sql("SELECT * FROM test", engine=sqlite_engine)) == 2
+            # One extra row is fetched to detect truncation
+            assert mock_execute.call_args.kwargs == {"limit": 3}
+        table = mock_replace.call_args[0][0]
+        assert table._component_args["total-rows"] == "too_many"
+
+        mock_replace.reset_mock()
+        assert (
+            len(sql("SELECT * FROM test LIMIT 1", engine=sqlite_engine)) == 1
+        )
+        table = mock_replace.call_args[0][0]
+        assert table._component_args["total-rows"] == 1
+
+    with patch.dict(os.environ, {"MARIMO_SQL_DEFAULT_LIMIT": "3"}):
+        mock_replace.reset_mock()
+        assert len(sql("SELECT * FROM test", engine=sqlite_engine)) == 3
+        table = mock_replace.call_args[0][0]
+        assert table._component_args["total-rows"] == 3
+
+
 @patch("marimo._sql.sql.replace")
 @pytest.mark.requires("polars", "duckdb")
 def test_applies_limit(mock_replace: MagicMock) -> None:
@@ -601,6 +601,30 @@ def test_sqlalchemy_engine_execute(sqlite_engine: sa.Engine) -> None:
     assert len(result) == 4
 
 
+@pytest.mark.skipif(
+    not HAS_SQLALCHEMY or not HAS_POLARS,
+    reason="SQLAlchemy and Polars not installed",
+)
+def test_sqlalchemy_engine_execute_with_limit(
+    sqlite_engine: sa.Engine,
+) -> None:
+    """Test SQLAlchemyEngine execute_with_limit."""
+    import polars as pl
+
+    with mock.patch.object(
+        SQLAlchemyEngine, "sql_output_format", return_value="polars"
+    ):
+        engine = SQLAlchemyEngine(
+            sqlite_engine, engine_name=VariableName("test_sqlite")
+        )
+        result = engine.execute_with_limit("SELECT * FROM test ORDER BY id", 2)
+        assert isinstance(result, pl.DataFrame)
+        assert result["id"].to_list() == [1, 2]
+
+        result = engine.execute_with_limit("SELECT * FROM test", 100)
+        assert len(result) == 4
+
+
 @pytest.mark.skipif(not HAS_SQLALCHEMY, reason="SQLAlchemy not installed")
 def test_sqlalchemy_get_database_name(sqlite_engine: sa.Engine) -> None:
     """Test SQLAlchemyEngine get_database_name."""
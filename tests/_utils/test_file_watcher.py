@@ -206,3 +206,36 @@ async def test_watchdog_file_moved() -> None:
         # Cleanup
         if await async_path.exists(tmp_path):
             os.remove(tmp_path)
+
+
+@pytest.mark.skipif(
+    not DependencyManager.watchdog.has(),
+    reason="watchdog not installed",
+)
+async def test_watchdog_shares_observer_per_directory(tmp_path: Path) -> None:
+    from marimo._utils import file_watcher
+
+    async def callback(path: Path) -> None:
+        del path
+
+    loop = asyncio.get_event_loop()
+    watchers = [
+        file_watcher._create_watchdog(tmp_path / f"{i}.py", callback, loop)
+        for i in range(3)
+    ]
+    # tmp_path is absolute
+    directory = str(tmp_path)
+    try:
+        for watcher in watchers:
+            watcher.start()
+        assert directory in file_watcher._observers
+        observer = file_watcher._observers[directory]
+        assert len(observer.watchers) == 3
+
+        watchers[0].stop()
+        assert file_watcher._observers[directory] is observer
+        assert len(observer.watchers) == 2
+    finally:
+        for watcher in watchers:
+            watcher.stop()
+    assert directory not in file_watcher._observers